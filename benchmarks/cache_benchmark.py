@@ -0,0 +1,86 @@
+"""
+Trace-replay benchmark of the response cache eviction policies.
+
+Trace is the Zipfian stream of the user lookups (popular words are looked up much more often)
+interleaved with the crawler scan (one-off words that are looked up once).
+Trace is replayed against the response cache with LRU and TinyLFU eviction
+(missed response is cached after lookup as client does) and hit ratios are compared.
+
+Run:
+::
+
+    $ python benchmarks/cache_benchmark.py
+"""
+
+import itertools
+import random
+import time
+import typing
+
+from freedictionaryapi.caching import (
+    EvictionPolicy,
+    ResponseCache
+)
+
+
+SEED = 42
+LOOKUPS_COUNT = 200_000
+VOCABULARY_SIZE = 50_000
+ZIPF_EXPONENT = 1.0
+CRAWLER_SHARE = 0.3
+CAPACITIES = (500, 2_000, 10_000)
+
+
+def generate_trace(rng: random.Random) -> typing.List[str]:
+    """ Generate lookups of the users (Zipfian) interleaved with the crawler scan (one-off words) """
+    vocabulary = [f'en_US/word{rank}' for rank in range(VOCABULARY_SIZE)]
+    cumulative_weights = list(itertools.accumulate(1 / rank ** ZIPF_EXPONENT for rank in range(1, VOCABULARY_SIZE + 1)))
+
+    user_lookups = iter(rng.choices(vocabulary, cum_weights=cumulative_weights, k=LOOKUPS_COUNT))
+    crawler_lookups = (f'en_US/crawled{index}' for index in itertools.count())
+
+    return [
+        next(crawler_lookups) if rng.random() < CRAWLER_SHARE else next(user_lookups)
+        for _ in range(LOOKUPS_COUNT)
+    ]
+
+
+def replay(trace: typing.List[str], capacity: int, eviction_policy: EvictionPolicy) -> typing.Tuple[float, float]:
+    """ Replay trace against the cache, get hit ratio and time per lookup """
+    cache = ResponseCache(capacity, eviction_policy=eviction_policy)
+    hits = 0
+
+    started_at = time.perf_counter()
+
+    for key in trace:
+        if cache.get(key) is None:
+            cache.set(key, key, 200, None)
+        else:
+            hits += 1
+
+    per_lookup = (time.perf_counter() - started_at) / len(trace)
+
+    return (hits / len(trace), per_lookup)
+
+
+def main():
+    trace = generate_trace(random.Random(SEED))
+
+    print(
+        f'Lookups: {LOOKUPS_COUNT} (vocabulary: {VOCABULARY_SIZE} words, Zipf exponent: {ZIPF_EXPONENT}, '
+        f'crawler share: {CRAWLER_SHARE:.0%})'
+    )
+
+    for capacity in CAPACITIES:
+        lru_hit_ratio, lru_per_lookup = replay(trace, capacity, EvictionPolicy.LRU)
+        tiny_lfu_hit_ratio, tiny_lfu_per_lookup = replay(trace, capacity, EvictionPolicy.TINY_LFU)
+
+        print(
+            f'capacity {capacity:>6}:  '
+            f'LRU {lru_hit_ratio:6.1%} ({lru_per_lookup * 1e6:4.1f} us/lookup)  '
+            f'TinyLFU {tiny_lfu_hit_ratio:6.1%} ({tiny_lfu_per_lookup * 1e6:4.1f} us/lookup)'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Synthetic corpus of API responses for benchmarks.
+
+Responses are generated like real ones:
+repeated parts of speech, popular synonyms, audio links with the common prefix.
+"""
+
+import random
+import typing
+
+
+__all__ = [
+    'generate_response',
+    'generate_corpus'
+]
+
+
+PARTS_OF_SPEECH = ['noun', 'verb', 'adjective', 'adverb', 'exclamation', 'intransitive verb', 'transitive verb']
+POPULAR_SYNONYMS = [
+    'greeting', 'welcome', 'salutation', 'address', 'big', 'large', 'huge', 'small', 'tiny', 'fast',
+    'quick', 'rapid', 'happy', 'glad', 'joyful', 'sad', 'unhappy', 'good', 'fine', 'nice',
+]
+AUDIO_URL_PREFIX = 'https://lex-audio.useremarkable.com/mp3/'
+
+
+def generate_response(index: int, rng: random.Random) -> list:
+    """ Generate API response (as loaded from JSON) for the synthetic word with given index """
+    word = f'word{index}'
+
+    phonetics = [
+        {
+            'text': f'/wɜːd{index}/',
+            'audio': f'{AUDIO_URL_PREFIX}{word}_us_{number}_rr.mp3'
+        }
+        for number in range(1, rng.randint(1, 3) + 1)
+    ]
+
+    meanings = []
+    for part_of_speech in rng.sample(PARTS_OF_SPEECH, rng.randint(1, 3)):
+        definitions = []
+        for number in range(rng.randint(1, 3)):
+            definition = {
+                'definition': f'Definition number {number} of the {word} as {part_of_speech}.',
+                'example': f'an example with {word}',
+            }
+            if rng.random() < 0.5:
+                definition['synonyms'] = rng.sample(POPULAR_SYNONYMS, rng.randint(1, 6))
+            definitions.append(definition)
+        meanings.append({'partOfSpeech': part_of_speech, 'definitions': definitions})
+
+    return [{'word': word, 'phonetics': phonetics, 'meanings': meanings}]
+
+
+def generate_corpus(size: int, seed: int = 0) -> typing.List[list]:
+    """ Generate list of API responses (as loaded from JSON) """
+    rng = random.Random(seed)
+
+    return [generate_response(index, rng) for index in range(size)]
@@ -0,0 +1,94 @@
+"""
+Import time benchmark of the package (based on ``python -X importtime``).
+
+Each statement is run in the fresh interpreter (``ROUNDS`` times, the best round is shown)
+and timed (modules imported by the interpreter startup are not counted),
+the slowest top-level imports of the statement are shown by ``-X importtime``.
+
+Statements are checked against the budget, so startup regressions are visible:
+benchmark exits with non-zero code if any statement is over budget.
+
+Run:
+::
+
+    $ python benchmarks/import_benchmark.py
+"""
+
+import re
+import subprocess
+import sys
+import typing
+
+
+ROUNDS = 5
+
+# statement -> budget in milliseconds
+STATEMENTS: typing.Dict[str, float] = {
+    'import freedictionaryapi': 5,
+    'import freedictionaryapi; freedictionaryapi.LanguageCodes': 20,
+    'import freedictionaryapi; freedictionaryapi.DictionaryApiClient': 250,
+    'import freedictionaryapi; freedictionaryapi.AsyncDictionaryApiClient': 500,
+}
+
+# ``import time: self [us] | cumulative | imported package`` (nesting is shown with indentation)
+_IMPORT_TIME_PATTERN = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$')
+
+
+def measure_once(statement: str) -> typing.Tuple[float, typing.List[typing.Tuple[str, float]]]:
+    """ Get time (ms) of the statement and the slowest top-level imports of it (by ``-X importtime``) """
+    # modules imported by ``importlib.import_module`` (lazy attributes) are not reported by ``-X importtime``,
+    # so the statement itself is timed with the clock
+    code = (
+        'import time; started_at = time.perf_counter(); '
+        f'{statement}; '
+        'print((time.perf_counter() - started_at) * 1000)'
+    )
+    completed_process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True
+    )
+
+    total = float(completed_process.stdout.strip())
+    top_level_imports = []
+    is_statement_started = False
+
+    for line in completed_process.stderr.splitlines():
+        match = _IMPORT_TIME_PATTERN.match(line)
+
+        if match is None:
+            continue
+
+        _, cumulative, indentation, module = match.groups()
+
+        # imports of the interpreter startup are reported before the package
+        if module == 'freedictionaryapi':
+            is_statement_started = True
+
+        # top-level imports are not nested (one space of indentation)
+        if is_statement_started and len(indentation) == 1:
+            top_level_imports.append((module, int(cumulative) / 1000))
+
+    return (total, sorted(top_level_imports, key=lambda item: item[1], reverse=True)[:3])
+
+
+def main():
+    is_over_budget = False
+
+    for statement, budget in STATEMENTS.items():
+        total, slowest_imports = min((measure_once(statement) for _ in range(ROUNDS)), key=lambda item: item[0])
+        status = 'ok' if total <= budget else 'OVER BUDGET'
+        is_over_budget = is_over_budget or total > budget
+
+        print(f'{statement:<72} {total:8.1f} ms  (budget {budget:.0f} ms) {status}')
+
+        for module, cumulative in slowest_imports:
+            print(f'    {module:<68} {cumulative:8.1f} ms')
+
+    sys.exit(1 if is_over_budget else 0)
+
+
+if __name__ == '__main__':
+    main()
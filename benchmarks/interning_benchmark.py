@@ -0,0 +1,98 @@
+"""
+Memory benchmark of the string interning pool
+on the synthetic corpus of the parsed words.
+
+Every response is loaded from its own JSON text (as it comes from API),
+so equal strings of different responses are separate objects
+unless they are interned.
+
+Two paths are measured:
+
+    * parser - parsed words of the responses;
+    * client - lookups of the client with the response cache
+      (kept in memory: cached responses, lookup results and their parsed words).
+
+Run:
+::
+
+    $ python benchmarks/interning_benchmark.py
+"""
+
+import gc
+import json
+import tracemalloc
+import typing
+
+from freedictionaryapi.caching import ResponseCache
+from freedictionaryapi.clients import BaseDictionaryApiClient
+from freedictionaryapi.interning import StringPool
+from freedictionaryapi.parsers import DictionaryApiParser
+
+from corpus import generate_corpus
+
+
+CORPUS_SIZE = 20_000
+
+
+class CorpusDictionaryApiClient(BaseDictionaryApiClient):
+    """ Client that responds with responses loaded from the JSON texts of the corpus """
+
+    def __init__(self, texts: typing.Dict[str, str], *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self._texts = texts
+
+    def fetch_api_response(self, url: str) -> typing.Tuple[int, typing.Any]:
+        return (200, json.loads(self._texts[url.rsplit('/', 1)[-1]]))
+
+
+def parse(texts: typing.Dict[str, str], string_pool: typing.Optional[StringPool]) -> list:
+    return [DictionaryApiParser(json.loads(text), string_pool=string_pool) for text in texts.values()]
+
+
+def look_up(texts: typing.Dict[str, str], string_pool: typing.Optional[StringPool]) -> list:
+    client = CorpusDictionaryApiClient(
+        texts,
+        string_pool=string_pool, response_cache=ResponseCache(capacity=len(texts))
+    )
+    results = [client.fetch_result(word) for word in texts]
+
+    for result in results:
+        _ = result.word
+
+    return [client, results]
+
+
+def measure(name: str, keep, texts: typing.Dict[str, str], string_pool=None) -> int:
+    gc.collect()
+    tracemalloc.start()
+
+    kept_objects = keep(texts, string_pool)
+
+    gc.collect()
+    current_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del kept_objects
+
+    print(f'{name:<28} {current_size / 2 ** 20:8.2f} MiB  ({current_size / len(texts):7.1f} B/word)')
+
+    return current_size
+
+
+def main():
+    texts = {response[0]['word']: json.dumps(response) for response in generate_corpus(CORPUS_SIZE)}
+
+    print(f'Corpus: {CORPUS_SIZE} words')
+
+    for path_name, keep in (('parser', parse), ('client + cache', look_up)):
+        plain_size = measure(f'{path_name} without pool', keep, texts)
+
+        string_pool = StringPool()
+        pooled_size = measure(f'{path_name} with pool', keep, texts, string_pool)
+
+        print(f'saved: {(1 - pooled_size / plain_size) * 100:.1f}%   pool stats: {string_pool.stats}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Microbenchmark of the logging overhead on the request hot path.
+
+Lookups are made by the client that responds without network,
+so the time per request is the time of the client logic
+(URL generating, response analyzing, logging).
+
+Logging is measured:
+
+    - off (level of the package loggers is WARNING);
+    - on (INFO and DEBUG records are formatted and written in the memory stream);
+    - on with sampling (each 100th event of the hot path is logged).
+
+Run:
+::
+
+    $ python benchmarks/logging_benchmark.py
+"""
+
+import io
+import logging
+import time
+import typing
+
+from freedictionaryapi.clients import BaseDictionaryApiClient
+from freedictionaryapi.logs import (
+    EVENTS,
+    set_sample_rate
+)
+
+from corpus import generate_corpus
+
+
+REQUESTS_COUNT = 20_000
+ROUNDS = 5
+RESPONSE = generate_corpus(1)[0]
+
+
+class CannedClient(BaseDictionaryApiClient):
+    """ Client that responds with the same response without network """
+
+    def fetch_api_response(self, url: str) -> typing.Tuple[int, typing.Any]:
+        return (200, RESPONSE)
+
+
+def measure(name: str, client: CannedClient) -> float:
+    durations = []
+
+    for _ in range(ROUNDS):
+        started_at = time.perf_counter()
+
+        for _ in range(REQUESTS_COUNT):
+            client.fetch_result('hello')
+
+        durations.append(time.perf_counter() - started_at)
+
+    # the best round is the least disturbed by the other processes
+    per_request = min(durations) / REQUESTS_COUNT
+
+    print(f'{name:<24} {per_request * 1e6:8.2f} us/request')
+
+    return per_request
+
+
+def main():
+    client = CannedClient()
+    package_logger = logging.getLogger('freedictionaryapi')
+    package_logger.propagate = False
+
+    handler = logging.StreamHandler(io.StringIO())
+    handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s %(message)s'))
+    package_logger.addHandler(handler)
+
+    print(f'Requests: {REQUESTS_COUNT} x {ROUNDS} rounds (the best round is shown)')
+
+    package_logger.setLevel(logging.WARNING)
+    off = measure('logging off', client)
+
+    package_logger.setLevel(logging.DEBUG)
+    on = measure('logging on', client)
+
+    for event in EVENTS:
+        set_sample_rate(event, 0.01)
+
+    sampled = measure('logging on, 1% sampled', client)
+
+    print(
+        f'logging overhead: {(on - off) * 1e6:.2f} us/request (on), '
+        f'{(sampled - off) * 1e6:.2f} us/request (sampled)'
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Throughput benchmark of the parallel dump parsing
+by count of the worker processes.
+
+Words are iterated end to end (``iter_words`` - parsed in the workers and rebuilt in the current process),
+serialized words (``iter_payloads``) are measured separately.
+CPU time of the current process per word bounds throughput of ``iter_words`` however many workers are used.
+
+Run:
+::
+
+    $ python benchmarks/parallel_parsing_benchmark.py
+"""
+
+import json
+import os
+import tempfile
+import time
+
+from freedictionaryapi.dumps import (
+    DumpReader,
+    ParallelDumpParser
+)
+
+from corpus import generate_corpus
+
+
+CORPUS_SIZE = 100_000
+
+
+def write_dump(path: str) -> None:
+    with open(path, 'w', encoding='utf-8') as file:
+        for response in generate_corpus(CORPUS_SIZE):
+            file.write(json.dumps(response))
+            file.write('\n')
+
+
+def measure(name: str, iter_words, iter_payloads=None) -> None:
+    started_at = time.perf_counter()
+    cpu_started_at = time.process_time()
+    count = sum(1 for word in iter_words() if word.word)
+    cpu_elapsed = time.process_time() - cpu_started_at
+    elapsed = time.perf_counter() - started_at
+
+    line = f'{name:<22} words: {count / elapsed:10.0f} words/s ({cpu_elapsed / count * 1e6:5.1f} us/word of CPU)'
+
+    if iter_payloads is not None:
+        started_at = time.perf_counter()
+        count = sum(1 for _ in iter_payloads())
+        elapsed = time.perf_counter() - started_at
+
+        line += f'   payloads: {count / elapsed:10.0f} words/s'
+
+    print(line)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'dump.jsonl')
+        write_dump(path)
+
+        print(f'Dump: {CORPUS_SIZE} responses, {os.path.getsize(path) / 2 ** 20:.1f} MiB')
+
+        measure('sequential reader', DumpReader(path).iter_words)
+
+        workers = 1
+        while workers <= (os.cpu_count() or 1):
+            parser = ParallelDumpParser(path, workers=workers, range_size=1 << 20)
+
+            measure(f'parallel, {workers} workers', parser.iter_words, parser.iter_payloads)
+
+            workers *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Round-trip benchmark of the parsed words serialization:
+compact binary form (``Word.to_bytes`` / ``Word.from_bytes``) and pickling
+against JSON.
+
+Binary form (storage format) is smaller than JSON and is faster to decode,
+pickling (``Word.__reduce__`` passes the data) is the fastest one (used to pass words between processes).
+
+Run:
+::
+
+    $ python benchmarks/serialization_benchmark.py
+"""
+
+import json
+import pickle
+import timeit
+
+from freedictionaryapi.types import Word
+
+from corpus import generate_corpus
+
+
+CORPUS_SIZE = 2_000
+REPEAT = 5
+
+
+def measure(name: str, dump, load, words) -> None:
+    payloads = [dump(word) for word in words]
+    size = sum(len(payload) for payload in payloads)
+
+    dump_time = min(timeit.repeat(lambda: [dump(word) for word in words], number=1, repeat=REPEAT))
+    load_time = min(timeit.repeat(lambda: [load(payload) for payload in payloads], number=1, repeat=REPEAT))
+
+    assert [load(payload) for payload in payloads] == words
+
+    print(
+        f'{name:<22} size: {size / len(words):8.1f} B/word   '
+        f'dump: {dump_time / len(words) * 1e6:6.2f} us/word   '
+        f'load: {load_time / len(words) * 1e6:6.2f} us/word'
+    )
+
+
+def main():
+    words = [Word(response[0]) for response in generate_corpus(CORPUS_SIZE)]
+
+    print(f'Corpus: {CORPUS_SIZE} words')
+
+    measure(
+        'JSON',
+        lambda word: json.dumps(word.data, ensure_ascii=False).encode('utf-8'),
+        lambda payload: Word(json.loads(payload)),
+        words
+    )
+    measure('binary (to/from_bytes)', Word.to_bytes, Word.from_bytes, words)
+    measure('pickle (dict data)', lambda word: pickle.dumps(word.data), lambda payload: Word(pickle.loads(payload)), words)
+    measure('pickle (Word)', pickle.dumps, pickle.loads, words)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark of the API URL generating.
+
+URLs are generated for the synthetic words (part of them is non-ASCII):
+
+    - with :obj:`ApiUrl` (object per URL);
+    - with :meth:`UrlBuilder.build` for the hot words (memoized);
+    - with :meth:`UrlBuilder.build_many` for the unique words (batch job).
+
+Run:
+::
+
+    $ python benchmarks/url_benchmark.py
+"""
+
+import logging
+import time
+
+from freedictionaryapi.languages import LanguageCodes
+from freedictionaryapi.urls import (
+    ApiUrl,
+    UrlBuilder
+)
+
+
+WORDS_COUNT = 200_000
+HOT_WORDS_COUNT = 1_000
+
+
+def measure(name: str, function) -> None:
+    started_at = time.perf_counter()
+    count = function()
+    per_url = (time.perf_counter() - started_at) / count
+
+    print(f'{name:<32} {per_url * 1e9:8.0f} ns/URL  ({1 / per_url / 1e6:5.2f} M URLs/s)')
+
+
+def main():
+    logging.getLogger('freedictionaryapi').setLevel(logging.WARNING)
+
+    words = [f'word{index}' if index % 4 else f'palavra{index}ção' for index in range(WORDS_COUNT)]
+    hot_words = [words[index % HOT_WORDS_COUNT] for index in range(WORDS_COUNT)]
+    language_code = LanguageCodes.BRAZILIAN_PORTUGUESE
+
+    print(f'Words: {WORDS_COUNT} (hot words: {HOT_WORDS_COUNT})')
+
+    measure('ApiUrl (unique words)', lambda: len([
+        ApiUrl(word, language_code=language_code).get_url() for word in words
+    ]))
+
+    builder = UrlBuilder()
+    measure('UrlBuilder.build (hot words)', lambda: len([
+        builder.build(word, language_code) for word in hot_words
+    ]))
+
+    measure('UrlBuilder.build_many (unique)', lambda: len(list(
+        UrlBuilder().build_many(words, language_code)
+    )))
+
+
+if __name__ == '__main__':
+    main()
@@ -2,45 +2,159 @@
 Implements convenient API wrapper for Free Dictionary API.
     - WEB:    [https://dictionaryapi.dev/]
     - Github: [https://github.com/meetDeveloper/freeDictionaryAPI]
+
+Package is loaded lazily: subpackages, modules and classes below
+are imported on first access (so ``import freedictionaryapi`` is fast),
+ready to use clients import their HTTP libraries (``httpx``, ``aiohttp``) only on first use.
 """
 
-from . import (
-    clients,
-    parsers,
-    types,
-    errors,
-    languages,
-    urls
-)
-from .errors import DictionaryApiError
-from .languages import LanguageCodes
-from .parsers import (
-    DictionaryApiParser,
-    DictionaryApiErrorParser
-)
-from .urls import ApiUrl
+import importlib
+import sys
 
 
 __all__ = [
     # packages
+    'audio',
     'clients',
+    'dumps',
     'parsers',
     'types',
     # modules
+    'caching',
+    'canonical',
+    'deadlines',
     'errors',
+    'eviction',
+    'filters',
+    'interning',
     'languages',
+    'logs',
+    'metrics',
+    'prefetching',
+    'results',
     'urls',
     # classes
+    # # ready to use clients (require external dependencies)
+    'AsyncDictionaryApiClient',
+    'DictionaryApiClient',
     # # parsers
     'DictionaryApiParser',
     'DictionaryApiErrorParser',
     # # supported languages
     'LanguageCodes',
-    # # API url generator
+    # # canonical key of the word lookup
+    'get_canonical_key',
+    # # API url generators
     'ApiUrl',
+    'UrlBuilder',
     # # Common error
-    'DictionaryApiError'
+    'DictionaryApiError',
+    # # filter of the missing words
+    'MissingWordsFilter',
+    # # string interning pool
+    'StringPool',
+    # # lookup result
+    'LookupResult',
+    'LookupTimings',
+    'WarmupProgress',
+    # # metrics of the requests
+    'ClientMetrics',
+    # # cache of the API responses
+    'EvictionPolicy',
+    'ResponseCache',
+    # # speculative prefetch of the synonyms
+    'PrefetchPolicy',
+    # # deadline of the lookups
+    'Deadline'
 ]
 
 
 __version__ = '0.9.10'
+
+
+# attribute -> (module that attribute is imported from, name in the module or ``None`` for module itself)
+_LAZY_ATTRIBUTES = {
+    # packages
+    'audio': ('.audio', None),
+    'clients': ('.clients', None),
+    'dumps': ('.dumps', None),
+    'parsers': ('.parsers', None),
+    'types': ('.types', None),
+    # modules
+    'caching': ('.caching', None),
+    'canonical': ('.canonical', None),
+    'deadlines': ('.deadlines', None),
+    'errors': ('.errors', None),
+    'eviction': ('.eviction', None),
+    'filters': ('.filters', None),
+    'interning': ('.interning', None),
+    'languages': ('.languages', None),
+    'logs': ('.logs', None),
+    'metrics': ('.metrics', None),
+    'prefetching': ('.prefetching', None),
+    'results': ('.results', None),
+    'urls': ('.urls', None),
+    # classes
+    'AsyncDictionaryApiClient': ('.clients.async_client', 'AsyncDictionaryApiClient'),
+    'DictionaryApiClient': ('.clients.sync_client', 'DictionaryApiClient'),
+    'DictionaryApiParser': ('.parsers', 'DictionaryApiParser'),
+    'DictionaryApiErrorParser': ('.parsers', 'DictionaryApiErrorParser'),
+    'LanguageCodes': ('.languages', 'LanguageCodes'),
+    'get_canonical_key': ('.canonical', 'get_canonical_key'),
+    'ApiUrl': ('.urls', 'ApiUrl'),
+    'UrlBuilder': ('.urls', 'UrlBuilder'),
+    'DictionaryApiError': ('.errors', 'DictionaryApiError'),
+    'MissingWordsFilter': ('.filters', 'MissingWordsFilter'),
+    'StringPool': ('.interning', 'StringPool'),
+    'LookupResult': ('.results', 'LookupResult'),
+    'LookupTimings': ('.results', 'LookupTimings'),
+    'WarmupProgress': ('.results', 'WarmupProgress'),
+    'ClientMetrics': ('.metrics', 'ClientMetrics'),
+    'EvictionPolicy': ('.caching', 'EvictionPolicy'),
+    'ResponseCache': ('.caching', 'ResponseCache'),
+    'PrefetchPolicy': ('.prefetching', 'PrefetchPolicy'),
+    'Deadline': ('.deadlines', 'Deadline'),
+}
+
+
+def __getattr__(name: str):
+    """
+    Import attribute of the package on first access (PEP 562).
+
+    :param name: name of the attribute
+    :type name: :obj:`str`
+
+    :return: imported subpackage, module or class
+    :rtype: :obj:`Any`
+
+    :raise:
+        :AttributeError: if package has no such attribute
+        :ImportError: if HTTP library of the ready to use client is not installed
+    """
+
+    try:
+        module_name, attribute_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+    module = importlib.import_module(module_name, __name__)
+    value = module if attribute_name is None else getattr(module, attribute_name)
+
+    # next accesses do not go through ``__getattr__``
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
+
+
+if sys.version_info < (3, 7):
+    # module ``__getattr__`` is not supported - attributes are imported eagerly
+    for _name in __all__:
+        try:
+            __getattr__(_name)
+        except ImportError:
+            # HTTP library of the ready to use client is not installed
+            pass
@@ -0,0 +1,32 @@
+"""
+Contains tools for downloading of the pronunciation audio.
+
+Audio (links of :attr:`Phonetic.audio`) is downloaded concurrently
+in the content-addressed on-disk cache.
+
+Available as synchronous as asynchronous downloaders
+that work on-top of the same HTTP libraries as clients:
+
+    - ``httpx`` - :obj:`freedictionaryapi.audio.sync_downloader.AudioDownloader`;
+    - ``aiohttp`` - :obj:`freedictionaryapi.audio.async_downloader.AsyncAudioDownloader`.
+"""
+
+from .base_downloader import (
+    AudioDownloadError,
+    BaseAudioDownloader,
+    get_audio_urls
+)
+from .cache import AudioCache
+
+# modules require external dependencies !!!!!!!!!!!!!!!
+# from .async_downloader import AsyncAudioDownloader
+# from .sync_downloader import AudioDownloader
+# !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+
+
+__all__ = [
+    'AudioCache',
+    'AudioDownloadError',
+    'BaseAudioDownloader',
+    'get_audio_urls'
+]
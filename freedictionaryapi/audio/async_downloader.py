@@ -0,0 +1,172 @@
+"""
+Contains asynchronous downloader of the pronunciation audio.
+
+FOR WORK REQUIRE ``aiohttp`` PACKAGE TO BE INSTALLED.
+
+.. class:: AsyncAudioDownloader(BaseAudioDownloader)
+"""
+
+import asyncio
+import logging
+import pathlib
+import typing
+
+import aiohttp
+
+from .base_downloader import BaseAudioDownloader
+from .cache import AudioCache
+
+
+__all__ = ['AsyncAudioDownloader']
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAudioDownloader(BaseAudioDownloader):
+    """
+    Implements asynchronous downloader of the pronunciation audio.
+
+    **Based** on :obj:`aiohttp.ClientSession` (session of the :obj:`AsyncDictionaryApiClient` might be shared).
+
+    At most ``concurrency`` downloads are in flight,
+    download of the same URL that is already in flight is not repeated but awaited.
+    """
+
+    def __init__(self, cache: AudioCache, *,
+                 session: typing.Optional[aiohttp.ClientSession] = None,
+                 **kwargs
+                 ) -> None:
+        """
+        Init asynchronous audio downloader instance.
+
+        :param cache: cache that audio is downloaded in
+        :type cache: :obj:`AudioCache`
+        :keyword session: ``aiohttp`` session to make HTTP requests asynchronously
+        :type session: :obj:`Optional[aiohttp.ClientSession]`
+        :keyword kwargs: options of the base downloader (see :meth:`BaseAudioDownloader.__init__`)
+
+        :raise:
+            :TypeError:
+                - if ``cache`` is not an instance of :obj:`AudioCache`
+                - if ``session`` is not an instance of :obj:`aiohttp.ClientSession`
+        """
+
+        super().__init__(cache, **kwargs)
+
+        if session:
+            self._session = session
+
+            if not isinstance(session, aiohttp.ClientSession):
+                message = (
+                    'For `session` has been passed object with unsupported type. '
+                    'Expected to get argument with type <aiohttp.ClientSession>! '
+                    f'Got (session={self._session!r})'
+                )
+                raise TypeError(message)
+        else:
+            self._session = aiohttp.ClientSession()
+
+        # semaphore is created lazily - within the running event loop
+        self._slots: typing.Optional[asyncio.Semaphore] = None
+        self._in_flight: typing.Dict[str, asyncio.Future] = {}
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """
+        :return: session used for making HTTP requests
+        :rtype: :obj:`aiohttp.ClientSession`
+        """
+
+        return self._session
+
+    async def __aenter__(self) -> 'AsyncAudioDownloader':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def download(self, url: str) -> pathlib.Path:
+        """
+        Download audio in the cache (if it is not cached).
+
+        :param url: audio URL
+        :type url: :obj:`str`
+
+        :return: path of the cached audio
+        :rtype: :obj:`pathlib.Path`
+
+        :raise:
+            :AudioDownloadError: if server responded with unexpected status
+        """
+
+        cached_path = self._get_cached_path(url)
+
+        if cached_path is not None:
+            return cached_path
+
+        download = self._in_flight.get(url)
+
+        if download is None:
+            download = self._in_flight[url] = asyncio.ensure_future(self._download(url))
+            download.add_done_callback(lambda _: self._in_flight.pop(url, None))
+
+        # cancellation of the one waiter does not cancel download for the others
+        return await asyncio.shield(download)
+
+    async def download_many(self, urls: typing.Iterable[str], *,
+                            return_exceptions: bool = False
+                            ) -> typing.Dict[str, typing.Union[pathlib.Path, Exception]]:
+        """
+        Download audio in the cache concurrently (duplicates are downloaded once).
+
+        :param urls: audio URLs
+        :type urls: :obj:`Iterable[str]`
+        :keyword return_exceptions: whether to return errors instead of raising the first one
+        :type return_exceptions: :obj:`bool`
+
+        :return: paths of the cached audio (or errors) by URLs
+        :rtype: :obj:`dict[str, Union[pathlib.Path, Exception]]`
+
+        :raise:
+            :AudioDownloadError: if server responded with unexpected status (and errors are not returned)
+        """
+
+        unique_urls = list(dict.fromkeys(urls))
+        paths = await asyncio.gather(*(self.download(url) for url in unique_urls), return_exceptions=return_exceptions)
+
+        return dict(zip(unique_urls, paths))
+
+    async def close(self) -> None:
+        """
+        Close audio downloader.
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        await self._session.close()
+
+    async def _download(self, url: str) -> pathlib.Path:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self._concurrency)
+
+        async with self._slots:
+            headers = self._get_request_headers(url)
+
+            async with self._session.get(url, headers=headers) as response:
+                offset = self._get_write_offset(url, response.status, response.headers)
+
+                if offset is None:
+                    return self._cache.get_path(url)
+
+                # chunks are small, so blocking writes do not stall event loop noticeably
+                with self._cache.open_partial(url, offset) as file:
+                    async for chunk in response.content.iter_chunked(self._chunk_size):
+                        file.write(chunk)
+
+        path = self._cache.commit(url)
+
+        logger.info(f'Audio {url!r} has been downloaded.')
+
+        return path
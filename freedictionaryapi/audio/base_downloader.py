@@ -0,0 +1,249 @@
+"""
+Contains base downloader of the pronunciation audio.
+
+.. exception:: AudioDownloadError(Exception)
+
+.. class:: BaseAudioDownloader
+
+.. function:: get_audio_urls(words: Iterable[Word]) -> list[str]
+"""
+
+from http import HTTPStatus
+import logging
+import pathlib
+import re
+import typing
+
+from .cache import AudioCache
+from ..types import Word
+
+
+__all__ = [
+    'AudioDownloadError',
+    'BaseAudioDownloader',
+    'get_audio_urls'
+]
+
+
+logger = logging.getLogger(__name__)
+
+
+_CONTENT_RANGE_START_PATTERN = re.compile(r'bytes\s+(\d+)-')
+
+
+class AudioDownloadError(Exception):
+    """
+    Error that raised if audio has not been downloaded
+    (server responded with unexpected status).
+    """
+
+    def __init__(self, url: str, status_code: int) -> None:
+        self.url = url
+        self.status_code = status_code
+
+        super().__init__(f'Audio {url!r} has not been downloaded: server responded with {status_code!r}.')
+
+
+def get_audio_urls(words: typing.Iterable[Word]) -> typing.List[str]:
+    """
+    Get unique links on audio with pronunciation of the words (in order of appearance).
+
+    Protocol-relative links (``//host/path.mp3``) are completed with ``https:``.
+
+    :param words: words
+    :type words: :obj:`Iterable[Word]`
+
+    :return: unique links on audio
+    :rtype: :obj:`list[str]`
+    """
+
+    urls: typing.Dict[str, None] = {}
+
+    for word in words:
+        for phonetic in word.phonetics:
+            url = phonetic.audio
+
+            if not url:
+                continue
+
+            if url.startswith('//'):
+                url = f'https:{url}'
+
+            urls[url] = None
+
+    return list(urls)
+
+
+class BaseAudioDownloader:
+    """
+    Implements base downloader of the pronunciation audio.
+
+    Logic of the downloading that does not depend on the HTTP transport:
+
+        - audio that is cached is not downloaded (or is revalidated with conditional request);
+        - interrupted download is resumed with ``Range`` request
+          (guarded by ``If-Range``, so changed audio is downloaded from the beginning);
+        - response body is streamed straight to the disk.
+
+    Inherited by ``sync`` and ``async`` downloaders.
+    """
+
+    def __init__(self, cache: AudioCache, *,
+                 concurrency: int = 8,
+                 chunk_size: int = 64 << 10,
+                 revalidate: bool = False
+                 ) -> None:
+        """
+        Init audio downloader instance.
+
+        :param cache: cache that audio is downloaded in
+        :type cache: :obj:`AudioCache`
+        :keyword concurrency: maximum count of the downloads in flight
+        :type concurrency: :obj:`int`
+        :keyword chunk_size: maximum size of the chunks (in bytes) that response body is read with (async downloader)
+        :type chunk_size: :obj:`int`
+        :keyword revalidate: whether to revalidate cached audio with conditional request
+        :type revalidate: :obj:`bool`
+
+        :raise:
+            :TypeError: if ``cache`` is not an instance of :obj:`AudioCache`
+            :ValueError: if ``concurrency`` or ``chunk_size`` is not positive
+        """
+
+        if not isinstance(cache, AudioCache):
+            message = (
+                'For `cache` has been passed object with unsupported type. '
+                'Expected to get argument with type `freedictionaryapi.audio.AudioCache`! '
+                f'Got (cache={cache!r})'
+            )
+            raise TypeError(message)
+
+        if concurrency <= 0 or chunk_size <= 0:
+            message = (
+                '`concurrency` and `chunk_size` arguments have to be positive. '
+                f'Got (concurrency={concurrency!r}, chunk_size={chunk_size!r}).'
+            )
+            raise ValueError(message)
+
+        self._cache = cache
+        self._concurrency = concurrency
+        self._chunk_size = chunk_size
+        self._revalidate = revalidate
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f'{class_name}(cache={self._cache!r}, concurrency={self._concurrency!r})'
+
+    @property
+    def cache(self) -> AudioCache:
+        """
+        :return: cache that audio is downloaded in
+        :rtype: :obj:`AudioCache`
+        """
+
+        return self._cache
+
+    def _get_cached_path(self, url: str) -> typing.Optional[pathlib.Path]:
+        """
+        Get path of the cached audio if it does not need to be requested.
+
+        :param url: audio URL
+        :type url: :obj:`str`
+
+        :return: path of the cached audio or ``None`` if request is needed
+        :rtype: :obj:`Optional[pathlib.Path]`
+        """
+
+        if self._revalidate:
+            return None
+
+        return self._cache.get(url)
+
+    def _get_request_headers(self, url: str) -> typing.Dict[str, str]:
+        """
+        Get headers of the audio request (conditional or range one).
+
+        :param url: audio URL
+        :type url: :obj:`str`
+
+        :return: request headers
+        :rtype: :obj:`dict[str, str]`
+        """
+
+        headers = {}
+
+        if url in self._cache:
+            # revalidation of the cached audio
+            metadata = self._cache.get_metadata(url)
+
+            if metadata.get('etag'):
+                headers['If-None-Match'] = metadata['etag']
+            if metadata.get('last_modified'):
+                headers['If-Modified-Since'] = metadata['last_modified']
+
+            return headers
+
+        partial_size = self._cache.get_partial_size(url)
+
+        if partial_size:
+            metadata = self._cache.get_metadata(url, is_partial=True)
+            # resuming is safe only if it is known that audio has not been changed
+            validator = metadata.get('etag') or metadata.get('last_modified')
+
+            if validator:
+                headers['Range'] = f'bytes={partial_size}-'
+                headers['If-Range'] = validator
+
+        return headers
+
+    def _get_write_offset(self, url: str, status_code: int,
+                          headers: typing.Mapping[str, str]
+                          ) -> typing.Optional[int]:
+        """
+        Get offset to write response body from (and save validators of the response).
+
+        :param url: audio URL
+        :type url: :obj:`str`
+        :param status_code: response status code
+        :type status_code: :obj:`int`
+        :param headers: response headers
+        :type headers: :obj:`Mapping[str, str]`
+
+        :return: offset to write response body from or ``None`` if cached audio is not modified
+        :rtype: :obj:`Optional[int]`
+
+        :raise:
+            :AudioDownloadError: if server responded with unexpected status
+        """
+
+        if status_code == HTTPStatus.NOT_MODIFIED and url in self._cache:
+            logger.debug(f'Cached audio {url!r} is not modified.')
+            return None
+
+        if status_code == HTTPStatus.PARTIAL_CONTENT:
+            match = _CONTENT_RANGE_START_PATTERN.match(headers.get('Content-Range', ''))
+            offset = None if match is None else int(match.group(1))
+
+            if offset != self._cache.get_partial_size(url):
+                # server sent other range than requested one
+                raise AudioDownloadError(url, status_code)
+
+            logger.debug(f'Download of the audio {url!r} is resumed from {offset!r} byte.')
+
+            return offset
+
+        if status_code != HTTPStatus.OK:
+            if status_code == HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE:
+                # partially downloaded audio is broken - it will be downloaded from the beginning next time
+                self._cache.remove(url)
+
+            raise AudioDownloadError(url, status_code)
+
+        self._cache.set_metadata(
+            url,
+            etag=headers.get('ETag'),
+            last_modified=headers.get('Last-Modified'),
+            is_partial=True
+        )
+
+        return 0
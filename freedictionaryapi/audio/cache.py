@@ -0,0 +1,293 @@
+"""
+Contains content-addressed on-disk cache of the pronunciation audio.
+
+.. class:: AudioCache
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import re
+import typing
+from urllib.parse import urlsplit
+
+
+__all__ = ['AudioCache']
+
+
+logger = logging.getLogger(__name__)
+
+
+_SUFFIX_PATTERN = re.compile(r'\.[A-Za-z0-9]{1,8}$')
+
+
+class AudioCache:
+    """
+    Implements content-addressed on-disk cache of the pronunciation audio.
+
+    File is addressed by hash of its URL:
+    ::
+
+        <directory>/<first 2 chars of hash>/<hash>.mp3        - downloaded audio
+        <directory>/<first 2 chars of hash>/<hash>.mp3.part   - partially downloaded audio
+        <directory>/<first 2 chars of hash>/<hash>.mp3.json   - metadata (URL, validators, size)
+        <directory>/<first 2 chars of hash>/<hash>.mp3.part.json - metadata of the partially downloaded audio
+
+    Audio is downloaded in the ``.part`` file and atomically renamed when it is complete,
+    so cached audio is never truncated.
+    Validators (``ETag``, ``Last-Modified``) of the response are kept in metadata
+    for conditional revalidation and for resuming of the interrupted downloads.
+    """
+
+    def __init__(self, directory: typing.Union[str, os.PathLike]) -> None:
+        """
+        Init audio cache instance.
+
+        Directory is created if it does not exist.
+
+        :param directory: directory of the cache
+        :type directory: :obj:`Union[str, os.PathLike]`
+        """
+
+        self._directory = pathlib.Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f'{class_name}(directory={str(self._directory)!r})'
+
+    def __contains__(self, url: str) -> bool:
+        return self.get_path(url).is_file()
+
+    @property
+    def directory(self) -> pathlib.Path:
+        """
+        :return: directory of the cache
+        :rtype: :obj:`pathlib.Path`
+        """
+
+        return self._directory
+
+    @staticmethod
+    def get_key(url: str) -> str:
+        """
+        Get key (hash) of the audio URL.
+
+        :param url: audio URL
+        :type url: :obj:`str`
+
+        :return: key of the audio URL
+        :rtype: :obj:`str`
+        """
+
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def get_path(self, url: str) -> pathlib.Path:
+        """
+        Get path of the cached audio (file might not exist).
+
+        :param url: audio URL
+        :type url: :obj:`str`
+
+        :return: path of the cached audio
+        :rtype: :obj:`pathlib.Path`
+        """
+
+        key = self.get_key(url)
+        suffix_match = _SUFFIX_PATTERN.search(urlsplit(url).path)
+        suffix = '' if suffix_match is None else suffix_match.group().lower()
+
+        return self._directory / key[:2] / f'{key}{suffix}'
+
+    def get_partial_path(self, url: str) -> pathlib.Path:
+        """
+        Get path of the partially downloaded audio (file might not exist).
+
+        :param url: audio URL
+        :type url: :obj:`str`
+
+        :return: path of the partially downloaded audio
+        :rtype: :obj:`pathlib.Path`
+        """
+
+        path = self.get_path(url)
+
+        return path.with_name(f'{path.name}.part')
+
+    def get(self, url: str) -> typing.Optional[pathlib.Path]:
+        """
+        Get path of the cached audio.
+
+        :param url: audio URL
+        :type url: :obj:`str`
+
+        :return: path of the cached audio or ``None`` if audio is not cached
+        :rtype: :obj:`Optional[pathlib.Path]`
+        """
+
+        path = self.get_path(url)
+
+        return path if path.is_file() else None
+
+    def get_partial_size(self, url: str) -> int:
+        """
+        Get size of the partially downloaded audio.
+
+        :param url: audio URL
+        :type url: :obj:`str`
+
+        :return: size of the partially downloaded audio in bytes (0 if there is no one)
+        :rtype: :obj:`int`
+        """
+
+        try:
+            return self.get_partial_path(url).stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def get_metadata(self, url: str, *, is_partial: bool = False) -> typing.Dict[str, typing.Any]:
+        """
+        Get metadata of the (partially) downloaded audio.
+
+        :param url: audio URL
+        :type url: :obj:`str`
+        :keyword is_partial: whether to get metadata of the partially downloaded audio
+        :type is_partial: :obj:`bool`
+
+        :return: metadata (``url``, ``etag``, ``last_modified``, ``size``) or empty dictionary
+        :rtype: :obj:`dict[str, Any]`
+        """
+
+        try:
+            with open(self._get_metadata_path(url, is_partial), 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def set_metadata(self, url: str, *,
+                     etag: typing.Optional[str] = None,
+                     last_modified: typing.Optional[str] = None,
+                     size: typing.Optional[int] = None,
+                     is_partial: bool = False
+                     ) -> None:
+        """
+        Set metadata of the (partially) downloaded audio (atomically).
+
+        :param url: audio URL
+        :type url: :obj:`str`
+        :keyword etag: ``ETag`` header of the response
+        :type etag: :obj:`Optional[str]`
+        :keyword last_modified: ``Last-Modified`` header of the response
+        :type last_modified: :obj:`Optional[str]`
+        :keyword size: size of the audio in bytes (if it is known)
+        :type size: :obj:`Optional[int]`
+        :keyword is_partial: whether to set metadata of the partially downloaded audio
+        :type is_partial: :obj:`bool`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        metadata = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'size': size,
+        }
+
+        path = self._get_metadata_path(url, is_partial)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_name(f'{path.name}.tmp')
+
+        with open(temporary_path, 'w', encoding='utf-8') as file:
+            json.dump(metadata, file)
+
+        os.replace(temporary_path, path)
+
+    def open_partial(self, url: str, offset: int) -> typing.BinaryIO:
+        """
+        Open partially downloaded audio for writing from the offset.
+
+        :param url: audio URL
+        :type url: :obj:`str`
+        :param offset: offset to write from (0 - download is started from the beginning)
+        :type offset: :obj:`int`
+
+        :return: file opened for binary writing
+        :rtype: :obj:`BinaryIO`
+        """
+
+        path = self.get_partial_path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        if not offset:
+            return open(path, 'wb')
+
+        file = open(path, 'r+b')
+        file.seek(offset)
+        file.truncate()
+
+        return file
+
+    def commit(self, url: str) -> pathlib.Path:
+        """
+        Move completely downloaded audio in the cache (atomically).
+
+        :param url: audio URL
+        :type url: :obj:`str`
+
+        :return: path of the cached audio
+        :rtype: :obj:`pathlib.Path`
+        """
+
+        path = self.get_path(url)
+        os.replace(self.get_partial_path(url), path)
+
+        # validators of the partially downloaded audio become validators of the cached one
+        metadata = self.get_metadata(url, is_partial=True)
+        self.set_metadata(
+            url,
+            etag=metadata.get('etag'),
+            last_modified=metadata.get('last_modified'),
+            size=path.stat().st_size
+        )
+
+        try:
+            self._get_metadata_path(url, True).unlink()
+        except FileNotFoundError:
+            pass
+
+        logger.debug(f'Audio {url!r} has been cached: {str(path)!r}.')
+
+        return path
+
+    def remove(self, url: str) -> None:
+        """
+        Remove (partially) downloaded audio and its metadata from the cache.
+
+        :param url: audio URL
+        :type url: :obj:`str`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        paths = (
+            self.get_path(url),
+            self.get_partial_path(url),
+            self._get_metadata_path(url, False),
+            self._get_metadata_path(url, True),
+        )
+
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _get_metadata_path(self, url: str, is_partial: bool = False) -> pathlib.Path:
+        path = self.get_partial_path(url) if is_partial else self.get_path(url)
+
+        return path.with_name(f'{path.name}.json')
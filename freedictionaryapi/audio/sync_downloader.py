@@ -0,0 +1,198 @@
+"""
+Contains synchronous downloader of the pronunciation audio.
+
+FOR WORK REQUIRE ``httpx`` PACKAGE TO BE INSTALLED.
+
+.. class:: AudioDownloader(BaseAudioDownloader)
+"""
+
+import concurrent.futures
+import logging
+import pathlib
+import threading
+import typing
+
+import httpx
+
+from .base_downloader import BaseAudioDownloader
+from .cache import AudioCache
+
+
+__all__ = ['AudioDownloader']
+
+
+logger = logging.getLogger(__name__)
+
+
+class AudioDownloader(BaseAudioDownloader):
+    """
+    Implements synchronous downloader of the pronunciation audio.
+
+    **Based** on :obj:`httpx.Client` (client of the :obj:`DictionaryApiClient` might be shared).
+
+    Downloads are run in threads (at most ``concurrency`` at once),
+    download of the same URL that is already in flight is not repeated but awaited.
+    """
+
+    def __init__(self, cache: AudioCache, *,
+                 client: typing.Optional[httpx.Client] = None,
+                 **kwargs
+                 ) -> None:
+        """
+        Init synchronous audio downloader instance.
+
+        :param cache: cache that audio is downloaded in
+        :type cache: :obj:`AudioCache`
+        :keyword client: ``httpx`` client to make HTTP requests
+        :type client: :obj:`Optional[httpx.Client]`
+        :keyword kwargs: options of the base downloader (see :meth:`BaseAudioDownloader.__init__`)
+
+        :raise:
+            :TypeError:
+                - if ``cache`` is not an instance of :obj:`AudioCache`
+                - if ``client`` is not an instance of :obj:`httpx.Client`
+        """
+
+        super().__init__(cache, **kwargs)
+
+        if client:
+            self._client = client
+
+            if not isinstance(self._client, httpx.Client):
+                message = (
+                    'For `client` has been passed object with unsupported type. '
+                    'Expected to get argument with type <httpx.Client>! '
+                    f'Got (client={self._client!r})'
+                )
+                raise TypeError(message)
+        else:
+            self._client = httpx.Client()
+
+        self._slots = threading.Semaphore(self._concurrency)
+        self._lock = threading.Lock()
+        self._in_flight: typing.Dict[str, concurrent.futures.Future] = {}
+
+    @property
+    def client(self) -> httpx.Client:
+        """
+        :return: client used for making HTTP requests
+        :rtype: :obj:`httpx.Client`
+        """
+
+        return self._client
+
+    def __enter__(self) -> 'AudioDownloader':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def download(self, url: str) -> pathlib.Path:
+        """
+        Download audio in the cache (if it is not cached).
+
+        :param url: audio URL
+        :type url: :obj:`str`
+
+        :return: path of the cached audio
+        :rtype: :obj:`pathlib.Path`
+
+        :raise:
+            :AudioDownloadError: if server responded with unexpected status
+        """
+
+        cached_path = self._get_cached_path(url)
+
+        if cached_path is not None:
+            return cached_path
+
+        with self._lock:
+            future = self._in_flight.get(url)
+            is_owner = future is None
+
+            if is_owner:
+                future = self._in_flight[url] = concurrent.futures.Future()
+
+        if not is_owner:
+            # the same audio is downloaded by other thread
+            return future.result()
+
+        try:
+            with self._slots:
+                path = self._download(url)
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(path)
+            return path
+        finally:
+            with self._lock:
+                del self._in_flight[url]
+
+    def download_many(self, urls: typing.Iterable[str], *,
+                      return_exceptions: bool = False
+                      ) -> typing.Dict[str, typing.Union[pathlib.Path, Exception]]:
+        """
+        Download audio in the cache concurrently (duplicates are downloaded once).
+
+        :param urls: audio URLs
+        :type urls: :obj:`Iterable[str]`
+        :keyword return_exceptions: whether to return errors instead of raising the first one
+        :type return_exceptions: :obj:`bool`
+
+        :return: paths of the cached audio (or errors) by URLs
+        :rtype: :obj:`dict[str, Union[pathlib.Path, Exception]]`
+
+        :raise:
+            :AudioDownloadError: if server responded with unexpected status (and errors are not returned)
+        """
+
+        unique_urls = list(dict.fromkeys(urls))
+        paths: typing.Dict[str, typing.Union[pathlib.Path, Exception]] = {}
+
+        with concurrent.futures.ThreadPoolExecutor(self._concurrency) as executor:
+            futures = {url: executor.submit(self.download, url) for url in unique_urls}
+
+            for url, future in futures.items():
+                try:
+                    paths[url] = future.result()
+                except Exception as error:
+                    if not return_exceptions:
+                        for other_future in futures.values():
+                            other_future.cancel()
+                        raise
+
+                    paths[url] = error
+
+        return paths
+
+    def close(self) -> None:
+        """
+        Close audio downloader.
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        self._client.close()
+
+    def _download(self, url: str) -> pathlib.Path:
+        headers = self._get_request_headers(url)
+
+        with self._client.stream('GET', url, headers=headers) as response:
+            offset = self._get_write_offset(url, response.status_code, response.headers)
+
+            if offset is None:
+                return self._cache.get_path(url)
+
+            with self._cache.open_partial(url, offset) as file:
+                # chunks are written as soon as they are received
+                for chunk in response.iter_bytes():
+                    file.write(chunk)
+
+        path = self._cache.commit(url)
+
+        logger.info(f'Audio {url!r} has been downloaded.')
+
+        return path
@@ -0,0 +1,529 @@
+"""
+Contains cache of the API responses.
+
+.. class:: EvictionPolicy(enum.Enum)
+.. class:: CachedResponse
+.. class:: ResponseCache
+
+.. const:: CACHEABLE_STATUS_CODES
+"""
+
+import enum
+from http import HTTPStatus
+import threading
+import time
+import typing
+
+from .eviction import (
+    BaseEviction,
+    LruEviction,
+    TinyLfuEviction
+)
+
+
+__all__ = [
+    'EvictionPolicy',
+    'CachedResponse',
+    'ResponseCache',
+    'CACHEABLE_STATUS_CODES'
+]
+
+
+CACHEABLE_STATUS_CODES: typing.FrozenSet[int] = frozenset({
+    HTTPStatus.OK,
+    HTTPStatus.NOT_FOUND,
+})
+""" Status codes of the responses that are cached (definite answers of the API) """
+
+
+class EvictionPolicy(enum.Enum):
+    """
+    Enumerates eviction policies of the response cache.
+    """
+
+    LRU = 'lru'
+    """ The least recently used response is evicted (see :obj:`freedictionaryapi.eviction.LruEviction`) """
+    TINY_LFU = 'tinylfu'
+    """
+    Frequency-aware eviction with admission (see :obj:`freedictionaryapi.eviction.TinyLfuEviction`):
+    one-off words do not flush out frequently requested ones
+    """
+
+
+_EVICTIONS: typing.Dict[EvictionPolicy, typing.Type[BaseEviction]] = {
+    EvictionPolicy.LRU: LruEviction,
+    EvictionPolicy.TINY_LFU: TinyLfuEviction,
+}
+
+
+class CachedResponse:
+    """
+    Implements entry of the response cache.
+
+    Entry is:
+
+        - fresh till soft expiration: it is returned as is;
+        - stale after soft expiration and till hard expiration:
+          it is returned immediately and refreshed in the background;
+        - expired after hard expiration: it is not returned at all (request blocks as without cache).
+
+    Validators of the response (``ETag``, ``Last-Modified``) are kept with it,
+    so entry is revalidated with conditional request (``304 Not Modified`` renews it without body transfer).
+    """
+
+    __slots__ = (
+        'url',
+        'status_code',
+        'response',
+        'stored_at',
+        'soft_expires_at',
+        'hard_expires_at',
+        'etag',
+        'last_modified',
+        'is_refreshing',
+        'refresh_failures',
+        'refresh_retry_at',
+    )
+
+    def __init__(self, url: str, status_code: int, response: typing.Any, *,
+                 stored_at: float,
+                 soft_expires_at: float,
+                 hard_expires_at: float,
+                 etag: typing.Optional[str] = None,
+                 last_modified: typing.Optional[str] = None
+                 ) -> None:
+        """
+        Init cached response instance.
+
+        :param url: URL of the API request
+        :type url: :obj:`str`
+        :param status_code: response status code
+        :type status_code: :obj:`int`
+        :param response: API response loaded in python object
+        :type response: :obj:`Any`
+        :keyword stored_at: time of the storing (by the clock of the cache)
+        :type stored_at: :obj:`float`
+        :keyword soft_expires_at: time after that entry is stale
+        :type soft_expires_at: :obj:`float`
+        :keyword hard_expires_at: time after that entry is expired
+        :type hard_expires_at: :obj:`float`
+        :keyword etag: ``ETag`` header of the response
+        :type etag: :obj:`Optional[str]`
+        :keyword last_modified: ``Last-Modified`` header of the response
+        :type last_modified: :obj:`Optional[str]`
+        """
+
+        self.url = url
+        self.status_code = status_code
+        self.response = response
+        self.stored_at = stored_at
+        self.soft_expires_at = soft_expires_at
+        self.hard_expires_at = hard_expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+        self.is_refreshing = False
+        self.refresh_failures = 0
+        self.refresh_retry_at = float('-inf')
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f'{class_name}(url={self.url!r}, status_code={self.status_code!r}, etag={self.etag!r})'
+
+    @property
+    def conditional_headers(self) -> typing.Dict[str, str]:
+        """
+        :return: headers of the conditional request that revalidates entry (empty if entry has no validators)
+        :rtype: :obj:`Dict[str, str]`
+        """
+
+        headers = {}
+
+        if self.etag is not None:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified is not None:
+            headers['If-Modified-Since'] = self.last_modified
+
+        return headers
+
+    def is_fresh(self, now: float) -> bool:
+        """
+        :param now: current time (by the clock of the cache)
+        :type now: :obj:`float`
+
+        :return: whether entry is not soft expired
+        :rtype: :obj:`bool`
+        """
+
+        return now < self.soft_expires_at
+
+    def is_expired(self, now: float) -> bool:
+        """
+        :param now: current time (by the clock of the cache)
+        :type now: :obj:`float`
+
+        :return: whether entry is hard expired
+        :rtype: :obj:`bool`
+        """
+
+        return now >= self.hard_expires_at
+
+
+class ResponseCache:
+    """
+    Implements cache of the API responses with soft and hard TTL (stale-while-revalidate).
+
+    Responses are cached by canonical key of the lookup (see :func:`freedictionaryapi.canonical.get_canonical_key`),
+    so variants of the word share the entry. Only definite answers are cached (see :const:`CACHEABLE_STATUS_CODES`).
+
+    If ``hard_ttl`` is greater than ``soft_ttl``, cache works in the stale-while-revalidate mode:
+    entry past its soft TTL is returned immediately and the single background refresh is scheduled by client,
+    so upstream latency is out of the hot path for the popular words.
+    Failed refresh keeps the stale entry and backs off exponentially (till hard expiration).
+
+    Hard expired entry with validators (``ETag``, ``Last-Modified``) is not returned
+    but is kept till eviction, so client revalidates it with conditional request.
+
+    Full cache evicts responses by its policy (see :obj:`EvictionPolicy`):
+    LRU by default or TinyLFU that keeps the hot working set when one-off words are looked up
+    (crawlers, batch jobs).
+
+    Cache is thread-safe: it might be shared between threads of the sync clients.
+    """
+
+    def __init__(self, capacity: int = 1024, *,
+                 soft_ttl: float = 3600.0,
+                 hard_ttl: typing.Optional[float] = None,
+                 refresh_backoff: float = 1.0,
+                 max_refresh_backoff: float = 60.0,
+                 eviction_policy: EvictionPolicy = EvictionPolicy.LRU,
+                 clock: typing.Callable[[], float] = time.monotonic
+                 ) -> None:
+        """
+        Init response cache instance.
+
+        :param capacity: maximum count of the cached responses
+        :type capacity: :obj:`int`
+        :keyword soft_ttl: time (in seconds) that entry is fresh for
+        :type soft_ttl: :obj:`float`
+        :keyword hard_ttl: time (in seconds) that entry might be returned for (stale after ``soft_ttl``),
+            ``soft_ttl`` if it is not passed (stale entries are not returned)
+        :type hard_ttl: :obj:`Optional[float]`
+        :keyword refresh_backoff: delay (in seconds) of the refresh retry after the first failure
+            (doubled on each next failure)
+        :type refresh_backoff: :obj:`float`
+        :keyword max_refresh_backoff: the longest delay of the refresh retry
+        :type max_refresh_backoff: :obj:`float`
+        :keyword eviction_policy: policy that responses are evicted by when cache is full
+        :type eviction_policy: :obj:`EvictionPolicy`
+        :keyword clock: clock of the cache (monotonic time in seconds)
+        :type clock: :obj:`Callable[[], float]`
+
+        :raise:
+            :TypeError: if ``eviction_policy`` is not an instance of :obj:`EvictionPolicy`
+            :ValueError: if capacity, TTLs or backoff are not consistent
+        """
+
+        if not isinstance(eviction_policy, EvictionPolicy):
+            message = (
+                'For `eviction_policy` has been passed object with unsupported type. '
+                'Expected to get argument with type `freedictionaryapi.caching.EvictionPolicy`! '
+                f'Got (eviction_policy={eviction_policy!r})'
+            )
+            raise TypeError(message)
+
+        if hard_ttl is None:
+            hard_ttl = soft_ttl
+
+        if not (capacity > 0 and 0 < soft_ttl <= hard_ttl and 0 < refresh_backoff <= max_refresh_backoff):
+            message = (
+                'Capacity, TTLs or backoff of the cache are not consistent. '
+                'Expected to get capacity > 0, 0 < soft_ttl <= hard_ttl, '
+                '0 < refresh_backoff <= max_refresh_backoff! '
+                f'Got (capacity={capacity!r}, soft_ttl={soft_ttl!r}, hard_ttl={hard_ttl!r}, '
+                f'refresh_backoff={refresh_backoff!r}, max_refresh_backoff={max_refresh_backoff!r}).'
+            )
+            raise ValueError(message)
+
+        self._capacity = capacity
+        self._soft_ttl = soft_ttl
+        self._hard_ttl = hard_ttl
+        self._refresh_backoff = refresh_backoff
+        self._max_refresh_backoff = max_refresh_backoff
+        self._eviction_policy = eviction_policy
+        self._clock = clock
+
+        self._entries: typing.Dict[str, CachedResponse] = {}
+        self._eviction = _EVICTIONS[eviction_policy](capacity)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return (
+            f'{class_name}(capacity={self._capacity!r}, '
+            f'soft_ttl={self._soft_ttl!r}, hard_ttl={self._hard_ttl!r}, eviction_policy={self._eviction_policy!r})'
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    @property
+    def capacity(self) -> int:
+        """
+        :return: maximum count of the cached responses
+        :rtype: :obj:`int`
+        """
+
+        return self._capacity
+
+    @property
+    def eviction_policy(self) -> EvictionPolicy:
+        """
+        :return: policy that responses are evicted by when cache is full
+        :rtype: :obj:`EvictionPolicy`
+        """
+
+        return self._eviction_policy
+
+    @property
+    def soft_ttl(self) -> float:
+        """
+        :return: time (in seconds) that entry is fresh for
+        :rtype: :obj:`float`
+        """
+
+        return self._soft_ttl
+
+    @property
+    def hard_ttl(self) -> float:
+        """
+        :return: time (in seconds) that entry might be returned for
+        :rtype: :obj:`float`
+        """
+
+        return self._hard_ttl
+
+    @property
+    def is_stale_while_revalidate(self) -> bool:
+        """
+        :return: whether stale entries are returned (and refreshed in the background)
+        :rtype: :obj:`bool`
+        """
+
+        return self._hard_ttl > self._soft_ttl
+
+    def now(self) -> float:
+        """
+        :return: current time by the clock of the cache
+        :rtype: :obj:`float`
+        """
+
+        return self._clock()
+
+    def get(self, key: str) -> typing.Optional[CachedResponse]:
+        """
+        Get cached response (fresh or stale), hard expired entry is removed.
+
+        :param key: canonical key of the lookup
+        :type key: :obj:`str`
+
+        :return: cached response or ``None`` if it is not cached or expired
+        :rtype: :obj:`Optional[CachedResponse]`
+        """
+
+        with self._lock:
+            # misses are recorded as well (frequency of the not cached keys matters for the admission)
+            self._eviction.record_access(key)
+
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            if entry.is_expired(self._clock()):
+                # entry without validators is useless for conditional revalidation
+                if not entry.conditional_headers:
+                    del self._entries[key]
+                    self._eviction.remove(key)
+
+                return None
+
+            return entry
+
+    def peek(self, key: str) -> typing.Optional[CachedResponse]:
+        """
+        Get cached response in any state (even hard expired), recency of the entry is not changed.
+
+        :param key: canonical key of the lookup
+        :type key: :obj:`str`
+
+        :return: cached response or ``None`` if it is not cached
+        :rtype: :obj:`Optional[CachedResponse]`
+        """
+
+        with self._lock:
+            return self._entries.get(key)
+
+    def set(self, key: str, url: str, status_code: int, response: typing.Any, *,
+            etag: typing.Optional[str] = None,
+            last_modified: typing.Optional[str] = None
+            ) -> bool:
+        """
+        Cache response (if its status code is cacheable), refresh state of the previous entry is reset.
+
+        :param key: canonical key of the lookup
+        :type key: :obj:`str`
+        :param url: URL of the API request
+        :type url: :obj:`str`
+        :param status_code: response status code
+        :type status_code: :obj:`int`
+        :param response: API response loaded in python object
+        :type response: :obj:`Any`
+        :keyword etag: ``ETag`` header of the response
+        :type etag: :obj:`Optional[str]`
+        :keyword last_modified: ``Last-Modified`` header of the response
+        :type last_modified: :obj:`Optional[str]`
+
+        :return: whether response has been cached (it is not cacheable or it is not admitted by the eviction policy)
+        :rtype: :obj:`bool`
+        """
+
+        if status_code not in CACHEABLE_STATUS_CODES:
+            return False
+
+        with self._lock:
+            now = self._clock()
+
+            entry = CachedResponse(
+                url, status_code, response,
+                stored_at=now,
+                soft_expires_at=now + self._soft_ttl,
+                hard_expires_at=now + self._hard_ttl,
+                etag=etag,
+                last_modified=last_modified
+            )
+
+            return self._store(key, entry)
+
+    def renew(self, key: str, entry: CachedResponse) -> None:
+        """
+        Renew entry that has been revalidated (API responded with ``304 Not Modified``):
+        it is fresh again and its refresh state is reset.
+
+        Entry is cached again (if it is admitted) if it has been evicted while it has been revalidated.
+
+        :param key: canonical key of the lookup
+        :type key: :obj:`str`
+        :param entry: revalidated entry
+        :type entry: :obj:`CachedResponse`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        with self._lock:
+            now = self._clock()
+
+            entry.stored_at = now
+            entry.soft_expires_at = now + self._soft_ttl
+            entry.hard_expires_at = now + self._hard_ttl
+            entry.is_refreshing = False
+            entry.refresh_failures = 0
+            entry.refresh_retry_at = float('-inf')
+
+            self._store(key, entry)
+
+    def _store(self, key: str, entry: CachedResponse) -> bool:
+        # lock is held by the caller
+        if key in self._entries:
+            self._entries[key] = entry
+            return True
+
+        self._entries[key] = entry
+
+        for evicted_key in self._eviction.add(key):
+            del self._entries[evicted_key]
+
+        return key in self._entries
+
+    def start_refresh(self, key: str) -> bool:
+        """
+        Mark stale entry as refreshing, so the only background refresh is scheduled for it.
+
+        :param key: canonical key of the lookup
+        :type key: :obj:`str`
+
+        :return: whether refresh should be scheduled
+            (entry is stale, it is not refreshing already and refresh is not backed off)
+        :rtype: :obj:`bool`
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            now = self._clock()
+
+            if (
+                    entry is None
+                    or entry.is_fresh(now)
+                    or entry.is_refreshing
+                    or now < entry.refresh_retry_at
+            ):
+                return False
+
+            entry.is_refreshing = True
+
+            return True
+
+    def fail_refresh(self, key: str) -> None:
+        """
+        Record failed refresh: stale entry is kept and next refresh is backed off.
+
+        :param key: canonical key of the lookup
+        :type key: :obj:`str`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return
+
+            # exponent is bounded, so backoff does not overflow on long outages
+            backoff = min(self._max_refresh_backoff, self._refresh_backoff * 2 ** min(entry.refresh_failures, 32))
+
+            entry.is_refreshing = False
+            entry.refresh_failures += 1
+            entry.refresh_retry_at = self._clock() + backoff
+
+    def invalidate(self, key: str) -> None:
+        """
+        Remove cached response.
+
+        :param key: canonical key of the lookup
+        :type key: :obj:`str`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._eviction.remove(key)
+
+    def clear(self) -> None:
+        """
+        Remove all cached responses.
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._eviction.clear()
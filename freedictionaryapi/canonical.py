@@ -0,0 +1,105 @@
+"""
+Contains canonicalization of the searched words.
+
+.. function:: normalize_word(word: str) -> str
+.. function:: fold_word(word: str, language_code: LanguageCodes) -> str
+.. function:: get_canonical_key(word: str, language_code: LanguageCodes) -> str
+
+.. const:: CASE_SENSITIVE_LANGUAGES
+"""
+
+import functools
+import typing
+import unicodedata
+
+from .languages import LanguageCodes
+
+
+__all__ = [
+    'normalize_word',
+    'fold_word',
+    'get_canonical_key',
+    'CASE_SENSITIVE_LANGUAGES'
+]
+
+
+CASE_SENSITIVE_LANGUAGES: typing.FrozenSet[LanguageCodes] = frozenset({
+    # nouns are capitalized: "Essen" (food) and "essen" (to eat) are different words
+    LanguageCodes.GERMAN,
+})
+""" Languages which words are not case folded (case distinguishes words) """
+
+# Turkish has dotted and dotless I: "I" is upper "ı", "İ" is upper "i"
+_TURKISH_UPPER_I_TRANSLATION = str.maketrans({'I': 'ı', 'İ': 'i'})
+
+
+def normalize_word(word: str) -> str:
+    """
+    Normalize word without changing its meaning:
+    strip whitespaces and compose characters (Unicode NFC).
+
+    Normalized word is the one that is sent to the API (case is kept).
+
+    :param word: searched word
+    :type word: :obj:`str`
+
+    :return: normalized word
+    :rtype: :obj:`str`
+    """
+
+    return unicodedata.normalize('NFC', str(word).strip())
+
+
+def fold_word(word: str, language_code: LanguageCodes) -> str:
+    """
+    Normalize word (see :func:`normalize_word`) and fold its case by rules of the language.
+
+    Rules:
+
+        - Turkish: dotted and dotless I are lowered separately (``"I"`` -> ``"ı"``, ``"İ"`` -> ``"i"``);
+        - languages of the :const:`CASE_SENSITIVE_LANGUAGES`: case is kept;
+        - other languages: full Unicode case folding.
+
+    :param word: searched word
+    :type word: :obj:`str`
+    :param language_code: language of the searched word
+    :type language_code: :obj:`LanguageCodes`
+
+    :return: folded word
+    :rtype: :obj:`str`
+    """
+
+    word = normalize_word(word)
+
+    if language_code in CASE_SENSITIVE_LANGUAGES:
+        return word
+
+    if language_code is LanguageCodes.TURKISH:
+        folded_word = word.translate(_TURKISH_UPPER_I_TRANSLATION).lower()
+    else:
+        folded_word = word.casefold()
+
+    # folding might decompose characters ("İ" -> "i" + combining dot)
+    return unicodedata.normalize('NFC', folded_word)
+
+
+@functools.lru_cache(maxsize=4096)
+def get_canonical_key(word: str, language_code: LanguageCodes) -> str:
+    """
+    Get canonical key of the word lookup for caches, request coalescing and indexes.
+
+    Key is stable (the same across processes and runs):
+    variants of the word that differ only by surrounding whitespaces, Unicode composition
+    or case (where it does not matter) get the same key.
+    Keys of the hot words are memoized.
+
+    :param word: searched word
+    :type word: :obj:`str`
+    :param language_code: language of the searched word
+    :type language_code: :obj:`LanguageCodes`
+
+    :return: canonical key (like ``'en_US/hello'``)
+    :rtype: :obj:`str`
+    """
+
+    return f'{language_code.value}/{fold_word(word, language_code)}'
@@ -14,16 +14,14 @@ client works on-top of ``aiohttp``.
 Synchronous client is powered with ``httpx`.
 Since ``httpx`` is modern and powerful HTTP client:
 client works on-top of ``httpx``.
-"""
 
-from .base_client_interface import BaseDictionaryApiClientInterface
-from .base_async_client import BaseAsyncDictionaryApiClient
-from .base_sync_client import BaseDictionaryApiClient
+Package is loaded lazily: classes below are imported on first access,
+so the sync client does not import ``asyncio`` and the ready to use clients
+import their HTTP libraries only when they are used.
+"""
 
-# modules require external dependencies !!!!!!!!!!!!!!!
-# from .async_client import AsyncDictionaryApiClient
-# from .sync_client import DictionaryApiClient
-# !!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!
+import importlib
+import sys
 
 
 __all__ = [
@@ -33,4 +31,70 @@ __all__ = [
     # # that might be inherited manually
     'BaseAsyncDictionaryApiClient',
     'BaseDictionaryApiClient',
+    # ready to use clients (require external dependencies)
+    'AsyncDictionaryApiClient',
+    'DictionaryApiClient',
+    # load balancing across API mirrors
+    'MirrorPool',
+    # adaptive limiting of the requests in flight
+    'AdaptiveConcurrencyLimiter',
+    # scheduling of the async requests
+    'Priority',
+    'RequestScheduler',
 ]
+
+
+# attribute -> module that attribute is imported from
+_LAZY_ATTRIBUTES = {
+    'BaseDictionaryApiClientInterface': '.base_client_interface',
+    'BaseAsyncDictionaryApiClient': '.base_async_client',
+    'BaseDictionaryApiClient': '.base_sync_client',
+    'AsyncDictionaryApiClient': '.async_client',
+    'DictionaryApiClient': '.sync_client',
+    'MirrorPool': '.balancing',
+    'AdaptiveConcurrencyLimiter': '.limiting',
+    'Priority': '.scheduling',
+    'RequestScheduler': '.scheduling',
+}
+
+
+def __getattr__(name: str):
+    """
+    Import class of the package on first access (PEP 562).
+
+    :param name: name of the class
+    :type name: :obj:`str`
+
+    :return: imported class
+    :rtype: :obj:`type`
+
+    :raise:
+        :AttributeError: if package has no such attribute
+        :ImportError: if HTTP library of the ready to use client is not installed
+    """
+
+    try:
+        module_name = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+
+    # next accesses do not go through ``__getattr__``
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
+
+
+if sys.version_info < (3, 7):
+    # module ``__getattr__`` is not supported - classes are imported eagerly
+    for _name in __all__:
+        try:
+            __getattr__(_name)
+        except ImportError:
+            # HTTP library of the ready to use client is not installed
+            pass
@@ -6,7 +6,9 @@ FOR WORK REQUIRE ``aiohttp`` PACKAGE TO BE INSTALLED.
 .. class:: AsyncDictionaryApiClient(BaseDictionaryApiClient)
 """
 
+from http import HTTPStatus
 import logging
+import time
 import typing
 
 import aiohttp
@@ -32,7 +34,8 @@ class AsyncDictionaryApiClient(BaseAsyncDictionaryApiClient):
     """
 
     def __init__(self, default_language_code: LanguageCodes = DEFAULT_LANGUAGE_CODE, *,
-                 session: typing.Optional[aiohttp.ClientSession] = None
+                 session: typing.Optional[aiohttp.ClientSession] = None,
+                 **kwargs
                  ) -> None:
         """
         Init asynchronous dictionary API client instance.
@@ -41,6 +44,7 @@ class AsyncDictionaryApiClient(BaseAsyncDictionaryApiClient):
         :type default_language_code: :obj:`LanguageCodes`
         :keyword session: ``aiohttp`` session to make HTTP requests asynchronously
         :type session: :obj:`Optional[aiohttp.ClientSession]`
+        :keyword kwargs: options of the base client (see :meth:`BaseDictionaryApiClientInterface.__init__`)
 
         :raise:
             :TypeError:
@@ -48,7 +52,7 @@ class AsyncDictionaryApiClient(BaseAsyncDictionaryApiClient):
                 - if ``session`` is not an instance of :obj:`aiohttp.ClientSession`
         """
 
-        super().__init__(default_language_code)
+        super().__init__(default_language_code, **kwargs)
 
         if session:
             self._session = session
@@ -82,7 +86,9 @@ class AsyncDictionaryApiClient(BaseAsyncDictionaryApiClient):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
 
-    async def fetch_api_response(self, url: str) -> typing.Tuple[int, typing.Any]:
+    async def fetch_api_response(self, url: str, *,
+                                 headers: typing.Optional[typing.Mapping[str, str]] = None
+                                 ) -> typing.Tuple[int, typing.Any, typing.Mapping[str, str]]:
         """
         Fetch data of the API response.
 
@@ -90,19 +96,32 @@ class AsyncDictionaryApiClient(BaseAsyncDictionaryApiClient):
 
         :param url: url that is generated by input params in invoked function
         :type url: :obj:`str`
+        :keyword headers: headers of the conditional request
+        :type headers: :obj:`Optional[Mapping[str, str]]`
 
         :return: tuple of:
 
             - response status code;
-            - python object loaded from API response with JSON decoding.
-        :rtype: :obj:`tuple[int, Any]`
+            - python object loaded from API response with JSON decoding;
+            - response headers.
+        :rtype: :obj:`tuple[int, Any, Mapping[str, str]]`
         """
 
-        async with self._session.get(url) as response:
+        async with self._session.get(url, headers=headers) as response:
             response_status_code = response.status
+
+            if response_status_code == HTTPStatus.NOT_MODIFIED:
+                # response to the conditional request has no body
+                return (response_status_code, None, response.headers)
+
+            body = await response.read()
+
+            # body has been already read, so only JSON decoding is timed
+            decoding_started_at = time.perf_counter()
             json_response = await response.json()
+            self._record_response_body(len(body), decoding_started_at)
 
-        data_of_the_api_response = (response_status_code, json_response)
+        data_of_the_api_response = (response_status_code, json_response, response.headers)
 
         return data_of_the_api_response
 
@@ -114,6 +133,9 @@ class AsyncDictionaryApiClient(BaseAsyncDictionaryApiClient):
         :rtype: :obj:`None`
         """
 
+        # background refreshes of the cached responses and prefetches still use HTTP session
+        await self.cancel_prefetches()
+        await self.wait_for_refreshes()
         await self._session.close()
 
         logger.info('Client has been closed.')
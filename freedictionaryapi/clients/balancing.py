@@ -0,0 +1,275 @@
+"""
+Contains latency-aware load balancing across API mirrors.
+
+.. class:: MirrorPool
+"""
+
+import logging
+import random
+import threading
+import time
+import typing
+
+
+__all__ = ['MirrorPool']
+
+
+logger = logging.getLogger(__name__)
+
+
+class _Mirror:
+    """ State of the one API mirror """
+
+    __slots__ = (
+        'base_url',
+        'latency',
+        'in_flight_count',
+        'failures_count',
+        'unhealthy_until',
+        'requests_count',
+        'errors_count',
+    )
+
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url
+        # EWMA of the latency (``None`` - mirror has not been measured yet)
+        self.latency: typing.Optional[float] = None
+        self.in_flight_count = 0
+        # count of the consecutive failures
+        self.failures_count = 0
+        self.unhealthy_until = float('-inf')
+
+        self.requests_count = 0
+        self.errors_count = 0
+
+
+class MirrorPool:
+    """
+    Implements pool of the API mirrors (base URLs of the self-hosted freeDictionaryAPI instances)
+    with latency-aware load balancing, health tracking and failover.
+
+    Mirror for the request is chosen with power of two choices:
+    two random healthy mirrors are compared and the one with the lower load score
+    (EWMA of the latency multiplied by count of the requests in flight plus one) is chosen,
+    so load follows the fastest mirrors without herding on a single one.
+    Mirrors that have not been measured yet are probed first (with one request at once).
+
+    Health is tracked passively: mirror that failed ``failures_threshold`` times in a row
+    (errors, timeouts, 429 and 5xx responses) is ejected for ``cooldown`` seconds,
+    then it gets requests again and is ejected again on the first failure (until success).
+    If all mirrors are ejected, the one that is readmitted the soonest is used.
+
+    Pool is thread-safe: it might be shared between threads of the sync batch lookups.
+    """
+
+    def __init__(self, base_urls: typing.Sequence[str], *,
+                 smoothing: float = 0.3,
+                 failures_threshold: int = 3,
+                 cooldown: float = 30.0,
+                 seed: typing.Optional[int] = None
+                 ) -> None:
+        """
+        Init mirror pool instance.
+
+        :param base_urls: base URLs of the mirrors (like ``'http://dictionary.local:9000'``),
+            the first one is primary
+        :type base_urls: :obj:`Sequence[str]`
+        :keyword smoothing: weight of the new latency in the EWMA of the latency
+        :type smoothing: :obj:`float`
+        :keyword failures_threshold: count of the consecutive failures that mirror is ejected after
+        :type failures_threshold: :obj:`int`
+        :keyword cooldown: time (in seconds) that ejected mirror does not get requests
+        :type cooldown: :obj:`float`
+        :keyword seed: seed of the random choices (for reproducible choosing)
+        :type seed: :obj:`Optional[int]`
+
+        :raise:
+            :ValueError:
+                - if ``base_urls`` is empty or contains duplicates
+                - if parameters of the balancing are not consistent
+        """
+
+        base_urls = [str(base_url).rstrip('/') for base_url in base_urls]
+
+        if not base_urls or len(set(base_urls)) != len(base_urls):
+            message = (
+                '`base_urls` argument has been passed with empty value or with duplicates. '
+                'Expected to get non-empty sequence of the unique base URLs! '
+                f'Got (base_urls={base_urls!r}).'
+            )
+            raise ValueError(message)
+
+        if not (0 < smoothing <= 1 and failures_threshold > 0 and cooldown >= 0):
+            message = (
+                'Parameters of the balancing are not consistent. '
+                'Expected to get 0 < smoothing <= 1, failures_threshold > 0, cooldown >= 0! '
+                f'Got (smoothing={smoothing!r}, failures_threshold={failures_threshold!r}, cooldown={cooldown!r}).'
+            )
+            raise ValueError(message)
+
+        self._mirrors = {base_url: _Mirror(base_url) for base_url in base_urls}
+        self._smoothing = smoothing
+        self._failures_threshold = failures_threshold
+        self._cooldown = cooldown
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f'{class_name}(base_urls={self.base_urls!r})'
+
+    def __len__(self) -> int:
+        return len(self._mirrors)
+
+    @property
+    def base_urls(self) -> typing.List[str]:
+        """
+        :return: base URLs of the mirrors (the first one is primary)
+        :rtype: :obj:`list[str]`
+        """
+
+        return list(self._mirrors)
+
+    @property
+    def primary_base_url(self) -> str:
+        """
+        :return: base URL of the primary mirror
+        :rtype: :obj:`str`
+        """
+
+        return next(iter(self._mirrors))
+
+    @property
+    def stats(self) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Statistics of the mirrors:
+
+            * base_url - base URL of the mirror;
+            * is_healthy - whether mirror gets requests;
+            * latency - EWMA of the latency in seconds (``None`` if mirror has not been measured yet);
+            * in_flight - count of the requests in flight;
+            * requests - count of the finished requests;
+            * errors - count of the failed requests.
+
+        :return: statistics of the mirrors
+        :rtype: :obj:`list[dict[str, Any]]`
+        """
+
+        now = time.monotonic()
+
+        with self._lock:
+            return [
+                {
+                    'base_url': mirror.base_url,
+                    'is_healthy': mirror.unhealthy_until <= now,
+                    'latency': mirror.latency,
+                    'in_flight': mirror.in_flight_count,
+                    'requests': mirror.requests_count,
+                    'errors': mirror.errors_count,
+                }
+                for mirror in self._mirrors.values()
+            ]
+
+    def choose(self, exclude: typing.Collection[str] = ()) -> typing.Optional[str]:
+        """
+        Choose mirror for the request and count the request in flight.
+
+        Each choosing must be followed by :meth:`record` (or :meth:`release`) for the chosen mirror.
+
+        :param exclude: base URLs of the mirrors that must not be chosen (already tried ones)
+        :type exclude: :obj:`Collection[str]`
+
+        :return: base URL of the chosen mirror or ``None`` if all mirrors are excluded
+        :rtype: :obj:`Optional[str]`
+        """
+
+        now = time.monotonic()
+
+        with self._lock:
+            candidates = [mirror for mirror in self._mirrors.values() if mirror.base_url not in exclude]
+
+            if not candidates:
+                return None
+
+            healthy_candidates = [mirror for mirror in candidates if mirror.unhealthy_until <= now]
+
+            if healthy_candidates:
+                if len(healthy_candidates) > 2:
+                    healthy_candidates = self._random.sample(healthy_candidates, 2)
+
+                mirror = min(healthy_candidates, key=self._get_score)
+            else:
+                # fail open - all mirrors are ejected
+                mirror = min(candidates, key=lambda candidate: candidate.unhealthy_until)
+
+            mirror.in_flight_count += 1
+
+            return mirror.base_url
+
+    def record(self, base_url: str, latency: float, *, is_failed: bool) -> None:
+        """
+        Record finished request of the mirror.
+
+        :param base_url: base URL of the mirror
+        :type base_url: :obj:`str`
+        :param latency: latency of the request in seconds
+        :type latency: :obj:`float`
+        :keyword is_failed: whether request has failed (error, timeout, 429 or 5xx response)
+        :type is_failed: :obj:`bool`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        with self._lock:
+            mirror = self._mirrors[base_url]
+
+            mirror.in_flight_count -= 1
+            mirror.requests_count += 1
+
+            if is_failed:
+                mirror.errors_count += 1
+                mirror.failures_count += 1
+
+                # readmitted mirror is ejected again on the first failure
+                is_readmitted = mirror.unhealthy_until > float('-inf')
+
+                if is_readmitted or mirror.failures_count >= self._failures_threshold:
+                    mirror.unhealthy_until = time.monotonic() + self._cooldown
+
+                    logger.warning(f'Mirror {base_url!r} has been ejected for {self._cooldown!r} seconds.')
+
+                return
+
+            mirror.failures_count = 0
+            mirror.unhealthy_until = float('-inf')
+
+            if mirror.latency is None:
+                mirror.latency = latency
+            else:
+                mirror.latency += (latency - mirror.latency) * self._smoothing
+
+    def release(self, base_url: str) -> None:
+        """
+        Release request of the mirror that has not finished (cancelled request).
+
+        Request is not recorded: it says nothing about the latency and the health of the mirror.
+
+        :param base_url: base URL of the mirror
+        :type base_url: :obj:`str`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        with self._lock:
+            self._mirrors[base_url].in_flight_count -= 1
+
+    @staticmethod
+    def _get_score(mirror: _Mirror) -> float:
+        # not measured mirror is probed with one request at once
+        if mirror.latency is None:
+            return 0.0 if mirror.in_flight_count == 0 else float('inf')
+
+        return mirror.latency * (mirror.in_flight_count + 1)
@@ -5,12 +5,30 @@ Contains base asynchronous dictionary API client.
 """
 
 import abc
+import asyncio
+import collections
 import logging
+import time
 import typing
 
 from .base_client_interface import BaseDictionaryApiClientInterface
-from ..languages import LanguageCodes
+from .scheduling import (
+    Priority,
+    RequestScheduler
+)
+from ..canonical import get_canonical_key
+from ..deadlines import Deadline
+from ..languages import (
+    DEFAULT_LANGUAGE_CODE,
+    LanguageCodes
+)
+from ..logs import log_event
 from ..parsers import DictionaryApiParser
+from ..results import (
+    LookupResult,
+    LookupTimings,
+    WarmupProgress
+)
 from ..types import Word
 
 
@@ -28,8 +46,58 @@ class BaseAsyncDictionaryApiClient(BaseDictionaryApiClientInterface):
     for ``async`` clients.
     """
 
+    def __init__(self, default_language_code: LanguageCodes = DEFAULT_LANGUAGE_CODE, *,
+                 scheduler: typing.Optional[RequestScheduler] = None,
+                 **kwargs
+                 ) -> None:
+        """
+        Init base asynchronous dictionary API client instance.
+
+        :param default_language_code: default language of the searched words for the client
+        :type default_language_code: :obj:`LanguageCodes`
+        :keyword scheduler: scheduler of the API requests (by priority, with concurrency limits)
+        :type scheduler: :obj:`Optional[RequestScheduler]`
+        :keyword kwargs: options of the base client (see :meth:`BaseDictionaryApiClientInterface.__init__`)
+
+        :raise:
+            :TypeError:
+                - if has been passed unsupported ``default_language_code``
+                - if ``scheduler`` is not an instance of :obj:`RequestScheduler`
+        """
+
+        super().__init__(default_language_code, **kwargs)
+
+        self._scheduler = scheduler
+
+        if scheduler is not None and not isinstance(scheduler, RequestScheduler):
+            message = (
+                'For `scheduler` has been passed object with unsupported type. '
+                'Expected to get argument with type `freedictionaryapi.clients.scheduling.RequestScheduler`! '
+                f'Got (scheduler={scheduler!r})'
+            )
+            raise TypeError(message)
+
+        # background refreshes of the stale cached responses
+        self._refreshes: typing.Set[asyncio.Future] = set()
+        # queue of the prefetches (word, language code, depth) and the single task that sends them one by one
+        self._prefetch_queue: typing.Deque[typing.Tuple[str, LanguageCodes, int]] = collections.deque()
+        self._prefetch_keys: typing.Set[str] = set()
+        self._prefetcher: typing.Optional[asyncio.Future] = None
+
+    @property
+    def scheduler(self) -> typing.Optional[RequestScheduler]:
+        """
+        :return: scheduler of the API requests
+        :rtype: :obj:`Optional[RequestScheduler]`
+        """
+
+        return self._scheduler
+
     @abc.abstractmethod
-    async def fetch_api_response(self, url: str) -> typing.Tuple[int, typing.Any]:
+    async def fetch_api_response(self, url: str, *,
+                                 headers: typing.Optional[typing.Mapping[str, str]] = None
+                                 ) -> typing.Union[typing.Tuple[int, typing.Any],
+                                                   typing.Tuple[int, typing.Any, typing.Mapping]]:
         """
         Fetch data of the API response.
 
@@ -91,44 +159,466 @@ class BaseAsyncDictionaryApiClient(BaseDictionaryApiClientInterface):
         you can also see some examples
         or just implementations of ready to use clients.
 
+        Optionally, implementation might call :meth:`_record_response_body`
+        right after JSON decoding, so received bytes are counted in the metrics
+        and JSON decoding is timed separately from the network.
+
+        Optionally, implementation might send passed ``headers`` with request
+        and return response headers as the third item of the tuple,
+        so cached responses are revalidated with conditional requests (``ETag``, ``Last-Modified``).
+        Response to the conditional request might be 304 (Not Modified) without body
+        (``None`` is returned instead of the JSON response then).
+        ``headers`` are passed only for conditional requests,
+        so implementations that do not accept them work without revalidation.
+
         :param url: url that is generated by input params in invoked function
         :type url: :obj:`str`
+        :keyword headers: headers of the conditional request (``If-None-Match``, ``If-Modified-Since``)
+        :type headers: :obj:`Optional[Mapping[str, str]]`
 
         :return: tuple of:
 
             - response status code;
-            - python object loaded from API response with JSON decoding.
-        :rtype: :obj:`tuple[int, Any]`
+            - python object loaded from API response with JSON decoding;
+            - (optionally) response headers.
+        :rtype: :obj:`Union[tuple[int, Any], tuple[int, Any, Mapping]]`
+        """
+
+    async def _send_request(self, url: str, *,
+                            priority: Priority,
+                            language_code: LanguageCodes,
+                            headers: typing.Optional[typing.Mapping[str, str]] = None,
+                            timings: typing.Optional[LookupTimings] = None,
+                            deadline: typing.Optional[Deadline] = None
+                            ) -> typing.Tuple[str, int, typing.Any, typing.Optional[typing.Mapping]]:
         """
+        Send request to the API (with :meth:`fetch_api_response`).
+
+        Request waits for its turn in the scheduler (if it is set)
+        and is recorded in the adaptive limiter (if it is set) that also sets limit of the scheduler
+        and in the metrics and in the timings (if they are set).
+        If mirrors are set, request is sent to the chosen mirror
+        and on failure (error, timeout, 429 or 5xx response) it is sent to the next one.
+        If deadline is set, waiting in the scheduler and each request are cancelled when budget is exhausted
+        and request is not retried.
+
+        :param url: URL that generated for API request
+        :type url: :obj:`str`
+        :keyword priority: priority class of the request
+        :type priority: :obj:`Priority`
+        :keyword language_code: language of the searched word
+        :type language_code: :obj:`LanguageCodes`
+        :keyword headers: headers of the conditional request (passed to ``fetch_api_response`` only if they are set)
+        :type headers: :obj:`Optional[Mapping[str, str]]`
+        :keyword timings: timings of the lookup (queueing and network stages are recorded)
+        :type timings: :obj:`Optional[LookupTimings]`
+        :keyword deadline: deadline of the lookup
+        :type deadline: :obj:`Optional[Deadline]`
+
+        :return: tuple of:
+
+            - URL that request has been sent to;
+            - response status code;
+            - python object loaded from API response with JSON decoding;
+            - response headers (``None`` if implementation of ``fetch_api_response`` does not return them).
+        :rtype: :obj:`tuple[str, int, Any, Optional[Mapping]]`
+
+        :raise:
+            :DictionaryApiTimeoutError: if lookup has exceeded its deadline
+            :Exception: error raised by the request (to the last mirror)
+        """
+
+        if self._scheduler is not None:
+            queueing_started_at = time.perf_counter()
+
+            if deadline is None:
+                await self._scheduler.acquire(priority, language_code)
+            else:
+                deadline.check('queueing')
 
-    async def fetch_json(self, word: str, language_code: typing.Optional[LanguageCodes] = None) -> typing.Any:
+                try:
+                    await asyncio.wait_for(self._scheduler.acquire(priority, language_code), deadline.remaining)
+                except asyncio.TimeoutError:
+                    # waiting request is dropped from the queue by cancellation
+                    raise deadline.make_error('queueing') from None
+
+            if timings is not None:
+                timings.queueing = time.perf_counter() - queueing_started_at
+
+        try:
+            return await self._send_request_with_failover(url, language_code, headers, timings, deadline)
+        finally:
+            if self._scheduler is not None:
+                if self._concurrency_limiter is not None:
+                    self._scheduler.max_concurrency = self._concurrency_limiter.limit
+
+                self._scheduler.release(priority, language_code)
+
+    async def _send_request_with_failover(self, url: str, language_code: LanguageCodes,
+                                          headers: typing.Optional[typing.Mapping[str, str]],
+                                          timings: typing.Optional[LookupTimings],
+                                          deadline: typing.Optional[Deadline] = None
+                                          ) -> typing.Tuple[str, int, typing.Any, typing.Optional[typing.Mapping]]:
+        tried_base_urls: typing.List[str] = []
+        last_error: typing.Optional[Exception] = None
+        options = self._get_request_options(headers)
+
+        while True:
+            if deadline is not None and deadline.is_expired:
+                stage = 'retrying request' if tried_base_urls else 'sending request'
+                raise deadline.make_error(stage) from last_error
+
+            if self._mirror_pool is None:
+                base_url, request_url = None, url
+            else:
+                base_url = self._mirror_pool.choose(tried_base_urls)
+
+                if base_url is None:
+                    # all mirrors have failed
+                    raise last_error
+
+                request_url = self._get_mirror_url(url, base_url)
+                tried_base_urls.append(base_url)
+
+            started_at = self._start_request(language_code)
+
+            try:
+                if deadline is None:
+                    api_response = await self.fetch_api_response(request_url, **options)
+                else:
+                    # request is cancelled when budget is exhausted (whatever timeouts implementation has)
+                    api_response = await asyncio.wait_for(
+                        self.fetch_api_response(request_url, **options),
+                        deadline.remaining
+                    )
+
+                response_status_code, json_response, response_headers = self._unpack_api_response(api_response)
+            except asyncio.CancelledError:
+                if base_url is not None:
+                    # cancelled request is neither failure nor success of the mirror, just free its slot
+                    self._mirror_pool.release(base_url)
+                if self._metrics is not None:
+                    self._metrics.request_cancelled(language_code)
+                raise
+            except Exception as error:
+                self._record_request(
+                    started_at, None, base_url,
+                    language_code=language_code, error=error, timings=timings
+                )
+
+                if deadline is not None and deadline.is_expired:
+                    raise deadline.make_error('waiting for response') from error
+
+                if base_url is None:
+                    raise
+
+                logger.warning(f'Request to the mirror {base_url!r} has failed: {error!r}.')
+
+                last_error = error
+                continue
+
+            is_failed = self._record_request(
+                started_at, response_status_code, base_url,
+                language_code=language_code, timings=timings
+            )
+
+            if (
+                    is_failed and base_url is not None and len(tried_base_urls) < len(self._mirror_pool)
+                    # failed response is returned if there is no budget to retry
+                    and (deadline is None or not deadline.is_expired)
+            ):
+                logger.warning(f'Mirror {base_url!r} has responded with {response_status_code!r}, try next one.')
+                continue
+
+            return (request_url, response_status_code, json_response, response_headers)
+
+    async def fetch_result(self, word: str, language_code: typing.Optional[LanguageCodes] = None, *,
+                           bypass_filter: bool = False,
+                           timeout: typing.Optional[typing.Union[float, Deadline]] = None,
+                           priority: Priority = Priority.INTERACTIVE
+                           ) -> LookupResult:
         """
-        Fetch API json response that loaded in Python object (``await response.json()``).
+        Fetch lookup result - lightweight result that is returned instead of raising error.
+
+        Unsuccessful response (the most often - 404, word is not found) is not raised,
+        error and its message are built only on demand (see :obj:`LookupResult`).
 
         :param word: searched word
         :type word: :obj:`str`
         :param language_code: language of the searched word
         :type language_code: :obj:`Optional[LanguageCodes]`
+        :keyword bypass_filter: send request even if word is in the missing words filter
+        :type bypass_filter: :obj:`bool`
+        :keyword timeout: timeout budget of the lookup (in seconds) or deadline shared by lookups
+            (without deadline if it is not passed)
+        :type timeout: :obj:`Optional[Union[float, Deadline]]`
+        :keyword priority: priority class of the request (used by the scheduler)
+        :type priority: :obj:`Priority`
 
-        :return: JSON response (supposed to be :obj:`list` or :obj:`dict`)
-        :rtype: :obj:`Any`
+        :return: lookup result
+        :rtype: :obj:`LookupResult`
 
         :raise:
-            :DictionaryApiError: when unsuccessful status code got of API request
+            :DictionaryApiTimeoutError: if lookup has exceeded its deadline
         """
 
-        url, language_code = self._generate_url(word, language_code)
+        result = await self._fetch_result(
+            word, language_code,
+            bypass_filter=bypass_filter, timeout=timeout, priority=priority
+        )
+        self._check_slow_lookup(result)
+
+        return result
+
+    async def _fetch_result(self, word: str, language_code: typing.Optional[LanguageCodes] = None, *,
+                             bypass_filter: bool = False,
+                             timeout: typing.Optional[typing.Union[float, Deadline]] = None,
+                             priority: Priority = Priority.INTERACTIVE
+                             ) -> LookupResult:
+        """
+        Fetch lookup result without checking whether lookup is slow
+        (callers check it with :meth:`_check_slow_lookup` after parsing if they parse the response).
+        """
+
+        deadline = Deadline.from_timeout(timeout)
+        timings = self._create_timings()
+        url, language_code = self._generate_url(word, language_code, timings=timings)
+
+        cached_result, is_refresh_needed = self._check_response_cache(word, language_code, timings=timings)
+
+        if cached_result is not None:
+            if is_refresh_needed:
+                self._schedule_refresh(word, language_code, url)
 
-        logger.info(f'Send request to API with word {word!r} and language code {language_code!r}. URL: {url!r}.')
+            return cached_result
 
-        response_status_code, json_response = await self.fetch_api_response(url)
+        if not bypass_filter:
+            filtered_result = self._check_missing_words_filter(word, language_code, url, timings=timings)
 
-        # logging - handling of API errors (and raising them)
-        analyzed_response = self._analyze_response(url, response_status_code, json_response)
+            if filtered_result is not None:
+                return filtered_result
 
-        return analyzed_response
+        log_event(
+            logger, logging.INFO, 'request_sent',
+            'Send request to API with word %(word)r and language code %(language_code)r. URL: %(url)r.',
+            word=word, language_code=language_code, url=url
+        )
 
-    async def fetch_parser(self, word: str, language_code: typing.Optional[LanguageCodes] = None
+        # hard expired cached response is revalidated with conditional request
+        revalidated_entry = self._get_revalidated_entry(word, language_code)
+        headers = None if revalidated_entry is None else revalidated_entry.conditional_headers
+
+        is_foreground = priority is not Priority.BACKGROUND
+
+        with self._collecting_timings(timings), self._counting_request_in_flight(is_foreground=is_foreground):
+            url, response_status_code, json_response, response_headers = await self._send_request(
+                url,
+                priority=priority, language_code=language_code, headers=headers, timings=timings, deadline=deadline
+            )
+
+        # logging - handling of API errors (without raising them)
+        result = self._make_result(
+            url, response_status_code, json_response,
+            word=word, language_code=language_code, timings=timings, revalidated_entry=revalidated_entry
+        )
+
+        self._cache_response(word, language_code, url, response_status_code, json_response, response_headers)
+
+        return result
+
+    def _schedule_refresh(self, word: str, language_code: LanguageCodes, url: str) -> None:
+        """
+        Refresh stale cached response in the background task (with background priority in the scheduler).
+
+        :param word: searched word
+        :type word: :obj:`str`
+        :param language_code: language of the searched word
+        :type language_code: :obj:`LanguageCodes`
+        :param url: URL that generated for API request
+        :type url: :obj:`str`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        refresh = asyncio.ensure_future(self._refresh(word, language_code, url))
+
+        # task is referenced till it is done, so it is not garbage collected
+        self._refreshes.add(refresh)
+        refresh.add_done_callback(self._refreshes.discard)
+
+    async def _refresh(self, word: str, language_code: LanguageCodes, url: str) -> None:
+        revalidated_entry = self._get_revalidated_entry(word, language_code)
+        headers = None if revalidated_entry is None else revalidated_entry.conditional_headers
+
+        try:
+            with self._counting_request_in_flight(is_foreground=False):
+                url, response_status_code, json_response, response_headers = await self._send_request(
+                    url,
+                    priority=Priority.BACKGROUND, language_code=language_code, headers=headers
+                )
+        except asyncio.CancelledError as error:
+            # stale response is kept, next lookup schedules refresh again after backoff
+            self._finish_refresh(word, language_code, error=error)
+            raise
+        except Exception as error:
+            self._finish_refresh(word, language_code, error=error)
+        else:
+            self._finish_refresh(
+                word, language_code,
+                url=url, status_code=response_status_code, response=json_response,
+                response_headers=response_headers, revalidated_entry=revalidated_entry
+            )
+
+    async def wait_for_refreshes(self) -> None:
+        """
+        Wait for background refreshes of the stale cached responses that are scheduled now.
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        if self._refreshes:
+            await asyncio.gather(*self._refreshes, return_exceptions=True)
+
+    def _is_scheduler_busy(self) -> bool:
+        """
+        Check whether scheduler (if it is set) has waiting requests, so prefetches are dropped.
+
+        :return: whether scheduler has waiting requests
+        :rtype: :obj:`bool`
+        """
+
+        return self._scheduler is not None and self._scheduler.metrics['queued'] > 0
+
+    def _schedule_prefetches(self, word: Word, language_code: typing.Optional[LanguageCodes], depth: int = 1) -> None:
+        """
+        Prefetch synonyms of the fetched word in the background task (by the prefetch policy if it is set).
+
+        Prefetches are dropped while scheduler has waiting requests or foreground requests are in flight
+        (see :meth:`_is_foreground_busy`), so they work without scheduler as well.
+
+        :param word: fetched word (parsed object)
+        :type word: :obj:`Word`
+        :param language_code: language of the fetched word
+        :type language_code: :obj:`Optional[LanguageCodes]`
+        :param depth: distance of the synonyms from the looked up word
+        :type depth: :obj:`int`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        if self._prefetch_policy is None or self._is_scheduler_busy() or self._is_foreground_busy():
+            return
+
+        language_code: LanguageCodes = self._default_language_code if language_code is None else language_code
+        synonyms = self._select_prefetched_words(
+            word, language_code,
+            depth=depth, pending_keys=self._prefetch_keys
+        )
+
+        self._prefetch_queue.extend((synonym, language_code, depth) for synonym in synonyms)
+
+        if self._prefetch_queue and (self._prefetcher is None or self._prefetcher.done()):
+            self._prefetcher = asyncio.ensure_future(self._run_prefetches())
+
+    async def _run_prefetches(self) -> None:
+        while self._prefetch_queue:
+            word, language_code, depth = self._prefetch_queue.popleft()
+
+            try:
+                await self._prefetch(word, language_code, depth)
+            finally:
+                self._prefetch_keys.discard(get_canonical_key(word, language_code))
+
+    async def _prefetch(self, word: str, language_code: LanguageCodes, depth: int) -> None:
+        if (
+                self._prefetch_policy.is_cancelled
+                or self._is_scheduler_busy()
+                or self._is_foreground_busy()
+                or self._is_response_cached(word, language_code)
+        ):
+            return
+
+        try:
+            result = await self.fetch_result(word, language_code, priority=Priority.BACKGROUND)
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            logger.warning(f'Prefetch of the word {word!r} has failed: {error!r}.')
+            return
+
+        if result.is_found:
+            self._schedule_prefetches(result.word, language_code, depth + 1)
+
+    async def wait_for_prefetches(self) -> None:
+        """
+        Wait for background prefetches of the synonyms (with prefetches that they schedule).
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        while self._prefetcher is not None and not self._prefetcher.done():
+            await asyncio.gather(self._prefetcher, return_exceptions=True)
+
+    async def cancel_prefetches(self) -> None:
+        """
+        Cancel background prefetches of the synonyms (with prefetch in flight).
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        self._prefetch_queue.clear()
+        self._prefetch_keys.clear()
+
+        if self._prefetcher is not None:
+            self._prefetcher.cancel()
+            await asyncio.gather(self._prefetcher, return_exceptions=True)
+
+    async def fetch_json(self, word: str, language_code: typing.Optional[LanguageCodes] = None, *,
+                         bypass_filter: bool = False,
+                         timeout: typing.Optional[typing.Union[float, Deadline]] = None,
+                         priority: Priority = Priority.INTERACTIVE
+                         ) -> typing.Any:
+        """
+        Fetch API JSON response that loaded in Python object (``await response.json()``).
+
+        :param word: searched word
+        :type word: :obj:`str`
+        :param language_code: language of the searched word
+        :type language_code: :obj:`Optional[LanguageCodes]`
+        :keyword bypass_filter: send request even if word is in the missing words filter
+        :type bypass_filter: :obj:`bool`
+        :keyword timeout: timeout budget of the lookup (in seconds) or deadline shared by lookups
+            (without deadline if it is not passed)
+        :type timeout: :obj:`Optional[Union[float, Deadline]]`
+        :keyword priority: priority class of the request (used by the scheduler)
+        :type priority: :obj:`Priority`
+
+        :return: JSON response (supposed to be :obj:`list` or :obj:`dict`)
+        :rtype: :obj:`Any`
+
+        :raise:
+            :DictionaryApiError: when unsuccessful status code got of API request
+            :DictionaryApiTimeoutError: if lookup has exceeded its deadline
+            :DictionaryApiNotFoundError: when searched word is in the missing words filter
+        """
+
+        result = await self.fetch_result(
+            word, language_code,
+            bypass_filter=bypass_filter, timeout=timeout, priority=priority
+        )
+        result.raise_for_status()
+
+        return result.response
+
+    async def fetch_parser(self, word: str, language_code: typing.Optional[LanguageCodes] = None, *,
+                           bypass_filter: bool = False,
+                           timeout: typing.Optional[typing.Union[float, Deadline]] = None,
+                           priority: Priority = Priority.INTERACTIVE
                            ) -> DictionaryApiParser:
         """
         Fetch dictionary API parser.
@@ -137,32 +627,445 @@ class BaseAsyncDictionaryApiClient(BaseDictionaryApiClientInterface):
         :type word: :obj:`str`
         :param language_code: language of the searched word (`word`)
         :type language_code: :obj:`Optional[LanguageCodes]`
+        :keyword bypass_filter: send request even if word is in the missing words filter
+        :type bypass_filter: :obj:`bool`
+        :keyword timeout: timeout budget of the lookup (in seconds) or deadline shared by lookups
+            (without deadline if it is not passed)
+        :type timeout: :obj:`Optional[Union[float, Deadline]]`
+        :keyword priority: priority class of the request (used by the scheduler)
+        :type priority: :obj:`Priority`
 
         :return: dictionary API parser
         :rtype: :obj:`DictionaryApiParser`
         """
 
-        json_response = await self.fetch_json(word, language_code)
-        parser = DictionaryApiParser(json_response)
+        result = await self._fetch_result(
+            word, language_code,
+            bypass_filter=bypass_filter, timeout=timeout, priority=priority
+        )
+        # parser is built before checking, so slow parsing is logged as well
+        parser = result.parser
+        self._check_slow_lookup(result)
+
+        result.raise_for_status()
 
         return parser
 
-    async def fetch_word(self, word: str, language_code: typing.Optional[LanguageCodes] = None) -> Word:
+    async def fetch_word(self, word: str, language_code: typing.Optional[LanguageCodes] = None, *,
+                         bypass_filter: bool = False,
+                         timeout: typing.Optional[typing.Union[float, Deadline]] = None,
+                         priority: Priority = Priority.INTERACTIVE
+                         ) -> Word:
         """
-        Fetch word - parsed object that has all word info.
+        Fetch word (:obj:`Word`) - parsed object that has all word info.
 
         Shortcut for the :attr:`DictionaryApiParser.word`.
 
+        Synonyms of the fetched word are prefetched in the background
+        if client has the prefetch policy (see :obj:`PrefetchPolicy`).
+
         :param word: searched word
         :type word: :obj:`str`
         :param language_code: language of the searched word
         :type language_code: :obj:`Optional[LanguageCodes]`
+        :keyword bypass_filter: send request even if word is in the missing words filter
+        :type bypass_filter: :obj:`bool`
+        :keyword timeout: timeout budget of the lookup (in seconds) or deadline shared by lookups
+            (without deadline if it is not passed)
+        :type timeout: :obj:`Optional[Union[float, Deadline]]`
+        :keyword priority: priority class of the request (used by the scheduler)
+        :type priority: :obj:`Priority`
 
         :return: word (parsed object)
         :rtype: :obj:`Word`
         """
 
-        parser = await self.fetch_parser(word, language_code)
+        parser = await self.fetch_parser(
+            word, language_code,
+            bypass_filter=bypass_filter, timeout=timeout, priority=priority
+        )
         word = parser.word
 
+        self._schedule_prefetches(word, language_code)
+
         return word
+
+    async def fetch_word_or_none(self, word: str, language_code: typing.Optional[LanguageCodes] = None, *,
+                                 bypass_filter: bool = False,
+                                 timeout: typing.Optional[typing.Union[float, Deadline]] = None,
+                                 priority: Priority = Priority.INTERACTIVE
+                                 ) -> typing.Optional[Word]:
+        """
+        Fetch word (:obj:`Word`) or ``None`` if word is not found.
+
+        Missing word is not exceptional (no error is built and raised),
+        so it is the cheapest way to look up words that might be missing.
+
+        :param word: searched word
+        :type word: :obj:`str`
+        :param language_code: language of the searched word
+        :type language_code: :obj:`Optional[LanguageCodes]`
+        :keyword bypass_filter: send request even if word is in the missing words filter
+        :type bypass_filter: :obj:`bool`
+        :keyword timeout: timeout budget of the lookup (in seconds) or deadline shared by lookups
+            (without deadline if it is not passed)
+        :type timeout: :obj:`Optional[Union[float, Deadline]]`
+        :keyword priority: priority class of the request (used by the scheduler)
+        :type priority: :obj:`Priority`
+
+        :return: word (parsed object) or ``None`` if word is not found
+        :rtype: :obj:`Optional[Word]`
+
+        :raise:
+            :DictionaryApiError: when unsuccessful (except 404) status code got of API request
+            :DictionaryApiTimeoutError: if lookup has exceeded its deadline
+        """
+
+        result = await self._fetch_result(
+            word, language_code,
+            bypass_filter=bypass_filter, timeout=timeout, priority=priority
+        )
+        # parser is built before checking, so slow parsing is logged as well
+        parser = result.parser
+        self._check_slow_lookup(result)
+
+        if result.is_not_found:
+            return None
+
+        result.raise_for_status()
+
+        return parser.word
+
+    async def fetch_word_across_languages(self, word: str, languages: typing.Iterable[LanguageCodes], *,
+                                          timeout: typing.Optional[typing.Union[float, Deadline]] = None,
+                                          bypass_filter: bool = False,
+                                          priority: Priority = Priority.INTERACTIVE
+                                          ) -> typing.Dict[LanguageCodes, typing.Optional[Word]]:
+        """
+        Fetch word (:obj:`Word`) in several languages concurrently - translations and cognates of the headword.
+
+        Latency is the latency of the slowest language (not the sum of them),
+        lookups that have not finished before deadline (``timeout``) are cancelled and missed.
+        Missed lookups (word is not found, lookup has failed or has missed deadline) are mapped to ``None``
+        (failures are logged, not raised).
+
+        Usage:
+        ::
+
+            words = await client.fetch_word_across_languages(
+                'hello', [LanguageCodes.ENGLISH_US, LanguageCodes.SPANISH, LanguageCodes.FRENCH], timeout=2
+            )
+
+        :param word: searched word
+        :type word: :obj:`str`
+        :param languages: languages to look up word in
+        :type languages: :obj:`Iterable[LanguageCodes]`
+        :keyword timeout: timeout budget of the whole lookup (in seconds) or deadline shared by lookups
+            (without deadline if it is not passed), each lookup is limited by it
+        :type timeout: :obj:`Optional[Union[float, Deadline]]`
+        :keyword bypass_filter: send requests even if word is in the missing words filter
+        :type bypass_filter: :obj:`bool`
+        :keyword priority: priority class of the requests (used by the scheduler)
+        :type priority: :obj:`Priority`
+
+        :return: mapping of the language to the word (parsed object) or ``None`` if lookup is missed
+            (in order of the passed languages)
+        :rtype: :obj:`Dict[LanguageCodes, Optional[Word]]`
+
+        :raise:
+            :TypeError: if ``languages`` contains unsupported language code or ``timeout`` is not a number
+            :ValueError: if ``timeout`` is not positive
+        """
+
+        deadline = Deadline.from_timeout(timeout)
+        languages = self._prepare_fanout_languages(languages)
+
+        if not languages:
+            return {}
+
+        lookups = {
+            language_code: asyncio.ensure_future(
+                self.fetch_result(word, language_code, bypass_filter=bypass_filter, timeout=deadline, priority=priority)
+            )
+            for language_code in languages
+        }
+
+        try:
+            await asyncio.wait(lookups.values(), timeout=None if deadline is None else deadline.remaining)
+        finally:
+            pending = [lookup for lookup in lookups.values() if not lookup.done()]
+
+            for lookup in pending:
+                lookup.cancel()
+
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        words = {}
+
+        for language_code, lookup in lookups.items():
+            if lookup.cancelled():
+                words[language_code] = self._get_word_or_miss(word, language_code)
+                continue
+
+            error = lookup.exception()
+            result = None if error is not None else lookup.result()
+
+            words[language_code] = self._get_word_or_miss(word, language_code, result, error=error)
+
+        return words
+
+    async def stream_lookups(self, words: typing.AsyncIterable[str], *,
+                             concurrency: int = 10,
+                             buffer: typing.Optional[int] = None,
+                             language_code: typing.Optional[LanguageCodes] = None,
+                             bypass_filter: bool = False,
+                             timeout: typing.Optional[typing.Union[float, Deadline]] = None,
+                             priority: Priority = Priority.BACKGROUND
+                             ) -> typing.AsyncIterator[LookupResult]:
+        """
+        Look up words of the asynchronous source and stream lookup results (in completion order).
+
+        Pipeline is bounded (memory stays flat regardless of source size):
+
+            - at most ``concurrency`` requests are in flight
+              (limited by the adaptive limiter of the client if it is set);
+            - at most ``buffer`` results wait to be consumed;
+            - source is pulled only when request slot is free,
+              so slow consumer slows down pulling from the source (backpressure).
+
+        Closing of the stream (``aclose()``, error, cancellation) cancels pulling and all requests in flight.
+
+        Usage:
+        ::
+
+            async for result in client.stream_lookups(queue_consumer(), concurrency=20):
+                if result:
+                    await store(result.word)
+
+        :param words: asynchronous source of the searched words
+        :type words: :obj:`AsyncIterable[str]`
+        :keyword concurrency: maximum count of the requests in flight
+        :type concurrency: :obj:`int`
+        :keyword buffer: maximum count of the not consumed results (``concurrency`` if not passed)
+        :type buffer: :obj:`Optional[int]`
+        :keyword language_code: language of the searched words
+        :type language_code: :obj:`Optional[LanguageCodes]`
+        :keyword bypass_filter: send requests even if words are in the missing words filter
+        :type bypass_filter: :obj:`bool`
+        :keyword timeout: timeout budget of each lookup (in seconds) or deadline shared by lookups
+            (without deadline if it is not passed)
+        :type timeout: :obj:`Optional[Union[float, Deadline]]`
+        :keyword priority: priority class of the requests (used by the scheduler)
+        :type priority: :obj:`Priority`
+
+        :return: asynchronous iterator of the lookup results
+        :rtype: :obj:`AsyncIterator[LookupResult]`
+
+        :raise:
+            :ValueError: if ``concurrency`` or ``buffer`` is not positive
+            :DictionaryApiTimeoutError: if lookup has exceeded its deadline (other requests are cancelled)
+            :Exception: error raised by the source or by the request (other requests are cancelled)
+        """
+
+        if buffer is None:
+            buffer = concurrency
+
+        if concurrency <= 0 or buffer <= 0:
+            message = (
+                '`concurrency` and `buffer` arguments have to be positive. '
+                f'Got (concurrency={concurrency!r}, buffer={buffer!r}).'
+            )
+            raise ValueError(message)
+
+        # items are tuples of (result, error), ``None`` marks the end of the stream
+        results: asyncio.Queue = asyncio.Queue(maxsize=buffer)
+        lookups: typing.Set[asyncio.Future] = set()
+        # count of the taken request slots, only producer waits for the free slot
+        in_flight_count = 0
+        slot_freed = asyncio.Event()
+
+        async def take_slot() -> None:
+            nonlocal in_flight_count
+
+            # limit is read on each check since adaptive limiter changes it
+            while in_flight_count >= self._get_concurrency_limit(concurrency):
+                slot_freed.clear()
+                await slot_freed.wait()
+
+            in_flight_count += 1
+
+        def free_slot() -> None:
+            nonlocal in_flight_count
+
+            in_flight_count -= 1
+            slot_freed.set()
+
+        async def look_up(word: str) -> None:
+            try:
+                result = await self.fetch_result(
+                    word, language_code,
+                    bypass_filter=bypass_filter, timeout=timeout, priority=priority
+                )
+            except Exception as error:
+                await results.put((None, error))
+            else:
+                # slot is kept till result is buffered, so full buffer stops pulling
+                await results.put((result, None))
+            finally:
+                free_slot()
+
+        async def produce() -> None:
+            try:
+                iterator = words.__aiter__()
+
+                while True:
+                    # word is pulled only when request slot is free
+                    await take_slot()
+
+                    try:
+                        word = await iterator.__anext__()
+                    except StopAsyncIteration:
+                        free_slot()
+                        break
+
+                    lookup = asyncio.ensure_future(look_up(word))
+                    lookups.add(lookup)
+                    lookup.add_done_callback(lookups.discard)
+
+                while in_flight_count:
+                    slot_freed.clear()
+                    await slot_freed.wait()
+            except Exception as error:
+                await results.put((None, error))
+            else:
+                await results.put(None)
+
+        producer = asyncio.ensure_future(produce())
+
+        try:
+            while True:
+                item = await results.get()
+
+                if item is None:
+                    break
+
+                result, error = item
+
+                if error is not None:
+                    raise error
+
+                yield result
+        finally:
+            pending = [producer, *lookups]
+
+            for future in pending:
+                future.cancel()
+
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def warmup(self, words_with_weights: typing.Union[typing.Mapping[str, float],
+                                                            typing.Iterable[typing.Tuple[str, float]]], *,
+                     top: typing.Optional[int] = None,
+                     budget: typing.Optional[float] = None,
+                     concurrency: int = 4,
+                     language_code: typing.Optional[LanguageCodes] = None,
+                     timeout: typing.Optional[float] = None,
+                     progress_callback: typing.Optional[typing.Callable[[WarmupProgress], None]] = None,
+                     priority: Priority = Priority.BACKGROUND
+                     ) -> WarmupProgress:
+        """
+        Warm up the response cache of the client (supposed to be called after deploy):
+        prefetch the most frequent words of the frequency list in order of frequency.
+
+        Warm-up yields to the live traffic:
+
+            - requests have background priority in the scheduler (if it is set),
+              so interactive requests are sent first;
+            - requests are paced so their rate does not exceed ``budget``;
+            - at most ``concurrency`` requests are in flight
+              (limited by the adaptive limiter of the client if it is set, so warm-up backs off under load);
+            - words which fresh responses are cached already are skipped (no request is sent).
+
+        Failed lookups are logged and counted, they do not stop warm-up.
+        Cancellation of the warm-up cancels all requests in flight.
+
+        Usage:
+        ::
+
+            asyncio.ensure_future(client.warmup(frequencies, top=10_000, budget=50, concurrency=8))
+
+        :param words_with_weights: frequency list - mapping or pairs of the word and its weight (frequency)
+        :type words_with_weights: :obj:`Union[Mapping[str, float], Iterable[tuple[str, float]]]`
+        :keyword top: count of the most frequent words to warm up (all words if it is not passed)
+        :type top: :obj:`Optional[int]`
+        :keyword budget: maximum rate of the warm-up requests (per second, without limit if it is not passed)
+        :type budget: :obj:`Optional[float]`
+        :keyword concurrency: maximum count of the warm-up requests in flight
+        :type concurrency: :obj:`int`
+        :keyword language_code: language of the words
+        :type language_code: :obj:`Optional[LanguageCodes]`
+        :keyword timeout: timeout budget of each lookup (in seconds, lookups that exceed it are counted as failed)
+        :type timeout: :obj:`Optional[float]`
+        :keyword progress_callback: callback that progress is reported to after each processed word
+        :type progress_callback: :obj:`Optional[Callable[[WarmupProgress], None]]`
+        :keyword priority: priority class of the requests (used by the scheduler)
+        :type priority: :obj:`Priority`
+
+        :return: finished progress of the warm-up
+        :rtype: :obj:`WarmupProgress`
+
+        :raise:
+            :ValueError: if ``top``, ``budget``, ``concurrency`` or ``timeout`` is not positive
+        """
+
+        self._check_warmup_arguments(top=top, budget=budget, concurrency=concurrency, timeout=timeout)
+
+        language_code: LanguageCodes = self._default_language_code if language_code is None else language_code
+        words = self._rank_warmup_words(words_with_weights, language_code, top)
+        progress = WarmupProgress(len(words))
+
+        sent_count = 0
+        pending: typing.Dict[asyncio.Future, str] = {}
+
+        async def collect_lookups() -> None:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            for lookup in done:
+                word = pending.pop(lookup)
+                self._record_warmup_lookup(
+                    progress, word,
+                    error=lookup.exception(), progress_callback=progress_callback
+                )
+
+        try:
+            for word in words:
+                if self._is_response_cached(word, language_code):
+                    self._record_warmup_lookup(
+                        progress, word,
+                        is_skipped=True, progress_callback=progress_callback
+                    )
+                    continue
+
+                # limit is read on each round since adaptive limiter changes it
+                while len(pending) >= self._get_concurrency_limit(concurrency):
+                    await collect_lookups()
+
+                await asyncio.sleep(self._get_warmup_delay(progress, sent_count, budget))
+
+                lookup = asyncio.ensure_future(
+                    self.fetch_result(word, language_code, timeout=timeout, priority=priority)
+                )
+                pending[lookup] = word
+                sent_count += 1
+
+            while pending:
+                await collect_lookups()
+        finally:
+            for lookup in pending:
+                lookup.cancel()
+
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        return self._finish_warmup(progress)
@@ -5,20 +5,50 @@ Contains base dictionary API client interface.
 """
 
 import abc
+import contextlib
 import logging
 from http import HTTPStatus
+import threading
+import time
 import typing
 
+try:
+    import contextvars
+except ImportError:  # Python 3.6 - JSON decoding is timed as a part of the network stage
+    contextvars = None
+
+from .balancing import MirrorPool
+from .limiting import AdaptiveConcurrencyLimiter
+from ..caching import (
+    CACHEABLE_STATUS_CODES,
+    CachedResponse,
+    ResponseCache
+)
+from ..canonical import (
+    fold_word,
+    get_canonical_key
+)
 from ..errors import (
     API_ERRORS_MAPPER,
     DictionaryApiError
 )
+from ..filters import MissingWordsFilter
+from ..interning import StringPool
 from ..languages import (
     DEFAULT_LANGUAGE_CODE,
     LanguageCodes
 )
+from ..logs import log_event
+from ..metrics import ClientMetrics
 from ..parsers import DictionaryApiErrorParser
-from ..urls import ApiUrl
+from ..prefetching import PrefetchPolicy
+from ..results import (
+    LookupResult,
+    LookupTimings,
+    WarmupProgress
+)
+from ..types import Word
+from ..urls import UrlBuilder
 
 
 __all__ = ['BaseDictionaryApiClientInterface']
@@ -27,6 +57,10 @@ __all__ = ['BaseDictionaryApiClientInterface']
 logger = logging.getLogger(__name__)
 
 
+# timings of the current lookup (for the implemented ``fetch_api_response`` that times JSON decoding)
+_current_timings = None if contextvars is None else contextvars.ContextVar('lookup_timings', default=None)
+
+
 class BaseDictionaryApiClientInterface(abc.ABC):
     """
     Implements base dictionary API client interface.
@@ -47,15 +81,65 @@ class BaseDictionaryApiClientInterface(abc.ABC):
     but provided with inheritance from this interface.
     """
 
-    def __init__(self, default_language_code: LanguageCodes = DEFAULT_LANGUAGE_CODE) -> None:
+    def __init__(self, default_language_code: LanguageCodes = DEFAULT_LANGUAGE_CODE, *,
+                 missing_words_filter: typing.Optional[MissingWordsFilter] = None,
+                 string_pool: typing.Optional[StringPool] = None,
+                 concurrency_limiter: typing.Optional[AdaptiveConcurrencyLimiter] = None,
+                 base_urls: typing.Optional[typing.Union[typing.Sequence[str], MirrorPool]] = None,
+                 metrics: typing.Optional[ClientMetrics] = None,
+                 response_cache: typing.Optional[ResponseCache] = None,
+                 prefetch_policy: typing.Optional[PrefetchPolicy] = None,
+                 collect_timings: bool = False,
+                 slow_lookup_threshold: typing.Optional[float] = None
+                 ) -> None:
         """
         Init base dictionary API client instance.
 
         :param default_language_code: default language of the searched words for the client
         :type default_language_code: :obj:`LanguageCodes`
+        :keyword missing_words_filter: filter of the words that are known to be missing in API
+            (fed with words that got 404 response, requests for words from the filter are not sent)
+        :type missing_words_filter: :obj:`Optional[MissingWordsFilter]`
+        :keyword string_pool: pool to intern repeated strings of the successful responses with
+            (once, on receiving - before they are cached)
+        :type string_pool: :obj:`Optional[StringPool]`
+        :keyword concurrency_limiter: adaptive limiter of the requests in flight
+            (observes requests, limits batch lookups and scheduler of the async client)
+        :type concurrency_limiter: :obj:`Optional[AdaptiveConcurrencyLimiter]`
+        :keyword base_urls: base URLs of the API mirrors (self-hosted instances) or configured pool of them
+            (requests are balanced across mirrors with failover), public API is used if it is not passed
+        :type base_urls: :obj:`Optional[Union[Sequence[str], MirrorPool]]`
+        :keyword metrics: metrics to collect the requests in (not collected if it is not passed)
+        :type metrics: :obj:`Optional[ClientMetrics]`
+        :keyword response_cache: cache of the API responses (by canonical key of the lookup),
+            stale entries are returned immediately and refreshed in the background
+            if cache works in the stale-while-revalidate mode,
+            entries with validators are revalidated with conditional requests
+        :type response_cache: :obj:`Optional[ResponseCache]`
+        :keyword prefetch_policy: policy of the speculative prefetch of the synonyms
+            (synonyms of the fetched words are looked up in the background, so they are cached)
+        :type prefetch_policy: :obj:`Optional[PrefetchPolicy]`
+        :keyword collect_timings: whether to collect per-stage timings of the lookups
+            (see :attr:`LookupResult.timings`)
+        :type collect_timings: :obj:`bool`
+        :keyword slow_lookup_threshold: duration (in seconds) that lookups are logged as slow after
+            with per-stage timings and payload size (timings are collected if it is passed)
+        :type slow_lookup_threshold: :obj:`Optional[float]`
 
         :raise:
-            :TypeError: if has been passed unsupported ``default_language_code``
+            :TypeError:
+                - if has been passed unsupported ``default_language_code``
+                - if ``missing_words_filter`` is not an instance of :obj:`MissingWordsFilter`
+                - if ``string_pool`` is not an instance of :obj:`StringPool`
+                - if ``concurrency_limiter`` is not an instance of :obj:`AdaptiveConcurrencyLimiter`
+                - if ``base_urls`` is not a sequence of the base URLs or an instance of :obj:`MirrorPool`
+                - if ``metrics`` is not an instance of :obj:`ClientMetrics`
+                - if ``response_cache`` is not an instance of :obj:`ResponseCache`
+                - if ``prefetch_policy`` is not an instance of :obj:`PrefetchPolicy`
+            :ValueError:
+                - if ``base_urls`` is empty or contains duplicates
+                - if ``prefetch_policy`` is passed without ``response_cache``
+                - if ``slow_lookup_threshold`` is negative
         """
 
         self._default_language_code = default_language_code
@@ -68,6 +152,105 @@ class BaseDictionaryApiClientInterface(abc.ABC):
             )
             raise TypeError(message)
 
+        self._missing_words_filter = missing_words_filter
+
+        if missing_words_filter is not None and not isinstance(missing_words_filter, MissingWordsFilter):
+            message = (
+                'For `missing_words_filter` has been passed object with unsupported type. '
+                'Expected to get argument with type `freedictionaryapi.filters.MissingWordsFilter`! '
+                f'Got (missing_words_filter={missing_words_filter!r})'
+            )
+            raise TypeError(message)
+
+        self._string_pool = string_pool
+
+        if string_pool is not None and not isinstance(string_pool, StringPool):
+            message = (
+                'For `string_pool` has been passed object with unsupported type. '
+                'Expected to get argument with type `freedictionaryapi.interning.StringPool`! '
+                f'Got (string_pool={string_pool!r})'
+            )
+            raise TypeError(message)
+
+        self._concurrency_limiter = concurrency_limiter
+
+        if concurrency_limiter is not None and not isinstance(concurrency_limiter, AdaptiveConcurrencyLimiter):
+            message = (
+                'For `concurrency_limiter` has been passed object with unsupported type. '
+                'Expected to get argument with type `freedictionaryapi.clients.limiting.AdaptiveConcurrencyLimiter`! '
+                f'Got (concurrency_limiter={concurrency_limiter!r})'
+            )
+            raise TypeError(message)
+
+        if base_urls is None or isinstance(base_urls, MirrorPool):
+            self._mirror_pool = base_urls
+        elif isinstance(base_urls, typing.Sequence) and not isinstance(base_urls, str):
+            self._mirror_pool = MirrorPool(base_urls)
+        else:
+            message = (
+                'For `base_urls` has been passed object with unsupported type. '
+                'Expected to get sequence of the base URLs '
+                'or argument with type `freedictionaryapi.clients.balancing.MirrorPool`! '
+                f'Got (base_urls={base_urls!r})'
+            )
+            raise TypeError(message)
+
+        self._url_builder = UrlBuilder(None if self._mirror_pool is None else self._mirror_pool.primary_base_url)
+
+        self._metrics = metrics
+
+        if metrics is not None and not isinstance(metrics, ClientMetrics):
+            message = (
+                'For `metrics` has been passed object with unsupported type. '
+                'Expected to get argument with type `freedictionaryapi.metrics.ClientMetrics`! '
+                f'Got (metrics={metrics!r})'
+            )
+            raise TypeError(message)
+
+        self._response_cache = response_cache
+
+        if response_cache is not None and not isinstance(response_cache, ResponseCache):
+            message = (
+                'For `response_cache` has been passed object with unsupported type. '
+                'Expected to get argument with type `freedictionaryapi.caching.ResponseCache`! '
+                f'Got (response_cache={response_cache!r})'
+            )
+            raise TypeError(message)
+
+        self._prefetch_policy = prefetch_policy
+
+        if prefetch_policy is not None and not isinstance(prefetch_policy, PrefetchPolicy):
+            message = (
+                'For `prefetch_policy` has been passed object with unsupported type. '
+                'Expected to get argument with type `freedictionaryapi.prefetching.PrefetchPolicy`! '
+                f'Got (prefetch_policy={prefetch_policy!r})'
+            )
+            raise TypeError(message)
+
+        if prefetch_policy is not None and response_cache is None:
+            message = (
+                '`prefetch_policy` argument has been passed without `response_cache`. '
+                'Expected to get response cache that prefetched responses are stored in! '
+                f'Got (prefetch_policy={prefetch_policy!r}, response_cache={response_cache!r}).'
+            )
+            raise ValueError(message)
+
+        if slow_lookup_threshold is not None and slow_lookup_threshold < 0:
+            message = (
+                '`slow_lookup_threshold` argument has been passed with negative value. '
+                'Expected to get not negative number of seconds! '
+                f'Got (slow_lookup_threshold={slow_lookup_threshold!r}).'
+            )
+            raise ValueError(message)
+
+        self._slow_lookup_threshold = slow_lookup_threshold
+        self._collect_timings = collect_timings or slow_lookup_threshold is not None
+
+        # requests of the lookups in flight (all and foreground ones), prefetches are sent only when foreground is idle
+        self._requests_in_flight_count = 0
+        self._foreground_requests_in_flight_count = 0
+        self._requests_in_flight_lock = threading.Lock()
+
     def __repr__(self) -> str:
         class_name = self.__class__.__name__
         return f'{class_name}(default_language_code={self._default_language_code!r})'
@@ -80,15 +263,388 @@ class BaseDictionaryApiClientInterface(abc.ABC):
         """
         return self._default_language_code
 
+    @property
+    def missing_words_filter(self) -> typing.Optional[MissingWordsFilter]:
+        """
+        :return: filter of the words that are known to be missing in API
+        :rtype: :obj:`Optional[MissingWordsFilter]`
+        """
+
+        return self._missing_words_filter
+
+    @property
+    def string_pool(self) -> typing.Optional[StringPool]:
+        """
+        :return: pool to intern repeated strings of the parsed responses with
+        :rtype: :obj:`Optional[StringPool]`
+        """
+
+        return self._string_pool
+
+    @property
+    def concurrency_limiter(self) -> typing.Optional[AdaptiveConcurrencyLimiter]:
+        """
+        :return: adaptive limiter of the requests in flight
+        :rtype: :obj:`Optional[AdaptiveConcurrencyLimiter]`
+        """
+
+        return self._concurrency_limiter
+
+    @property
+    def mirror_pool(self) -> typing.Optional[MirrorPool]:
+        """
+        :return: pool of the API mirrors (``None`` if public API is used)
+        :rtype: :obj:`Optional[MirrorPool]`
+        """
+
+        return self._mirror_pool
+
+    @property
+    def metrics(self) -> typing.Optional[ClientMetrics]:
+        """
+        :return: metrics that the requests are collected in
+        :rtype: :obj:`Optional[ClientMetrics]`
+        """
+
+        return self._metrics
+
+    @property
+    def response_cache(self) -> typing.Optional[ResponseCache]:
+        """
+        :return: cache of the API responses
+        :rtype: :obj:`Optional[ResponseCache]`
+        """
+
+        return self._response_cache
+
+    @property
+    def collect_timings(self) -> bool:
+        """
+        :return: whether per-stage timings of the lookups are collected
+        :rtype: :obj:`bool`
+        """
+
+        return self._collect_timings
+
+    @property
+    def prefetch_policy(self) -> typing.Optional[PrefetchPolicy]:
+        """
+        :return: policy of the speculative prefetch of the synonyms
+        :rtype: :obj:`Optional[PrefetchPolicy]`
+        """
+
+        return self._prefetch_policy
+
+    @property
+    def slow_lookup_threshold(self) -> typing.Optional[float]:
+        """
+        :return: duration (in seconds) that lookups are logged as slow after
+        :rtype: :obj:`Optional[float]`
+        """
+
+        return self._slow_lookup_threshold
+
+    def _get_concurrency_limit(self, concurrency: int) -> int:
+        """
+        Get current limit of the requests in flight of the batch lookups.
+
+        :param concurrency: maximum count of the requests in flight
+        :type concurrency: :obj:`int`
+
+        :return: ``concurrency`` limited by the adaptive limiter (if it is set)
+        :rtype: :obj:`int`
+        """
+
+        if self._concurrency_limiter is None:
+            return concurrency
+
+        return min(concurrency, self._concurrency_limiter.limit)
+
     @staticmethod
-    def _analyze_response(url: str, status_code: int, response: typing.Union[dict, list]) -> typing.Union[dict, list]:
+    def _get_request_options(headers: typing.Optional[typing.Mapping[str, str]] = None) -> typing.Dict[str, typing.Any]:
+        """
+        Get keyword arguments of the ``fetch_api_response``
+        (options are passed only if they are set, so implementations that do not accept them still work).
+
+        :param headers: headers of the conditional request
+        :type headers: :obj:`Optional[Mapping[str, str]]`
+
+        :return: keyword arguments
+        :rtype: :obj:`Dict[str, Any]`
+        """
+
+        return {} if headers is None else {'headers': headers}
+
+    def _start_request(self, language_code: typing.Optional[LanguageCodes] = None) -> float:
+        """
+        Record started request in the metrics (if they are set).
+
+        :param language_code: language of the searched word
+        :type language_code: :obj:`Optional[LanguageCodes]`
+
+        :return: start time of the request (by :func:`time.monotonic`)
+        :rtype: :obj:`float`
+        """
+
+        if self._metrics is not None:
+            self._metrics.request_started(language_code)
+
+        return time.monotonic()
+
+    def _record_request(self, started_at: float, status_code: typing.Optional[int],
+                        base_url: typing.Optional[str] = None, *,
+                        language_code: typing.Optional[LanguageCodes] = None,
+                        error: typing.Optional[BaseException] = None,
+                        timings: typing.Optional[LookupTimings] = None
+                        ) -> bool:
+        """
+        Record finished request in the adaptive limiter, in the mirror pool and in the metrics (if they are set).
+
+        :param started_at: start time of the request (by :meth:`_start_request`)
+        :type started_at: :obj:`float`
+        :param status_code: response status code (``None`` if request has failed)
+        :type status_code: :obj:`Optional[int]`
+        :param base_url: base URL of the mirror that request has been sent to
+        :type base_url: :obj:`Optional[str]`
+        :keyword language_code: language of the searched word
+        :type language_code: :obj:`Optional[LanguageCodes]`
+        :keyword error: error that request has failed with
+        :type error: :obj:`Optional[BaseException]`
+        :keyword timings: timings of the lookup that request is sent for (network stage is recorded)
+        :type timings: :obj:`Optional[LookupTimings]`
+
+        :return: whether request has failed (error, timeout, 429 or 5xx response)
+        :rtype: :obj:`bool`
+        """
+
+        finished_at = time.monotonic()
+        is_failed = status_code is None or AdaptiveConcurrencyLimiter.is_overload_status(status_code)
+
+        if self._concurrency_limiter is not None:
+            self._concurrency_limiter.record(started_at, is_overloaded=is_failed, finished_at=finished_at)
+
+        if base_url is not None:
+            self._mirror_pool.record(base_url, finished_at - started_at, is_failed=is_failed)
+
+        if self._metrics is not None:
+            self._metrics.request_finished(language_code, finished_at - started_at, error=error)
+
+        if timings is not None:
+            timings.network += finished_at - started_at
+
+        return is_failed
+
+    def _record_response_body(self, payload_size: int, decoding_started_at: float) -> None:
+        """
+        Record received response body in the metrics and in the timings of the current lookup (if they are set).
+
+        Supposed to be called by the implemented ``fetch_api_response`` right after JSON decoding.
+
+        :param payload_size: size of the response body in bytes
+        :type payload_size: :obj:`int`
+        :param decoding_started_at: start time of the JSON decoding (by :func:`time.perf_counter`)
+        :type decoding_started_at: :obj:`float`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        if self._metrics is not None:
+            self._metrics.bytes_received(payload_size)
+
+        timings = None if _current_timings is None else _current_timings.get()
+
+        if timings is not None:
+            decoding = time.perf_counter() - decoding_started_at
+
+            timings.decoding += decoding
+            # the whole request (with decoding) is recorded in the network stage after that
+            timings.network -= decoding
+            timings.payload_size = payload_size
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _collecting_timings(timings: typing.Optional[LookupTimings]) -> typing.Iterator[None]:
+        """
+        Make timings current for the requests of the lookup (so JSON decoding is timed).
+
+        :param timings: timings of the lookup
+        :type timings: :obj:`Optional[LookupTimings]`
+        """
+
+        if timings is None or _current_timings is None:
+            yield
+            return
+
+        token = _current_timings.set(timings)
+
+        try:
+            yield
+        finally:
+            _current_timings.reset(token)
+
+    @contextlib.contextmanager
+    def _counting_request_in_flight(self, *, is_foreground: bool) -> typing.Iterator[None]:
+        """
+        Count request of the lookup (or refresh) in flight till it is finished.
+
+        :keyword is_foreground: whether request is sent for the foreground lookup
+            (not for prefetch, refresh or lookup with background priority)
+        :type is_foreground: :obj:`bool`
+        """
+
+        with self._requests_in_flight_lock:
+            self._requests_in_flight_count += 1
+            self._foreground_requests_in_flight_count += is_foreground
+
+        try:
+            yield
+        finally:
+            with self._requests_in_flight_lock:
+                self._requests_in_flight_count -= 1
+                self._foreground_requests_in_flight_count -= is_foreground
+
+    def _is_foreground_busy(self) -> bool:
+        """
+        Check whether foreground requests are in flight or requests in flight have reached limit
+        of the adaptive limiter (if it is set), so prefetches are dropped (they never take capacity from foreground).
+
+        :return: whether foreground is busy
+        :rtype: :obj:`bool`
+        """
+
+        if self._foreground_requests_in_flight_count > 0:
+            return True
+
+        return (
+            self._concurrency_limiter is not None
+            and self._requests_in_flight_count >= self._concurrency_limiter.limit
+        )
+
+    def _create_timings(self) -> typing.Optional[LookupTimings]:
+        """
+        Create timings of the lookup if they are collected.
+
+        :return: timings of the lookup or ``None`` if they are not collected
+        :rtype: :obj:`Optional[LookupTimings]`
+        """
+
+        return LookupTimings() if self._collect_timings else None
+
+    def _check_slow_lookup(self, result: LookupResult) -> None:
+        """
+        Log lookup as slow if it has taken more than threshold.
+
+        Lookups that parse the response (``fetch_parser``, ``fetch_word``, ``fetch_word_or_none``)
+        are checked after parsing, so parsing stage is counted,
+        others (``fetch_result``, ``fetch_json``, batch lookups) are checked before parsing.
+
+        :param result: lookup result
+        :type result: :obj:`LookupResult`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        timings = result.timings
+
+        if self._slow_lookup_threshold is None or timings is None or timings.total < self._slow_lookup_threshold:
+            return
+
+        logger.warning(
+            f'Slow lookup of the word {result.searched_word!r} [language_code={result.language_code!r}, '
+            f'status_code={result.status_code!r}]: {timings.format()}.'
+        )
+
+    def _unpack_api_response(self, api_response: tuple
+                             ) -> typing.Tuple[int, typing.Any, typing.Optional[typing.Mapping]]:
+        """
+        Unpack data of the API response returned by ``fetch_api_response``
+        (response headers are optional, so implementations that do not return them are supported).
+
+        Successful response is interned with the string pool (if it is set) right here -
+        before it is cached or stored in the result,
+        so only the interned copy of the response is kept.
+
+        :param api_response: tuple of the status code, JSON response and (optionally) response headers
+        :type api_response: :obj:`tuple`
+
+        :return: tuple of:
+
+            - response status code;
+            - python object loaded from API response with JSON decoding;
+            - response headers (``None`` if they are not returned).
+        :rtype: :obj:`tuple[int, Any, Optional[Mapping]]`
+        """
+
+        if len(api_response) == 2:
+            status_code, response = api_response
+            response_headers = None
+        else:
+            status_code, response, response_headers = api_response
+
+        if self._string_pool is not None and status_code == HTTPStatus.OK:
+            response = self._string_pool.intern_data(response)
+
+        return (status_code, response, response_headers)
+
+    @staticmethod
+    def _get_header(headers: typing.Optional[typing.Mapping[str, str]], name: str) -> typing.Optional[str]:
+        """
+        Get value of the response header (case-insensitively).
+
+        :param headers: response headers
+        :type headers: :obj:`Optional[Mapping[str, str]]`
+        :param name: name of the header
+        :type name: :obj:`str`
+
+        :return: value of the header or ``None`` if there is no such header
+        :rtype: :obj:`Optional[str]`
+        """
+
+        if not headers:
+            return None
+
+        # headers of HTTP libraries are case-insensitive, plain mappings are scanned
+        value = headers.get(name)
+
+        if value is not None:
+            return value
+
+        name = name.lower()
+
+        return next((value for key, value in headers.items() if key.lower() == name), None)
+
+    def _get_mirror_url(self, url: str, base_url: str) -> str:
+        """
+        Get URL of the same API request for other mirror.
+
+        :param url: URL that generated for API request (with the primary mirror)
+        :type url: :obj:`str`
+        :param base_url: base URL of the mirror
+        :type base_url: :obj:`str`
+
+        :return: URL of the API request for the mirror
+        :rtype: :obj:`str`
+        """
+
+        return base_url + url[len(self._mirror_pool.primary_base_url):]
+
+    def _analyze_response(self, url: str, status_code: int, response: typing.Union[dict, list], *,
+                          word: typing.Optional[str] = None,
+                          language_code: typing.Optional[LanguageCodes] = None,
+                          raise_error: bool = True
+                          ) -> typing.Union[dict, list]:
         """
         Analyze API response.
 
         Do this:
 
             - log about response status (successful | unsuccessful);
-            - raise correspond error if response is not successful.
+            - count response status in the metrics (if they are set);
+            - treat 304 (Not Modified) as successful revalidation of the cached response (cache hit);
+            - add searched word in the missing words filter if response status is 404 (Not Found);
+            - raise correspond error if response is not successful (and ``raise_error`` is set).
 
         :param url: URL that generated for API request
         :type url: :obj:`str`
@@ -96,6 +652,13 @@ class BaseDictionaryApiClientInterface(abc.ABC):
         :type status_code: :obj:`int`
         :param response: API response that loaded in python object
         :type response: :obj:`Union[dict, list]`
+        :keyword word: searched word (used to feed the missing words filter)
+        :type word: :obj:`Optional[str]`
+        :keyword language_code: language of the searched word (used to feed the missing words filter)
+        :type language_code: :obj:`Optional[LanguageCodes]`
+        :keyword raise_error: whether to raise error if response is not successful
+            (otherwise error and its message are not built at all)
+        :type raise_error: :obj:`bool`
 
         :return: passed response
         :rtype: :obj:`Union[dict, list]`
@@ -104,23 +667,111 @@ class BaseDictionaryApiClientInterface(abc.ABC):
             :DictionaryApiError: when unsuccessful status code got of API request
         """
 
+        if self._metrics is not None:
+            self._metrics.response_analyzed(status_code)
+
+        if status_code == HTTPStatus.NOT_MODIFIED:
+            log_event(
+                logger, logging.INFO, 'response_received',
+                'Cached response is not modified [code=%(status_code)s] from url: %(url)s.',
+                status_code=status_code, url=url
+            )
+
+            return response
+
         if status_code != HTTPStatus.OK:
-            # get error type by status code from error mapper
-            # by default get common error
-            error = API_ERRORS_MAPPER.get(status_code, DictionaryApiError)
+            log_event(
+                logger, logging.INFO, 'response_received',
+                'Response is not successful [code=%(status_code)r] from url: %(url)r.',
+                status_code=status_code, url=url
+            )
 
-            error_parser = DictionaryApiErrorParser(status_code, response)
-            error_message = error_parser.get_formatted_error_message()
+            if (
+                    status_code == HTTPStatus.NOT_FOUND
+                    and self._missing_words_filter is not None
+                    and word is not None
+                    and language_code is not None
+            ):
+                self._missing_words_filter.add(fold_word(word, language_code), language_code)
 
-            logger.info(f'Response is not successful [code={status_code!r}] from url: {url!r}.')
+            if raise_error:
+                # get error type by status code from error mapper
+                # by default get common error
+                error = API_ERRORS_MAPPER.get(status_code, DictionaryApiError)
 
-            raise error(error_message)
+                error_parser = DictionaryApiErrorParser(status_code, response)
+                error_message = error_parser.get_formatted_error_message()
 
-        logger.info(f'Response is successful [code={status_code}] from url: {url}.')
+                raise error(error_message)
+
+            return response
+
+        log_event(
+            logger, logging.INFO, 'response_received',
+            'Response is successful [code=%(status_code)s] from url: %(url)s.',
+            status_code=status_code, url=url
+        )
 
         return response
 
-    def _generate_url(self, word: str, language_code: typing.Optional[LanguageCodes] = None
+    def _make_result(self, url: str, status_code: int, response: typing.Any, *,
+                     word: str,
+                     language_code: LanguageCodes,
+                     timings: typing.Optional[LookupTimings] = None,
+                     revalidated_entry: typing.Optional[CachedResponse] = None
+                     ) -> LookupResult:
+        """
+        Analyze API response (without error raising) and make lookup result of it.
+
+        If API responded to the conditional request with 304 (Not Modified),
+        result is made of the revalidated cached response.
+
+        :param url: URL that generated for API request
+        :type url: :obj:`str`
+        :param status_code: response status code
+        :type status_code: :obj:`int`
+        :param response: API response that loaded in python object
+        :type response: :obj:`Any`
+        :keyword word: searched word
+        :type word: :obj:`str`
+        :keyword language_code: language of the searched word
+        :type language_code: :obj:`LanguageCodes`
+        :keyword timings: timings of the lookup (analysis stage is recorded)
+        :type timings: :obj:`Optional[LookupTimings]`
+        :keyword revalidated_entry: cached response that request has been conditional for
+        :type revalidated_entry: :obj:`Optional[CachedResponse]`
+
+        :return: lookup result
+        :rtype: :obj:`LookupResult`
+        """
+
+        started_at = time.perf_counter()
+
+        self._analyze_response(url, status_code, response, word=word, language_code=language_code, raise_error=False)
+
+        if timings is not None:
+            timings.analysis = time.perf_counter() - started_at
+
+        if (
+                revalidated_entry is not None
+                and self._renew_cached_response(word, language_code, revalidated_entry, status_code)
+        ):
+            result = LookupResult(
+                word, language_code, revalidated_entry.url, revalidated_entry.status_code, revalidated_entry.response,
+                is_cached=True, timings=timings
+            )
+
+            return result
+
+        result = LookupResult(
+            word, language_code, url, status_code, response,
+            timings=timings
+        )
+
+        return result
+
+    def _generate_url(self, word: str, language_code: typing.Optional[LanguageCodes] = None, *,
+                      timings: typing.Optional[LookupTimings] = None
                       ) -> typing.Tuple[str, LanguageCodes]:
         """
         Generate URL for API request.
@@ -129,6 +780,8 @@ class BaseDictionaryApiClientInterface(abc.ABC):
         :type word: :obj:`str`
         :param language_code: language of the searched word
         :type language_code: :obj:`Optional[LanguageCodes]`
+        :keyword timings: timings of the lookup (URL generation stage is recorded)
+        :type timings: :obj:`Optional[LookupTimings]`
 
         :return: tuple of:
 
@@ -137,7 +790,544 @@ class BaseDictionaryApiClientInterface(abc.ABC):
         :rtype: :obj:`Union[str, LanguageCodes]`
         """
 
+        started_at = time.perf_counter()
+
         language_code: LanguageCodes = self._default_language_code if language_code is None else language_code
-        url = ApiUrl(word, language_code=language_code).get_url()
+        url = self._url_builder.build(word, language_code)
+
+        if timings is not None:
+            timings.url_generation = time.perf_counter() - started_at
 
         return (url, language_code)
+
+    def _check_missing_words_filter(self, word: str, language_code: LanguageCodes, url: str, *,
+                                    timings: typing.Optional[LookupTimings] = None
+                                    ) -> typing.Optional[LookupResult]:
+        """
+        Check whether searched word is in the missing words filter.
+
+        If word is almost certainly missing - request should not be sent,
+        result is the same as API does for the missing word (404).
+
+        :param word: searched word
+        :type word: :obj:`str`
+        :param language_code: language of the searched word
+        :type language_code: :obj:`LanguageCodes`
+        :param url: URL that generated for API request
+        :type url: :obj:`str`
+        :keyword timings: timings of the lookup (attached to the result)
+        :type timings: :obj:`Optional[LookupTimings]`
+
+        :return: lookup result of the missing word or ``None`` if word is not in the filter
+        :rtype: :obj:`Optional[LookupResult]`
+        """
+
+        if self._missing_words_filter is None:
+            return None
+
+        # variants of the word (case, whitespaces, Unicode composition) share the filter entry
+        is_missing = self._missing_words_filter.might_contain(fold_word(word, language_code), language_code)
+
+        if self._metrics is not None:
+            self._metrics.cache_looked_up('missing_words_filter', is_hit=is_missing)
+
+        if not is_missing:
+            return None
+
+        log_event(
+            logger, logging.INFO, 'word_filtered',
+            'Word %(word)r [language_code=%(language_code)r] is found in the missing words filter.',
+            word=word, language_code=language_code
+        )
+
+        result = LookupResult(word, language_code, url, HTTPStatus.NOT_FOUND, None, is_filtered=True, timings=timings)
+
+        return result
+
+    def _check_response_cache(self, word: str, language_code: LanguageCodes, *,
+                              timings: typing.Optional[LookupTimings] = None
+                              ) -> typing.Tuple[typing.Optional[LookupResult], bool]:
+        """
+        Check whether response of the lookup is in the response cache.
+
+        Stale response (past its soft TTL) is returned as well,
+        the only caller gets the sign to refresh it in the background.
+
+        :param word: searched word
+        :type word: :obj:`str`
+        :param language_code: language of the searched word
+        :type language_code: :obj:`LanguageCodes`
+        :keyword timings: timings of the lookup (attached to the result)
+        :type timings: :obj:`Optional[LookupTimings]`
+
+        :return: tuple of:
+
+            - lookup result of the cached response or ``None`` if response is not cached;
+            - whether cached response should be refreshed in the background.
+        :rtype: :obj:`tuple[Optional[LookupResult], bool]`
+        """
+
+        if self._response_cache is None:
+            return (None, False)
+
+        key = get_canonical_key(word, language_code)
+        entry = self._response_cache.get(key)
+
+        if self._metrics is not None:
+            self._metrics.cache_looked_up('response_cache', is_hit=entry is not None)
+
+        if entry is None:
+            return (None, False)
+
+        is_stale = not entry.is_fresh(self._response_cache.now())
+        is_refresh_needed = is_stale and self._response_cache.start_refresh(key)
+
+        log_event(
+            logger, logging.DEBUG, 'cache_hit',
+            'Response for the word %(word)r [language_code=%(language_code)r] is taken from the cache '
+            '[is_stale=%(is_stale)r].',
+            word=word, language_code=language_code, is_stale=is_stale
+        )
+
+        result = LookupResult(
+            word, language_code, entry.url, entry.status_code, entry.response,
+            is_cached=True, is_stale=is_stale, timings=timings
+        )
+
+        return (result, is_refresh_needed)
+
+    def _get_revalidated_entry(self, word: str, language_code: LanguageCodes) -> typing.Optional[CachedResponse]:
+        """
+        Get cached response (stale or hard expired) that request of the lookup should be conditional for.
+
+        :param word: searched word
+        :type word: :obj:`str`
+        :param language_code: language of the searched word
+        :type language_code: :obj:`LanguageCodes`
+
+        :return: cached response with validators (``ETag``, ``Last-Modified``)
+            or ``None`` if request should not be conditional
+        :rtype: :obj:`Optional[CachedResponse]`
+        """
+
+        if self._response_cache is None:
+            return None
+
+        entry = self._response_cache.peek(get_canonical_key(word, language_code))
+
+        if entry is None or not entry.conditional_headers:
+            return None
+
+        return entry
+
+    def _renew_cached_response(self, word: str, language_code: LanguageCodes, entry: CachedResponse,
+                               status_code: int
+                               ) -> bool:
+        """
+        Renew cached response if API responded to the conditional request with 304 (Not Modified).
+
+        Revalidation is counted in the metrics (if they are set): 304 is hit, other response is miss.
+
+        :param word: searched word
+        :type word: :obj:`str`
+        :param language_code: language of the searched word
+        :type language_code: :obj:`LanguageCodes`
+        :param entry: cached response that request has been conditional for
+        :type entry: :obj:`CachedResponse`
+        :param status_code: response status code
+        :type status_code: :obj:`int`
+
+        :return: whether cached response is not modified (and has been renewed)
+        :rtype: :obj:`bool`
+        """
+
+        is_not_modified = status_code == HTTPStatus.NOT_MODIFIED
+
+        if self._metrics is not None:
+            self._metrics.cache_looked_up('revalidation', is_hit=is_not_modified)
+
+        if is_not_modified:
+            self._response_cache.renew(get_canonical_key(word, language_code), entry)
+
+        return is_not_modified
+
+    def _cache_response(self, word: str, language_code: LanguageCodes, url: str, status_code: int,
+                        response: typing.Any,
+                        response_headers: typing.Optional[typing.Mapping[str, str]] = None
+                        ) -> None:
+        """
+        Put response of the lookup in the response cache (if it is set and status code is cacheable)
+        with its validators (``ETag``, ``Last-Modified``).
+
+        :param word: searched word
+        :type word: :obj:`str`
+        :param language_code: language of the searched word
+        :type language_code: :obj:`LanguageCodes`
+        :param url: URL that request has been sent to
+        :type url: :obj:`str`
+        :param status_code: response status code
+        :type status_code: :obj:`int`
+        :param response: API response that loaded in python object
+        :type response: :obj:`Any`
+        :param response_headers: response headers (if implementation of ``fetch_api_response`` returns them)
+        :type response_headers: :obj:`Optional[Mapping[str, str]]`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        if self._response_cache is None:
+            return
+
+        self._response_cache.set(
+            get_canonical_key(word, language_code), url, status_code, response,
+            etag=self._get_header(response_headers, 'ETag'),
+            last_modified=self._get_header(response_headers, 'Last-Modified')
+        )
+
+    def _finish_refresh(self, word: str, language_code: LanguageCodes, *,
+                        url: typing.Optional[str] = None,
+                        status_code: typing.Optional[int] = None,
+                        response: typing.Any = None,
+                        response_headers: typing.Optional[typing.Mapping[str, str]] = None,
+                        revalidated_entry: typing.Optional[CachedResponse] = None,
+                        error: typing.Optional[BaseException] = None
+                        ) -> None:
+        """
+        Finish background refresh of the stale cached response.
+
+        Definite response (see :const:`CACHEABLE_STATUS_CODES`) replaces the cached one,
+        304 (Not Modified) response to the conditional request renews the cached one,
+        on failure (error or other response) stale response is kept and next refresh is backed off.
+
+        :param word: searched word
+        :type word: :obj:`str`
+        :param language_code: language of the searched word
+        :type language_code: :obj:`LanguageCodes`
+        :keyword url: URL that request has been sent to
+        :type url: :obj:`Optional[str]`
+        :keyword status_code: response status code (``None`` if request has failed)
+        :type status_code: :obj:`Optional[int]`
+        :keyword response: API response that loaded in python object
+        :type response: :obj:`Any`
+        :keyword response_headers: response headers (if implementation of ``fetch_api_response`` returns them)
+        :type response_headers: :obj:`Optional[Mapping[str, str]]`
+        :keyword revalidated_entry: cached response that request has been conditional for
+        :type revalidated_entry: :obj:`Optional[CachedResponse]`
+        :keyword error: error that request has failed with
+        :type error: :obj:`Optional[BaseException]`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        if error is None:
+            self._analyze_response(url, status_code, response, word=word, language_code=language_code, raise_error=False)
+
+            if (
+                    revalidated_entry is not None
+                    and self._renew_cached_response(word, language_code, revalidated_entry, status_code)
+            ):
+                return
+
+            if status_code in CACHEABLE_STATUS_CODES:
+                self._cache_response(word, language_code, url, status_code, response, response_headers)
+                return
+
+        self._response_cache.fail_refresh(get_canonical_key(word, language_code))
+
+        logger.warning(
+            f'Refresh of the cached response for the word {word!r} [language_code={language_code!r}] has failed '
+            f'[status_code={status_code!r}, error={error!r}], stale response is kept.'
+        )
+
+    @staticmethod
+    def _check_warmup_arguments(*, top: typing.Optional[int],
+                                budget: typing.Optional[float],
+                                concurrency: int,
+                                timeout: typing.Optional[float] = None
+                                ) -> None:
+        """
+        Check arguments of the cache warm-up.
+
+        :keyword top: count of the most frequent words to warm up
+        :type top: :obj:`Optional[int]`
+        :keyword budget: maximum rate of the warm-up requests (per second)
+        :type budget: :obj:`Optional[float]`
+        :keyword concurrency: maximum count of the warm-up requests in flight
+        :type concurrency: :obj:`int`
+        :keyword timeout: timeout budget of each lookup (in seconds)
+        :type timeout: :obj:`Optional[float]`
+
+        :return: None
+        :rtype: :obj:`None`
+
+        :raise:
+            :ValueError: if ``top``, ``budget``, ``concurrency`` or ``timeout`` is not positive
+        """
+
+        if (
+                concurrency <= 0
+                or any(argument is not None and argument <= 0 for argument in (top, budget, timeout))
+        ):
+            message = (
+                '`top`, `budget`, `concurrency` and `timeout` arguments have to be positive. '
+                f'Got (top={top!r}, budget={budget!r}, concurrency={concurrency!r}, timeout={timeout!r}).'
+            )
+            raise ValueError(message)
+
+    def _rank_warmup_words(self, words_with_weights: typing.Union[typing.Mapping[str, float],
+                                                                  typing.Iterable[typing.Tuple[str, float]]],
+                           language_code: LanguageCodes,
+                           top: typing.Optional[int] = None
+                           ) -> typing.List[str]:
+        """
+        Get words of the frequency list to warm up (the most frequent first).
+
+        Variants of the word (see :func:`freedictionaryapi.canonical.get_canonical_key`) are warmed up once.
+
+        :param words_with_weights: frequency list - mapping or pairs of the word and its weight (frequency)
+        :type words_with_weights: :obj:`Union[Mapping[str, float], Iterable[tuple[str, float]]]`
+        :param language_code: language of the words
+        :type language_code: :obj:`LanguageCodes`
+        :param top: count of the most frequent words to warm up (all words if it is not passed)
+        :type top: :obj:`Optional[int]`
+
+        :return: words in order of frequency
+        :rtype: :obj:`List[str]`
+        """
+
+        if isinstance(words_with_weights, typing.Mapping):
+            words_with_weights = words_with_weights.items()
+
+        words = []
+        keys = set()
+
+        for word, _ in sorted(words_with_weights, key=lambda item: item[1], reverse=True):
+            key = get_canonical_key(word, language_code)
+
+            if key in keys:
+                continue
+
+            keys.add(key)
+            words.append(word)
+
+            if top is not None and len(words) >= top:
+                break
+
+        return words
+
+    def _is_response_cached(self, word: str, language_code: LanguageCodes) -> bool:
+        """
+        Check whether fresh response of the lookup is cached (recency and frequency of the entry are not changed).
+
+        :param word: searched word
+        :type word: :obj:`str`
+        :param language_code: language of the searched word
+        :type language_code: :obj:`LanguageCodes`
+
+        :return: whether fresh response is cached
+        :rtype: :obj:`bool`
+        """
+
+        if self._response_cache is None:
+            return False
+
+        entry = self._response_cache.peek(get_canonical_key(word, language_code))
+
+        return entry is not None and entry.is_fresh(self._response_cache.now())
+
+    @staticmethod
+    def _get_warmup_delay(progress: WarmupProgress, sent_count: int, budget: typing.Optional[float]) -> float:
+        """
+        Get delay of the next warm-up request, so requests do not exceed rate budget.
+
+        :param progress: progress of the warm-up
+        :type progress: :obj:`WarmupProgress`
+        :param sent_count: count of the sent warm-up requests
+        :type sent_count: :obj:`int`
+        :param budget: maximum rate of the warm-up requests (per second)
+        :type budget: :obj:`Optional[float]`
+
+        :return: delay in seconds (0 if request might be sent now)
+        :rtype: :obj:`float`
+        """
+
+        if budget is None:
+            return 0.0
+
+        return max(0.0, progress.started_at + sent_count / budget - time.monotonic())
+
+    @staticmethod
+    def _record_warmup_lookup(progress: WarmupProgress, word: str, *,
+                              is_skipped: bool = False,
+                              error: typing.Optional[BaseException] = None,
+                              progress_callback: typing.Optional[typing.Callable[[WarmupProgress], None]] = None
+                              ) -> None:
+        """
+        Record processed word of the warm-up and report progress.
+
+        :param progress: progress of the warm-up
+        :type progress: :obj:`WarmupProgress`
+        :param word: processed word
+        :type word: :obj:`str`
+        :keyword is_skipped: whether word has been already cached
+        :type is_skipped: :obj:`bool`
+        :keyword error: error that lookup has failed with
+        :type error: :obj:`Optional[BaseException]`
+        :keyword progress_callback: callback that progress is reported to
+        :type progress_callback: :obj:`Optional[Callable[[WarmupProgress], None]]`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        if is_skipped:
+            progress.skipped += 1
+        elif error is not None:
+            progress.failed += 1
+            logger.warning(f'Warm-up lookup of the word {word!r} has failed: {error!r}.')
+        else:
+            progress.fetched += 1
+
+        if progress_callback is not None:
+            progress_callback(progress)
+
+    @staticmethod
+    def _finish_warmup(progress: WarmupProgress) -> WarmupProgress:
+        """
+        Mark warm-up as finished and log its summary.
+
+        :param progress: progress of the warm-up
+        :type progress: :obj:`WarmupProgress`
+
+        :return: passed progress
+        :rtype: :obj:`WarmupProgress`
+        """
+
+        progress.finished_at = time.monotonic()
+
+        logger.info(
+            f'Cache warm-up has finished in {progress.elapsed:.2f}s: {progress.fetched} fetched, '
+            f'{progress.skipped} already cached, {progress.failed} failed of {progress.total} words.'
+        )
+
+        return progress
+
+    def _select_prefetched_words(self, word: Word, language_code: LanguageCodes, *,
+                                 depth: int,
+                                 pending_keys: typing.Set[str]
+                                 ) -> typing.List[str]:
+        """
+        Select synonyms of the fetched word to prefetch by the prefetch policy (if it is set).
+
+        Synonyms that are cached, pending or do not fit in the budget are not selected.
+        Canonical keys of the selected synonyms are added to the ``pending_keys``.
+
+        :param word: fetched word (parsed object)
+        :type word: :obj:`Word`
+        :param language_code: language of the fetched word
+        :type language_code: :obj:`LanguageCodes`
+        :keyword depth: distance of the synonyms from the looked up word (1 - its synonyms)
+        :type depth: :obj:`int`
+        :keyword pending_keys: canonical keys of the scheduled prefetches of the client
+        :type pending_keys: :obj:`Set[str]`
+
+        :return: synonyms to prefetch
+        :rtype: :obj:`List[str]`
+        """
+
+        policy = self._prefetch_policy
+
+        if policy is None or policy.is_cancelled or depth > policy.depth:
+            return []
+
+        synonyms = []
+
+        for synonym in policy.select_synonyms(word):
+            if len(pending_keys) >= policy.max_pending:
+                break
+
+            key = get_canonical_key(synonym, language_code)
+
+            if key in pending_keys or self._is_response_cached(synonym, language_code):
+                continue
+
+            if not policy.try_spend():
+                break
+
+            pending_keys.add(key)
+            synonyms.append(synonym)
+
+        return synonyms
+
+    @staticmethod
+    def _prepare_fanout_languages(languages: typing.Iterable[LanguageCodes]) -> typing.List[LanguageCodes]:
+        """
+        Prepare languages of the multi-language lookup (duplicates are dropped, order is kept).
+
+        :param languages: languages to look up word in
+        :type languages: :obj:`Iterable[LanguageCodes]`
+
+        :return: unique languages
+        :rtype: :obj:`List[LanguageCodes]`
+
+        :raise:
+            :TypeError: if ``languages`` contains unsupported language code
+        """
+
+        unique_languages = []
+
+        for language_code in languages:
+            if not isinstance(language_code, LanguageCodes):
+                message = (
+                    'For `languages` has been passed unsupported language code. '
+                    'Expected to get language codes with type `freedictionaryapi.languages.LanguageCodes`! '
+                    f'Got (language_code={language_code!r})'
+                )
+                raise TypeError(message)
+
+            if language_code not in unique_languages:
+                unique_languages.append(language_code)
+
+        return unique_languages
+
+    @staticmethod
+    def _get_word_or_miss(word: str, language_code: LanguageCodes,
+                          result: typing.Optional[LookupResult] = None, *,
+                          error: typing.Optional[BaseException] = None
+                          ) -> typing.Optional[Word]:
+        """
+        Get word of the lookup of the multi-language lookup or ``None`` if it is missed.
+
+        Lookup is missed if word is not found, lookup has failed or has not finished before deadline
+        (failures are logged).
+
+        :param word: searched word
+        :type word: :obj:`str`
+        :param language_code: language of the searched word
+        :type language_code: :obj:`LanguageCodes`
+        :param result: lookup result (``None`` if lookup has not finished before deadline or has failed)
+        :type result: :obj:`Optional[LookupResult]`
+        :keyword error: error that lookup has failed with
+        :type error: :obj:`Optional[BaseException]`
+
+        :return: word (parsed object) or ``None``
+        :rtype: :obj:`Optional[Word]`
+        """
+
+        if error is not None:
+            logger.warning(f'Lookup of the word {word!r} [language_code={language_code!r}] has failed: {error!r}.')
+            return None
+
+        if result is None:
+            logger.warning(f'Lookup of the word {word!r} [language_code={language_code!r}] has missed deadline.')
+            return None
+
+        if not result.is_found and not result.is_not_found:
+            logger.warning(
+                f'Lookup of the word {word!r} [language_code={language_code!r}] '
+                f'has got unsuccessful response: {result.status_code}.'
+            )
+
+        return result.word if result.is_found else None
@@ -5,12 +5,27 @@ Contains base dictionary API client.
 """
 
 import abc
+import concurrent.futures
+import inspect
 import logging
+import threading
+import time
 import typing
 
 from .base_client_interface import BaseDictionaryApiClientInterface
-from ..languages import LanguageCodes
+from ..canonical import get_canonical_key
+from ..deadlines import Deadline
+from ..languages import (
+    DEFAULT_LANGUAGE_CODE,
+    LanguageCodes
+)
+from ..logs import log_event
 from ..parsers import DictionaryApiParser
+from ..results import (
+    LookupResult,
+    LookupTimings,
+    WarmupProgress
+)
 from ..types import Word
 
 
@@ -20,6 +35,12 @@ __all__ = ['BaseDictionaryApiClient']
 logger = logging.getLogger(__name__)
 
 
+REFRESH_WORKERS = 4
+""" Count of the threads that refresh stale cached responses in the background """
+PREFETCH_WORKERS = 1
+""" Count of the threads that prefetch synonyms in the background (prefetches are sent one by one) """
+
+
 class BaseDictionaryApiClient(BaseDictionaryApiClientInterface):
     """
     Implements base dictionary API client.
@@ -28,8 +49,41 @@ class BaseDictionaryApiClient(BaseDictionaryApiClientInterface):
     for ``sync`` clients.
     """
 
+    def __init__(self, default_language_code: LanguageCodes = DEFAULT_LANGUAGE_CODE, **kwargs) -> None:
+        """
+        Init base dictionary API client instance.
+
+        :param default_language_code: default language of the searched words for the client
+        :type default_language_code: :obj:`LanguageCodes`
+        :keyword kwargs: options of the base client (see :meth:`BaseDictionaryApiClientInterface.__init__`)
+
+        :raise:
+            :TypeError: if has been passed unsupported ``default_language_code``
+        """
+
+        super().__init__(default_language_code, **kwargs)
+
+        # threads of the background refreshes are started on the first refresh
+        self._refresh_executor: typing.Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._refreshes: typing.Set[concurrent.futures.Future] = set()
+        self._refreshes_lock = threading.Lock()
+
+        # thread of the prefetches is started on the first prefetch, scheduled prefetches are mapped to their keys
+        self._prefetch_executor: typing.Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._prefetches: typing.Dict[concurrent.futures.Future, str] = {}
+        self._prefetch_keys: typing.Set[str] = set()
+        self._prefetches_lock = threading.Lock()
+        # lookups of the prefetch thread are not foreground ones
+        self._prefetch_thread_state = threading.local()
+
+        # implementations written before deadlines do not accept ``timeout``
+        self._is_timeout_accepted = self._accepts_keyword(self.fetch_api_response, 'timeout')
+
     @abc.abstractmethod
-    def fetch_api_response(self, url: str) -> typing.Tuple[int, typing.Any]:
+    def fetch_api_response(self, url: str, *,
+                           headers: typing.Optional[typing.Mapping[str, str]] = None,
+                           timeout: typing.Optional[float] = None
+                           ) -> typing.Union[typing.Tuple[int, typing.Any], typing.Tuple[int, typing.Any, typing.Mapping]]:
         """
         Fetch data of the API response.
 
@@ -91,18 +145,468 @@ class BaseDictionaryApiClient(BaseDictionaryApiClientInterface):
         you can also see some examples
         or just implementations of ready to use clients.
 
+        Optionally, implementation might call :meth:`_record_response_body`
+        right after JSON decoding, so received bytes are counted in the metrics
+        and JSON decoding is timed separately from the network.
+
+        Optionally, implementation might send passed ``headers`` with request
+        and return response headers as the third item of the tuple,
+        so cached responses are revalidated with conditional requests (``ETag``, ``Last-Modified``).
+        Response to the conditional request might be 304 (Not Modified) without body
+        (``None`` is returned instead of the JSON response then).
+        ``headers`` are passed only for conditional requests,
+        so implementations that do not accept them work without revalidation.
+
+        Optionally, implementation might accept ``timeout`` (remaining budget of the lookup in seconds)
+        and apply it to the request as the limit of its total time, so request fails fast on deadline.
+        ``timeout`` is passed only for lookups with deadline and only to implementations that accept it.
+        Either way deadline is checked after the request:
+        response that has come past deadline fails the lookup with timeout error.
+
 
         :param url: url that is generated by input params in invoked function
         :type url: :obj:`str`
+        :keyword headers: headers of the conditional request (``If-None-Match``, ``If-Modified-Since``)
+        :type headers: :obj:`Optional[Mapping[str, str]]`
+        :keyword timeout: timeout of the request (in seconds)
+        :type timeout: :obj:`Optional[float]`
 
         :return: tuple of:
 
             - response status code;
-            - python object loaded from API response with JSON decoding.
-        :rtype: :obj:`tuple[int, Any]`
+            - python object loaded from API response with JSON decoding;
+            - (optionally) response headers.
+        :rtype: :obj:`Union[tuple[int, Any], tuple[int, Any, Mapping]]`
+        """
+
+    @staticmethod
+    def _accepts_keyword(function: typing.Callable, name: str) -> bool:
+        """
+        Check whether function accepts keyword argument.
+
+        :param function: checked function
+        :type function: :obj:`Callable`
+        :param name: name of the keyword argument
+        :type name: :obj:`str`
+
+        :return: whether function accepts keyword argument (``True`` if signature is not available)
+        :rtype: :obj:`bool`
+        """
+
+        try:
+            parameters = inspect.signature(function).parameters
+        except (TypeError, ValueError):
+            return True
+
+        return name in parameters or any(
+            parameter.kind is inspect.Parameter.VAR_KEYWORD
+            for parameter in parameters.values()
+        )
+
+    def _send_request(self, url: str, *,
+                      headers: typing.Optional[typing.Mapping[str, str]] = None,
+                      language_code: typing.Optional[LanguageCodes] = None,
+                      timings: typing.Optional[LookupTimings] = None,
+                      deadline: typing.Optional[Deadline] = None
+                      ) -> typing.Tuple[str, int, typing.Any, typing.Optional[typing.Mapping]]:
+        """
+        Send request to the API (with :meth:`fetch_api_response`).
+
+        Request is recorded in the adaptive limiter, in the metrics and in the timings (if they are set).
+        If mirrors are set, request is sent to the chosen mirror
+        and on failure (error, timeout, 429 or 5xx response) it is sent to the next one.
+        If deadline is set, each request gets its remaining budget as timeout
+        (if implementation accepts it), response that has come past deadline is not returned
+        and request is not retried when budget is exhausted.
+
+        :param url: URL that generated for API request
+        :type url: :obj:`str`
+        :keyword headers: headers of the conditional request (passed to ``fetch_api_response`` only if they are set)
+        :type headers: :obj:`Optional[Mapping[str, str]]`
+        :keyword language_code: language of the searched word (used by the metrics)
+        :type language_code: :obj:`Optional[LanguageCodes]`
+        :keyword timings: timings of the lookup (network stage is recorded)
+        :type timings: :obj:`Optional[LookupTimings]`
+        :keyword deadline: deadline of the lookup
+        :type deadline: :obj:`Optional[Deadline]`
+
+        :return: tuple of:
+
+            - URL that request has been sent to;
+            - response status code;
+            - python object loaded from API response with JSON decoding;
+            - response headers (``None`` if implementation of ``fetch_api_response`` does not return them).
+        :rtype: :obj:`tuple[str, int, Any, Optional[Mapping]]`
+
+        :raise:
+            :DictionaryApiTimeoutError: if lookup has exceeded its deadline
+            :Exception: error raised by the request (to the last mirror)
+        """
+
+        tried_base_urls: typing.List[str] = []
+        last_error: typing.Optional[Exception] = None
+        options = self._get_request_options(headers)
+
+        while True:
+            if deadline is not None:
+                if deadline.is_expired:
+                    stage = 'retrying request' if tried_base_urls else 'sending request'
+                    raise deadline.make_error(stage) from last_error
+
+                if self._is_timeout_accepted:
+                    options['timeout'] = deadline.remaining
+
+            if self._mirror_pool is None:
+                base_url, request_url = None, url
+            else:
+                base_url = self._mirror_pool.choose(tried_base_urls)
+
+                if base_url is None:
+                    # all mirrors have failed
+                    raise last_error
+
+                request_url = self._get_mirror_url(url, base_url)
+                tried_base_urls.append(base_url)
+
+            started_at = self._start_request(language_code)
+
+            try:
+                api_response = self.fetch_api_response(request_url, **options)
+                response_status_code, json_response, response_headers = self._unpack_api_response(api_response)
+            except Exception as error:
+                self._record_request(
+                    started_at, None, base_url,
+                    language_code=language_code, error=error, timings=timings
+                )
+
+                if deadline is not None and deadline.is_expired:
+                    raise deadline.make_error('waiting for response') from error
+
+                if base_url is None:
+                    raise
+
+                logger.warning(f'Request to the mirror {base_url!r} has failed: {error!r}.')
+
+                last_error = error
+                continue
+
+            is_failed = self._record_request(
+                started_at, response_status_code, base_url,
+                language_code=language_code, timings=timings
+            )
+
+            # implementation might overrun the budget (or not apply it at all)
+            if deadline is not None and deadline.is_expired:
+                raise deadline.make_error('waiting for response')
+
+            if (
+                    is_failed and base_url is not None and len(tried_base_urls) < len(self._mirror_pool)
+                    # failed response is returned if there is no budget to retry
+                    and (deadline is None or not deadline.is_expired)
+            ):
+                logger.warning(f'Mirror {base_url!r} has responded with {response_status_code!r}, try next one.')
+                continue
+
+            return (request_url, response_status_code, json_response, response_headers)
+
+    def fetch_result(self, word: str, language_code: typing.Optional[LanguageCodes] = None, *,
+                     bypass_filter: bool = False,
+                     timeout: typing.Optional[typing.Union[float, Deadline]] = None
+                     ) -> LookupResult:
+        """
+        Fetch lookup result - lightweight result that is returned instead of raising error.
+
+        Unsuccessful response (the most often - 404, word is not found) is not raised,
+        error and its message are built only on demand (see :obj:`LookupResult`).
+
+        :param word: searched word
+        :type word: :obj:`str`
+        :param language_code: language of the searched word
+        :type language_code: :obj:`Optional[LanguageCodes]`
+        :keyword bypass_filter: send request even if word is in the missing words filter
+        :type bypass_filter: :obj:`bool`
+        :keyword timeout: timeout budget of the lookup (in seconds) or deadline shared by lookups
+            (without deadline if it is not passed)
+        :type timeout: :obj:`Optional[Union[float, Deadline]]`
+
+        :return: lookup result
+        :rtype: :obj:`LookupResult`
+
+        :raise:
+            :DictionaryApiTimeoutError: if lookup has exceeded its deadline
+        """
+
+        result = self._fetch_result(
+            word, language_code,
+            bypass_filter=bypass_filter, timeout=timeout
+        )
+        self._check_slow_lookup(result)
+
+        return result
+
+    def _fetch_result(self, word: str, language_code: typing.Optional[LanguageCodes] = None, *,
+                       bypass_filter: bool = False,
+                       timeout: typing.Optional[typing.Union[float, Deadline]] = None
+                       ) -> LookupResult:
+        """
+        Fetch lookup result without checking whether lookup is slow
+        (callers check it with :meth:`_check_slow_lookup` after parsing if they parse the response).
+        """
+
+        deadline = Deadline.from_timeout(timeout)
+        timings = self._create_timings()
+        url, language_code = self._generate_url(word, language_code, timings=timings)
+
+        cached_result, is_refresh_needed = self._check_response_cache(word, language_code, timings=timings)
+
+        if cached_result is not None:
+            if is_refresh_needed:
+                self._schedule_refresh(word, language_code, url)
+
+            return cached_result
+
+        if not bypass_filter:
+            filtered_result = self._check_missing_words_filter(word, language_code, url, timings=timings)
+
+            if filtered_result is not None:
+                return filtered_result
+
+        log_event(
+            logger, logging.INFO, 'request_sent',
+            'Send request to API with word %(word)r and language code %(language_code)r. URL: %(url)r.',
+            word=word, language_code=language_code, url=url
+        )
+
+        # hard expired cached response is revalidated with conditional request
+        revalidated_entry = self._get_revalidated_entry(word, language_code)
+        headers = None if revalidated_entry is None else revalidated_entry.conditional_headers
+
+        is_foreground = not getattr(self._prefetch_thread_state, 'is_prefetching', False)
+
+        with self._collecting_timings(timings), self._counting_request_in_flight(is_foreground=is_foreground):
+            url, response_status_code, json_response, response_headers = self._send_request(
+                url,
+                headers=headers, language_code=language_code, timings=timings, deadline=deadline
+            )
+
+        # logging - handling of API errors (without raising them)
+        result = self._make_result(
+            url, response_status_code, json_response,
+            word=word, language_code=language_code, timings=timings, revalidated_entry=revalidated_entry
+        )
+
+        self._cache_response(word, language_code, url, response_status_code, json_response, response_headers)
+
+        return result
+
+    def _schedule_refresh(self, word: str, language_code: LanguageCodes, url: str) -> None:
+        """
+        Refresh stale cached response in the background thread.
+
+        :param word: searched word
+        :type word: :obj:`str`
+        :param language_code: language of the searched word
+        :type language_code: :obj:`LanguageCodes`
+        :param url: URL that generated for API request
+        :type url: :obj:`str`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        with self._refreshes_lock:
+            if self._refresh_executor is None:
+                self._refresh_executor = concurrent.futures.ThreadPoolExecutor(
+                    REFRESH_WORKERS,
+                    thread_name_prefix='freedictionaryapi-refresh'
+                )
+
+            refresh = self._refresh_executor.submit(self._refresh, word, language_code, url)
+            self._refreshes.add(refresh)
+
+        refresh.add_done_callback(self._discard_refresh)
+
+    def _discard_refresh(self, refresh: concurrent.futures.Future) -> None:
+        with self._refreshes_lock:
+            self._refreshes.discard(refresh)
+
+    def _refresh(self, word: str, language_code: LanguageCodes, url: str) -> None:
+        revalidated_entry = self._get_revalidated_entry(word, language_code)
+        headers = None if revalidated_entry is None else revalidated_entry.conditional_headers
+
+        try:
+            with self._counting_request_in_flight(is_foreground=False):
+                url, response_status_code, json_response, response_headers = self._send_request(
+                    url,
+                    headers=headers, language_code=language_code
+                )
+        except Exception as error:
+            self._finish_refresh(word, language_code, error=error)
+        else:
+            self._finish_refresh(
+                word, language_code,
+                url=url, status_code=response_status_code, response=json_response,
+                response_headers=response_headers, revalidated_entry=revalidated_entry
+            )
+
+    def wait_for_refreshes(self, timeout: typing.Optional[float] = None) -> None:
+        """
+        Wait for background refreshes of the stale cached responses that are scheduled now.
+
+        :param timeout: the longest time (in seconds) to wait for (without limit if it is not passed)
+        :type timeout: :obj:`Optional[float]`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        with self._refreshes_lock:
+            refreshes = list(self._refreshes)
+
+        concurrent.futures.wait(refreshes, timeout=timeout)
+
+    def _shutdown_refreshes(self) -> None:
+        """
+        Wait for background refreshes and stop their threads (supposed to be called on closing of the client).
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        with self._refreshes_lock:
+            executor, self._refresh_executor = self._refresh_executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _schedule_prefetches(self, word: Word, language_code: typing.Optional[LanguageCodes], depth: int = 1) -> None:
+        """
+        Prefetch synonyms of the fetched word in the background thread (by the prefetch policy if it is set).
+
+        Prefetches are dropped while foreground requests are in flight (see :meth:`_is_foreground_busy`).
+
+        :param word: fetched word (parsed object)
+        :type word: :obj:`Word`
+        :param language_code: language of the fetched word
+        :type language_code: :obj:`Optional[LanguageCodes]`
+        :param depth: distance of the synonyms from the looked up word
+        :type depth: :obj:`int`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        if self._prefetch_policy is None or self._is_foreground_busy():
+            return
+
+        language_code: LanguageCodes = self._default_language_code if language_code is None else language_code
+        prefetches = []
+
+        with self._prefetches_lock:
+            synonyms = self._select_prefetched_words(
+                word, language_code,
+                depth=depth, pending_keys=self._prefetch_keys
+            )
+
+            if synonyms and self._prefetch_executor is None:
+                self._prefetch_executor = concurrent.futures.ThreadPoolExecutor(
+                    PREFETCH_WORKERS,
+                    thread_name_prefix='freedictionaryapi-prefetch'
+                )
+
+            for synonym in synonyms:
+                prefetch = self._prefetch_executor.submit(self._prefetch, synonym, language_code, depth)
+                self._prefetches[prefetch] = get_canonical_key(synonym, language_code)
+                prefetches.append(prefetch)
+
+        # callback of the done future is called immediately, so it is added out of the lock
+        for prefetch in prefetches:
+            prefetch.add_done_callback(self._discard_prefetch)
+
+    def _discard_prefetch(self, prefetch: concurrent.futures.Future) -> None:
+        with self._prefetches_lock:
+            self._prefetch_keys.discard(self._prefetches.pop(prefetch, None))
+
+    def _prefetch(self, word: str, language_code: LanguageCodes, depth: int) -> None:
+        self._prefetch_thread_state.is_prefetching = True
+
+        if (
+                self._prefetch_policy.is_cancelled
+                or self._is_foreground_busy()
+                or self._is_response_cached(word, language_code)
+        ):
+            return
+
+        try:
+            result = self.fetch_result(word, language_code)
+        except Exception as error:
+            logger.warning(f'Prefetch of the word {word!r} has failed: {error!r}.')
+            return
+
+        if result.is_found:
+            self._schedule_prefetches(result.word, language_code, depth + 1)
+
+    def wait_for_prefetches(self, timeout: typing.Optional[float] = None) -> None:
         """
+        Wait for background prefetches of the synonyms (with prefetches that they schedule).
+
+        :param timeout: the longest time (in seconds) to wait for (without limit if it is not passed)
+        :type timeout: :obj:`Optional[float]`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            with self._prefetches_lock:
+                prefetches = list(self._prefetches)
+
+            if not prefetches:
+                return
+
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            _, not_done = concurrent.futures.wait(prefetches, timeout=remaining)
+
+            if not_done:
+                return
 
-    def fetch_json(self, word: str, language_code: typing.Optional[LanguageCodes] = None) -> typing.Any:
+    def cancel_prefetches(self) -> None:
+        """
+        Cancel background prefetches of the synonyms that are not started
+        (prefetch in flight is finished).
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        with self._prefetches_lock:
+            prefetches = list(self._prefetches)
+
+        for prefetch in prefetches:
+            prefetch.cancel()
+
+    def _shutdown_prefetches(self) -> None:
+        """
+        Cancel background prefetches and stop their thread (supposed to be called on closing of the client).
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        self.cancel_prefetches()
+
+        with self._prefetches_lock:
+            executor, self._prefetch_executor = self._prefetch_executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def fetch_json(self, word: str, language_code: typing.Optional[LanguageCodes] = None, *,
+                   bypass_filter: bool = False,
+                   timeout: typing.Optional[typing.Union[float, Deadline]] = None
+                   ) -> typing.Any:
         """
         Fetch API JSON response that loaded in Python object (``response.json()``).
 
@@ -110,26 +614,33 @@ class BaseDictionaryApiClient(BaseDictionaryApiClientInterface):
         :type word: :obj:`str`
         :param language_code: language of the searched word
         :type language_code: :obj:`Optional[LanguageCodes]`
+        :keyword bypass_filter: send request even if word is in the missing words filter
+        :type bypass_filter: :obj:`bool`
+        :keyword timeout: timeout budget of the lookup (in seconds) or deadline shared by lookups
+            (without deadline if it is not passed)
+        :type timeout: :obj:`Optional[Union[float, Deadline]]`
 
         :return: JSON response (supposed to be :obj:`list` or :obj:`dict`)
         :rtype: :obj:`Any`
 
         :raise:
             :DictionaryApiError: when unsuccessful status code got of API request
+            :DictionaryApiTimeoutError: if lookup has exceeded its deadline
+            :DictionaryApiNotFoundError: when searched word is in the missing words filter
         """
 
-        url, language_code = self._generate_url(word, language_code)
-
-        logger.info(f'Send request to API with word {word!r} and language code {language_code!r}. URL: {url!r}.')
-
-        response_status_code, json_response = self.fetch_api_response(url)
+        result = self.fetch_result(
+            word, language_code,
+            bypass_filter=bypass_filter, timeout=timeout
+        )
+        result.raise_for_status()
 
-        # logging - handling of API errors (and raising them)
-        analyzed_response = self._analyze_response(url, response_status_code, json_response)
+        return result.response
 
-        return analyzed_response
-
-    def fetch_parser(self, word: str, language_code: typing.Optional[LanguageCodes] = None) -> DictionaryApiParser:
+    def fetch_parser(self, word: str, language_code: typing.Optional[LanguageCodes] = None, *,
+                     bypass_filter: bool = False,
+                     timeout: typing.Optional[typing.Union[float, Deadline]] = None
+                     ) -> DictionaryApiParser:
         """
         Fetch dictionary API parser.
 
@@ -137,32 +648,382 @@ class BaseDictionaryApiClient(BaseDictionaryApiClientInterface):
         :type word: :obj:`str`
         :param language_code: language of the searched word (`word`)
         :type language_code: :obj:`Optional[LanguageCodes]`
+        :keyword bypass_filter: send request even if word is in the missing words filter
+        :type bypass_filter: :obj:`bool`
+        :keyword timeout: timeout budget of the lookup (in seconds) or deadline shared by lookups
+            (without deadline if it is not passed)
+        :type timeout: :obj:`Optional[Union[float, Deadline]]`
 
         :return: dictionary API parser
         :rtype: :obj:`DictionaryApiParser`
         """
 
-        json_response = self.fetch_json(word, language_code)
-        parser = DictionaryApiParser(json_response)
+        result = self._fetch_result(
+            word, language_code,
+            bypass_filter=bypass_filter, timeout=timeout
+        )
+        # parser is built before checking, so slow parsing is logged as well
+        parser = result.parser
+        self._check_slow_lookup(result)
+
+        result.raise_for_status()
 
         return parser
 
-    def fetch_word(self, word: str, language_code: typing.Optional[LanguageCodes] = None) -> Word:
+    def fetch_word(self, word: str, language_code: typing.Optional[LanguageCodes] = None, *,
+                   bypass_filter: bool = False,
+                   timeout: typing.Optional[typing.Union[float, Deadline]] = None
+                   ) -> Word:
         """
         Fetch word (:obj:`Word`) - parsed object that has all word info.
 
         Shortcut for the :attr:`DictionaryApiParser.word`.
 
+        Synonyms of the fetched word are prefetched in the background
+        if client has the prefetch policy (see :obj:`PrefetchPolicy`).
+
         :param word: searched word
         :type word: :obj:`str`
         :param language_code: language of the searched word
         :type language_code: :obj:`Optional[LanguageCodes]`
+        :keyword bypass_filter: send request even if word is in the missing words filter
+        :type bypass_filter: :obj:`bool`
+        :keyword timeout: timeout budget of the lookup (in seconds) or deadline shared by lookups
+            (without deadline if it is not passed)
+        :type timeout: :obj:`Optional[Union[float, Deadline]]`
 
         :return: word (parsed object)
         :rtype: :obj:`Word`
         """
 
-        parser = self.fetch_parser(word, language_code)
+        parser = self.fetch_parser(
+            word, language_code,
+            bypass_filter=bypass_filter, timeout=timeout
+        )
         word = parser.word
 
+        self._schedule_prefetches(word, language_code)
+
         return word
+
+    def fetch_word_or_none(self, word: str, language_code: typing.Optional[LanguageCodes] = None, *,
+                           bypass_filter: bool = False,
+                           timeout: typing.Optional[typing.Union[float, Deadline]] = None
+                           ) -> typing.Optional[Word]:
+        """
+        Fetch word (:obj:`Word`) or ``None`` if word is not found.
+
+        Missing word is not exceptional (no error is built and raised),
+        so it is the cheapest way to look up words that might be missing.
+
+        :param word: searched word
+        :type word: :obj:`str`
+        :param language_code: language of the searched word
+        :type language_code: :obj:`Optional[LanguageCodes]`
+        :keyword bypass_filter: send request even if word is in the missing words filter
+        :type bypass_filter: :obj:`bool`
+        :keyword timeout: timeout budget of the lookup (in seconds) or deadline shared by lookups
+            (without deadline if it is not passed)
+        :type timeout: :obj:`Optional[Union[float, Deadline]]`
+
+        :return: word (parsed object) or ``None`` if word is not found
+        :rtype: :obj:`Optional[Word]`
+
+        :raise:
+            :DictionaryApiError: when unsuccessful (except 404) status code got of API request
+            :DictionaryApiTimeoutError: if lookup has exceeded its deadline
+        """
+
+        result = self._fetch_result(
+            word, language_code,
+            bypass_filter=bypass_filter, timeout=timeout
+        )
+        # parser is built before checking, so slow parsing is logged as well
+        parser = result.parser
+        self._check_slow_lookup(result)
+
+        if result.is_not_found:
+            return None
+
+        result.raise_for_status()
+
+        return parser.word
+
+    def fetch_word_across_languages(self, word: str, languages: typing.Iterable[LanguageCodes], *,
+                                    timeout: typing.Optional[typing.Union[float, Deadline]] = None,
+                                    bypass_filter: bool = False
+                                    ) -> typing.Dict[LanguageCodes, typing.Optional[Word]]:
+        """
+        Fetch word (:obj:`Word`) in several languages concurrently (in threads)
+        - translations and cognates of the headword.
+
+        Latency is the latency of the slowest language (not the sum of them),
+        lookups that have not finished before deadline (``timeout``) are missed, so they do not delay the result.
+        Missed lookups (word is not found, lookup has failed or has missed deadline) are mapped to ``None``
+        (failures are logged, not raised).
+
+        Client (``fetch_api_response``) must be thread-safe.
+
+        Usage:
+        ::
+
+            words = client.fetch_word_across_languages(
+                'hello', [LanguageCodes.ENGLISH_US, LanguageCodes.SPANISH, LanguageCodes.FRENCH], timeout=2
+            )
+
+        :param word: searched word
+        :type word: :obj:`str`
+        :param languages: languages to look up word in
+        :type languages: :obj:`Iterable[LanguageCodes]`
+        :keyword timeout: timeout budget of the whole lookup (in seconds) or deadline shared by lookups
+            (without deadline if it is not passed), each lookup is limited by it
+        :type timeout: :obj:`Optional[Union[float, Deadline]]`
+        :keyword bypass_filter: send requests even if word is in the missing words filter
+        :type bypass_filter: :obj:`bool`
+
+        :return: mapping of the language to the word (parsed object) or ``None`` if lookup is missed
+            (in order of the passed languages)
+        :rtype: :obj:`Dict[LanguageCodes, Optional[Word]]`
+
+        :raise:
+            :TypeError: if ``languages`` contains unsupported language code or ``timeout`` is not a number
+            :ValueError: if ``timeout`` is not positive
+        """
+
+        deadline = Deadline.from_timeout(timeout)
+        languages = self._prepare_fanout_languages(languages)
+
+        if not languages:
+            return {}
+
+        executor = concurrent.futures.ThreadPoolExecutor(
+            self._get_concurrency_limit(len(languages)),
+            thread_name_prefix='freedictionaryapi-fanout'
+        )
+        lookups = {
+            language_code: executor.submit(
+                self.fetch_result, word, language_code,
+                bypass_filter=bypass_filter, timeout=deadline
+            )
+            for language_code in languages
+        }
+
+        try:
+            concurrent.futures.wait(lookups.values(), timeout=None if deadline is None else deadline.remaining)
+        finally:
+            for lookup in lookups.values():
+                lookup.cancel()
+
+            # lookups that have missed deadline finish in the background
+            executor.shutdown(wait=False)
+
+        words = {}
+
+        for language_code, lookup in lookups.items():
+            if not lookup.done() or lookup.cancelled():
+                words[language_code] = self._get_word_or_miss(word, language_code)
+                continue
+
+            error = lookup.exception()
+            result = None if error is not None else lookup.result()
+
+            words[language_code] = self._get_word_or_miss(word, language_code, result, error=error)
+
+        return words
+
+    def stream_lookups(self, words: typing.Iterable[str], *,
+                       concurrency: int = 10,
+                       language_code: typing.Optional[LanguageCodes] = None,
+                       bypass_filter: bool = False,
+                       timeout: typing.Optional[typing.Union[float, Deadline]] = None
+                       ) -> typing.Iterator[LookupResult]:
+        """
+        Look up words of the source in threads and stream lookup results (in completion order).
+
+        At most ``concurrency`` requests are in flight
+        (limited by the adaptive limiter of the client if it is set),
+        words are pulled from the source only when request slot is free.
+
+        Client (``fetch_api_response``) must be thread-safe.
+
+        :param words: source of the searched words
+        :type words: :obj:`Iterable[str]`
+        :keyword concurrency: maximum count of the requests in flight (count of the threads)
+        :type concurrency: :obj:`int`
+        :keyword language_code: language of the searched words
+        :type language_code: :obj:`Optional[LanguageCodes]`
+        :keyword bypass_filter: send requests even if words are in the missing words filter
+        :type bypass_filter: :obj:`bool`
+        :keyword timeout: timeout budget of each lookup (in seconds) or deadline shared by lookups
+            (without deadline if it is not passed)
+        :type timeout: :obj:`Optional[Union[float, Deadline]]`
+
+        :return: iterator of the lookup results
+        :rtype: :obj:`Iterator[LookupResult]`
+
+        :raise:
+            :ValueError: if ``concurrency`` is not positive
+            :DictionaryApiTimeoutError: if lookup has exceeded its deadline (not started requests are cancelled)
+            :Exception: error raised by the request (not started requests are cancelled)
+        """
+
+        if concurrency <= 0:
+            message = (
+                '`concurrency` argument has been passed with not positive value. '
+                'Expected to get positive integer! '
+                f'Got (concurrency={concurrency!r}).'
+            )
+            raise ValueError(message)
+
+        words = iter(words)
+        is_exhausted = False
+        pending: typing.Set[concurrent.futures.Future] = set()
+
+        with concurrent.futures.ThreadPoolExecutor(concurrency) as executor:
+            try:
+                while True:
+                    # limit is read on each round since adaptive limiter changes it
+                    while not is_exhausted and len(pending) < self._get_concurrency_limit(concurrency):
+                        try:
+                            word = next(words)
+                        except StopIteration:
+                            is_exhausted = True
+                        else:
+                            pending.add(
+                                executor.submit(
+                                    self.fetch_result, word, language_code,
+                                    bypass_filter=bypass_filter, timeout=timeout
+                                )
+                            )
+
+                    if not pending:
+                        break
+
+                    done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+
+                    for future in done:
+                        yield future.result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def warmup(self, words_with_weights: typing.Union[typing.Mapping[str, float],
+                                                      typing.Iterable[typing.Tuple[str, float]]], *,
+               top: typing.Optional[int] = None,
+               budget: typing.Optional[float] = None,
+               concurrency: int = 4,
+               language_code: typing.Optional[LanguageCodes] = None,
+               timeout: typing.Optional[float] = None,
+               progress_callback: typing.Optional[typing.Callable[[WarmupProgress], None]] = None
+               ) -> WarmupProgress:
+        """
+        Warm up the response cache of the client (supposed to be called after deploy):
+        prefetch the most frequent words of the frequency list in order of frequency.
+
+        Warm-up yields to the live traffic:
+
+            - requests are paced so their rate does not exceed ``budget``;
+            - at most ``concurrency`` requests are in flight
+              (limited by the adaptive limiter of the client if it is set, so warm-up backs off under load);
+            - words which fresh responses are cached already are skipped (no request is sent).
+
+        Failed lookups are logged and counted, they do not stop warm-up.
+
+        Client (``fetch_api_response``) must be thread-safe.
+
+        Usage:
+        ::
+
+            client.warmup(
+                {'hello': 1200, 'world': 800, ...},
+                top=10_000, budget=50, concurrency=8,
+                progress_callback=lambda progress: print(f'{progress.ratio:.0%}')
+            )
+
+        :param words_with_weights: frequency list - mapping or pairs of the word and its weight (frequency)
+        :type words_with_weights: :obj:`Union[Mapping[str, float], Iterable[tuple[str, float]]]`
+        :keyword top: count of the most frequent words to warm up (all words if it is not passed)
+        :type top: :obj:`Optional[int]`
+        :keyword budget: maximum rate of the warm-up requests (per second, without limit if it is not passed)
+        :type budget: :obj:`Optional[float]`
+        :keyword concurrency: maximum count of the warm-up requests in flight (count of the threads)
+        :type concurrency: :obj:`int`
+        :keyword language_code: language of the words
+        :type language_code: :obj:`Optional[LanguageCodes]`
+        :keyword timeout: timeout budget of each lookup (in seconds, lookups that exceed it are counted as failed)
+        :type timeout: :obj:`Optional[float]`
+        :keyword progress_callback: callback that progress is reported to after each processed word
+        :type progress_callback: :obj:`Optional[Callable[[WarmupProgress], None]]`
+
+        :return: finished progress of the warm-up
+        :rtype: :obj:`WarmupProgress`
+
+        :raise:
+            :ValueError: if ``top``, ``budget``, ``concurrency`` or ``timeout`` is not positive
+        """
+
+        self._check_warmup_arguments(top=top, budget=budget, concurrency=concurrency, timeout=timeout)
+
+        language_code: LanguageCodes = self._default_language_code if language_code is None else language_code
+        words = self._rank_warmup_words(words_with_weights, language_code, top)
+        progress = WarmupProgress(len(words))
+
+        words = iter(words)
+        sent_count = 0
+        pending: typing.Dict[concurrent.futures.Future, str] = {}
+
+        executor = concurrent.futures.ThreadPoolExecutor(concurrency, thread_name_prefix='freedictionaryapi-warmup')
+
+        with executor:
+            try:
+                for word in words:
+                    if self._is_response_cached(word, language_code):
+                        self._record_warmup_lookup(
+                            progress, word,
+                            is_skipped=True, progress_callback=progress_callback
+                        )
+                        continue
+
+                    # limit is read on each round since adaptive limiter changes it
+                    while len(pending) >= self._get_concurrency_limit(concurrency):
+                        self._collect_warmup_lookups(pending, progress, progress_callback)
+
+                    time.sleep(self._get_warmup_delay(progress, sent_count, budget))
+
+                    pending[executor.submit(self.fetch_result, word, language_code, timeout=timeout)] = word
+                    sent_count += 1
+
+                while pending:
+                    self._collect_warmup_lookups(pending, progress, progress_callback)
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        return self._finish_warmup(progress)
+
+    def _collect_warmup_lookups(self, pending: typing.Dict[concurrent.futures.Future, str],
+                                progress: WarmupProgress,
+                                progress_callback: typing.Optional[typing.Callable[[WarmupProgress], None]]
+                                ) -> None:
+        """
+        Wait for at least one warm-up lookup in flight and record the finished ones.
+
+        :param pending: warm-up lookups in flight (future -> word)
+        :type pending: :obj:`Dict[concurrent.futures.Future, str]`
+        :param progress: progress of the warm-up
+        :type progress: :obj:`WarmupProgress`
+        :param progress_callback: callback that progress is reported to
+        :type progress_callback: :obj:`Optional[Callable[[WarmupProgress], None]]`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+
+        for future in done:
+            word = pending.pop(future)
+            self._record_warmup_lookup(
+                progress, word,
+                error=future.exception(), progress_callback=progress_callback
+            )
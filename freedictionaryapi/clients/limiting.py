@@ -0,0 +1,210 @@
+"""
+Contains adaptive concurrency limiter of the API requests.
+
+.. class:: AdaptiveConcurrencyLimiter
+"""
+
+from http import HTTPStatus
+import logging
+import threading
+import time
+import typing
+
+
+__all__ = ['AdaptiveConcurrencyLimiter']
+
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Implements adaptive concurrency limiter (AIMD - additive increase, multiplicative decrease).
+
+    Limiter observes finished requests and adjusts limit of the requests in flight:
+
+        - additive increase: while latency stays near baseline (``latency_tolerance`` times of the baseline),
+          limit grows by ``increase`` per round trip (``increase / limit`` per successful request);
+        - multiplicative decrease: on overload (429, 5xx, timeouts and other request errors)
+          limit is cut by ``decrease_factor``. Requests that have been started before the previous cut
+          do not cut limit again, so one burst of errors cuts limit once.
+
+    Baseline latency is the lowest observed latency that slowly drifts up to the current latency,
+    so it follows upstream that became slower permanently.
+
+    So throughput settles near the real capacity of the upstream on its own.
+
+    Limiter is thread-safe: it might be shared between threads of the sync batch lookups.
+    """
+
+    def __init__(self, initial_limit: int = 10, *,
+                 min_limit: int = 1,
+                 max_limit: int = 200,
+                 increase: float = 1.0,
+                 decrease_factor: float = 0.5,
+                 latency_tolerance: float = 2.0,
+                 baseline_drift: float = 0.01
+                 ) -> None:
+        """
+        Init adaptive concurrency limiter instance.
+
+        :param initial_limit: initial limit of the requests in flight
+        :type initial_limit: :obj:`int`
+        :keyword min_limit: the lowest limit
+        :type min_limit: :obj:`int`
+        :keyword max_limit: the highest limit
+        :type max_limit: :obj:`int`
+        :keyword increase: increase of the limit per round trip
+        :type increase: :obj:`float`
+        :keyword decrease_factor: factor that limit is multiplied by on overload
+        :type decrease_factor: :obj:`float`
+        :keyword latency_tolerance: how many times latency might exceed baseline to still increase limit
+        :type latency_tolerance: :obj:`float`
+        :keyword baseline_drift: weight of the latency that is higher than baseline in the baseline update
+        :type baseline_drift: :obj:`float`
+
+        :raise:
+            :ValueError: if limits or parameters of the limit adjusting are not consistent
+        """
+
+        if not (
+                0 < min_limit <= initial_limit <= max_limit
+                and increase > 0
+                and 0 < decrease_factor < 1
+                and latency_tolerance >= 1
+                and 0 <= baseline_drift <= 1
+        ):
+            message = (
+                'Limits or parameters of the limit adjusting are not consistent. '
+                'Expected to get 0 < min_limit <= initial_limit <= max_limit, increase > 0, '
+                '0 < decrease_factor < 1, latency_tolerance >= 1, 0 <= baseline_drift <= 1! '
+                f'Got (initial_limit={initial_limit!r}, min_limit={min_limit!r}, max_limit={max_limit!r}, '
+                f'increase={increase!r}, decrease_factor={decrease_factor!r}, '
+                f'latency_tolerance={latency_tolerance!r}, baseline_drift={baseline_drift!r}).'
+            )
+            raise ValueError(message)
+
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._increase = increase
+        self._decrease_factor = decrease_factor
+        self._latency_tolerance = latency_tolerance
+        self._baseline_drift = baseline_drift
+
+        self._baseline_latency: typing.Optional[float] = None
+        self._last_decrease_time = float('-inf')
+
+        self._samples = 0
+        self._overloads = 0
+        self._decreases = 0
+
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f'{class_name}(limit={self.limit!r}, min_limit={self._min_limit!r}, max_limit={self._max_limit!r})'
+
+    @property
+    def limit(self) -> int:
+        """
+        :return: current limit of the requests in flight
+        :rtype: :obj:`int`
+        """
+
+        return int(self._limit)
+
+    @property
+    def baseline_latency(self) -> typing.Optional[float]:
+        """
+        :return: baseline latency in seconds (``None`` if nothing has been observed yet)
+        :rtype: :obj:`Optional[float]`
+        """
+
+        return self._baseline_latency
+
+    @property
+    def metrics(self) -> typing.Dict[str, int]:
+        """
+        Metrics of the limiter:
+
+            * limit - current limit of the requests in flight;
+            * baseline_latency_ms - baseline latency in milliseconds;
+            * samples - count of the observed requests;
+            * overloads - count of the observed overloaded requests (429, 5xx, errors);
+            * decreases - count of the limit cuts.
+
+        :return: metrics of the limiter
+        :rtype: :obj:`dict[str, int]`
+        """
+
+        baseline_latency = self._baseline_latency
+
+        return {
+            'limit': self.limit,
+            'baseline_latency_ms': 0 if baseline_latency is None else round(baseline_latency * 1000),
+            'samples': self._samples,
+            'overloads': self._overloads,
+            'decreases': self._decreases,
+        }
+
+    @staticmethod
+    def is_overload_status(status_code: int) -> bool:
+        """
+        Check whether response status means that upstream is overloaded.
+
+        :param status_code: response status code
+        :type status_code: :obj:`int`
+
+        :return: whether status is 429 (Too Many Requests) or 5xx
+        :rtype: :obj:`bool`
+        """
+
+        return status_code == HTTPStatus.TOO_MANY_REQUESTS or status_code >= HTTPStatus.INTERNAL_SERVER_ERROR
+
+    def record(self, started_at: float, *,
+               is_overloaded: bool,
+               finished_at: typing.Optional[float] = None
+               ) -> None:
+        """
+        Record finished request and adjust limit.
+
+        :param started_at: start time of the request (by :func:`time.monotonic`)
+        :type started_at: :obj:`float`
+        :keyword is_overloaded: whether request got overload response (429, 5xx) or failed (timeout, connection)
+        :type is_overloaded: :obj:`bool`
+        :keyword finished_at: finish time of the request (by :func:`time.monotonic`, now if not passed)
+        :type finished_at: :obj:`float`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        if finished_at is None:
+            finished_at = time.monotonic()
+
+        latency = finished_at - started_at
+
+        with self._lock:
+            self._samples += 1
+
+            if is_overloaded:
+                self._overloads += 1
+
+                # requests started before the previous cut have been sent with the old limit
+                if started_at >= self._last_decrease_time:
+                    self._limit = max(self._min_limit, self._limit * self._decrease_factor)
+                    self._last_decrease_time = finished_at
+                    self._decreases += 1
+
+                    logger.debug(f'Concurrency limit has been decreased to {self.limit!r}.')
+
+                return
+
+            if self._baseline_latency is None or latency < self._baseline_latency:
+                self._baseline_latency = latency
+            else:
+                self._baseline_latency += (latency - self._baseline_latency) * self._baseline_drift
+
+            if latency <= self._baseline_latency * self._latency_tolerance:
+                self._limit = min(self._max_limit, self._limit + self._increase / self._limit)
@@ -0,0 +1,373 @@
+"""
+Contains scheduler of the asynchronous API requests.
+
+.. class:: Priority(enum.IntEnum)
+.. class:: RequestScheduler
+"""
+
+import asyncio
+import collections
+import enum
+import logging
+import typing
+
+from ..languages import LanguageCodes
+
+
+__all__ = [
+    'Priority',
+    'RequestScheduler'
+]
+
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(enum.IntEnum):
+    """
+    Enumerates priority classes of the API requests.
+
+    The lower value is, the higher priority is.
+    """
+
+    INTERACTIVE = 0
+    """ User-facing requests (waiting user is served first) """
+    BACKGROUND = 1
+    """ Background requests (crawlers, enrichment, batch lookups) """
+
+
+class RequestScheduler:
+    """
+    Implements scheduler of the asynchronous API requests.
+
+    Scheduler is put in front of the ``fetch_api_response`` of the async client
+    and limits count of the requests in flight:
+
+        - global concurrency cap (``max_concurrency``);
+        - optional concurrency limits of the priority classes (``priority_limits``).
+
+    Waiting requests are started strictly by priority:
+    queued interactive request is always started before queued background ones
+    (background request starts only when there is no interactive request that might start).
+
+    Within the priority class requests are queued per language
+    and served with weighted fair queuing: waiting request gets virtual finish time
+    (its virtual start - virtual time on queueing or finish of the previous request of the language,
+    whichever is later - plus ``1 / weight``) and request with the earliest virtual finish time is started.
+    So each language gets share of the started requests proportional to its weight
+    (``language_weights``, 1 by default) and one hot language does not crowd out the others.
+    When waiter is cancelled (or timed out), the rest waiters of its language are re-stamped,
+    so dropped requests do not push the language back.
+    Virtual times are kept per priority class, so background requests of the language
+    do not delay its interactive requests.
+    Languages might also be limited by concurrency quotas (``language_limits``, ``default_language_limit``),
+    so one language does not occupy all connections.
+
+    Scheduler is not thread-safe, it must be used within one event loop.
+    """
+
+    def __init__(self, max_concurrency: int = 10, *,
+                 priority_limits: typing.Optional[typing.Mapping[Priority, int]] = None,
+                 language_limits: typing.Optional[typing.Mapping[LanguageCodes, int]] = None,
+                 default_language_limit: typing.Optional[int] = None,
+                 language_weights: typing.Optional[typing.Mapping[LanguageCodes, float]] = None
+                 ) -> None:
+        """
+        Init request scheduler instance.
+
+        :param max_concurrency: maximum count of the requests in flight
+        :type max_concurrency: :obj:`int`
+        :keyword priority_limits: maximum counts of the requests in flight of the priority classes
+            (priority class that is not passed is limited only by ``max_concurrency``)
+        :type priority_limits: :obj:`Optional[Mapping[Priority, int]]`
+        :keyword language_limits: maximum counts of the requests in flight of the languages (quotas)
+        :type language_limits: :obj:`Optional[Mapping[LanguageCodes, int]]`
+        :keyword default_language_limit: maximum count of the requests in flight
+            of the language that is not passed in ``language_limits`` (not limited if not passed)
+        :type default_language_limit: :obj:`Optional[int]`
+        :keyword language_weights: weights of the languages in fair queuing (language that is not passed has weight 1)
+        :type language_weights: :obj:`Optional[Mapping[LanguageCodes, float]]`
+
+        :raise:
+            :ValueError: if ``max_concurrency`` or any of the limits or weights is not positive
+        """
+
+        priority_limits = {} if priority_limits is None else dict(priority_limits)
+        language_limits = {} if language_limits is None else dict(language_limits)
+        language_weights = {} if language_weights is None else dict(language_weights)
+
+        limits = [max_concurrency, *priority_limits.values(), *language_limits.values(), *language_weights.values()]
+
+        if default_language_limit is not None:
+            limits.append(default_language_limit)
+
+        if any(limit <= 0 for limit in limits):
+            message = (
+                '`max_concurrency` and all limits and weights have to be positive. '
+                f'Got (max_concurrency={max_concurrency!r}, priority_limits={priority_limits!r}, '
+                f'language_limits={language_limits!r}, default_language_limit={default_language_limit!r}, '
+                f'language_weights={language_weights!r}).'
+            )
+            raise ValueError(message)
+
+        self._max_concurrency = max_concurrency
+        self._priority_limits = {Priority(priority): limit for priority, limit in priority_limits.items()}
+        self._language_limits = language_limits
+        self._default_language_limit = default_language_limit
+        self._language_weights = language_weights
+
+        # waiters are queued per priority class and per language,
+        # waiter is a list of [virtual finish time, virtual start time, virtual time on queueing, future]
+        self._queues: typing.Dict[Priority, typing.Dict[typing.Optional[LanguageCodes], typing.Deque[list]]] = {
+            priority: collections.defaultdict(collections.deque) for priority in Priority
+        }
+        self._in_flight: typing.Dict[Priority, int] = {priority: 0 for priority in Priority}
+        self._in_flight_by_language: typing.Dict[typing.Optional[LanguageCodes], int] = collections.Counter()
+        self._in_flight_count = 0
+        self._max_queue_depths: typing.Dict[Priority, int] = {priority: 0 for priority in Priority}
+
+        # weighted fair queuing state (per priority class),
+        # finish times are of the last started requests of the languages
+        self._virtual_times: typing.Dict[Priority, float] = {priority: 0.0 for priority in Priority}
+        self._last_finish_times: typing.Dict[typing.Tuple[Priority, typing.Optional[LanguageCodes]], float] = {}
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return (
+            f'{class_name}(max_concurrency={self._max_concurrency!r}, '
+            f'priority_limits={self._priority_limits!r})'
+        )
+
+    @property
+    def max_concurrency(self) -> int:
+        """
+        :return: maximum count of the requests in flight
+        :rtype: :obj:`int`
+        """
+
+        return self._max_concurrency
+
+    @max_concurrency.setter
+    def max_concurrency(self, max_concurrency: int) -> None:
+        """
+        Set maximum count of the requests in flight (waiting requests are started if it is increased).
+
+        :param max_concurrency: maximum count of the requests in flight
+        :type max_concurrency: :obj:`int`
+
+        :raise:
+            :ValueError: if ``max_concurrency`` is not positive
+        """
+
+        if max_concurrency <= 0:
+            message = (
+                '`max_concurrency` has been set with not positive value. '
+                'Expected to get positive integer! '
+                f'Got (max_concurrency={max_concurrency!r}).'
+            )
+            raise ValueError(message)
+
+        self._max_concurrency = max_concurrency
+
+        self._dispatch()
+
+    @property
+    def priority_limits(self) -> typing.Dict[Priority, int]:
+        """
+        :return: maximum counts of the requests in flight of the priority classes
+        :rtype: :obj:`dict[Priority, int]`
+        """
+
+        return dict(self._priority_limits)
+
+    @property
+    def language_limits(self) -> typing.Dict[LanguageCodes, int]:
+        """
+        :return: maximum counts of the requests in flight of the languages (quotas)
+        :rtype: :obj:`dict[LanguageCodes, int]`
+        """
+
+        return dict(self._language_limits)
+
+    @property
+    def language_weights(self) -> typing.Dict[LanguageCodes, float]:
+        """
+        :return: weights of the languages in fair queuing
+        :rtype: :obj:`dict[LanguageCodes, float]`
+        """
+
+        return dict(self._language_weights)
+
+    @property
+    def metrics(self) -> typing.Dict[str, int]:
+        """
+        Metrics of the scheduler:
+
+            * in_flight - count of the requests in flight;
+            * queued - count of the waiting requests;
+            * in_flight_<priority> - count of the requests in flight of the priority class;
+            * queued_<priority> - count of the waiting requests (queue depth) of the priority class;
+            * max_queued_<priority> - the biggest observed queue depth of the priority class;
+            * in_flight_<language code> - count of the requests in flight of the language;
+            * queued_<language code> - count of the waiting requests of the language.
+
+        :return: metrics of the scheduler
+        :rtype: :obj:`dict[str, int]`
+        """
+
+        queued_by_language: typing.Dict[typing.Optional[LanguageCodes], int] = collections.Counter()
+
+        for language_queues in self._queues.values():
+            for language_code, queue in language_queues.items():
+                queued_by_language[language_code] += len(queue)
+
+        metrics = {
+            'in_flight': self._in_flight_count,
+            'queued': sum(queued_by_language.values()),
+        }
+
+        for priority in Priority:
+            name = priority.name.lower()
+
+            metrics[f'in_flight_{name}'] = self._in_flight[priority]
+            metrics[f'queued_{name}'] = self._get_queue_depth(priority)
+            metrics[f'max_queued_{name}'] = self._max_queue_depths[priority]
+
+        for language_code in {*self._in_flight_by_language, *queued_by_language} - {None}:
+            metrics[f'in_flight_{language_code.value}'] = self._in_flight_by_language[language_code]
+            metrics[f'queued_{language_code.value}'] = queued_by_language[language_code]
+
+        return metrics
+
+    async def acquire(self, priority: Priority = Priority.INTERACTIVE,
+                      language_code: typing.Optional[LanguageCodes] = None
+                      ) -> None:
+        """
+        Wait till request of the priority class (and language) might be started and take its slot.
+
+        Each acquiring must be followed by :meth:`release` with the same arguments.
+
+        :param priority: priority class of the request
+        :type priority: :obj:`Priority`
+        :param language_code: language of the searched word
+        :type language_code: :obj:`Optional[LanguageCodes]`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        future = asyncio.get_event_loop().create_future()
+
+        queue = self._queues[priority][language_code]
+        virtual_time = self._virtual_times[priority]
+        # virtual start of the request is not earlier than finish of the previous request of the language
+        previous_finish_time = queue[-1][0] if queue else self._last_finish_times.get((priority, language_code), 0.0)
+        start_time = max(virtual_time, previous_finish_time)
+
+        waiter = [self._get_finish_time(start_time, language_code), start_time, virtual_time, future]
+        queue.append(waiter)
+        self._max_queue_depths[priority] = max(self._max_queue_depths[priority], self._get_queue_depth(priority))
+
+        self._dispatch()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                # cancelled while waiting - might be already dropped from the queue by dispatching
+                try:
+                    queue.remove(waiter)
+                except ValueError:
+                    pass
+
+                self._restamp(priority, language_code)
+            else:
+                # slot has been granted right before cancellation
+                self.release(priority, language_code)
+
+            raise
+
+    def release(self, priority: Priority = Priority.INTERACTIVE,
+                language_code: typing.Optional[LanguageCodes] = None
+                ) -> None:
+        """
+        Free slot of the finished request and start waiting requests.
+
+        :param priority: priority class of the request
+        :type priority: :obj:`Priority`
+        :param language_code: language of the searched word
+        :type language_code: :obj:`Optional[LanguageCodes]`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        self._in_flight[priority] -= 1
+        self._in_flight_by_language[language_code] -= 1
+        self._in_flight_count -= 1
+
+        self._dispatch()
+
+    def _get_queue_depth(self, priority: Priority) -> int:
+        return sum(len(queue) for queue in self._queues[priority].values())
+
+    def _has_language_capacity(self, language_code: typing.Optional[LanguageCodes]) -> bool:
+        limit = self._language_limits.get(language_code, self._default_language_limit)
+
+        return limit is None or self._in_flight_by_language[language_code] < limit
+
+    def _has_capacity(self, priority: Priority) -> bool:
+        limit = self._priority_limits.get(priority)
+
+        return limit is None or self._in_flight[priority] < limit
+
+    def _get_finish_time(self, start_time: float, language_code: typing.Optional[LanguageCodes]) -> float:
+        return start_time + 1 / self._language_weights.get(language_code, 1)
+
+    def _restamp(self, priority: Priority, language_code: typing.Optional[LanguageCodes]) -> None:
+        """ Recompute virtual times of the waiters of the language (after one of them has been dropped) """
+
+        previous_finish_time = self._last_finish_times.get((priority, language_code), 0.0)
+
+        for waiter in self._queues[priority][language_code]:
+            waiter[1] = max(waiter[2], previous_finish_time)
+            waiter[0] = previous_finish_time = self._get_finish_time(waiter[1], language_code)
+
+    def _dispatch(self) -> None:
+        """ Start waiting requests (by priority, then by fair queuing of languages) while there are free slots """
+
+        while self._in_flight_count < self._max_concurrency:
+            for priority in Priority:
+                if not self._has_capacity(priority):
+                    continue
+
+                chosen_language_code, chosen_waiter = None, None
+
+                for language_code, queue in self._queues[priority].items():
+                    # drop cancelled waiters (the rest are re-stamped by the cancelled acquiring)
+                    while queue and queue[0][3].done():
+                        queue.popleft()
+
+                    if not queue or not self._has_language_capacity(language_code):
+                        continue
+
+                    # waiter with the earliest virtual finish time is served first
+                    if chosen_waiter is None or queue[0][0] < chosen_waiter[0]:
+                        chosen_language_code, chosen_waiter = language_code, queue[0]
+
+                if chosen_waiter is not None:
+                    self._queues[priority][chosen_language_code].popleft()
+
+                    finish_time, start_time, _, future = chosen_waiter
+                    self._virtual_times[priority] = max(self._virtual_times[priority], start_time)
+                    self._last_finish_times[(priority, chosen_language_code)] = finish_time
+
+                    self._in_flight[priority] += 1
+                    self._in_flight_by_language[chosen_language_code] += 1
+                    self._in_flight_count += 1
+
+                    future.set_result(None)
+                    break
+            else:
+                # no request might be started
+                break
@@ -6,7 +6,10 @@ FOR WORK REQUIRE ``httpx`` PACKAGE TO BE INSTALLED.
 .. class:: DictionaryApiClient(BaseDictionaryApiClient)
 """
 
+from http import HTTPStatus
+import json
 import logging
+import time
 import typing
 
 import httpx
@@ -32,7 +35,8 @@ class DictionaryApiClient(BaseDictionaryApiClient):
     """
 
     def __init__(self, default_language_code: LanguageCodes = DEFAULT_LANGUAGE_CODE, *,
-                 client: typing.Optional[httpx.Client] = None
+                 client: typing.Optional[httpx.Client] = None,
+                 **kwargs
                  ) -> None:
         """
         Init synchronous dictionary API client instance.
@@ -41,6 +45,7 @@ class DictionaryApiClient(BaseDictionaryApiClient):
         :type default_language_code: LanguageCodes
         :keyword client: ``httpx`` client to make HTTP requests
         :type client: :obj:`Optional[httpx.Client]`
+        :keyword kwargs: options of the base client (see :meth:`BaseDictionaryApiClientInterface.__init__`)
 
         :raise:
             :TypeError:
@@ -48,7 +53,7 @@ class DictionaryApiClient(BaseDictionaryApiClient):
                 - if ``client`` is not an instance of :obj:`httpx.Client`
         """
 
-        super().__init__(default_language_code)
+        super().__init__(default_language_code, **kwargs)
 
         if client:
             self._client = client
@@ -67,7 +72,10 @@ class DictionaryApiClient(BaseDictionaryApiClient):
 
         logger.info('Client has been init-ed.')
 
-    def fetch_api_response(self, url: str) -> typing.Tuple[int, typing.Any]:
+    def fetch_api_response(self, url: str, *,
+                           headers: typing.Optional[typing.Mapping[str, str]] = None,
+                           timeout: typing.Optional[float] = None
+                           ) -> typing.Tuple[int, typing.Any, httpx.Headers]:
         """
         Fetch data of the API response.
 
@@ -75,23 +83,83 @@ class DictionaryApiClient(BaseDictionaryApiClient):
 
         :param url: url that is generated by input params in invoked function
         :type url: :obj:`str`
+        :keyword headers: headers of the conditional request
+        :type headers: :obj:`Optional[Mapping[str, str]]`
+        :keyword timeout: limit of the total time of the request (in seconds),
+            timeouts of the ``httpx`` client if it is not passed
+        :type timeout: :obj:`Optional[float]`
 
         :return: tuple of:
         
             - response status code;
-            - python object loaded from API response with JSON decoding.
-        :rtype: :obj:`tuple[int, Any]`
+            - python object loaded from API response with JSON decoding;
+            - response headers.
+        :rtype: :obj:`tuple[int, Any, httpx.Headers]`
         """
 
-        response = self._client.get(url)
+        if timeout is None:
+            response = self._client.get(url, headers=headers)
+            content = response.content
+        else:
+            response, content = self._get_within_timeout(url, headers, timeout)
 
         response_status_code = response.status_code
-        json_response = response.json()
 
-        data_of_the_api_response = (response_status_code, json_response)
+        if response_status_code == HTTPStatus.NOT_MODIFIED:
+            # response to the conditional request has no body
+            return (response_status_code, None, response.headers)
+
+        decoding_started_at = time.perf_counter()
+        json_response = json.loads(content) if timeout is not None else response.json()
+        self._record_response_body(len(content), decoding_started_at)
+
+        data_of_the_api_response = (response_status_code, json_response, response.headers)
 
         return data_of_the_api_response
 
+    def _get_within_timeout(self, url: str, headers: typing.Optional[typing.Mapping[str, str]],
+                            timeout: float
+                            ) -> typing.Tuple[httpx.Response, bytes]:
+        """
+        Send request that is limited by total time.
+
+        Timeouts of ``httpx`` limit each operation (connect, write, pool, each read) separately
+        and read timeout restarts after every chunk,
+        so body is streamed and total time is checked after every chunk.
+
+        :param url: URL of the request
+        :type url: :obj:`str`
+        :param headers: headers of the request
+        :type headers: :obj:`Optional[Mapping[str, str]]`
+        :param timeout: limit of the total time of the request (in seconds)
+        :type timeout: :obj:`float`
+
+        :return: tuple of:
+
+            - response (with the closed stream);
+            - body of the response.
+        :rtype: :obj:`tuple[httpx.Response, bytes]`
+
+        :raise:
+            :httpx.TimeoutException: if request has not been finished in time
+        """
+
+        expires_at = time.monotonic() + timeout
+        chunks = []
+
+        with self._client.stream('GET', url, headers=headers, timeout=httpx.Timeout(timeout)) as response:
+            for chunk in response.iter_bytes():
+                chunks.append(chunk)
+
+                if time.monotonic() >= expires_at:
+                    break
+
+        if time.monotonic() >= expires_at:
+            message = f'Response has not been received in {timeout}s: {url!r}.'
+            raise httpx.ReadTimeout(message, request=response.request)
+
+        return (response, b''.join(chunks))
+
     @property
     def client(self) -> httpx.Client:
         """
@@ -115,6 +183,9 @@ class DictionaryApiClient(BaseDictionaryApiClient):
         :rtype: :obj:`None`
         """
 
+        # background refreshes of the cached responses and prefetches still use HTTP client
+        self._shutdown_prefetches()
+        self._shutdown_refreshes()
         self._client.close()
 
         logger.info('Client has been closed.')
@@ -0,0 +1,162 @@
+"""
+Contains deadlines of the lookups.
+
+.. class:: Deadline
+"""
+
+import time
+import typing
+
+from .errors import DictionaryApiTimeoutError
+
+
+__all__ = ['Deadline']
+
+
+class Deadline:
+    """
+    Implements deadline of the lookup - timeout budget that carries through all its stages.
+
+    Remaining budget is spent on waiting in the scheduler (queueing), requests and retries (failover to mirrors),
+    so lookup fails fast with :obj:`DictionaryApiTimeoutError` when budget is exhausted
+    instead of waiting for the HTTP library defaults.
+
+    Deadline might be shared by several lookups (like lookups of the request handler),
+    so they are limited by one budget:
+    ::
+
+        deadline = Deadline(0.5)
+
+        word = client.fetch_word('hello', timeout=deadline)
+        synonym = client.fetch_word_or_none(word.meanings[0].definitions[0].synonyms[0], timeout=deadline)
+    """
+
+    __slots__ = (
+        '_timeout',
+        '_expires_at',
+        '_clock',
+    )
+
+    def __init__(self, timeout: float, *, clock: typing.Callable[[], float] = time.monotonic) -> None:
+        """
+        Init deadline instance (budget is started to be spent).
+
+        :param timeout: timeout budget (in seconds)
+        :type timeout: :obj:`float`
+        :keyword clock: source of the current time (in seconds)
+        :type clock: :obj:`Callable[[], float]`
+
+        :raise:
+            :ValueError: if ``timeout`` is not positive
+        """
+
+        if timeout <= 0:
+            message = (
+                '`timeout` argument has been passed with not positive value. '
+                'Expected to get positive number of seconds! '
+                f'Got (timeout={timeout!r}).'
+            )
+            raise ValueError(message)
+
+        self._timeout = timeout
+        self._clock = clock
+        self._expires_at = clock() + timeout
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f'{class_name}(timeout={self._timeout!r}, remaining={self.remaining:.3f})'
+
+    @classmethod
+    def from_timeout(cls, timeout: typing.Optional[typing.Union[float, 'Deadline']]) -> typing.Optional['Deadline']:
+        """
+        Get deadline of the lookup by its ``timeout`` argument.
+
+        :param timeout: timeout budget of the lookup (in seconds) or shared deadline
+        :type timeout: :obj:`Optional[Union[float, Deadline]]`
+
+        :return: new deadline for the budget, passed deadline itself or ``None`` if lookup has no deadline
+        :rtype: :obj:`Optional[Deadline]`
+
+        :raise:
+            :TypeError: if ``timeout`` is neither number nor :obj:`Deadline`
+            :ValueError: if ``timeout`` is not positive
+        """
+
+        if timeout is None or isinstance(timeout, cls):
+            return timeout
+
+        if isinstance(timeout, bool) or not isinstance(timeout, (int, float)):
+            message = (
+                'For `timeout` has been passed object with unsupported type. '
+                'Expected to get number of seconds or argument with type `freedictionaryapi.deadlines.Deadline`! '
+                f'Got (timeout={timeout!r})'
+            )
+            raise TypeError(message)
+
+        return cls(timeout)
+
+    @property
+    def timeout(self) -> float:
+        """
+        :return: timeout budget (in seconds)
+        :rtype: :obj:`float`
+        """
+
+        return self._timeout
+
+    @property
+    def expires_at(self) -> float:
+        """
+        :return: time (by the clock of the deadline) when budget is exhausted
+        :rtype: :obj:`float`
+        """
+
+        return self._expires_at
+
+    @property
+    def remaining(self) -> float:
+        """
+        :return: remaining budget (in seconds, 0 if it is exhausted)
+        :rtype: :obj:`float`
+        """
+
+        return max(0.0, self._expires_at - self._clock())
+
+    @property
+    def is_expired(self) -> bool:
+        """
+        :return: whether budget is exhausted
+        :rtype: :obj:`bool`
+        """
+
+        return self._clock() >= self._expires_at
+
+    def make_error(self, stage: str) -> DictionaryApiTimeoutError:
+        """
+        Make error of the exceeded deadline.
+
+        :param stage: stage of the lookup that deadline has been exceeded on (like ``'queueing'``)
+        :type stage: :obj:`str`
+
+        :return: timeout error
+        :rtype: :obj:`DictionaryApiTimeoutError`
+        """
+
+        return DictionaryApiTimeoutError(f'Lookup has exceeded its deadline ({self._timeout}s) while {stage}.')
+
+    def check(self, stage: str) -> None:
+        """
+        Fail fast if budget is exhausted.
+
+        :param stage: stage of the lookup that is going to be started
+        :type stage: :obj:`str`
+
+        :return: None
+        :rtype: :obj:`None`
+
+        :raise:
+            :DictionaryApiTimeoutError: if budget is exhausted
+        """
+
+        if self.is_expired:
+            raise self.make_error(stage)
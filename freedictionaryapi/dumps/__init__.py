@@ -0,0 +1,16 @@
+"""
+Contains tools for work with dumps of the API responses.
+
+Dump is JSON Lines file (might be compressed)
+where each line is API response
+(or envelope object with API response and its language).
+"""
+
+from .parallel import ParallelDumpParser
+from .reader import DumpReader
+
+
+__all__ = [
+    'DumpReader',
+    'ParallelDumpParser'
+]
@@ -0,0 +1,275 @@
+"""
+Contains parallel (multiprocess) parser of the API responses dumps.
+
+.. class:: ParallelDumpParser
+"""
+
+import collections
+import concurrent.futures
+import logging
+import marshal
+import os
+import typing
+
+from .reader import DumpReader
+from ..languages import (
+    DEFAULT_LANGUAGE_CODE,
+    LanguageCodes
+)
+from ..types import Word
+
+
+__all__ = ['ParallelDumpParser']
+
+
+logger = logging.getLogger(__name__)
+
+
+_Range = typing.Tuple[int, int]
+_RangeResult = typing.Tuple[typing.List[typing.Any], typing.Dict[str, int]]
+
+
+def _process_range(path: typing.Union[str, os.PathLike], byte_range: _Range, reader_options: dict,
+                   function: typing.Callable[[Word], typing.Any],
+                   is_marshalled: bool = False
+                   ) -> _RangeResult:
+    """
+    Parse lines of the dump byte range and apply function to the words (runs in the worker process).
+
+    :return: tuple of:
+
+        - results of the function applied to words (marshalled at once if ``is_marshalled`` is set);
+        - reading statistics.
+    """
+
+    reader = DumpReader(path, compression=None, **reader_options)
+    results = [function(parser.word) for parser in reader.iter_range_parsers(*byte_range)]
+
+    if is_marshalled:
+        results = marshal.dumps(results)
+
+    return (results, reader.stats)
+
+
+def _get_data(word: Word) -> dict:
+    """ Get data of the word (JSON-compatible, so it might be marshalled) """
+    return word.data
+
+
+def _serialize(word: Word) -> bytes:
+    """ Serialize word in the compact binary form (see :meth:`Word.to_bytes`) """
+    return word.to_bytes()
+
+
+class ParallelDumpParser:
+    """
+    Implements parallel parser of the API responses dumps.
+
+    Dump file is split in byte ranges aligned to line boundaries,
+    each range is decoded and parsed in the worker process
+    of the :obj:`concurrent.futures.ProcessPoolExecutor`,
+    results come back to the current process and are merged in the dump order.
+
+    Words come back as their data marshalled by ranges
+    (the cheapest form to decode - cheaper than JSON, pickle and the binary form),
+    so the current process just wraps words around the decoded data.
+
+    Only not compressed dumps are supported
+    (compressed stream can not be split in byte ranges),
+    use :obj:`DumpReader` for compressed ones.
+
+    For the biggest throughput keep the work in the workers:
+
+        - :meth:`iter_payloads` - serialized words (to write snapshot) without deserialization;
+        - :meth:`map` - apply function (to build index) to the words in the workers.
+    """
+
+    def __init__(self, path: typing.Union[str, os.PathLike], *,
+                 workers: typing.Optional[int] = None,
+                 range_size: int = 16 << 20,
+                 languages: typing.Optional[typing.Iterable[LanguageCodes]] = None,
+                 headwords: typing.Optional[typing.Iterable[str]] = None,
+                 default_language_code: LanguageCodes = DEFAULT_LANGUAGE_CODE,
+                 max_line_size: int = 16 << 20
+                 ) -> None:
+        """
+        Init parallel dump parser instance.
+
+        :param path: path of the dump file (not compressed)
+        :type path: :obj:`Union[str, os.PathLike]`
+        :keyword workers: count of the worker processes (count of CPUs if not passed)
+        :type workers: :obj:`Optional[int]`
+        :keyword range_size: approximate size of the byte range (in bytes) processed by worker at once
+        :type range_size: :obj:`int`
+        :keyword languages: languages of the responses to read (all if not passed)
+        :type languages: :obj:`Optional[Iterable[LanguageCodes]]`
+        :keyword headwords: headwords of the responses to read (all if not passed)
+        :type headwords: :obj:`Optional[Iterable[str]]`
+        :keyword default_language_code: language of the responses that are not enveloped with language
+        :type default_language_code: :obj:`LanguageCodes`
+        :keyword max_line_size: maximum size of the line (in bytes), longer lines are skipped as malformed
+        :type max_line_size: :obj:`int`
+
+        :raise:
+            :ValueError:
+                - if dump is compressed
+                - if ``range_size`` is not positive
+        """
+
+        # the same validation and compression detection as in the reader
+        reader = DumpReader(path, max_line_size=max_line_size)
+
+        if reader.compression is not None:
+            message = (
+                'Compressed dump can not be split in byte ranges. '
+                'Expected to get not compressed dump (use `DumpReader` for compressed ones)! '
+                f'Got (path={path!r}, compression={reader.compression!r})'
+            )
+            raise ValueError(message)
+
+        if range_size <= 0:
+            message = (
+                '`range_size` argument has been passed with not positive value. '
+                'Expected to get positive integer! '
+                f'Got (range_size={range_size!r}).'
+            )
+            raise ValueError(message)
+
+        self._path = path
+        self._workers = workers or os.cpu_count() or 1
+        self._range_size = range_size
+        self._reader_options = {
+            'languages': None if languages is None else list(languages),
+            'headwords': None if headwords is None else list(headwords),
+            'default_language_code': default_language_code,
+            'max_line_size': max_line_size,
+        }
+
+        self._stats: typing.Dict[str, int] = collections.Counter()
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f'{class_name}(path={self._path!r}, workers={self._workers!r})'
+
+    @property
+    def workers(self) -> int:
+        """
+        :return: count of the worker processes
+        :rtype: :obj:`int`
+        """
+
+        return self._workers
+
+    @property
+    def stats(self) -> typing.Dict[str, int]:
+        """
+        Statistics of the reading (summed over all ranges, see :attr:`DumpReader.stats`).
+
+        :return: statistics of the reading
+        :rtype: :obj:`dict[str, int]`
+        """
+
+        return dict(self._stats)
+
+    def split(self) -> typing.List[_Range]:
+        """
+        Split dump file in byte ranges aligned to line boundaries.
+
+        :return: list of the byte ranges (start, end)
+        :rtype: :obj:`list[tuple[int, int]]`
+        """
+
+        file_size = os.path.getsize(self._path)
+        ranges = []
+
+        with open(self._path, 'rb') as file:
+            start = 0
+
+            while start < file_size:
+                file.seek(min(start + self._range_size, file_size))
+                # move boundary to the start of the next line
+                file.readline()
+                end = min(file.tell(), file_size)
+
+                ranges.append((start, end))
+                start = end
+
+        return ranges
+
+    def iter_payloads(self) -> typing.Iterator[bytes]:
+        """
+        Iterate over serialized words (see :meth:`Word.to_bytes`) in the dump order.
+
+        Words are serialized in the worker processes.
+
+        :return: iterator of the serialized words
+        :rtype: :obj:`Iterator[bytes]`
+        """
+
+        return self._iter_results(_serialize)
+
+    def iter_words(self) -> typing.Iterator[Word]:
+        """
+        Iterate over words in the dump order.
+
+        Words data is passed from the worker processes marshalled
+        and words are wrapped around it in the current process.
+
+        :return: iterator of the words
+        :rtype: :obj:`Iterator[Word]`
+        """
+
+        return (Word(data) for data in self._iter_results(_get_data, is_marshalled=True))
+
+    def map(self, function: typing.Callable[[Word], typing.Any]) -> typing.Iterator[typing.Any]:
+        """
+        Apply function to the words in the worker processes
+        and iterate over results in the dump order.
+
+        :param function: function to apply (must be picklable - defined on the module level)
+        :type function: :obj:`Callable[[Word], Any]`
+
+        :return: iterator of the function results
+        :rtype: :obj:`Iterator[Any]`
+        """
+
+        return self._iter_results(function)
+
+    def _iter_results(self, function: typing.Callable[[Word], typing.Any], *,
+                      is_marshalled: bool = False
+                      ) -> typing.Iterator[typing.Any]:
+        self._stats = collections.Counter()
+
+        ranges = iter(self.split())
+        # bounded count of the submitted ranges keeps memory bounded
+        max_pending_count = self._workers * 2
+
+        with concurrent.futures.ProcessPoolExecutor(self._workers) as executor:
+            pending: typing.Deque[concurrent.futures.Future] = collections.deque()
+
+            for byte_range in ranges:
+                pending.append(
+                    executor.submit(
+                        _process_range, self._path, byte_range, self._reader_options, function, is_marshalled
+                    )
+                )
+
+                if len(pending) >= max_pending_count:
+                    break
+
+            while pending:
+                results, stats = pending.popleft().result()
+
+                next_range = next(ranges, None)
+                if next_range is not None:
+                    pending.append(
+                        executor.submit(
+                            _process_range, self._path, next_range, self._reader_options, function, is_marshalled
+                        )
+                    )
+
+                self._stats.update(stats)
+
+                yield from marshal.loads(results) if is_marshalled else results
+
+        logger.info(f'Dump has been parsed in parallel: {self._path!r}. Stats: {self.stats!r}.')
@@ -0,0 +1,399 @@
+"""
+Contains streaming reader of the API responses dumps.
+
+.. class:: DumpReader
+"""
+
+import gzip
+import json
+import logging
+import os
+import re
+import typing
+
+from ..interning import StringPool
+from ..languages import (
+    DEFAULT_LANGUAGE_CODE,
+    LanguageCodes
+)
+from ..parsers import DictionaryApiParser
+from ..types import Word
+
+
+__all__ = ['DumpReader']
+
+
+logger = logging.getLogger(__name__)
+
+
+# cheap pre-filtering of the raw lines (before JSON decoding)
+_LANGUAGE_CODE_PATTERN = re.compile(rb'"language_code"\s*:\s*"([^"\\]*)"')
+_HEADWORD_PATTERN = re.compile(rb'"word"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+_COMPRESSIONS_BY_SUFFIX = {
+    '.gz': 'gzip',
+    '.gzip': 'gzip',
+    '.zst': 'zstd',
+    '.zstd': 'zstd',
+}
+
+
+class DumpReader:
+    """
+    Implements constant-memory streaming reader of the API responses dumps.
+
+    Dump is JSON Lines file (might be compressed with ``gzip`` or ``zstd``),
+    each line is one of:
+
+        - API response (as it is returned by API);
+        - envelope object with API response and its language:
+          ``{"language_code": "en_US", "response": [...]}``.
+
+    File is read with buffered chunks, so only one chunk and one line are kept in memory.
+    Malformed lines are skipped and counted.
+    Lines might be filtered by language and headword before JSON decoding.
+
+    Reading of the ``zstd`` compressed dumps requires ``zstandard`` package to be installed.
+    """
+
+    def __init__(self, path: typing.Union[str, os.PathLike], *,
+                 compression: typing.Optional[str] = 'auto',
+                 chunk_size: int = 1 << 20,
+                 max_line_size: int = 16 << 20,
+                 languages: typing.Optional[typing.Iterable[LanguageCodes]] = None,
+                 headwords: typing.Optional[typing.Iterable[str]] = None,
+                 default_language_code: LanguageCodes = DEFAULT_LANGUAGE_CODE,
+                 string_pool: typing.Optional[StringPool] = None
+                 ) -> None:
+        """
+        Init dump reader instance.
+
+        :param path: path of the dump file
+        :type path: :obj:`Union[str, os.PathLike]`
+        :keyword compression: compression of the dump: ``'gzip'``, ``'zstd'``, ``None`` (not compressed)
+            or ``'auto'`` (detected by file suffix)
+        :type compression: :obj:`Optional[str]`
+        :keyword chunk_size: size of the chunks (in bytes) that file is read with
+        :type chunk_size: :obj:`int`
+        :keyword max_line_size: maximum size of the line (in bytes), longer lines are skipped as malformed
+        :type max_line_size: :obj:`int`
+        :keyword languages: languages of the responses to read (all if not passed)
+        :type languages: :obj:`Optional[Iterable[LanguageCodes]]`
+        :keyword headwords: headwords of the responses to read (all if not passed)
+        :type headwords: :obj:`Optional[Iterable[str]]`
+        :keyword default_language_code: language of the responses that are not enveloped with language
+        :type default_language_code: :obj:`LanguageCodes`
+        :keyword string_pool: pool to intern repeated strings of the parsed responses with
+        :type string_pool: :obj:`Optional[StringPool]`
+
+        :raise:
+            :ValueError:
+                - if ``compression`` is not supported
+                - if ``chunk_size`` or ``max_line_size`` is not positive
+        """
+
+        if compression == 'auto':
+            compression = _COMPRESSIONS_BY_SUFFIX.get(os.path.splitext(os.fspath(path))[1].lower())
+
+        if compression not in (None, 'gzip', 'zstd'):
+            message = (
+                '`compression` argument has been passed with unsupported value. '
+                "Expected to get one of 'auto', 'gzip', 'zstd' or None! "
+                f'Got (compression={compression!r}).'
+            )
+            raise ValueError(message)
+
+        if chunk_size <= 0 or max_line_size <= 0:
+            message = (
+                '`chunk_size` and `max_line_size` arguments have to be positive. '
+                f'Got (chunk_size={chunk_size!r}, max_line_size={max_line_size!r}).'
+            )
+            raise ValueError(message)
+
+        self._path = path
+        self._compression = compression
+        self._chunk_size = chunk_size
+        self._max_line_size = max_line_size
+        self._languages = None if languages is None else frozenset(languages)
+        self._headwords = None if headwords is None else frozenset(headwords)
+        self._default_language_code = default_language_code
+        self._string_pool = string_pool
+
+        self._lines = 0
+        self._records = 0
+        self._malformed = 0
+        self._filtered = 0
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f'{class_name}(path={self._path!r}, compression={self._compression!r})'
+
+    def __iter__(self) -> typing.Iterator[DictionaryApiParser]:
+        return self.iter_parsers()
+
+    @property
+    def path(self) -> typing.Union[str, os.PathLike]:
+        """
+        :return: path of the dump file
+        :rtype: :obj:`Union[str, os.PathLike]`
+        """
+
+        return self._path
+
+    @property
+    def compression(self) -> typing.Optional[str]:
+        """
+        :return: compression of the dump (``None`` if it is not compressed)
+        :rtype: :obj:`Optional[str]`
+        """
+
+        return self._compression
+
+    @property
+    def stats(self) -> typing.Dict[str, int]:
+        """
+        Statistics of the reading:
+
+            * lines - count of the read non-empty lines;
+            * records - count of the parsed responses;
+            * malformed - count of the skipped malformed (or too long) lines;
+            * filtered - count of the skipped lines by language or headword.
+
+        :return: statistics of the reading
+        :rtype: :obj:`dict[str, int]`
+        """
+
+        return {
+            'lines': self._lines,
+            'records': self._records,
+            'malformed': self._malformed,
+            'filtered': self._filtered,
+        }
+
+    def iter_parsers(self) -> typing.Iterator[DictionaryApiParser]:
+        """
+        Iterate over parsers of the dump responses.
+
+        :return: iterator of the parsers
+        :rtype: :obj:`Iterator[DictionaryApiParser]`
+        """
+
+        with self._open() as file:
+            for line in self._iter_lines(file):
+                parser = self.parse_line(line)
+
+                if parser is not None:
+                    yield parser
+
+        logger.info(f'Dump has been read: {self._path!r}. Stats: {self.stats!r}.')
+
+    def iter_range_parsers(self, start: int, end: int) -> typing.Iterator[DictionaryApiParser]:
+        """
+        Iterate over parsers of the dump responses in the byte range of the file
+        (range should be aligned to line boundaries, like ranges of :meth:`ParallelDumpParser.split`).
+
+        Only not compressed dumps might be read by ranges.
+
+        :param start: offset of the range start (in bytes)
+        :type start: :obj:`int`
+        :param end: offset of the range end (in bytes, exclusive)
+        :type end: :obj:`int`
+
+        :return: iterator of the parsers
+        :rtype: :obj:`Iterator[DictionaryApiParser]`
+
+        :raise:
+            :ValueError:
+                - if dump is compressed
+                - if range is wrong (``start`` is negative or bigger than ``end``)
+        """
+
+        if self._compression is not None:
+            message = (
+                'Compressed dump can not be read by byte ranges. '
+                'Expected to get not compressed dump! '
+                f'Got (path={self._path!r}, compression={self._compression!r})'
+            )
+            raise ValueError(message)
+
+        if not 0 <= start <= end:
+            message = (
+                'Byte range has been passed with wrong bounds. '
+                'Expected to get 0 <= start <= end! '
+                f'Got (start={start!r}, end={end!r}).'
+            )
+            raise ValueError(message)
+
+        return self._iter_range_parsers(start, end)
+
+    def iter_words(self) -> typing.Iterator[Word]:
+        """
+        Iterate over words of the dump responses.
+
+        :return: iterator of the words
+        :rtype: :obj:`Iterator[Word]`
+        """
+
+        return (parser.word for parser in self.iter_parsers())
+
+    def parse_line(self, line: bytes) -> typing.Optional[DictionaryApiParser]:
+        """
+        Parse one line of the dump.
+
+        Statistics of the reader are updated.
+
+        :param line: line of the dump (without line break)
+        :type line: :obj:`bytes`
+
+        :return: parser of the response or ``None`` if line is malformed or filtered
+        :rtype: :obj:`Optional[DictionaryApiParser]`
+        """
+
+        if not line.strip():
+            return None
+
+        self._lines += 1
+
+        if not self._is_line_passed(line):
+            self._filtered += 1
+            return None
+
+        try:
+            record = json.loads(line)
+
+            if isinstance(record, dict) and 'response' in record:
+                record = record['response']
+
+            parser = DictionaryApiParser(record, string_pool=self._string_pool)
+        except (ValueError, TypeError, IndexError, KeyError) as error:
+            self._malformed += 1
+
+            logger.debug(f'Malformed line of the dump {self._path!r} has been skipped: {error!r}.')
+
+            return None
+
+        self._records += 1
+
+        return parser
+
+    def _iter_range_parsers(self, start: int, end: int) -> typing.Iterator[DictionaryApiParser]:
+        with open(self._path, 'rb') as file:
+            file.seek(start)
+
+            for line in self._iter_lines(file, end - start):
+                parser = self.parse_line(line)
+
+                if parser is not None:
+                    yield parser
+
+    def _is_line_passed(self, line: bytes) -> bool:
+        if self._languages is not None:
+            match = _LANGUAGE_CODE_PATTERN.search(line)
+
+            if match is None:
+                language_code = self._default_language_code
+            else:
+                try:
+                    language_code = LanguageCodes(match.group(1).decode('utf-8'))
+                except (ValueError, UnicodeDecodeError):
+                    return False
+
+            if language_code not in self._languages:
+                return False
+
+        if self._headwords is not None:
+            match = _HEADWORD_PATTERN.search(line)
+
+            if match is None:
+                return False
+
+            try:
+                headword = json.loads(b'"' + match.group(1) + b'"')
+            except ValueError:
+                return False
+
+            if headword not in self._headwords:
+                return False
+
+        return True
+
+    def _open(self) -> typing.BinaryIO:
+        if self._compression == 'gzip':
+            return gzip.open(self._path, 'rb')
+
+        if self._compression == 'zstd':
+            try:
+                import zstandard
+            except ImportError as error:
+                message = 'Reading of the `zstd` compressed dumps requires `zstandard` package to be installed.'
+                raise ImportError(message) from error
+
+            file = open(self._path, 'rb')
+            return zstandard.ZstdDecompressor().stream_reader(file, read_across_frames=True, closefd=True)
+
+        return open(self._path, 'rb')
+
+    def _iter_lines(self, file: typing.BinaryIO, size: typing.Optional[int] = None) -> typing.Iterator[bytes]:
+        """
+        Iterate over lines of the file read with chunks.
+
+        :param file: opened binary file
+        :type file: :obj:`BinaryIO`
+        :param size: count of the bytes to read from the current position (till the end if not passed)
+        :type size: :obj:`Optional[int]`
+
+        :return: iterator of the lines (without line breaks)
+        :rtype: :obj:`Iterator[bytes]`
+        """
+
+        tail = b''
+        # line that is longer than limit is skipped till its end
+        is_skipping = False
+        remaining_size = size
+
+        while True:
+            if remaining_size is None:
+                chunk = file.read(self._chunk_size)
+            else:
+                chunk = file.read(min(self._chunk_size, remaining_size))
+                remaining_size -= len(chunk)
+
+            if not chunk:
+                break
+
+            start = 0
+
+            if is_skipping:
+                line_end = chunk.find(b'\n')
+
+                if line_end == -1:
+                    continue
+
+                is_skipping = False
+                start = line_end + 1
+
+            while True:
+                line_end = chunk.find(b'\n', start)
+
+                if line_end == -1:
+                    break
+
+                line = tail + chunk[start:line_end] if tail else chunk[start:line_end]
+                tail = b''
+
+                yield line
+
+                start = line_end + 1
+
+            tail += chunk[start:]
+
+            if len(tail) > self._max_line_size:
+                self._lines += 1
+                self._malformed += 1
+                tail = b''
+                is_skipping = True
+
+                logger.debug(f'Too long line of the dump {self._path!r} has been skipped.')
+
+        if tail and not is_skipping:
+            yield tail
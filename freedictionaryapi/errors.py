@@ -5,9 +5,11 @@ Errors hierarchy:
 
     DictionaryApiError
         +-- DictionaryApiNotFoundError
+        +-- DictionaryApiTimeoutError
 
 .. exception:: DictionaryApiError(Exception)
 .. exception:: DictionaryApiNotFoundError(DictionaryApiError):
+.. exception:: DictionaryApiTimeoutError(DictionaryApiError, TimeoutError):
 
 .. const:: API_ERRORS_MAPPER
 """
@@ -18,6 +20,7 @@ import typing
 __all__ = [
     'DictionaryApiError',
     'DictionaryApiNotFoundError',
+    'DictionaryApiTimeoutError',
     'API_ERRORS_MAPPER'
 ]
 
@@ -42,6 +45,16 @@ class DictionaryApiNotFoundError(DictionaryApiError):
     code = 404
 
 
+class DictionaryApiTimeoutError(DictionaryApiError, TimeoutError):
+    """
+    Error that raised
+    if lookup has exceeded its deadline (see :obj:`freedictionaryapi.deadlines.Deadline`):
+    while request waited for its turn, was sent or retried.
+
+    It is not an API response error, so it is not mapped to status code.
+    """
+
+
 ERRORS: typing.List[typing.Type[DictionaryApiError]] = [
     DictionaryApiNotFoundError,
 ]
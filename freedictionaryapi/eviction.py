@@ -0,0 +1,409 @@
+"""
+Contains eviction of the cached responses.
+
+.. class:: FrequencySketch
+.. class:: BaseEviction(abc.ABC)
+.. class:: LruEviction(BaseEviction)
+.. class:: TinyLfuEviction(BaseEviction)
+"""
+
+import abc
+import collections
+import typing
+
+
+__all__ = [
+    'FrequencySketch',
+    'BaseEviction',
+    'LruEviction',
+    'TinyLfuEviction'
+]
+
+
+_MASK_64 = 0xFFFF_FFFF_FFFF_FFFF
+# odd 64-bit multipliers of the multiply-shift hashing (one per row of the sketch)
+_ROW_SEEDS = (
+    0x9E37_79B9_7F4A_7C15,
+    0xC2B2_AE3D_27D4_EB4F,
+    0x1656_67B1_9E37_79F9,
+    0x85EB_CA77_C2B2_AE63,
+)
+
+
+class FrequencySketch:
+    """
+    Implements count-min sketch - compact estimator of the access frequencies of the keys.
+
+    Sketch has 4 rows of the small saturating counters (at most 15, like 4-bit counters),
+    estimation is the minimum of the key counters, so it might overestimate (on hash collisions)
+    but never underestimates recent frequency.
+    Counters are increased conservatively (only the minimal ones), so collisions inflate them less.
+
+    Sketch ages: after ``sample_size`` increments all counters are halved,
+    so frequencies follow the recent popularity of the keys (old hot keys cool down).
+    """
+
+    MAX_COUNT = 15
+    """ Saturation value of the counters """
+
+    def __init__(self, width: int, *, sample_size: typing.Optional[int] = None) -> None:
+        """
+        Init frequency sketch instance.
+
+        :param width: count of the counters in the row (rounded up to the power of two),
+            supposed to be about count of the tracked keys (capacity of the cache)
+        :type width: :obj:`int`
+        :keyword sample_size: count of the increments after that counters are halved (10 widths by default)
+        :type sample_size: :obj:`Optional[int]`
+
+        :raise:
+            :ValueError: if ``width`` or ``sample_size`` is not positive
+        """
+
+        if width <= 0 or (sample_size is not None and sample_size <= 0):
+            message = (
+                '`width` and `sample_size` arguments have to be positive. '
+                f'Got (width={width!r}, sample_size={sample_size!r}).'
+            )
+            raise ValueError(message)
+
+        bits = max(1, (width - 1).bit_length())
+
+        self._width = 1 << bits
+        self._shift = 64 - bits
+        self._sample_size = 10 * self._width if sample_size is None else sample_size
+        self._counters = bytearray(self._width * len(_ROW_SEEDS))
+        self._additions = 0
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f'{class_name}(width={self._width!r}, sample_size={self._sample_size!r})'
+
+    @property
+    def width(self) -> int:
+        """
+        :return: count of the counters in the row
+        :rtype: :obj:`int`
+        """
+
+        return self._width
+
+    def _get_indexes(self, key: typing.Hashable) -> typing.List[int]:
+        key_hash = hash(key) & _MASK_64
+
+        return [
+            row * self._width + (((key_hash * seed) & _MASK_64) >> self._shift)
+            for row, seed in enumerate(_ROW_SEEDS)
+        ]
+
+    def increment(self, key: typing.Hashable) -> None:
+        """
+        Count access of the key.
+
+        :param key: accessed key
+        :type key: :obj:`Hashable`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        counters = self._counters
+        indexes = self._get_indexes(key)
+        count = min(counters[index] for index in indexes)
+
+        if count < self.MAX_COUNT:
+            for index in indexes:
+                if counters[index] == count:
+                    counters[index] = count + 1
+
+        self._additions += 1
+
+        if self._additions >= self._sample_size:
+            self._age()
+
+    def estimate(self, key: typing.Hashable) -> int:
+        """
+        Estimate recent access frequency of the key.
+
+        :param key: key
+        :type key: :obj:`Hashable`
+
+        :return: estimated count of the recent accesses (at most :attr:`MAX_COUNT`)
+        :rtype: :obj:`int`
+        """
+
+        counters = self._counters
+
+        return min(counters[index] for index in self._get_indexes(key))
+
+    def _age(self) -> None:
+        self._counters = bytearray(count >> 1 for count in self._counters)
+        self._additions //= 2
+
+    def clear(self) -> None:
+        """
+        Reset all counters.
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        self._counters = bytearray(len(self._counters))
+        self._additions = 0
+
+
+class BaseEviction(abc.ABC):
+    """
+    Implements base eviction of the cached keys.
+
+    Eviction tracks keys of the cache and decides which of them are evicted when cache is full.
+    It is not thread-safe: cache calls it under its own lock.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Init eviction instance.
+
+        :param capacity: maximum count of the cached keys
+        :type capacity: :obj:`int`
+
+        :raise:
+            :ValueError: if ``capacity`` is not positive
+        """
+
+        if capacity <= 0:
+            message = (
+                '`capacity` argument has been passed with not positive value. '
+                'Expected to get positive integer! '
+                f'Got (capacity={capacity!r}).'
+            )
+            raise ValueError(message)
+
+        self._capacity = capacity
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f'{class_name}(capacity={self._capacity!r})'
+
+    @property
+    def capacity(self) -> int:
+        """
+        :return: maximum count of the cached keys
+        :rtype: :obj:`int`
+        """
+
+        return self._capacity
+
+    @abc.abstractmethod
+    def record_access(self, key: str) -> None:
+        """
+        Record lookup of the key (cached or not).
+
+        :param key: looked up key
+        :type key: :obj:`str`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+    @abc.abstractmethod
+    def add(self, key: str) -> typing.List[str]:
+        """
+        Add not cached key.
+
+        :param key: added key
+        :type key: :obj:`str`
+
+        :return: keys that are evicted (added key itself if it is not admitted)
+        :rtype: :obj:`List[str]`
+        """
+
+    @abc.abstractmethod
+    def remove(self, key: str) -> None:
+        """
+        Remove key that is removed from the cache (expired or invalidated).
+
+        :param key: removed key
+        :type key: :obj:`str`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """
+        Remove all keys.
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+
+class LruEviction(BaseEviction):
+    """
+    Implements LRU eviction: the least recently used key is evicted.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__(capacity)
+
+        self._keys: typing.MutableMapping[str, None] = collections.OrderedDict()
+
+    def record_access(self, key: str) -> None:
+        if key in self._keys:
+            self._keys.move_to_end(key)
+
+    def add(self, key: str) -> typing.List[str]:
+        self._keys[key] = None
+
+        evicted_keys = []
+
+        while len(self._keys) > self._capacity:
+            evicted_key, _ = self._keys.popitem(last=False)
+            evicted_keys.append(evicted_key)
+
+        return evicted_keys
+
+    def remove(self, key: str) -> None:
+        self._keys.pop(key, None)
+
+    def clear(self) -> None:
+        self._keys.clear()
+
+
+class TinyLfuEviction(BaseEviction):
+    """
+    Implements W-TinyLFU eviction: frequency-aware eviction with admission of the new keys.
+
+    Keys are split in the segments:
+
+        - window (LRU, ``window_share`` of the capacity): new keys get there,
+          so recency bursts are absorbed;
+        - main (segmented LRU): keys evicted from the window get in its probation segment
+          only if they are admitted, keys accessed in the probation are promoted to the protected segment.
+
+    Admission: key evicted from the window (candidate) replaces the least recently used key of the probation (victim)
+    only if estimated frequency of the candidate (see :obj:`FrequencySketch`) is higher,
+    so one-hit wonders (one-off words of the crawlers) do not flush out the hot working set.
+    """
+
+    def __init__(self, capacity: int, *,
+                 window_share: float = 0.01,
+                 protected_share: float = 0.8
+                 ) -> None:
+        """
+        Init W-TinyLFU eviction instance.
+
+        :param capacity: maximum count of the cached keys
+        :type capacity: :obj:`int`
+        :keyword window_share: share of the window segment in the capacity
+        :type window_share: :obj:`float`
+        :keyword protected_share: share of the protected segment in the main segment
+        :type protected_share: :obj:`float`
+
+        :raise:
+            :ValueError: if ``capacity`` is not positive or shares are not in (0, 1)
+        """
+
+        super().__init__(capacity)
+
+        if not (0 < window_share < 1 and 0 < protected_share < 1):
+            message = (
+                '`window_share` and `protected_share` arguments have to be in (0, 1). '
+                f'Got (window_share={window_share!r}, protected_share={protected_share!r}).'
+            )
+            raise ValueError(message)
+
+        self._window_capacity = max(1, round(capacity * window_share))
+        self._main_capacity = capacity - self._window_capacity
+        self._protected_capacity = int(self._main_capacity * protected_share)
+
+        self._window: typing.MutableMapping[str, None] = collections.OrderedDict()
+        self._probation: typing.MutableMapping[str, None] = collections.OrderedDict()
+        self._protected: typing.MutableMapping[str, None] = collections.OrderedDict()
+
+        # rows are wider than capacity, so hot keys rarely collide with the whole row set of the candidate
+        self._sketch = FrequencySketch(4 * capacity, sample_size=10 * capacity)
+
+    @property
+    def sketch(self) -> FrequencySketch:
+        """
+        :return: estimator of the access frequencies
+        :rtype: :obj:`FrequencySketch`
+        """
+
+        return self._sketch
+
+    def record_access(self, key: str) -> None:
+        self._sketch.increment(key)
+
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._probation:
+            # the second access in the main segment - key is promoted
+            del self._probation[key]
+            self._protected[key] = None
+
+            if len(self._protected) > self._protected_capacity:
+                demoted_key, _ = self._protected.popitem(last=False)
+                self._probation[demoted_key] = None
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+
+    def add(self, key: str) -> typing.List[str]:
+        self._window[key] = None
+
+        evicted_keys = []
+
+        while len(self._window) > self._window_capacity:
+            candidate, _ = self._window.popitem(last=False)
+            evicted_key = self._admit(candidate)
+
+            if evicted_key is not None:
+                evicted_keys.append(evicted_key)
+
+        return evicted_keys
+
+    def _admit(self, candidate: str) -> typing.Optional[str]:
+        """
+        Move key evicted from the window in the main segment if it is admitted.
+
+        :param candidate: key evicted from the window
+        :type candidate: :obj:`str`
+
+        :return: evicted key (candidate itself if it is not admitted) or ``None`` if main segment is not full
+        :rtype: :obj:`Optional[str]`
+        """
+
+        if len(self._probation) + len(self._protected) < self._main_capacity:
+            self._probation[candidate] = None
+            return None
+
+        victims = self._probation or self._protected
+
+        if not victims:
+            # main segment has no room at all (capacity of the window only)
+            return candidate
+
+        victim = next(iter(victims))
+
+        if self._sketch.estimate(candidate) <= self._sketch.estimate(victim):
+            return candidate
+
+        del victims[victim]
+        self._probation[candidate] = None
+
+        return victim
+
+    def remove(self, key: str) -> None:
+        for segment in (self._window, self._probation, self._protected):
+            if key in segment:
+                del segment[key]
+                return
+
+    def clear(self) -> None:
+        self._window.clear()
+        self._probation.clear()
+        self._protected.clear()
+        self._sketch.clear()
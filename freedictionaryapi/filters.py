@@ -0,0 +1,326 @@
+"""
+Contains probabilistic filters.
+
+.. class:: MissingWordsFilter
+"""
+
+import hashlib
+import logging
+import math
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import typing
+
+from .languages import LanguageCodes
+
+
+__all__ = ['MissingWordsFilter']
+
+
+logger = logging.getLogger(__name__)
+
+
+class MissingWordsFilter:
+    """
+    Implements Bloom filter of the words that are known to be missing in API
+    (pairs of word and language code for which API responded with 404).
+
+    Membership check might give false positive (with configured rate)
+    but never gives false negative,
+    so client can skip request for the word
+    that is almost certainly missing.
+
+    Filter might be persisted in file:
+    bits are memory mapped (shared mapping),
+    so few processes that opened filter with the same path
+    see words added by each other without any extra I/O.
+    """
+
+    # file layout:
+    # <header><bits>
+    # header: magic, version, capacity, false positive rate, number of bits, number of hashes
+    HEADER = struct.Struct('<4sBxxxQdQI4x')
+    """ Header of the filter file """
+    MAGIC = b'FDMW'
+    """ Magic bytes of the filter file """
+    VERSION = 1
+    """ Version of the filter file layout """
+
+    def __init__(self, capacity: int = 100_000, false_positive_rate: float = 0.01, *,
+                 path: typing.Optional[typing.Union[str, os.PathLike]] = None
+                 ) -> None:
+        """
+        Init missing words filter instance.
+
+        If ``path`` is passed and file exists -
+        filter is loaded from the file (``capacity`` and ``false_positive_rate`` are taken from the file),
+        otherwise file is created.
+
+        :param capacity: expected count of the missing words
+        :type capacity: :obj:`int`
+        :param false_positive_rate: desired false positive rate on the expected count of the missing words
+        :type false_positive_rate: :obj:`float`
+        :keyword path: path of the file to persist filter in
+        :type path: :obj:`Optional[Union[str, os.PathLike]]`
+
+        :raise:
+            :ValueError:
+                - if ``capacity`` is not positive
+                - if ``false_positive_rate`` is not in range (0, 1)
+                - if file does not contain missing words filter
+        """
+
+        if capacity <= 0:
+            message = (
+                '`capacity` argument has been passed with not positive value. '
+                'Expected to get positive integer! '
+                f'Got (capacity={capacity!r}).'
+            )
+            raise ValueError(message)
+
+        if not 0 < false_positive_rate < 1:
+            message = (
+                '`false_positive_rate` argument has been passed with value out of range. '
+                'Expected to get float in range (0, 1)! '
+                f'Got (false_positive_rate={false_positive_rate!r}).'
+            )
+            raise ValueError(message)
+
+        self._path = path
+        self._lock = threading.Lock()
+        self._file = None
+        self._mmap = None
+
+        if path is not None and os.path.exists(path):
+            self._load(path)
+        else:
+            self._capacity = capacity
+            self._false_positive_rate = false_positive_rate
+            self._bits_count = self._get_optimal_bits_count(capacity, false_positive_rate)
+            self._hashes_count = self._get_optimal_hashes_count(capacity, self._bits_count)
+
+            if path is None:
+                self._bits = bytearray(self._get_bytes_count())
+            else:
+                self._create(path)
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return (
+            f'{class_name}(capacity={self._capacity!r}, false_positive_rate={self._false_positive_rate!r}, '
+            f'path={self._path!r})'
+        )
+
+    def __contains__(self, item: typing.Tuple[str, LanguageCodes]) -> bool:
+        word, language_code = item
+        return self.might_contain(word, language_code)
+
+    def __enter__(self) -> 'MissingWordsFilter':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def capacity(self) -> int:
+        """
+        :return: expected count of the missing words
+        :rtype: :obj:`int`
+        """
+
+        return self._capacity
+
+    @property
+    def false_positive_rate(self) -> float:
+        """
+        :return: false positive rate on the expected count of the missing words
+        :rtype: :obj:`float`
+        """
+
+        return self._false_positive_rate
+
+    @property
+    def path(self) -> typing.Optional[typing.Union[str, os.PathLike]]:
+        """
+        :return: path of the file where filter is persisted (if filter is persisted)
+        :rtype: :obj:`Optional[Union[str, os.PathLike]]`
+        """
+
+        return self._path
+
+    def add(self, word: str, language_code: LanguageCodes) -> None:
+        """
+        Add word to the filter.
+
+        :param word: missing word
+        :type word: :obj:`str`
+        :param language_code: language of the missing word
+        :type language_code: :obj:`LanguageCodes`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        with self._lock:
+            for position in self._get_positions(word, language_code):
+                self._bits[position >> 3] |= 1 << (position & 7)
+
+        logger.debug('Word %r [language_code=%r] has been added in missing words filter.', word, language_code)
+
+    def might_contain(self, word: str, language_code: LanguageCodes) -> bool:
+        """
+        Check whether word might be in the filter.
+
+        :param word: searched word
+        :type word: :obj:`str`
+        :param language_code: language of the searched word
+        :type language_code: :obj:`LanguageCodes`
+
+        :return: ``False`` if word is certainly not in the filter, ``True`` if word is in the filter most likely
+        :rtype: :obj:`bool`
+        """
+
+        bits = self._bits
+
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._get_positions(word, language_code)
+        )
+
+    def clear(self) -> None:
+        """
+        Remove all words from the filter.
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        with self._lock:
+            self._bits[:] = bytes(self._get_bytes_count())
+
+    def flush(self) -> None:
+        """
+        Flush filter in the file (if filter is persisted).
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        if self._mmap is not None:
+            self._mmap.flush()
+
+    def close(self) -> None:
+        """
+        Close filter - flush in the file and release it (if filter is persisted).
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        if self._mmap is not None:
+            self._mmap.flush()
+            # view must be released before the mapping is closed
+            self._bits.release()
+            self._bits = bytearray(self._get_bytes_count())
+            self._mmap.close()
+            self._mmap = None
+            self._file.close()
+            self._file = None
+
+    # sizing -----------------------------------------------------------------------------------------------------------
+
+    @staticmethod
+    def _get_optimal_bits_count(capacity: int, false_positive_rate: float) -> int:
+        bits_count = math.ceil(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2))
+        # round up to the whole bytes
+        return max(8, bits_count + (-bits_count % 8))
+
+    @staticmethod
+    def _get_optimal_hashes_count(capacity: int, bits_count: int) -> int:
+        return max(1, round(bits_count / capacity * math.log(2)))
+
+    def _get_bytes_count(self) -> int:
+        return self._bits_count // 8
+
+    def _get_positions(self, word: str, language_code: LanguageCodes) -> typing.Iterator[int]:
+        # double hashing: two 64-bit halves of the one digest
+        # give all ``k`` positions (Kirsch-Mitzenmacher)
+        key = f'{language_code.value}\x00{word}'.encode('utf-8')
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        first_hash, second_hash = struct.unpack('<QQ', digest)
+
+        bits_count = self._bits_count
+
+        return (
+            (first_hash + index * second_hash) % bits_count
+            for index in range(self._hashes_count)
+        )
+
+    # persistence ------------------------------------------------------------------------------------------------------
+
+    def _create(self, path: typing.Union[str, os.PathLike]) -> None:
+        header = self.HEADER.pack(
+            self.MAGIC, self.VERSION,
+            self._capacity, self._false_positive_rate, self._bits_count, self._hashes_count
+        )
+
+        # filter is fully written in the temporary file of the same directory
+        # and only then is linked by the path (linking does not replace existing file),
+        # so other processes never see partly written filter;
+        # if other process has just created the same file - filter is loaded from it
+        directory = os.path.dirname(os.path.abspath(path))
+        descriptor, temporary_path = tempfile.mkstemp(prefix='.missing_words.', suffix='.tmp', dir=directory)
+
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                file.write(header)
+                file.truncate(self.HEADER.size + self._get_bytes_count())
+
+            try:
+                os.link(temporary_path, path)
+            except FileExistsError:
+                self._load(path)
+                return
+        finally:
+            os.unlink(temporary_path)
+
+        self._map(path)
+
+        logger.debug(f'Missing words filter file has been created: {path!r}.')
+
+    def _load(self, path: typing.Union[str, os.PathLike]) -> None:
+        with open(path, 'rb') as file:
+            header = file.read(self.HEADER.size)
+            file_size = os.fstat(file.fileno()).st_size
+
+        try:
+            magic, version, capacity, false_positive_rate, bits_count, hashes_count = self.HEADER.unpack(header)
+        except struct.error:
+            magic, version, bits_count = None, None, 0
+
+        # short file (truncated or not a filter at all) is never mapped
+        if magic != self.MAGIC or version != self.VERSION or file_size < self.HEADER.size + bits_count // 8:
+            message = (
+                'File does not contain missing words filter of the supported version. '
+                f'Got (path={path!r}).'
+            )
+            raise ValueError(message)
+
+        self._capacity = capacity
+        self._false_positive_rate = false_positive_rate
+        self._bits_count = bits_count
+        self._hashes_count = hashes_count
+
+        self._map(path)
+
+        logger.debug(f'Missing words filter has been loaded from the file: {path!r}.')
+
+    def _map(self, path: typing.Union[str, os.PathLike]) -> None:
+        self._file = open(path, 'r+b')
+        # offset of the mapping must be aligned to the allocation granularity,
+        # so whole file is mapped and bits are viewed after the header
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_WRITE)
+        self._bits = memoryview(self._mmap)[self.HEADER.size:self.HEADER.size + self._get_bytes_count()]
@@ -0,0 +1,214 @@
+"""
+Contains string interning pool.
+
+.. class:: StringPool
+
+.. const:: DEFAULT_INTERNED_FIELDS
+"""
+
+import threading
+import typing
+
+
+__all__ = [
+    'StringPool',
+    'DEFAULT_INTERNED_FIELDS'
+]
+
+
+DEFAULT_INTERNED_FIELDS: typing.FrozenSet[str] = frozenset({
+    'partOfSpeech',
+    'synonyms',
+    'antonyms',
+    'text',
+    'audio',
+    'sourceUrl',
+    'sourceUrls',
+    'license',
+    'name',
+    'url',
+})
+""" Fields of the API response which values (or items of the list values) repeat across words """
+
+
+class StringPool:
+    """
+    Implements bounded string interning pool (flyweight).
+
+    Equal strings that are passed through the pool
+    are replaced with the one shared string object,
+    so large in-memory corpora of the parsed words
+    keep each repeated string (dictionary keys, parts of speech, popular synonyms, audio links)
+    only once.
+
+    Pool is bounded: when it is full, new strings are not added (returned as is)
+    but already pooled ones are still shared.
+
+    Long unique strings (definitions, examples) are not interned
+    since they are not repeated and would just fill the pool.
+
+    Pool is thread-safe and might be shared by clients and readers
+    (interning of the whole response takes the lock once).
+    """
+
+    def __init__(self, max_size: int = 100_000, *,
+                 fields: typing.AbstractSet[str] = DEFAULT_INTERNED_FIELDS
+                 ) -> None:
+        """
+        Init string pool instance.
+
+        :param max_size: maximum count of the pooled strings
+        :type max_size: :obj:`int`
+        :keyword fields: fields of the API response which values are interned (keys are interned always)
+        :type fields: :obj:`AbstractSet[str]`
+
+        :raise:
+            :ValueError: if ``max_size`` is not positive
+        """
+
+        if max_size <= 0:
+            message = (
+                '`max_size` argument has been passed with not positive value. '
+                'Expected to get positive integer! '
+                f'Got (max_size={max_size!r}).'
+            )
+            raise ValueError(message)
+
+        self._max_size = max_size
+        self._fields = frozenset(fields)
+        self._strings: typing.Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._rejections = 0
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f'{class_name}(max_size={self._max_size!r}, size={len(self._strings)!r})'
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __contains__(self, string: str) -> bool:
+        return string in self._strings
+
+    @property
+    def max_size(self) -> int:
+        """
+        :return: maximum count of the pooled strings
+        :rtype: :obj:`int`
+        """
+
+        return self._max_size
+
+    @property
+    def fields(self) -> typing.FrozenSet[str]:
+        """
+        :return: fields of the API response which values are interned
+        :rtype: :obj:`frozenset[str]`
+        """
+
+        return self._fields
+
+    @property
+    def stats(self) -> typing.Dict[str, int]:
+        """
+        Statistics of the pool usage:
+
+            * size - count of the pooled strings;
+            * hits - count of the strings replaced with the pooled one;
+            * misses - count of the strings added in the pool;
+            * rejections - count of the strings that were not added since pool is full.
+
+        :return: statistics of the pool usage
+        :rtype: :obj:`dict[str, int]`
+        """
+
+        with self._lock:
+            return {
+                'size': len(self._strings),
+                'hits': self._hits,
+                'misses': self._misses,
+                'rejections': self._rejections,
+            }
+
+    def intern(self, string: str) -> str:
+        """
+        Get pooled string equal to the passed one.
+
+        :param string: string to intern
+        :type string: :obj:`str`
+
+        :return: pooled string (or passed string if pool is full)
+        :rtype: :obj:`str`
+        """
+
+        with self._lock:
+            return self._intern(string)
+
+    def intern_data(self, data: typing.Any) -> typing.Any:
+        """
+        Intern strings of the API response (or part of it) loaded in python object.
+
+        All dictionary keys and values of the :attr:`fields` are interned.
+        Data is not mutated - containers are rebuilt.
+
+        :param data: API response (or part of it) loaded in python object
+        :type data: :obj:`Any`
+
+        :return: the same data with interned strings
+        :rtype: :obj:`Any`
+        """
+
+        with self._lock:
+            return self._intern_value(data, False)
+
+    def clear(self) -> None:
+        """
+        Remove all strings from the pool and reset statistics.
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        with self._lock:
+            self._strings.clear()
+
+            self._hits = 0
+            self._misses = 0
+            self._rejections = 0
+
+    def _intern(self, string: str) -> str:
+        # must be called with the acquired lock
+        pooled_string = self._strings.get(string)
+
+        if pooled_string is not None:
+            self._hits += 1
+            return pooled_string
+
+        if len(self._strings) >= self._max_size:
+            self._rejections += 1
+            return string
+
+        self._misses += 1
+
+        return self._strings.setdefault(string, string)
+
+    def _intern_value(self, value: typing.Any, is_interned_field: bool) -> typing.Any:
+        if isinstance(value, dict):
+            intern = self._intern
+            fields = self._fields
+
+            return {
+                intern(key): self._intern_value(item, key in fields)
+                for key, item in value.items()
+            }
+
+        if isinstance(value, list):
+            return [self._intern_value(item, is_interned_field) for item in value]
+
+        if is_interned_field and isinstance(value, str):
+            return self._intern(value)
+
+        return value
@@ -0,0 +1,130 @@
+"""
+Contains structured logging of the events on the request hot path.
+
+.. function:: log_event(logger: logging.Logger, level: int, event: str, message: str, **fields) -> None
+.. function:: set_sample_rate(event: str, rate: Optional[float]) -> None
+.. function:: get_sample_rate(event: str) -> Optional[float]
+
+.. const:: EVENTS
+"""
+
+import itertools
+import logging
+import typing
+
+
+__all__ = [
+    'log_event',
+    'set_sample_rate',
+    'get_sample_rate',
+    'EVENTS'
+]
+
+
+EVENTS: typing.FrozenSet[str] = frozenset({
+    'url_generated',
+    'request_sent',
+    'response_received',
+    'word_filtered',
+    'cache_hit',
+})
+""" Names of the events that are logged on the request hot path """
+
+
+# event -> period of the sampling (each ``period``-th event is logged)
+_sampling_periods: typing.Dict[str, int] = {}
+_sampling_counters: typing.Dict[str, typing.Iterator[int]] = {}
+
+
+def set_sample_rate(event: str, rate: typing.Optional[float]) -> None:
+    """
+    Set share of the events that are logged (sampling).
+
+    Sampling is deterministic: with rate 0.01 each 100th event is logged.
+
+    :param event: name of the event (see :const:`EVENTS`)
+    :type event: :obj:`str`
+    :param rate: share of the logged events (``None`` - all events are logged)
+    :type rate: :obj:`Optional[float]`
+
+    :return: None
+    :rtype: :obj:`None`
+
+    :raise:
+        :ValueError: if ``rate`` is not in (0, 1]
+    """
+
+    if rate is None:
+        _sampling_periods.pop(event, None)
+        _sampling_counters.pop(event, None)
+        return
+
+    if not 0 < rate <= 1:
+        message = (
+            '`rate` argument has been passed with value out of range. '
+            'Expected to get number in (0, 1]! '
+            f'Got (event={event!r}, rate={rate!r}).'
+        )
+        raise ValueError(message)
+
+    _sampling_counters[event] = itertools.count()
+    _sampling_periods[event] = max(1, round(1 / rate))
+
+
+def get_sample_rate(event: str) -> typing.Optional[float]:
+    """
+    Get share of the events that are logged.
+
+    :param event: name of the event (see :const:`EVENTS`)
+    :type event: :obj:`str`
+
+    :return: share of the logged events (``None`` if events are not sampled)
+    :rtype: :obj:`Optional[float]`
+    """
+
+    period = _sampling_periods.get(event)
+
+    return None if period is None else 1 / period
+
+
+def log_event(logger: logging.Logger, level: int, event: str, message: str, **fields: typing.Any) -> None:
+    """
+    Log structured event lazily.
+
+    Nothing is formatted if level of the event is disabled or event is dropped by the sampling:
+    message is formatted with fields (``%(name)r`` placeholders) only when record is emitted by handler.
+    Fields are also available for handlers and formatters as ``event_fields`` attribute of the record
+    (and name of the event as ``event`` attribute).
+
+    :param logger: logger to log the event with
+    :type logger: :obj:`logging.Logger`
+    :param level: level of the event
+    :type level: :obj:`int`
+    :param event: name of the event (see :const:`EVENTS`)
+    :type event: :obj:`str`
+    :param message: message with ``%(field)s`` placeholders
+    :type message: :obj:`str`
+    :param fields: fields of the event
+
+    :return: None
+    :rtype: :obj:`None`
+    """
+
+    if not logger.isEnabledFor(level):
+        return
+
+    period = _sampling_periods.get(event)
+
+    if period is not None:
+        counter = _sampling_counters.get(event)
+
+        if counter is not None and next(counter) % period:
+            return
+
+    extra = {'event': event, 'event_fields': fields}
+
+    if fields:
+        # the only mapping argument is used for ``%(name)s`` formatting
+        logger.log(level, message, fields, extra=extra)
+    else:
+        logger.log(level, message, extra=extra)
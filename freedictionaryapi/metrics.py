@@ -0,0 +1,408 @@
+"""
+Contains metrics of the client requests (with Prometheus text exposition).
+
+.. class:: ClientMetrics
+
+.. const:: DEFAULT_LATENCY_BUCKETS
+.. const:: CONTENT_TYPE
+"""
+
+import math
+import threading
+import typing
+
+from .languages import LanguageCodes
+
+
+__all__ = [
+    'ClientMetrics',
+    'DEFAULT_LATENCY_BUCKETS',
+    'CONTENT_TYPE'
+]
+
+
+DEFAULT_LATENCY_BUCKETS: typing.Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+""" Upper bounds (in seconds) of the buckets of the latency histograms """
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+""" Content type of the Prometheus text exposition format """
+
+
+_LabelValues = typing.Tuple[str, ...]
+
+
+class _MetricFamily:
+    """ Metric with all its samples (by label values) """
+
+    __slots__ = (
+        'name',
+        'type',
+        'documentation',
+        'label_names',
+        'samples',
+    )
+
+    def __init__(self, name: str, type_: str, documentation: str, label_names: typing.Tuple[str, ...]) -> None:
+        self.name = name
+        self.type = type_
+        self.documentation = documentation
+        self.label_names = label_names
+        # counter, gauge: label values -> value,
+        # histogram: label values -> [bucket counts (not cumulative), sum, count]
+        self.samples: typing.Dict[_LabelValues, typing.Any] = {}
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+
+
+def _format_labels(label_names: typing.Sequence[str], label_values: typing.Sequence[str]) -> str:
+    if not label_names:
+        return ''
+
+    labels = ','.join(
+        f'{name}="{_escape_label_value(value)}"'
+        for name, value in zip(label_names, label_values)
+    )
+
+    return f'{{{labels}}}'
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+
+    return repr(float(value))
+
+
+def _get_language_label(language_code: typing.Optional[LanguageCodes]) -> str:
+    return '' if language_code is None else language_code.value
+
+
+class ClientMetrics:
+    """
+    Implements metrics of the client requests.
+
+    Metrics (names are prefixed with ``prefix``):
+
+        * ``requests_total{language}`` - counter of the requests sent to the API
+          (each mirror attempt is counted);
+        * ``request_errors_total{language, error}`` - counter of the requests that failed with error
+          (timeout, connection error) instead of response;
+        * ``responses_total{status}`` - counter of the analyzed API responses by status (404s, errors);
+        * ``cache_hits_total{cache}``, ``cache_misses_total{cache}`` - counters of the lookups
+          that have been answered (or not) without request;
+        * ``request_duration_seconds{language}`` - histogram of the request latency;
+        * ``received_bytes_total`` - counter of the received bytes of the response bodies;
+        * ``requests_in_flight{language}`` - gauge of the requests in flight.
+
+    Metrics are collected only if they are passed to the client,
+    so client without metrics does not pay for them (one ``None`` check per hook).
+
+    Metrics are thread-safe: they might be shared between threads and clients.
+    """
+
+    def __init__(self, *,
+                 prefix: str = 'freedictionaryapi',
+                 latency_buckets: typing.Sequence[float] = DEFAULT_LATENCY_BUCKETS
+                 ) -> None:
+        """
+        Init client metrics instance.
+
+        :keyword prefix: prefix of the metric names
+        :type prefix: :obj:`str`
+        :keyword latency_buckets: upper bounds (in seconds) of the buckets of the latency histograms
+        :type latency_buckets: :obj:`Sequence[float]`
+
+        :raise:
+            :ValueError: if ``latency_buckets`` is empty or is not sorted in increasing order
+        """
+
+        latency_buckets = tuple(float(bound) for bound in latency_buckets if bound != math.inf)
+
+        if not latency_buckets or any(lower >= upper for lower, upper in zip(latency_buckets, latency_buckets[1:])):
+            message = (
+                '`latency_buckets` argument has been passed with empty or not sorted value. '
+                'Expected to get non-empty sequence of the increasing bounds! '
+                f'Got (latency_buckets={latency_buckets!r}).'
+            )
+            raise ValueError(message)
+
+        self._prefix = prefix
+        self._latency_buckets = latency_buckets
+
+        self._requests = self._create_family('requests_total', 'counter', 'Requests sent to the API.', 'language')
+        self._request_errors = self._create_family(
+            'request_errors_total', 'counter', 'Requests that failed with error instead of response.',
+            'language', 'error'
+        )
+        self._responses = self._create_family('responses_total', 'counter', 'Analyzed API responses.', 'status')
+        self._cache_hits = self._create_family(
+            'cache_hits_total', 'counter', 'Lookups answered without request.', 'cache'
+        )
+        self._cache_misses = self._create_family(
+            'cache_misses_total', 'counter', 'Lookups not answered without request.', 'cache'
+        )
+        self._request_durations = self._create_family(
+            'request_duration_seconds', 'histogram', 'Latency of the API requests.', 'language'
+        )
+        self._received_bytes = self._create_family(
+            'received_bytes_total', 'counter', 'Received bytes of the API response bodies.'
+        )
+        self._requests_in_flight = self._create_family(
+            'requests_in_flight', 'gauge', 'API requests in flight.', 'language'
+        )
+
+        self._families = (
+            self._requests,
+            self._request_errors,
+            self._responses,
+            self._cache_hits,
+            self._cache_misses,
+            self._request_durations,
+            self._received_bytes,
+            self._requests_in_flight,
+        )
+
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f'{class_name}(prefix={self._prefix!r})'
+
+    @property
+    def prefix(self) -> str:
+        """
+        :return: prefix of the metric names
+        :rtype: :obj:`str`
+        """
+
+        return self._prefix
+
+    @property
+    def latency_buckets(self) -> typing.Tuple[float, ...]:
+        """
+        :return: upper bounds (in seconds) of the buckets of the latency histograms
+        :rtype: :obj:`tuple[float, ...]`
+        """
+
+        return self._latency_buckets
+
+    def request_started(self, language_code: typing.Optional[LanguageCodes] = None) -> None:
+        """
+        Record request that has been sent to the API.
+
+        Each start must be followed by :meth:`request_finished` or :meth:`request_cancelled`.
+
+        :param language_code: language of the searched word
+        :type language_code: :obj:`Optional[LanguageCodes]`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        labels = (_get_language_label(language_code),)
+
+        with self._lock:
+            self._increment(self._requests, labels)
+            self._increment(self._requests_in_flight, labels)
+
+    def request_finished(self, language_code: typing.Optional[LanguageCodes], latency: float, *,
+                         error: typing.Optional[BaseException] = None
+                         ) -> None:
+        """
+        Record finished request (response has been got or request has failed).
+
+        :param language_code: language of the searched word
+        :type language_code: :obj:`Optional[LanguageCodes]`
+        :param latency: latency of the request in seconds
+        :type latency: :obj:`float`
+        :keyword error: error that request has failed with (``None`` if response has been got)
+        :type error: :obj:`Optional[BaseException]`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        language_label = _get_language_label(language_code)
+        labels = (language_label,)
+
+        with self._lock:
+            self._increment(self._requests_in_flight, labels, -1)
+            self._observe(self._request_durations, labels, latency)
+
+            if error is not None:
+                self._increment(self._request_errors, (language_label, type(error).__name__))
+
+    def request_cancelled(self, language_code: typing.Optional[LanguageCodes] = None) -> None:
+        """
+        Record cancelled request (it is not observed in the latency histogram).
+
+        :param language_code: language of the searched word
+        :type language_code: :obj:`Optional[LanguageCodes]`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        with self._lock:
+            self._increment(self._requests_in_flight, (_get_language_label(language_code),), -1)
+
+    def response_analyzed(self, status_code: int) -> None:
+        """
+        Record analyzed API response.
+
+        :param status_code: response status code
+        :type status_code: :obj:`int`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        with self._lock:
+            self._increment(self._responses, (str(int(status_code)),))
+
+    def cache_looked_up(self, cache: str, *, is_hit: bool) -> None:
+        """
+        Record lookup that might be answered without request (by the filter or the cache).
+
+        :param cache: name of the cache (like ``'missing_words_filter'``)
+        :type cache: :obj:`str`
+        :keyword is_hit: whether lookup has been answered without request
+        :type is_hit: :obj:`bool`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        with self._lock:
+            self._increment(self._cache_hits if is_hit else self._cache_misses, (cache,))
+
+    def bytes_received(self, size: int) -> None:
+        """
+        Record received bytes of the response body.
+
+        :param size: size of the response body in bytes
+        :type size: :obj:`int`
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        with self._lock:
+            self._increment(self._received_bytes, (), size)
+
+    def get_sample_value(self, name: str,
+                         labels: typing.Optional[typing.Mapping[str, str]] = None
+                         ) -> typing.Optional[float]:
+        """
+        Get value of the sample.
+
+        Sample is named as in exposition (with prefix and with ``_bucket``, ``_sum``, ``_count``
+        suffixes for histograms, bucket is chosen with ``le`` label).
+
+        :param name: name of the sample (like ``'freedictionaryapi_requests_total'``)
+        :type name: :obj:`str`
+        :param labels: labels of the sample
+        :type labels: :obj:`Optional[Mapping[str, str]]`
+
+        :return: value of the sample or ``None`` if there is no such sample
+        :rtype: :obj:`Optional[float]`
+        """
+
+        labels = {} if labels is None else dict(labels)
+
+        for sample_name, sample_labels, value in self._collect():
+            if sample_name == name and sample_labels == labels:
+                return value
+
+        return None
+
+    def render(self) -> str:
+        """
+        Render metrics in Prometheus text exposition format (see :const:`CONTENT_TYPE`).
+
+        :return: metrics in Prometheus text format
+        :rtype: :obj:`str`
+        """
+
+        lines = []
+
+        with self._lock:
+            for family in self._families:
+                name = self._get_name(family)
+
+                lines.append(f'# HELP {name} {family.documentation}')
+                lines.append(f'# TYPE {name} {family.type}')
+
+                for sample_name, label_names, label_values, value in self._get_samples(family):
+                    lines.append(f'{sample_name}{_format_labels(label_names, label_values)} {_format_value(value)}')
+
+        return '\n'.join(lines) + '\n'
+
+    @staticmethod
+    def _create_family(name: str, type_: str, documentation: str, *label_names: str) -> _MetricFamily:
+        return _MetricFamily(name, type_, documentation, label_names)
+
+    def _get_name(self, family: _MetricFamily) -> str:
+        return f'{self._prefix}_{family.name}' if self._prefix else family.name
+
+    @staticmethod
+    def _increment(family: _MetricFamily, labels: _LabelValues, amount: float = 1) -> None:
+        family.samples[labels] = family.samples.get(labels, 0) + amount
+
+    def _observe(self, family: _MetricFamily, labels: _LabelValues, value: float) -> None:
+        sample = family.samples.get(labels)
+
+        if sample is None:
+            # the last bucket is ``+Inf`` one
+            sample = family.samples[labels] = [[0] * (len(self._latency_buckets) + 1), 0.0, 0]
+
+        bucket_counts = sample[0]
+
+        for index, bound in enumerate(self._latency_buckets):
+            if value <= bound:
+                bucket_counts[index] += 1
+                break
+        else:
+            bucket_counts[-1] += 1
+
+        sample[1] += value
+        sample[2] += 1
+
+    def _get_samples(self, family: _MetricFamily
+                     ) -> typing.Iterator[typing.Tuple[str, typing.Tuple[str, ...], _LabelValues, float]]:
+        """ Get samples of the metric as tuples of (sample name, label names, label values, value) """
+
+        name = self._get_name(family)
+
+        for labels, sample in sorted(family.samples.items()):
+            if family.type != 'histogram':
+                yield (name, family.label_names, labels, sample)
+                continue
+
+            bucket_counts, total, count = sample
+            cumulative_count = 0
+
+            for bound, bucket_count in zip((*self._latency_buckets, math.inf), bucket_counts):
+                cumulative_count += bucket_count
+                yield (
+                    f'{name}_bucket',
+                    (*family.label_names, 'le'), (*labels, _format_value(bound)),
+                    cumulative_count
+                )
+
+            yield (f'{name}_sum', family.label_names, labels, total)
+            yield (f'{name}_count', family.label_names, labels, count)
+
+    def _collect(self) -> typing.Iterator[typing.Tuple[str, typing.Dict[str, str], float]]:
+        with self._lock:
+            samples = [
+                (sample_name, dict(zip(label_names, label_values)), float(value))
+                for family in self._families
+                for sample_name, label_names, label_values, value in self._get_samples(family)
+            ]
+
+        return iter(samples)
@@ -7,6 +7,7 @@ Contains dictionary API response parser.
 import typing
 
 from .base_parser import BaseDictionaryApiParser
+from ..interning import StringPool
 from ..types import (
     Definition,
     Phonetic,
@@ -31,7 +32,9 @@ class DictionaryApiParser(BaseDictionaryApiParser):
     it is possible to use some of prepared methods and properties.
     """
 
-    def __init__(self, response: typing.Union[dict, list]) -> None:
+    def __init__(self, response: typing.Union[dict, list], *,
+                 string_pool: typing.Optional[StringPool] = None
+                 ) -> None:
         """
         Init dictionary API parser response instance.
         Parse API response.
@@ -44,8 +47,13 @@ class DictionaryApiParser(BaseDictionaryApiParser):
 
         :param response: API json response loaded in python object
         :type response: :obj:`Union[dict, list]`
+        :keyword string_pool: pool to intern repeated strings of the response with
+        :type string_pool: :obj:`Optional[StringPool]`
         """
 
+        if string_pool is not None:
+            response = string_pool.intern_data(response)
+
         super().__init__(response)
 
         if isinstance(self._response, list):
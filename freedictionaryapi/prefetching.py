@@ -0,0 +1,208 @@
+"""
+Contains speculative prefetch of the related words.
+
+.. class:: PrefetchPolicy
+"""
+
+import threading
+import time
+import typing
+
+from .types import Word
+
+
+__all__ = ['PrefetchPolicy']
+
+
+class PrefetchPolicy:
+    """
+    Implements policy of the speculative prefetch of the synonyms.
+
+    Users often go from the word to its synonyms, so after successful ``fetch_word``
+    client (with the response cache) looks up synonyms of the word in the background
+    and the follow-up lookup is served from the cache.
+
+    Prefetch is limited:
+
+        - by depth: synonyms of the prefetched words are prefetched too while depth allows;
+        - by count of the synonyms of the word (the first ones of the definitions);
+        - by budget: rate of the prefetches (token bucket), extra synonyms are dropped;
+        - by count of the pending prefetches, extra synonyms are dropped.
+
+    Prefetches never take capacity from the foreground requests:
+    they are sent one by one (the sync client sends them in the dedicated thread),
+    with background priority in the scheduler of the async client
+    and they are dropped while foreground requests are in flight, requests in flight have reached limit
+    of the adaptive limiter or scheduler has waiting requests.
+
+    Policy is cancellable: cancelled policy schedules nothing
+    and pending prefetches are dropped (till policy is resumed).
+    Policy is thread-safe and might be shared by clients.
+    """
+
+    def __init__(self, *,
+                 depth: int = 1,
+                 max_synonyms: int = 5,
+                 budget: float = 2.0,
+                 max_pending: int = 16,
+                 clock: typing.Callable[[], float] = time.monotonic
+                 ) -> None:
+        """
+        Init prefetch policy instance.
+
+        :keyword depth: how far from the looked up word synonyms are prefetched
+            (1 - synonyms of the word, 2 - also synonyms of its synonyms, ...)
+        :type depth: :obj:`int`
+        :keyword max_synonyms: maximum count of the prefetched synonyms of the word
+        :type max_synonyms: :obj:`int`
+        :keyword budget: maximum rate of the prefetches (per second), bursts up to ``max(1, budget)`` prefetches
+        :type budget: :obj:`float`
+        :keyword max_pending: maximum count of the scheduled prefetches of the client (waiting and in flight)
+        :type max_pending: :obj:`int`
+        :keyword clock: source of the current time (in seconds)
+        :type clock: :obj:`Callable[[], float]`
+
+        :raise:
+            :ValueError: if ``depth``, ``max_synonyms``, ``budget`` or ``max_pending`` is not positive
+        """
+
+        if depth <= 0 or max_synonyms <= 0 or budget <= 0 or max_pending <= 0:
+            message = (
+                '`depth`, `max_synonyms`, `budget` and `max_pending` arguments have to be positive. '
+                f'Got (depth={depth!r}, max_synonyms={max_synonyms!r}, '
+                f'budget={budget!r}, max_pending={max_pending!r}).'
+            )
+            raise ValueError(message)
+
+        self._depth = depth
+        self._max_synonyms = max_synonyms
+        self._budget = budget
+        self._max_pending = max_pending
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._burst = max(1.0, budget)
+        self._tokens = self._burst
+        self._updated_at = clock()
+        self._is_cancelled = False
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return (
+            f'{class_name}(depth={self._depth!r}, max_synonyms={self._max_synonyms!r}, '
+            f'budget={self._budget!r}, max_pending={self._max_pending!r})'
+        )
+
+    @property
+    def depth(self) -> int:
+        """
+        :return: how far from the looked up word synonyms are prefetched
+        :rtype: :obj:`int`
+        """
+
+        return self._depth
+
+    @property
+    def max_synonyms(self) -> int:
+        """
+        :return: maximum count of the prefetched synonyms of the word
+        :rtype: :obj:`int`
+        """
+
+        return self._max_synonyms
+
+    @property
+    def budget(self) -> float:
+        """
+        :return: maximum rate of the prefetches (per second)
+        :rtype: :obj:`float`
+        """
+
+        return self._budget
+
+    @property
+    def max_pending(self) -> int:
+        """
+        :return: maximum count of the scheduled prefetches of the client
+        :rtype: :obj:`int`
+        """
+
+        return self._max_pending
+
+    @property
+    def is_cancelled(self) -> bool:
+        """
+        :return: whether policy is cancelled (nothing is prefetched)
+        :rtype: :obj:`bool`
+        """
+
+        return self._is_cancelled
+
+    def cancel(self) -> None:
+        """
+        Cancel prefetch: nothing is scheduled and pending prefetches are dropped.
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        self._is_cancelled = True
+
+    def resume(self) -> None:
+        """
+        Resume cancelled prefetch.
+
+        :return: None
+        :rtype: :obj:`None`
+        """
+
+        self._is_cancelled = False
+
+    def select_synonyms(self, word: Word) -> typing.List[str]:
+        """
+        Select synonyms of the word to prefetch (in order of the definitions, without duplicates).
+
+        :param word: looked up word (parsed object)
+        :type word: :obj:`Word`
+
+        :return: at most :attr:`max_synonyms` synonyms
+        :rtype: :obj:`List[str]`
+        """
+
+        # the word itself is often listed among synonyms
+        seen = {(word.word or '').lower()}
+        synonyms = []
+
+        for meaning in word.meanings:
+            for definition in meaning.definitions:
+                for synonym in definition.synonyms or ():
+                    if synonym.lower() in seen:
+                        continue
+
+                    seen.add(synonym.lower())
+                    synonyms.append(synonym)
+
+                    if len(synonyms) >= self._max_synonyms:
+                        return synonyms
+
+        return synonyms
+
+    def try_spend(self) -> bool:
+        """
+        Take the budget of one prefetch.
+
+        :return: whether prefetch fits in the budget
+        :rtype: :obj:`bool`
+        """
+
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self._burst, self._tokens + (now - self._updated_at) * self._budget)
+            self._updated_at = now
+
+            if self._tokens < 1:
+                return False
+
+            self._tokens -= 1
+
+            return True
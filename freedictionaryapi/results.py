@@ -0,0 +1,474 @@
+"""
+Contains lookup result.
+
+.. class:: LookupResult
+.. class:: LookupTimings
+.. class:: WarmupProgress
+"""
+
+from http import HTTPStatus
+import time
+import typing
+
+from .errors import (
+    API_ERRORS_MAPPER,
+    DictionaryApiError
+)
+from .interning import StringPool
+from .languages import LanguageCodes
+from .parsers import (
+    DictionaryApiErrorParser,
+    DictionaryApiParser
+)
+from .types import Word
+
+
+__all__ = [
+    'LookupResult',
+    'LookupTimings',
+    'WarmupProgress'
+]
+
+
+class LookupTimings:
+    """
+    Implements per-stage timing breakdown of the word lookup (durations in seconds):
+
+        * url_generation - generating of the URL (:meth:`UrlBuilder.build`);
+        * queueing - waiting for the turn in the scheduler (async client);
+        * network - requests (``fetch_api_response`` without JSON decoding, all mirror attempts);
+        * decoding - JSON decoding of the response bodies
+          (measured by the implemented clients on Python 3.7+, otherwise it is a part of the network stage);
+        * analysis - analyzing of the response (``_analyze_response``);
+        * parsing - construction of the :obj:`DictionaryApiParser` (``None`` until parser is built).
+
+    Also keeps ``payload_size`` - size of the response body in bytes (``None`` if it is not known).
+
+    Timings are filled by the client that collects them
+    and are available as :attr:`LookupResult.timings`.
+    Slow lookup log of the client counts parsing stage only for lookups that parse the response
+    (``fetch_parser``, ``fetch_word``, ``fetch_word_or_none``).
+    """
+
+    __slots__ = (
+        'url_generation',
+        'queueing',
+        'network',
+        'decoding',
+        'analysis',
+        'parsing',
+        'payload_size',
+    )
+
+    STAGES: typing.Tuple[str, ...] = ('url_generation', 'queueing', 'network', 'decoding', 'analysis', 'parsing')
+    """ Names of the stages in order of the lookup """
+
+    def __init__(self) -> None:
+        """ Init lookup timings instance (all stages take no time). """
+
+        self.url_generation = 0.0
+        self.queueing = 0.0
+        self.network = 0.0
+        self.decoding = 0.0
+        self.analysis = 0.0
+        self.parsing: typing.Optional[float] = None
+        self.payload_size: typing.Optional[int] = None
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f'{class_name}({self.format()})'
+
+    @property
+    def total(self) -> float:
+        """
+        :return: total duration of the measured stages in seconds
+        :rtype: :obj:`float`
+        """
+
+        return sum(duration for duration in self.as_dict().values() if duration is not None)
+
+    def as_dict(self) -> typing.Dict[str, typing.Optional[float]]:
+        """
+        Get durations of the stages.
+
+        :return: durations of the stages in seconds (by names of the stages)
+        :rtype: :obj:`dict[str, Optional[float]]`
+        """
+
+        return {stage: getattr(self, stage) for stage in self.STAGES}
+
+    def format(self) -> str:
+        """
+        Format durations of the stages (in milliseconds) and payload size for logging.
+
+        :return: formatted timings (like ``'total=12.3ms url_generation=0.1ms ... payload_size=2048B'``)
+        :rtype: :obj:`str`
+        """
+
+        parts = [f'total={self.total * 1000:.1f}ms']
+        parts.extend(
+            f'{stage}={duration * 1000:.1f}ms'
+            for stage, duration in self.as_dict().items()
+            if duration is not None
+        )
+
+        if self.payload_size is not None:
+            parts.append(f'payload_size={self.payload_size}B')
+
+        return ' '.join(parts)
+
+
+class WarmupProgress:
+    """
+    Implements progress of the cache warm-up (see ``warmup`` of the clients).
+
+    Counts of the words:
+
+        * total - words to warm up (the top words of the frequency list);
+        * fetched - words that have been looked up (found or not);
+        * skipped - words that have been already cached (no request is sent);
+        * failed - words which lookup has failed (request error).
+    """
+
+    __slots__ = (
+        'total',
+        'fetched',
+        'skipped',
+        'failed',
+        'started_at',
+        'finished_at',
+    )
+
+    def __init__(self, total: int) -> None:
+        """
+        Init warm-up progress instance (warm-up is started).
+
+        :param total: count of the words to warm up
+        :type total: :obj:`int`
+        """
+
+        self.total = total
+        self.fetched = 0
+        self.skipped = 0
+        self.failed = 0
+        self.started_at = time.monotonic()
+        self.finished_at: typing.Optional[float] = None
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return (
+            f'{class_name}(total={self.total!r}, fetched={self.fetched!r}, skipped={self.skipped!r}, '
+            f'failed={self.failed!r}, elapsed={self.elapsed:.2f})'
+        )
+
+    @property
+    def done(self) -> int:
+        """
+        :return: count of the processed words (fetched, skipped and failed)
+        :rtype: :obj:`int`
+        """
+
+        return self.fetched + self.skipped + self.failed
+
+    @property
+    def ratio(self) -> float:
+        """
+        :return: share of the processed words (1 if there is nothing to warm up)
+        :rtype: :obj:`float`
+        """
+
+        return self.done / self.total if self.total else 1.0
+
+    @property
+    def is_finished(self) -> bool:
+        """
+        :return: whether warm-up has finished
+        :rtype: :obj:`bool`
+        """
+
+        return self.finished_at is not None
+
+    @property
+    def elapsed(self) -> float:
+        """
+        :return: duration of the warm-up in seconds (till now if it has not finished)
+        :rtype: :obj:`float`
+        """
+
+        finished_at = time.monotonic() if self.finished_at is None else self.finished_at
+
+        return finished_at - self.started_at
+
+
+class LookupResult:
+    """
+    Implements lightweight result of the word lookup.
+
+    Result is returned instead of raising error
+    if API responded unsuccessfully (the most often - 404, word is not found),
+    so the miss costs almost nothing:
+    parsers, error objects and formatted error messages
+    are built only on demand (on first access).
+
+    Result is truthy only if word is found.
+
+    If client collects timings, result keeps per-stage timing breakdown of the lookup
+    (see :obj:`LookupTimings`).
+    """
+
+    __slots__ = (
+        '_searched_word',
+        '_language_code',
+        '_url',
+        '_status_code',
+        '_response',
+        '_is_filtered',
+        '_is_cached',
+        '_is_stale',
+        '_string_pool',
+        '_parser',
+        '_error_parser',
+        '_timings',
+    )
+
+    def __init__(self, searched_word: str, language_code: LanguageCodes, url: str, status_code: int,
+                 response: typing.Any, *,
+                 is_filtered: bool = False,
+                 is_cached: bool = False,
+                 is_stale: bool = False,
+                 string_pool: typing.Optional[StringPool] = None,
+                 timings: typing.Optional[LookupTimings] = None
+                 ) -> None:
+        """
+        Init lookup result instance.
+
+        :param searched_word: searched word
+        :type searched_word: :obj:`str`
+        :param language_code: language of the searched word
+        :type language_code: :obj:`LanguageCodes`
+        :param url: URL of the API request
+        :type url: :obj:`str`
+        :param status_code: response status code
+        :type status_code: :obj:`int`
+        :param response: API response loaded in python object
+        :type response: :obj:`Any`
+        :keyword is_filtered: whether request has not been sent since word is in the missing words filter
+        :type is_filtered: :obj:`bool`
+        :keyword is_cached: whether response has been taken from the response cache
+        :type is_cached: :obj:`bool`
+        :keyword is_stale: whether cached response is stale (past its soft TTL, refreshed in the background)
+        :type is_stale: :obj:`bool`
+        :keyword string_pool: pool to intern repeated strings of the response with (on parsing)
+        :type string_pool: :obj:`Optional[StringPool]`
+        :keyword timings: per-stage timings of the lookup (if they are collected)
+        :type timings: :obj:`Optional[LookupTimings]`
+        """
+
+        self._searched_word = searched_word
+        self._language_code = language_code
+        self._url = url
+        self._status_code = status_code
+        self._response = response
+        self._is_filtered = is_filtered
+        self._is_cached = is_cached
+        self._is_stale = is_stale
+        self._string_pool = string_pool
+        self._timings = timings
+
+        self._parser: typing.Optional[DictionaryApiParser] = None
+        self._error_parser: typing.Optional[DictionaryApiErrorParser] = None
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return (
+            f'{class_name}(searched_word={self._searched_word!r}, language_code={self._language_code!r}, '
+            f'status_code={self._status_code!r})'
+        )
+
+    def __bool__(self) -> bool:
+        return self.is_found
+
+    @property
+    def searched_word(self) -> str:
+        """
+        :return: searched word
+        :rtype: :obj:`str`
+        """
+
+        return self._searched_word
+
+    @property
+    def language_code(self) -> LanguageCodes:
+        """
+        :return: language of the searched word
+        :rtype: :obj:`LanguageCodes`
+        """
+
+        return self._language_code
+
+    @property
+    def url(self) -> str:
+        """
+        :return: URL of the API request
+        :rtype: :obj:`str`
+        """
+
+        return self._url
+
+    @property
+    def status_code(self) -> int:
+        """
+        :return: response status code
+        :rtype: :obj:`int`
+        """
+
+        return self._status_code
+
+    @property
+    def response(self) -> typing.Any:
+        """
+        :return: API response loaded in python object (``None`` if request has not been sent)
+        :rtype: :obj:`Any`
+        """
+
+        return self._response
+
+    @property
+    def is_found(self) -> bool:
+        """
+        :return: whether word is found (response is successful)
+        :rtype: :obj:`bool`
+        """
+
+        return self._status_code == HTTPStatus.OK
+
+    @property
+    def is_not_found(self) -> bool:
+        """
+        :return: whether word is not found (response status is 404 or word is in the missing words filter)
+        :rtype: :obj:`bool`
+        """
+
+        return self._status_code == HTTPStatus.NOT_FOUND
+
+    @property
+    def is_filtered(self) -> bool:
+        """
+        :return: whether request has not been sent since word is in the missing words filter
+        :rtype: :obj:`bool`
+        """
+
+        return self._is_filtered
+
+    @property
+    def is_cached(self) -> bool:
+        """
+        :return: whether response has been taken from the response cache
+        :rtype: :obj:`bool`
+        """
+
+        return self._is_cached
+
+    @property
+    def is_stale(self) -> bool:
+        """
+        :return: whether cached response is stale (past its soft TTL, refreshed in the background)
+        :rtype: :obj:`bool`
+        """
+
+        return self._is_stale
+
+    @property
+    def timings(self) -> typing.Optional[LookupTimings]:
+        """
+        :return: per-stage timings of the lookup (``None`` if they are not collected)
+        :rtype: :obj:`Optional[LookupTimings]`
+        """
+
+        return self._timings
+
+    @property
+    def parser(self) -> typing.Optional[DictionaryApiParser]:
+        """
+        Parser of the successful response (built on first access, its construction is timed if timings are set).
+
+        :return: parser of the response or ``None`` if word is not found
+        :rtype: :obj:`Optional[DictionaryApiParser]`
+        """
+
+        if self._parser is None and self.is_found:
+            started_at = time.perf_counter()
+            self._parser = DictionaryApiParser(self._response, string_pool=self._string_pool)
+
+            if self._timings is not None:
+                self._timings.parsing = time.perf_counter() - started_at
+
+        return self._parser
+
+    @property
+    def word(self) -> typing.Optional[Word]:
+        """
+        Word of the successful response (built on first access).
+
+        :return: word or ``None`` if word is not found
+        :rtype: :obj:`Optional[Word]`
+        """
+
+        parser = self.parser
+
+        return None if parser is None else parser.word
+
+    @property
+    def error_parser(self) -> typing.Optional[DictionaryApiErrorParser]:
+        """
+        Parser of the unsuccessful response (built on first access).
+
+        :return: parser of the error response
+            or ``None`` if response is successful or request has not been sent
+        :rtype: :obj:`Optional[DictionaryApiErrorParser]`
+        """
+
+        if self._error_parser is None and not self.is_found and not self._is_filtered:
+            self._error_parser = DictionaryApiErrorParser(self._status_code, self._response)
+
+        return self._error_parser
+
+    @property
+    def error(self) -> typing.Optional[DictionaryApiError]:
+        """
+        Error that correspond to the unsuccessful response (built on each access).
+
+        :return: error or ``None`` if response is successful
+        :rtype: :obj:`Optional[DictionaryApiError]`
+        """
+
+        if self.is_found:
+            return None
+
+        # get error type by status code from error mapper
+        # by default get common error
+        error = API_ERRORS_MAPPER.get(self._status_code, DictionaryApiError)
+
+        if self._is_filtered:
+            error_message = (
+                f'Word {self._searched_word!r} [language_code={self._language_code!r}] is known to be missing in API '
+                '(found in the missing words filter), request has not been sent.'
+            )
+        else:
+            error_message = self.error_parser.get_formatted_error_message()
+
+        return error(error_message)
+
+    def raise_for_status(self) -> None:
+        """
+        Raise correspond error if response is not successful.
+
+        :return: None
+        :rtype: :obj:`None`
+
+        :raise:
+            :DictionaryApiError: when unsuccessful status code got of API request
+        """
+
+        if not self.is_found:
+            raise self.error
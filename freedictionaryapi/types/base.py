@@ -6,6 +6,9 @@ Contains base types.
 
 import abc
 import logging
+import typing
+
+from . import serialization
 
 
 __all__ = ['ParsedObject']
@@ -92,6 +95,14 @@ class ParsedObject(abc.ABC):
         ]
     """
 
+    _TYPES: typing.Dict[str, typing.Type['ParsedObject']] = {}
+    """ Registry of the parsed object types by name (for binary deserialization) """
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        ParsedObject._TYPES[cls.__name__] = cls
+
     def __init__(self, data: dict) -> None:
         """
         Init parsed object instance.
@@ -125,3 +136,55 @@ class ParsedObject(abc.ABC):
         equality = self._data == other._data
 
         return equality
+
+    def __reduce__(self) -> tuple:
+        # pickle only the data (restored object is init-ed with it) - the fastest way between processes
+        return (self.__class__, (self._data,))
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize parsed object in compact versioned binary form
+        (see :mod:`freedictionaryapi.types.serialization`).
+
+        Binary form is storage format (caches, queues, snapshots),
+        pickling passes the data as is (see ``__reduce__``).
+
+        :return: serialized parsed object
+        :rtype: :obj:`bytes`
+        """
+
+        return serialization.encode(self.__class__.__name__, self._data)
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> 'ParsedObject':
+        """
+        Deserialize parsed object from binary form (made by :meth:`to_bytes`).
+
+        Invoked on :obj:`ParsedObject` returns object of the serialized type,
+        invoked on concrete type checks that serialized object has the same type.
+
+        :param payload: serialized parsed object
+        :type payload: :obj:`bytes`
+
+        :return: parsed object
+        :rtype: :obj:`ParsedObject`
+
+        :raise:
+            :ValueError:
+                - if payload is not serialized parsed object of the supported version
+                - if payload contains parsed object of other type
+        """
+
+        type_name, data = serialization.decode(payload)
+
+        parsed_object_type = cls._TYPES.get(type_name)
+
+        if parsed_object_type is None or not issubclass(parsed_object_type, cls):
+            message = (
+                'Payload contains serialized parsed object of unsupported type. '
+                f'Expected to get <{cls.__name__}>! '
+                f'Got <{type_name}>'
+            )
+            raise ValueError(message)
+
+        return parsed_object_type(data)
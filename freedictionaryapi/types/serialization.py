@@ -0,0 +1,156 @@
+"""
+Contains compact binary serialization of the parsed objects data.
+
+Binary layout (all integers are little-endian):
+::
+
+    magic (4 bytes) | version (u8) | pad (3 bytes) | body length (u32)
+    body - type name and data of the parsed object in ``marshal`` format (version 4)
+
+Body is encoded and decoded by the C implementation of ``marshal``,
+so round trip is faster than JSON one (no text parsing and no per-value python code on decoding).
+It is smaller than JSON as well: strings are stored with their length (without quoting and escaping)
+and repeated dictionary keys of the response loaded from JSON are stored once (as references).
+
+Version 4 of ``marshal`` format is readable by all supported versions of python.
+Like pickle, binary form is meant for the trusted storage (caches, queues, snapshots made by the package).
+
+.. const:: FORMAT_VERSION
+
+.. function:: encode(type_name: str, data: Any) -> bytes
+.. function:: decode(payload: bytes) -> tuple[str, Any]
+"""
+
+import marshal
+import struct
+import typing
+
+
+__all__ = [
+    'FORMAT_VERSION',
+    'encode',
+    'decode'
+]
+
+
+FORMAT_VERSION = 2
+""" Version of the binary layout """
+
+_MAGIC = b'FDWB'
+_HEADER = struct.Struct('<4sB3xI')
+_MARSHAL_VERSION = 4
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _check_data(data: typing.Any) -> None:
+    # iterative walk (without python call per value) - ``marshal`` accepts much more than JSON-compatible data
+    values = [data]
+    pop_value = values.pop
+    extend_values = values.extend
+
+    while values:
+        value = pop_value()
+        value_type = value.__class__
+
+        if value_type is str:
+            continue
+
+        if value_type is dict:
+            for key in value:
+                if key.__class__ is not str:
+                    message = (
+                        'Data contains dictionary key with unsupported type. '
+                        'Expected to get <str>! '
+                        f'Got {key!r}'
+                    )
+                    raise TypeError(message)
+            extend_values(value.values())
+        elif value_type is list:
+            extend_values(value)
+        elif value_type not in _SCALAR_TYPES:
+            message = (
+                'Data contains object with unsupported type. '
+                'Expected to get JSON-compatible data! '
+                f'Got {value!r}'
+            )
+            raise TypeError(message)
+
+
+def encode(type_name: str, data: typing.Any) -> bytes:
+    """
+    Encode data of the parsed object in bytes.
+
+    Supported data is JSON-compatible (``dict`` with ``str`` keys, ``list``, ``str``, ``int``, ``float``,
+    ``bool``, ``None``) - exactly what API response consists of.
+
+    :param type_name: name of the parsed object type
+    :type type_name: :obj:`str`
+    :param data: parsed object data
+    :type data: :obj:`Any`
+
+    :return: encoded data
+    :rtype: :obj:`bytes`
+
+    :raise:
+        :TypeError: if data contains unsupported type
+    """
+
+    _check_data(data)
+
+    body = marshal.dumps((type_name, data), _MARSHAL_VERSION)
+
+    return _HEADER.pack(_MAGIC, FORMAT_VERSION, len(body)) + body
+
+
+def decode(payload: bytes) -> typing.Tuple[str, typing.Any]:
+    """
+    Decode data of the parsed object from bytes.
+
+    :param payload: encoded data
+    :type payload: :obj:`bytes`
+
+    :return: tuple of:
+
+        - name of the parsed object type;
+        - parsed object data.
+    :rtype: :obj:`tuple[str, Any]`
+
+    :raise:
+        :ValueError: if payload is not encoded data of the supported version or it is truncated (corrupted)
+    """
+
+    try:
+        magic, version, body_length = _HEADER.unpack_from(payload)
+    except struct.error:
+        magic, version, body_length = None, None, None
+
+    if magic != _MAGIC or version != FORMAT_VERSION:
+        message = (
+            'Payload does not contain encoded data of the supported version. '
+            f'Expected to get version {FORMAT_VERSION}! '
+            f'Got (magic={magic!r}, version={version!r})'
+        )
+        raise ValueError(message)
+
+    if len(payload) != _HEADER.size + body_length:
+        _raise_corrupted_payload_error(f'body has {len(payload) - _HEADER.size} bytes instead of {body_length}')
+
+    try:
+        decoded_body = marshal.loads(payload[_HEADER.size:])
+    except (EOFError, ValueError, TypeError):
+        _raise_corrupted_payload_error('body is not valid')
+
+    if not (decoded_body.__class__ is tuple and len(decoded_body) == 2 and decoded_body[0].__class__ is str):
+        _raise_corrupted_payload_error('body does not contain type name and data')
+
+    return decoded_body
+
+
+def _raise_corrupted_payload_error(reason: str) -> typing.NoReturn:
+    message = (
+        'Payload contains corrupted encoded data. '
+        'Expected to get data encoded in full! '
+        f'Got payload where {reason}'
+    )
+    raise ValueError(message)
@@ -2,22 +2,84 @@
 Contains class for work with API urls.
 
 .. class:: ApiUrl
+.. class:: UrlBuilder
 """
 
+import functools
 import logging
+import re
+import typing
+from urllib.parse import quote
 
+from .canonical import normalize_word
 from .languages import (
     DEFAULT_LANGUAGE_CODE,
     LanguageCodes
 )
+from .logs import log_event
 
 
-__all__ = ['ApiUrl']
+__all__ = [
+    'ApiUrl',
+    'UrlBuilder'
+]
 
 
 logger = logging.getLogger(__name__)
 
 
+# characters that are allowed in the path segment as is (RFC 3986 sub-delims, ``:`` and ``@``),
+# all others (``/``, ``?``, ``#``, ``%``, spaces, non-ASCII) are percent-encoded (UTF-8)
+_SAFE_CHARACTERS = "!$&'()*+,;=:@"
+
+
+def _prepare_word(word: str) -> str:
+    """
+    Prepare word for URL (normalize it and check that it is not empty).
+
+    :param word: searched word
+    :type word: :obj:`str`
+
+    :return: normalized word (stripped, Unicode NFC)
+    :rtype: :obj:`str`
+
+    :raise:
+        :ValueError: raised if ``word`` is empty
+    """
+
+    prepared_word = normalize_word(word)
+
+    if not prepared_word:
+        message = (
+            '`word` argument has been passed with empty value. '
+            'Expected to get non-empty value! '
+            f'Got (word={prepared_word!r}).'
+        )
+        raise ValueError(message)
+
+    if len(prepared_word.split()) > 1:
+        message = (
+            'For `word` argument has passed string that contains more than one word, '
+            'most likely response won`t be successful. '
+            'Expected to get string that contains one word! '
+            f'Got (word={prepared_word!r})'
+        )
+        logger.warning(message)
+
+    return prepared_word
+
+
+# words that do not need percent-encoding (the most of them)
+_UNRESERVED_WORD_PATTERN = re.compile(r'[A-Za-z0-9_.~-]+')
+
+
+def _quote_word(word: str) -> str:
+    if _UNRESERVED_WORD_PATTERN.fullmatch(word) is not None:
+        return word
+
+    return quote(word, safe=_SAFE_CHARACTERS)
+
+
 class ApiUrl:
     """
     Implements API URL object.
@@ -26,14 +88,22 @@ class ApiUrl:
     # pattern:
     # https://api.dictionaryapi.dev/api/v2/entries/<language_code>/<word>
 
-    # Note: ``API_URL_PATTERN`` is a format string!
-    API_URL_PATTERN: str = 'https://api.dictionaryapi.dev/api/v2/entries/{language_code}/{word}'
-    """ Pattern of the API URL """
+    DEFAULT_BASE_URL: str = 'https://api.dictionaryapi.dev'
+    """ Base URL of the public API """
+
+    # Note: ``API_PATH_PATTERN`` and ``API_URL_PATTERN`` are format strings!
+    API_PATH_PATTERN: str = '/api/v2/entries/{language_code}/{word}'
+    """ Pattern of the API URL path (the same for the public API and self-hosted instances) """
+    API_URL_PATTERN: str = DEFAULT_BASE_URL + API_PATH_PATTERN
+    """ Pattern of the public API URL """
 
     # example:
     # https://api.dictionaryapi.dev/api/v2/entries/en_US/hello
 
-    def __init__(self, word: str, *, language_code: LanguageCodes = DEFAULT_LANGUAGE_CODE) -> None:
+    def __init__(self, word: str, *,
+                 language_code: LanguageCodes = DEFAULT_LANGUAGE_CODE,
+                 base_url: typing.Optional[str] = None
+                 ) -> None:
         """
         Init API URL instance.
 
@@ -41,31 +111,16 @@ class ApiUrl:
         :type word: :obj:`str`
         :keyword language_code: language of the searched word
         :type language_code: :obj:`LanguageCodes`
+        :keyword base_url: base URL of the API (like ``'http://dictionary.local:9000'`` for self-hosted instance),
+            public API is used if it is not passed
+        :type base_url: :obj:`Optional[str]`
 
         :raise:
             :ValueError: raised if ``word`` is empty
             :TypeError: raised if ``language_code`` is not an instance of :obj:`LanguageCodes`
         """
 
-        self._word = str(word).strip()
-
-        if not self._word:
-            message = (
-                '`word` argument has been passed with empty value. '
-                'Expected to get non-empty value! '
-                f'Got (word={self._word!r}).'
-            )
-            raise ValueError(message)
-
-        if len(self._word.split()) > 1:
-            message = (
-                'For `word` argument has passed string that contains more than one word, '
-                'most likely response won`t be successful. '
-                'Expected to get string that contains one word! '
-                f'Got (word={self._word!r})'
-            )
-            logger.warning(message)
-
+        self._word = _prepare_word(word)
         self._language_code = language_code
 
         if not isinstance(language_code, LanguageCodes):
@@ -76,6 +131,8 @@ class ApiUrl:
             )
             raise TypeError(message)
 
+        self._base_url = None if base_url is None else str(base_url).rstrip('/')
+
     def __repr__(self) -> str:
         class_name = self.__class__.__name__
         return f'{class_name}(word={self._word}, language_code={self._language_code!r})'
@@ -98,21 +155,184 @@ class ApiUrl:
 
         return self._language_code
 
+    @property
+    def base_url(self) -> typing.Optional[str]:
+        """
+        :return: base URL of the API (``None`` if public API is used)
+        :rtype: :obj:`Optional[str]`
+        """
+
+        return self._base_url
+
     def get_url(self) -> str:
         """
         Get prepared (with substituted word and language code) URL that is ready for request.
 
+        Word is percent-encoded (non-ASCII and reserved characters).
+
         :return: prepared URL
         :rtype: :obj:`str`
         """
 
-        url = self.API_URL_PATTERN.format(
-            word=self._word,
+        if self._base_url is None:
+            url_pattern = self.API_URL_PATTERN
+        else:
+            url_pattern = self._base_url + self.API_PATH_PATTERN
+
+        url = url_pattern.format(
+            word=_quote_word(self._word),
             language_code=self._language_code.value
         )
 
-        logger.debug(
-            f'Generated url: <{url!r}> with word: <{self._word!r}> and language_code: <{self._language_code!r}>.'
+        log_event(
+            logger, logging.DEBUG, 'url_generated',
+            'Generated url: <%(url)r> with word: <%(word)r> and language_code: <%(language_code)r>.',
+            url=url, word=self._word, language_code=self._language_code
+        )
+
+        return url
+
+
+class UrlBuilder:
+    """
+    Implements builder of the API URLs for the hot path and batch jobs.
+
+    Unlike :obj:`ApiUrl` (object per URL), builder:
+
+        - precomputes URL prefix (base URL, path and language code) for each :obj:`LanguageCodes` value;
+        - percent-encodes words (non-ASCII and reserved characters) as :meth:`ApiUrl.get_url` does;
+        - memoizes URLs of the hot words (bounded LRU cache).
+
+    Built URLs are equal to URLs of :meth:`ApiUrl.get_url`.
+    """
+
+    def __init__(self, base_url: typing.Optional[str] = None, *,
+                 cache_size: int = 4096
+                 ) -> None:
+        """
+        Init URL builder instance.
+
+        :param base_url: base URL of the API (like ``'http://dictionary.local:9000'`` for self-hosted instance),
+            public API is used if it is not passed
+        :type base_url: :obj:`Optional[str]`
+        :keyword cache_size: maximum count of the memoized URLs (0 - URLs are not memoized)
+        :type cache_size: :obj:`int`
+
+        :raise:
+            :ValueError: if ``cache_size`` is negative
+        """
+
+        if cache_size < 0:
+            message = (
+                '`cache_size` argument has been passed with negative value. '
+                'Expected to get not negative integer! '
+                f'Got (cache_size={cache_size!r}).'
+            )
+            raise ValueError(message)
+
+        self._base_url = None if base_url is None else str(base_url).rstrip('/')
+        self._cache_size = cache_size
+
+        root_url = ApiUrl.DEFAULT_BASE_URL if self._base_url is None else self._base_url
+        # path pattern ends with the word
+        path_prefix_pattern = ApiUrl.API_PATH_PATTERN[:-len('{word}')]
+
+        self._prefixes: typing.Dict[LanguageCodes, str] = {
+            language_code: root_url + path_prefix_pattern.format(language_code=language_code.value)
+            for language_code in LanguageCodes
+        }
+
+        self._build_cached = functools.lru_cache(maxsize=cache_size)(self._build) if cache_size else self._build
+
+    def __repr__(self) -> str:
+        class_name = self.__class__.__name__
+        return f'{class_name}(base_url={self._base_url!r}, cache_size={self._cache_size!r})'
+
+    @property
+    def base_url(self) -> typing.Optional[str]:
+        """
+        :return: base URL of the API (``None`` if public API is used)
+        :rtype: :obj:`Optional[str]`
+        """
+
+        return self._base_url
+
+    @property
+    def cache_info(self) -> typing.Optional[typing.NamedTuple]:
+        """
+        :return: statistics of the memo cache (``hits``, ``misses``, ``maxsize``, ``currsize``)
+            or ``None`` if URLs are not memoized
+        :rtype: :obj:`Optional[NamedTuple]`
+        """
+
+        if not self._cache_size:
+            return None
+
+        return self._build_cached.cache_info()
+
+    def build(self, word: str, language_code: LanguageCodes = DEFAULT_LANGUAGE_CODE) -> str:
+        """
+        Build URL of the API request (memoized).
+
+        :param word: searched word
+        :type word: :obj:`str`
+        :param language_code: language of the searched word
+        :type language_code: :obj:`LanguageCodes`
+
+        :return: prepared URL
+        :rtype: :obj:`str`
+
+        :raise:
+            :ValueError: raised if ``word`` is empty
+            :TypeError: raised if ``language_code`` is not an instance of :obj:`LanguageCodes`
+        """
+
+        return self._build_cached(word, language_code)
+
+    def build_many(self, words: typing.Iterable[str],
+                   language_code: LanguageCodes = DEFAULT_LANGUAGE_CODE
+                   ) -> typing.Iterator[str]:
+        """
+        Build URLs of the API requests for the words of one language (lazily, in order of the words).
+
+        Memo cache is bypassed (batch words are mostly unique, so they would just evict hot words).
+
+        :param words: searched words
+        :type words: :obj:`Iterable[str]`
+        :param language_code: language of the searched words
+        :type language_code: :obj:`LanguageCodes`
+
+        :return: iterator of the prepared URLs
+        :rtype: :obj:`Iterator[str]`
+
+        :raise:
+            :ValueError: raised if any of ``words`` is empty
+            :TypeError: raised if ``language_code`` is not an instance of :obj:`LanguageCodes`
+        """
+
+        prefix = self._get_prefix(language_code)
+
+        for word in words:
+            yield prefix + _quote_word(_prepare_word(word))
+
+    def _build(self, word: str, language_code: LanguageCodes) -> str:
+        url = self._get_prefix(language_code) + _quote_word(_prepare_word(word))
+
+        log_event(
+            logger, logging.DEBUG, 'url_generated',
+            'Generated url: <%(url)r> with word: <%(word)r> and language_code: <%(language_code)r>.',
+            url=url, word=word, language_code=language_code
         )
 
         return url
+
+    def _get_prefix(self, language_code: LanguageCodes) -> str:
+        try:
+            return self._prefixes[language_code]
+        except (KeyError, TypeError):
+            message = (
+                'For `language_code` has been passed object with unsupported type. '
+                'Expected to get argument with type `freedictionaryapi.languages.LanguageCodes`! '
+                f'Got (language_code={language_code!r})'
+            )
+            raise TypeError(message) from None
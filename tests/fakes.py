@@ -0,0 +1,171 @@
+"""
+Contains fake clients for tests.
+
+Fake clients do not make HTTP requests
+but respond with prepared API responses,
+so clients logic might be tested without network.
+
+.. class:: FakeDictionaryApiClient(BaseDictionaryApiClient)
+.. class:: FakeAsyncDictionaryApiClient(BaseAsyncDictionaryApiClient)
+.. class:: FakeApiServer
+"""
+
+import hashlib
+import http.server
+import json
+import socketserver
+import threading
+import time
+import typing
+
+from freedictionaryapi.clients import (
+    BaseAsyncDictionaryApiClient,
+    BaseDictionaryApiClient
+)
+
+from .settings import DATA_DIR
+
+
+__all__ = [
+    'EXISTENT_WORD',
+    'FakeDictionaryApiClient',
+    'FakeAsyncDictionaryApiClient',
+    'FakeApiServer'
+]
+
+
+EXISTENT_WORD = 'hello'
+""" The only word that fake clients know """
+
+
+def _load_response(file_name: str) -> typing.Any:
+    with open(DATA_DIR / file_name, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+WORD_RESPONSE = _load_response('word_hello_API_response.json')
+ERROR_404_RESPONSE = _load_response('error_404_API_response.json')
+
+
+def _respond(url: str) -> typing.Tuple[int, typing.Any]:
+    requested_word = url.rsplit('/', 1)[-1]
+
+    if requested_word == EXISTENT_WORD:
+        return (200, WORD_RESPONSE)
+
+    return (404, ERROR_404_RESPONSE)
+
+
+class FakeDictionaryApiClient(BaseDictionaryApiClient):
+    """ Sync client that responds with prepared responses and counts requests """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.requested_urls: typing.List[str] = []
+
+    def fetch_api_response(self, url: str) -> typing.Tuple[int, typing.Any]:
+        self.requested_urls.append(url)
+
+        return _respond(url)
+
+
+class FakeAsyncDictionaryApiClient(BaseAsyncDictionaryApiClient):
+    """ Async client that responds with prepared responses and counts requests """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.requested_urls: typing.List[str] = []
+
+    async def fetch_api_response(self, url: str) -> typing.Tuple[int, typing.Any]:
+        self.requested_urls.append(url)
+
+        return _respond(url)
+
+
+class _ThreadingHTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    """ Threading HTTP server (``http.server.ThreadingHTTPServer`` is available only since Python 3.7) """
+
+    daemon_threads = True
+
+
+class FakeApiServer:
+    """
+    Local stand-in of the API server (self-hosted freeDictionaryAPI instance) that runs in the thread.
+
+    Server responds as fake clients do or (if it is broken) with 503 (Service Unavailable).
+    Responses have ``ETag``, conditional requests with the same ``If-None-Match`` get 304 (Not Modified).
+    Slow server (with ``chunk_delay``) sends body by small chunks with delay between them.
+
+    Usage:
+    ::
+
+        with FakeApiServer() as server:
+            client = DictionaryApiClient(base_urls=[server.base_url])
+    """
+
+    CHUNK_SIZE = 64
+    """ Size of the body chunks of the slow server (in bytes) """
+
+    def __init__(self, *, is_broken: bool = False, chunk_delay: float = 0.0) -> None:
+        self.is_broken = is_broken
+        self.chunk_delay = chunk_delay
+        self.requested_paths: typing.List[str] = []
+        self.not_modified_count = 0
+
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                server.requested_paths.append(self.path)
+
+                if server.is_broken:
+                    status_code, response = (503, {'title': 'Service Unavailable', 'message': '', 'resolution': ''})
+                else:
+                    status_code, response = _respond(self.path)
+
+                body = json.dumps(response).encode('utf-8')
+                etag = f'"{hashlib.sha1(body).hexdigest()}"'
+
+                if self.headers.get('If-None-Match') == etag:
+                    server.not_modified_count += 1
+
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+
+                self.send_response(status_code)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', etag)
+                self.end_headers()
+
+                if not server.chunk_delay:
+                    self.wfile.write(body)
+                    return
+
+                for start in range(0, len(body), server.CHUNK_SIZE):
+                    self.wfile.write(body[start:start + server.CHUNK_SIZE])
+                    self.wfile.flush()
+                    time.sleep(server.chunk_delay)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self._server = _ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def __enter__(self) -> 'FakeApiServer':
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._server.shutdown()
+        self._server.server_close()
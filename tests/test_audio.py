@@ -0,0 +1,260 @@
+"""
+Contains tests for downloading of the pronunciation audio.
+
+.. class:: TestAudioCache
+.. class:: TestAudioDownloader
+.. class:: TestAsyncAudioDownloader
+"""
+
+import hashlib
+import http.server
+import socketserver
+import threading
+import typing
+
+import pytest
+
+from freedictionaryapi.audio import (
+    AudioCache,
+    AudioDownloadError,
+    get_audio_urls
+)
+from freedictionaryapi.audio.async_downloader import AsyncAudioDownloader
+from freedictionaryapi.audio.sync_downloader import AudioDownloader
+from freedictionaryapi.parsers import DictionaryApiParser
+
+from .fakes import WORD_RESPONSE
+
+
+AUDIO = bytes(range(256)) * 64
+AUDIO_ETAG = '"' + hashlib.md5(AUDIO).hexdigest() + '"'
+
+
+class _ThreadingHTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+
+
+class FakeAudioServer:
+    """
+    Local audio server that supports conditional and range requests.
+
+    Server might interrupt the first full response (send half of the body and close connection).
+    """
+
+    def __init__(self, *, is_interrupting: bool = False) -> None:
+        self.is_interrupting = is_interrupting
+        self.requests: typing.List[typing.Tuple[str, typing.Dict[str, str]]] = []
+
+        server = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                server.requests.append((self.path, dict(self.headers)))
+
+                if not self.path.endswith('.mp3'):
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                if self.headers.get('If-None-Match') == AUDIO_ETAG:
+                    self.send_response(304)
+                    self.send_header('ETag', AUDIO_ETAG)
+                    self.end_headers()
+                    return
+
+                range_header = self.headers.get('Range')
+                start = 0
+
+                if range_header and self.headers.get('If-Range') == AUDIO_ETAG:
+                    start = int(range_header[len('bytes='):].rstrip('-'))
+
+                    self.send_response(206)
+                    self.send_header('Content-Range', f'bytes {start}-{len(AUDIO) - 1}/{len(AUDIO)}')
+                else:
+                    self.send_response(200)
+
+                body = AUDIO[start:]
+
+                self.send_header('ETag', AUDIO_ETAG)
+                self.send_header('Content-Type', 'audio/mpeg')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+
+                if server.is_interrupting and not start:
+                    server.is_interrupting = False
+                    self.wfile.write(body[:len(body) // 2])
+                    self.wfile.flush()
+                    self.close_connection = True
+                    return
+
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self._server = _ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def get_url(self, name: str) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}/{name}'
+
+    def __enter__(self) -> 'FakeAudioServer':
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class TestAudioCache:
+    """
+    Contains tests for
+        * audio cache (``AudioCache``);
+        * getting of the audio links (``get_audio_urls``).
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_content_addressed_path(self, tmp_path):
+        cache = AudioCache(tmp_path)
+        url = 'https://example.com/audio/hello.mp3'
+
+        path = cache.get_path(url)
+
+        assert path.name == cache.get_key(url) + '.mp3'
+        assert path.parent.parent == tmp_path
+        assert url not in cache
+
+    def test_audio_urls_are_unique(self):
+        word = DictionaryApiParser(WORD_RESPONSE).word
+
+        urls = get_audio_urls([word, word])
+
+        assert urls
+        assert len(urls) == len(set(urls))
+        assert all(url.startswith('http') for url in urls)
+
+
+class TestAudioDownloader:
+    """
+    Contains tests for
+        * sync audio downloader (``AudioDownloader``).
+
+    Checking that audio is cached, deduplicated, revalidated and resumed.
+    """
+
+    # fixtures ---------------------------------------------------------------------------------------------------------
+
+    @pytest.fixture(name='server')
+    def fixture_server(self) -> FakeAudioServer:
+        """ Get running local audio server """
+        with FakeAudioServer() as server:
+            yield server
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_error_raising_on_wrong_cache_argument(self):
+        with pytest.raises(TypeError) as raised_error:
+            _ = AudioDownloader('I am not a cache')
+
+    def test_download_and_cache(self, tmp_path, server: FakeAudioServer):
+        url = server.get_url('hello.mp3')
+
+        with AudioDownloader(AudioCache(tmp_path)) as downloader:
+            path = downloader.download(url)
+            cached_path = downloader.download(url)
+
+        assert path == cached_path
+        assert path.read_bytes() == AUDIO
+        assert len(server.requests) == 1
+
+    def test_duplicates_are_downloaded_once(self, tmp_path, server: FakeAudioServer):
+        urls = [server.get_url(f'word{index % 3}.mp3') for index in range(12)]
+
+        with AudioDownloader(AudioCache(tmp_path), concurrency=4) as downloader:
+            paths = downloader.download_many(urls)
+
+        assert len(paths) == 3
+        assert len(server.requests) == 3
+
+    def test_errors_returning(self, tmp_path, server: FakeAudioServer):
+        with AudioDownloader(AudioCache(tmp_path)) as downloader:
+            paths = downloader.download_many([server.get_url('missing.wav')], return_exceptions=True)
+
+            with pytest.raises(AudioDownloadError) as raised_error:
+                _ = downloader.download(server.get_url('missing.wav'))
+
+        assert isinstance(paths[server.get_url('missing.wav')], AudioDownloadError)
+
+    def test_revalidation(self, tmp_path, server: FakeAudioServer):
+        url = server.get_url('hello.mp3')
+        cache = AudioCache(tmp_path)
+
+        with AudioDownloader(cache) as downloader:
+            _ = downloader.download(url)
+
+        with AudioDownloader(cache, revalidate=True) as downloader:
+            path = downloader.download(url)
+
+        path_, headers = server.requests[-1]
+
+        assert headers.get('If-None-Match') == AUDIO_ETAG
+        assert path.read_bytes() == AUDIO
+
+    def test_resume_of_interrupted_download(self, tmp_path):
+        with FakeAudioServer(is_interrupting=True) as server:
+            url = server.get_url('hello.mp3')
+            cache = AudioCache(tmp_path)
+
+            with AudioDownloader(cache) as downloader:
+                with pytest.raises(Exception) as raised_error:
+                    _ = downloader.download(url)
+
+                assert 0 < cache.get_partial_size(url) < len(AUDIO)
+
+                path = downloader.download(url)
+
+        path_, headers = server.requests[-1]
+
+        assert headers.get('Range') == f'bytes={len(AUDIO) // 2}-'
+        assert path.read_bytes() == AUDIO
+
+
+class TestAsyncAudioDownloader:
+    """
+    Contains tests for
+        * async audio downloader (``AsyncAudioDownloader``).
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    @pytest.mark.asyncio
+    async def test_duplicates_are_downloaded_once(self, tmp_path):
+        with FakeAudioServer() as server:
+            urls = [server.get_url(f'word{index % 3}.mp3') for index in range(12)]
+
+            async with AsyncAudioDownloader(AudioCache(tmp_path), concurrency=2) as downloader:
+                paths = await downloader.download_many(urls)
+
+        assert len(paths) == 3
+        assert len(server.requests) == 3
+        assert all(path.read_bytes() == AUDIO for path in paths.values())
+
+    @pytest.mark.asyncio
+    async def test_resume_of_interrupted_download(self, tmp_path):
+        with FakeAudioServer(is_interrupting=True) as server:
+            url = server.get_url('hello.mp3')
+
+            async with AsyncAudioDownloader(AudioCache(tmp_path)) as downloader:
+                with pytest.raises(Exception) as raised_error:
+                    _ = await downloader.download(url)
+
+                path = await downloader.download(url)
+
+        path_, headers = server.requests[-1]
+
+        assert 'Range' in headers
+        assert path.read_bytes() == AUDIO
@@ -0,0 +1,193 @@
+"""
+Contains tests for load balancing across API mirrors.
+
+.. class:: TestMirrorPool
+.. class:: TestClientWithMirrors
+"""
+
+import asyncio
+import typing
+
+import pytest
+
+from freedictionaryapi.clients import MirrorPool
+from freedictionaryapi.clients.sync_client import DictionaryApiClient
+from freedictionaryapi.urls import ApiUrl
+
+from .fakes import (
+    EXISTENT_WORD,
+    FakeApiServer,
+    FakeAsyncDictionaryApiClient,
+    FakeDictionaryApiClient
+)
+
+
+BROKEN_BASE_URL = 'http://broken.local'
+HEALTHY_BASE_URL = 'http://healthy.local'
+
+
+class TestMirrorPool:
+    """
+    Contains tests for
+        * pool of the API mirrors (``MirrorPool``).
+
+    Checking that pool prefers fast mirrors and ejects failing ones.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_error_raising_on_wrong_base_urls(self):
+        with pytest.raises(ValueError) as raised_error:
+            _ = MirrorPool([])
+
+        with pytest.raises(ValueError) as raised_error:
+            _ = MirrorPool(['http://a.local', 'http://a.local/'])
+
+    def test_base_url_generating(self):
+        url = ApiUrl(EXISTENT_WORD, base_url='http://a.local:9000/').get_url()
+
+        assert url == f'http://a.local:9000/api/v2/entries/en_US/{EXISTENT_WORD}'
+
+    def test_fast_mirror_is_preferred(self):
+        pool = MirrorPool(['http://slow.local', 'http://fast.local'], seed=0)
+
+        for base_url, latency in (('http://slow.local', 1.0), ('http://fast.local', 0.1)):
+            assert pool.choose(exclude=[url for url in pool.base_urls if url != base_url]) == base_url
+            pool.record(base_url, latency, is_failed=False)
+
+        chosen_base_urls = []
+        for _ in range(10):
+            base_url = pool.choose()
+            chosen_base_urls.append(base_url)
+            pool.record(base_url, 0.1 if base_url == 'http://fast.local' else 1.0, is_failed=False)
+
+        assert chosen_base_urls.count('http://fast.local') == 10
+
+    def test_failing_mirror_is_ejected(self):
+        pool = MirrorPool(['http://a.local', 'http://b.local'], failures_threshold=2, cooldown=60)
+
+        for _ in range(2):
+            assert pool.choose(exclude=['http://b.local']) == 'http://a.local'
+            pool.record('http://a.local', 0.1, is_failed=True)
+
+        assert all(pool.choose() == 'http://b.local' for _ in range(5))
+
+        stats = {mirror_stats['base_url']: mirror_stats for mirror_stats in pool.stats}
+
+        assert not stats['http://a.local']['is_healthy']
+        assert stats['http://a.local']['errors'] == 2
+        assert stats['http://b.local']['in_flight'] == 5
+
+    def test_fail_open_when_all_mirrors_are_ejected(self):
+        pool = MirrorPool(['http://a.local'], failures_threshold=1, cooldown=60)
+
+        pool.choose()
+        pool.record('http://a.local', 0.1, is_failed=True)
+
+        assert pool.choose() == 'http://a.local'
+        assert pool.choose(exclude=['http://a.local']) is None
+
+    def test_release(self):
+        pool = MirrorPool(['http://a.local'])
+
+        pool.choose()
+        pool.release('http://a.local')
+
+        assert pool.stats[0]['in_flight'] == 0
+        assert pool.stats[0]['requests'] == 0
+        assert pool.stats[0]['latency'] is None
+
+
+class PartiallyBrokenFakeDictionaryApiClient(FakeDictionaryApiClient):
+    """ Sync fake client which requests to the broken mirror fail """
+
+    def fetch_api_response(self, url: str) -> typing.Tuple[int, typing.Any]:
+        if url.startswith(BROKEN_BASE_URL):
+            self.requested_urls.append(url)
+            raise ConnectionError('mirror is down')
+
+        return super().fetch_api_response(url)
+
+
+class HangingFakeAsyncDictionaryApiClient(FakeAsyncDictionaryApiClient):
+    """ Async fake client which requests to the broken mirror hang """
+
+    async def fetch_api_response(self, url: str) -> typing.Tuple[int, typing.Any]:
+        if url.startswith(BROKEN_BASE_URL):
+            self.requested_urls.append(url)
+            await asyncio.sleep(10)
+
+        return await super().fetch_api_response(url)
+
+
+class TestClientWithMirrors:
+    """
+    Contains tests for
+        * clients with API mirrors (``base_urls``).
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_error_raising_on_wrong_base_urls_argument(self):
+        with pytest.raises(TypeError) as raised_error:
+            _ = FakeDictionaryApiClient(base_urls='http://a.local')
+
+    def test_failover(self):
+        pool = MirrorPool([BROKEN_BASE_URL, HEALTHY_BASE_URL], failures_threshold=1)
+        client = PartiallyBrokenFakeDictionaryApiClient(base_urls=pool)
+
+        for _ in range(5):
+            result = client.fetch_result(EXISTENT_WORD)
+
+            assert result.is_found
+            assert result.url.startswith(HEALTHY_BASE_URL)
+
+        # broken mirror has been ejected after the first failure
+        assert sum(url.startswith(BROKEN_BASE_URL) for url in client.requested_urls) == 1
+
+    def test_error_raising_when_all_mirrors_fail(self):
+        client = PartiallyBrokenFakeDictionaryApiClient(base_urls=[BROKEN_BASE_URL])
+
+        with pytest.raises(ConnectionError) as raised_error:
+            _ = client.fetch_result(EXISTENT_WORD)
+
+    def test_local_servers(self):
+        with FakeApiServer(is_broken=True) as broken_server, FakeApiServer() as server:
+            pool = MirrorPool([broken_server.base_url, server.base_url], failures_threshold=1)
+
+            with DictionaryApiClient(base_urls=pool) as client:
+                words = [client.fetch_word(EXISTENT_WORD) for _ in range(5)]
+                result = client.fetch_result('blablablabla')
+
+        assert all(word.word == EXISTENT_WORD for word in words)
+        assert result.is_not_found
+        assert len(broken_server.requested_paths) == 1
+        assert len(server.requested_paths) == 6
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_is_not_recorded(self):
+        pool = MirrorPool([BROKEN_BASE_URL], failures_threshold=2)
+        client = HangingFakeAsyncDictionaryApiClient(base_urls=pool)
+
+        for is_failed in (False, True):
+            pool.choose()
+            pool.record(BROKEN_BASE_URL, 1.0, is_failed=is_failed)
+
+        stats = pool.stats
+
+        # request to the hanging mirror is cancelled (by deadline or closed stream)
+        lookup = asyncio.ensure_future(client.fetch_result(EXISTENT_WORD))
+        await asyncio.sleep(0.05)
+        lookup.cancel()
+
+        with pytest.raises(asyncio.CancelledError) as raised_error:
+            await lookup
+
+        assert len(client.requested_urls) == 1
+        assert pool.stats == stats
+
+        # consecutive failures have not been reset
+        pool.choose()
+        pool.record(BROKEN_BASE_URL, 1.0, is_failed=True)
+
+        assert not pool.stats[0]['is_healthy']
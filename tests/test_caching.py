@@ -0,0 +1,356 @@
+"""
+Contains tests for cache of the API responses.
+
+.. class:: TestResponseCache
+.. class:: TestClientWithResponseCache
+.. class:: TestAsyncClientWithResponseCache
+.. class:: TestConditionalRevalidation
+"""
+
+import typing
+
+import pytest
+
+from freedictionaryapi.caching import ResponseCache
+from freedictionaryapi.clients import DictionaryApiClient
+from freedictionaryapi.languages import LanguageCodes
+from freedictionaryapi.metrics import ClientMetrics
+
+from .fakes import (
+    EXISTENT_WORD,
+    FakeApiServer,
+    FakeAsyncDictionaryApiClient,
+    FakeDictionaryApiClient
+)
+
+
+class FakeClock:
+    """ Clock that is moved manually """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FlakyDictionaryApiClient(FakeDictionaryApiClient):
+    """ Sync client that fails requests while it is broken """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.is_broken = False
+
+    def fetch_api_response(self, url: str) -> typing.Tuple[int, typing.Any]:
+        if self.is_broken:
+            self.requested_urls.append(url)
+            raise ConnectionError(url)
+
+        return super().fetch_api_response(url)
+
+
+class ValidatingAsyncDictionaryApiClient(FakeAsyncDictionaryApiClient):
+    """ Async client that responds with ``ETag`` and with 304 (Not Modified) to the matching conditional requests """
+
+    ETAG = '"1"'
+
+    async def fetch_api_response(self, url: str, *,
+                                 headers: typing.Optional[typing.Mapping[str, str]] = None
+                                 ) -> typing.Tuple[int, typing.Any, typing.Mapping[str, str]]:
+        status_code, response = await super().fetch_api_response(url)
+
+        if headers is not None and headers.get('If-None-Match') == self.ETAG:
+            return (304, None, {'etag': self.ETAG})
+
+        return (status_code, response, {'etag': self.ETAG})
+
+
+class TestResponseCache:
+    """
+    Contains tests for
+        * response cache (``ResponseCache``).
+
+    Checking soft and hard expiration, the single refresh and its backoff.
+    """
+
+    # fixtures ---------------------------------------------------------------------------------------------------------
+
+    @pytest.fixture(name='clock')
+    def fixture_clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture(name='cache')
+    def fixture_cache(self, clock: FakeClock) -> ResponseCache:
+        return ResponseCache(2, soft_ttl=10, hard_ttl=100, refresh_backoff=1, max_refresh_backoff=4, clock=clock)
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_error_raising_on_inconsistent_ttl(self):
+        with pytest.raises(ValueError) as raised_error:
+            _ = ResponseCache(soft_ttl=10, hard_ttl=5)
+
+    def test_only_definite_responses_are_cached(self, cache: ResponseCache):
+        assert cache.set('en_US/hello', 'url', 200, [])
+        assert cache.set('en_US/blablablabla', 'url', 404, {})
+        assert not cache.set('en_US/hi', 'url', 503, {})
+
+        assert 'en_US/hello' in cache
+        assert 'en_US/hi' not in cache
+
+    def test_least_recently_used_eviction(self, cache: ResponseCache):
+        cache.set('en_US/a', 'url', 200, [])
+        cache.set('en_US/b', 'url', 200, [])
+        cache.get('en_US/a')
+        cache.set('en_US/c', 'url', 200, [])
+
+        assert 'en_US/a' in cache
+        assert 'en_US/b' not in cache
+
+    def test_expiration(self, cache: ResponseCache, clock: FakeClock):
+        cache.set('en_US/hello', 'url', 200, [])
+
+        assert cache.get('en_US/hello').is_fresh(clock())
+
+        clock.now = 50
+
+        assert not cache.get('en_US/hello').is_fresh(clock())
+
+        clock.now = 100
+
+        assert cache.get('en_US/hello') is None
+        assert len(cache) == 0
+
+    def test_single_refresh(self, cache: ResponseCache, clock: FakeClock):
+        cache.set('en_US/hello', 'url', 200, [])
+
+        assert not cache.start_refresh('en_US/hello')
+
+        clock.now = 20
+
+        assert cache.start_refresh('en_US/hello')
+        assert not cache.start_refresh('en_US/hello')
+
+    def test_refresh_backoff(self, cache: ResponseCache, clock: FakeClock):
+        cache.set('en_US/hello', 'url', 200, [])
+        clock.now = 20
+
+        backoffs = []
+
+        for _ in range(4):
+            assert cache.start_refresh('en_US/hello')
+            cache.fail_refresh('en_US/hello')
+
+            retry_at = cache.get('en_US/hello').refresh_retry_at
+            backoffs.append(retry_at - clock.now)
+
+            assert not cache.start_refresh('en_US/hello')
+
+            clock.now = retry_at
+
+        assert backoffs == [1, 2, 4, 4]
+
+    def test_stale_while_revalidate_mode(self):
+        assert ResponseCache(soft_ttl=10, hard_ttl=20).is_stale_while_revalidate
+        assert not ResponseCache(soft_ttl=10).is_stale_while_revalidate
+
+
+class TestClientWithResponseCache:
+    """
+    Contains tests for
+        * sync client usage of the response cache.
+
+    Checking that stale responses are returned immediately and refreshed once in the background,
+    failed refresh keeps stale response and hard expired responses are requested again.
+    """
+
+    # fixtures ---------------------------------------------------------------------------------------------------------
+
+    @pytest.fixture(name='clock')
+    def fixture_clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture(name='client')
+    def fixture_client(self, clock: FakeClock) -> FlakyDictionaryApiClient:
+        """ Get instance of fake sync API client with response cache in the stale-while-revalidate mode """
+        cache = ResponseCache(soft_ttl=10, hard_ttl=100, clock=clock)
+        client = FlakyDictionaryApiClient(response_cache=cache)
+
+        yield client
+
+        client._shutdown_refreshes()
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_error_raising_on_wrong_cache_argument(self):
+        with pytest.raises(TypeError) as raised_error:
+            _ = FakeDictionaryApiClient(response_cache='I am not a cache')
+
+    def test_fresh_response_is_cached(self, client: FlakyDictionaryApiClient):
+        first_result = client.fetch_result(EXISTENT_WORD)
+        second_result = client.fetch_result(EXISTENT_WORD.upper())
+
+        assert not first_result.is_cached
+        assert second_result.is_cached and not second_result.is_stale
+        assert second_result.word.word == EXISTENT_WORD
+        assert len(client.requested_urls) == 1
+
+    def test_languages_are_cached_separately(self, client: FlakyDictionaryApiClient):
+        client.fetch_result(EXISTENT_WORD, LanguageCodes.ENGLISH_US)
+        client.fetch_result(EXISTENT_WORD, LanguageCodes.SPANISH)
+
+        assert len(client.requested_urls) == 2
+
+    def test_stale_response_is_refreshed_once(self, client: FlakyDictionaryApiClient, clock: FakeClock):
+        client.fetch_result(EXISTENT_WORD)
+        clock.now = 20
+
+        results = [client.fetch_result(EXISTENT_WORD) for _ in range(3)]
+        client.wait_for_refreshes()
+
+        # the first stale lookup schedules refresh, the next ones get stale or already refreshed response
+        assert results[0].is_stale
+        assert all(result.is_cached for result in results)
+        assert len(client.requested_urls) == 2
+        assert not client.fetch_result(EXISTENT_WORD).is_stale
+
+    def test_failed_refresh_keeps_stale_response(self, client: FlakyDictionaryApiClient, clock: FakeClock):
+        client.fetch_result(EXISTENT_WORD)
+        clock.now = 20
+        client.is_broken = True
+
+        client.fetch_result(EXISTENT_WORD)
+        client.wait_for_refreshes()
+
+        result = client.fetch_result(EXISTENT_WORD)
+        client.wait_for_refreshes()
+
+        assert result.is_stale and result.word.word == EXISTENT_WORD
+        # next refresh is backed off
+        assert len(client.requested_urls) == 2
+
+    def test_hard_expired_response_is_requested(self, client: FlakyDictionaryApiClient, clock: FakeClock):
+        client.fetch_result(EXISTENT_WORD)
+        clock.now = 100
+
+        result = client.fetch_result(EXISTENT_WORD)
+
+        assert not result.is_cached
+        assert len(client.requested_urls) == 2
+
+
+class TestAsyncClientWithResponseCache:
+    """
+    Contains tests for
+        * async client usage of the response cache.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    @pytest.mark.asyncio
+    async def test_stale_response_is_refreshed_once(self):
+        clock = FakeClock()
+        client = FakeAsyncDictionaryApiClient(response_cache=ResponseCache(soft_ttl=10, hard_ttl=100, clock=clock))
+
+        await client.fetch_result(EXISTENT_WORD)
+        clock.now = 20
+
+        results = [await client.fetch_result(EXISTENT_WORD) for _ in range(3)]
+        await client.wait_for_refreshes()
+
+        assert all(result.is_cached and result.is_stale for result in results)
+        assert len(client.requested_urls) == 2
+        assert not (await client.fetch_result(EXISTENT_WORD)).is_stale
+
+
+class TestConditionalRevalidation:
+    """
+    Contains tests for
+        * conditional revalidation of the cached responses (``ETag``, ``Last-Modified``).
+
+    Checking that validators are stored with responses, expired responses are revalidated
+    with conditional requests and 304 (Not Modified) renews cached response.
+    """
+
+    # fixtures ---------------------------------------------------------------------------------------------------------
+
+    @pytest.fixture(name='clock')
+    def fixture_clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture(name='server')
+    def fixture_server(self) -> FakeApiServer:
+        with FakeApiServer() as server:
+            yield server
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_conditional_headers(self, clock: FakeClock):
+        cache = ResponseCache(soft_ttl=10, clock=clock)
+        cache.set('en_US/hello', 'url', 200, [], etag='"1"', last_modified='Mon, 01 Jan 2024 00:00:00 GMT')
+        cache.set('en_US/hi', 'url', 200, [])
+
+        assert cache.peek('en_US/hello').conditional_headers == {
+            'If-None-Match': '"1"',
+            'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'
+        }
+        assert cache.peek('en_US/hi').conditional_headers == {}
+
+        clock.now = 20
+
+        # expired entry is kept for revalidation only if it has validators
+        assert cache.get('en_US/hello') is None and cache.peek('en_US/hello') is not None
+        assert cache.get('en_US/hi') is None and cache.peek('en_US/hi') is None
+
+    def test_expired_response_revalidation(self, server: FakeApiServer, clock: FakeClock):
+        metrics = ClientMetrics()
+        cache = ResponseCache(soft_ttl=10, clock=clock)
+
+        with DictionaryApiClient(base_urls=[server.base_url], response_cache=cache, metrics=metrics) as client:
+            client.fetch_result(EXISTENT_WORD)
+            clock.now = 20
+            result = client.fetch_result(EXISTENT_WORD)
+
+            assert client.fetch_result(EXISTENT_WORD).is_cached
+
+        assert len(server.requested_paths) == 2
+        assert server.not_modified_count == 1
+        assert result.is_cached and result.word.word == EXISTENT_WORD
+        assert metrics.get_sample_value('freedictionaryapi_cache_hits_total', {'cache': 'revalidation'}) == 1
+
+    def test_stale_response_refresh_revalidation(self, server: FakeApiServer, clock: FakeClock):
+        cache = ResponseCache(soft_ttl=10, hard_ttl=100, clock=clock)
+
+        with DictionaryApiClient(base_urls=[server.base_url], response_cache=cache) as client:
+            client.fetch_result(EXISTENT_WORD)
+            clock.now = 20
+
+            assert client.fetch_result(EXISTENT_WORD).is_stale
+
+            client.wait_for_refreshes()
+
+            assert not client.fetch_result(EXISTENT_WORD).is_stale
+
+        assert server.not_modified_count == 1
+
+    def test_missing_word_revalidation(self, server: FakeApiServer, clock: FakeClock):
+        cache = ResponseCache(soft_ttl=10, clock=clock)
+
+        with DictionaryApiClient(base_urls=[server.base_url], response_cache=cache) as client:
+            client.fetch_result('blablablabla')
+            clock.now = 20
+            result = client.fetch_result('blablablabla')
+
+        assert server.not_modified_count == 1
+        assert result.is_not_found and result.is_cached
+
+    @pytest.mark.asyncio
+    async def test_async_expired_response_revalidation(self, clock: FakeClock):
+        client = ValidatingAsyncDictionaryApiClient(response_cache=ResponseCache(soft_ttl=10, clock=clock))
+
+        await client.fetch_result(EXISTENT_WORD)
+        clock.now = 20
+        result = await client.fetch_result(EXISTENT_WORD)
+
+        assert len(client.requested_urls) == 2
+        assert result.is_cached and result.word.word == EXISTENT_WORD
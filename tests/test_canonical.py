@@ -0,0 +1,109 @@
+"""
+Contains tests for canonicalization of the searched words.
+
+.. class:: TestCanonicalKey
+.. class:: TestClientWithCanonicalWords
+"""
+
+import unicodedata
+
+import pytest
+
+from freedictionaryapi.canonical import (
+    fold_word,
+    get_canonical_key,
+    normalize_word
+)
+from freedictionaryapi.errors import DictionaryApiNotFoundError
+from freedictionaryapi.filters import MissingWordsFilter
+from freedictionaryapi.languages import LanguageCodes
+
+from .fakes import FakeDictionaryApiClient
+
+
+class TestCanonicalKey:
+    """
+    Contains tests for
+        * normalizing of the words (``normalize_word``);
+        * case folding by rules of the language (``fold_word``);
+        * canonical keys (``get_canonical_key``).
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_normalizing_keeps_case(self):
+        decomposed_word = unicodedata.normalize('NFD', ' Olá ')
+
+        assert normalize_word(decomposed_word) == unicodedata.normalize('NFC', 'Olá')
+
+    @pytest.mark.parametrize(
+        'word',
+        [
+            'hello',
+            'Hello',
+            ' hello ',
+            'HELLO\n'
+        ]
+    )
+    def test_variants_share_key(self, word: str):
+        assert get_canonical_key(word, LanguageCodes.ENGLISH_US) == 'en_US/hello'
+
+    def test_composition_variants_share_key(self):
+        composed_word = unicodedata.normalize('NFC', 'Café')
+        decomposed_word = unicodedata.normalize('NFD', 'café')
+
+        assert composed_word != decomposed_word
+        assert (
+            get_canonical_key(composed_word, LanguageCodes.FRENCH)
+            == get_canonical_key(decomposed_word, LanguageCodes.FRENCH)
+        )
+
+    def test_languages_do_not_share_key(self):
+        assert get_canonical_key('hola', LanguageCodes.SPANISH) != get_canonical_key('hola', LanguageCodes.ENGLISH_US)
+
+    def test_turkish_case_folding(self):
+        assert fold_word('IRMAK', LanguageCodes.TURKISH) == 'ırmak'
+        assert fold_word('İSTANBUL', LanguageCodes.TURKISH) == 'istanbul'
+
+    def test_german_case_is_kept(self):
+        assert fold_word(' Essen ', LanguageCodes.GERMAN) == 'Essen'
+        assert get_canonical_key('Essen', LanguageCodes.GERMAN) != get_canonical_key('essen', LanguageCodes.GERMAN)
+
+    def test_full_case_folding(self):
+        assert fold_word('Straße', LanguageCodes.ENGLISH_US) == fold_word('STRASSE', LanguageCodes.ENGLISH_US)
+
+
+class TestClientWithCanonicalWords:
+    """
+    Contains tests for
+        * client usage of the canonical words.
+
+    Checking that variants of the word share the missing words filter entry
+    and that the word sent to the API keeps its case.
+    """
+
+    # fixtures ---------------------------------------------------------------------------------------------------------
+
+    @pytest.fixture(name='client')
+    def fixture_client(self) -> FakeDictionaryApiClient:
+        """ Get instance of fake sync API client with missing words filter """
+        client = FakeDictionaryApiClient(missing_words_filter=MissingWordsFilter(capacity=100))
+
+        return client
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_variants_share_filter_entry(self, client: FakeDictionaryApiClient):
+        for word in ('Blablablabla', 'blablablabla ', 'BLABLABLABLA'):
+            with pytest.raises(DictionaryApiNotFoundError) as raised_error:
+                _ = client.fetch_word(word)
+
+        assert len(client.requested_urls) == 1
+
+    def test_sent_word_keeps_case(self, client: FakeDictionaryApiClient):
+        with pytest.raises(DictionaryApiNotFoundError) as raised_error:
+            _ = client.fetch_word(' Blablablabla ')
+
+        requested_url, = client.requested_urls
+
+        assert requested_url.endswith('/Blablablabla')
@@ -0,0 +1,255 @@
+"""
+Contains tests for deadlines of the lookups.
+
+.. class:: TestDeadline
+.. class:: TestClientWithDeadline
+.. class:: TestAsyncClientWithDeadline
+"""
+
+import asyncio
+import time
+import typing
+
+import pytest
+
+from freedictionaryapi.caching import ResponseCache
+from freedictionaryapi.clients import DictionaryApiClient
+from freedictionaryapi.clients.scheduling import RequestScheduler
+from freedictionaryapi.deadlines import Deadline
+from freedictionaryapi.errors import (
+    DictionaryApiError,
+    DictionaryApiTimeoutError
+)
+
+from .fakes import (
+    EXISTENT_WORD,
+    FakeApiServer,
+    FakeAsyncDictionaryApiClient,
+    FakeDictionaryApiClient
+)
+
+
+DELAY = 0.2
+""" Delay of the responses of the slow clients (in seconds) """
+
+
+class FakeClock:
+    """ Clock that is moved manually """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class SlowDictionaryApiClient(FakeDictionaryApiClient):
+    """ Sync client that responds with delay and applies timeout (records timeouts of the requests) """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.timeouts: typing.List[typing.Optional[float]] = []
+
+    def fetch_api_response(self, url: str, *,
+                           timeout: typing.Optional[float] = None
+                           ) -> typing.Tuple[int, typing.Any]:
+        self.timeouts.append(timeout)
+
+        if timeout is not None and timeout < DELAY:
+            time.sleep(timeout)
+            raise TimeoutError(url)
+
+        time.sleep(DELAY)
+
+        return super().fetch_api_response(url)
+
+
+class LegacySlowDictionaryApiClient(FakeDictionaryApiClient):
+    """ Sync client that responds with delay and does not accept timeout (written before deadlines) """
+
+    def fetch_api_response(self, url: str) -> typing.Tuple[int, typing.Any]:
+        time.sleep(DELAY)
+
+        return super().fetch_api_response(url)
+
+
+class SlowAsyncDictionaryApiClient(FakeAsyncDictionaryApiClient):
+    """ Async client that responds with delay """
+
+    async def fetch_api_response(self, url: str) -> typing.Tuple[int, typing.Any]:
+        await asyncio.sleep(DELAY)
+
+        return await super().fetch_api_response(url)
+
+
+class TestDeadline:
+    """
+    Contains tests for
+        * deadline of the lookup (``Deadline``).
+    """
+
+    # fixtures ---------------------------------------------------------------------------------------------------------
+
+    @pytest.fixture(name='clock')
+    def fixture_clock(self) -> FakeClock:
+        return FakeClock()
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    @pytest.mark.parametrize(
+        argnames=('timeout', 'error_type'),
+        argvalues=[
+            (0, ValueError),
+            (-1, ValueError),
+            ('1', TypeError),
+        ]
+    )
+    def test_error_raising_on_unsupported_timeout(self, timeout: typing.Any, error_type: typing.Type[Exception]):
+        with pytest.raises(error_type) as raised_error:
+            _ = Deadline.from_timeout(timeout)
+
+    def test_from_timeout(self):
+        deadline = Deadline(1)
+
+        assert Deadline.from_timeout(None) is None
+        assert Deadline.from_timeout(deadline) is deadline
+        assert Deadline.from_timeout(2).timeout == 2
+
+    def test_budget_spending(self, clock: FakeClock):
+        deadline = Deadline(1, clock=clock)
+
+        clock.now = 0.25
+
+        assert deadline.remaining == 0.75
+        assert not deadline.is_expired
+
+        clock.now = 1
+
+        assert deadline.remaining == 0
+        assert deadline.is_expired
+
+    def test_check(self, clock: FakeClock):
+        deadline = Deadline(1, clock=clock)
+        deadline.check('queueing')
+
+        clock.now = 2
+
+        with pytest.raises(DictionaryApiTimeoutError) as raised_error:
+            deadline.check('queueing')
+
+        assert isinstance(raised_error.value, DictionaryApiError)
+        assert isinstance(raised_error.value, TimeoutError)
+        assert 'queueing' in str(raised_error.value)
+
+
+class TestClientWithDeadline:
+    """
+    Contains tests for
+        * sync client lookups with deadline.
+
+    Checking that remaining budget is passed to requests and retries and that lookup fails fast.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_request_gets_remaining_budget(self):
+        client = SlowDictionaryApiClient()
+
+        word = client.fetch_word(EXISTENT_WORD, timeout=10 * DELAY)
+
+        assert word.word == EXISTENT_WORD
+        assert 9 * DELAY < client.timeouts[0] <= 10 * DELAY
+
+    def test_lookup_fails_fast(self):
+        client = SlowDictionaryApiClient()
+
+        started_at = time.monotonic()
+
+        with pytest.raises(DictionaryApiTimeoutError) as raised_error:
+            _ = client.fetch_word(EXISTENT_WORD, timeout=DELAY / 4)
+
+        assert time.monotonic() - started_at < DELAY
+
+    def test_request_is_not_retried_without_budget(self):
+        client = SlowDictionaryApiClient(base_urls=['http://mirror-1', 'http://mirror-2'])
+
+        with pytest.raises(DictionaryApiTimeoutError) as raised_error:
+            _ = client.fetch_word(EXISTENT_WORD, timeout=DELAY / 4)
+
+        assert len(client.requested_urls) == 0
+        assert len(client.timeouts) == 1
+
+    def test_expired_shared_deadline(self):
+        clock = FakeClock()
+        deadline = Deadline(1, clock=clock)
+        client = SlowDictionaryApiClient(response_cache=ResponseCache())
+
+        client.fetch_word(EXISTENT_WORD, timeout=deadline)
+        clock.now = 2
+
+        # cached response is returned regardless of deadline
+        assert client.fetch_word(EXISTENT_WORD, timeout=deadline).word == EXISTENT_WORD
+
+        with pytest.raises(DictionaryApiTimeoutError) as raised_error:
+            _ = client.fetch_word('blablablabla', timeout=deadline)
+
+        assert len(client.requested_urls) == 1
+
+    def test_client_without_timeout_support(self):
+        client = LegacySlowDictionaryApiClient()
+
+        assert client.fetch_word(EXISTENT_WORD, timeout=10 * DELAY).word == EXISTENT_WORD
+
+        # response that has come past deadline fails lookup
+        with pytest.raises(DictionaryApiTimeoutError) as raised_error:
+            _ = client.fetch_word(EXISTENT_WORD, timeout=DELAY / 4)
+
+        assert 'waiting for response' in str(raised_error.value)
+
+    def test_slow_response_body_is_limited_by_deadline(self):
+        # every chunk comes in time (read timeout is not exceeded) but the whole body does not
+        with FakeApiServer(chunk_delay=DELAY / 4) as server:
+            with DictionaryApiClient(base_urls=[server.base_url]) as client:
+                started_at = time.monotonic()
+
+                with pytest.raises(DictionaryApiTimeoutError) as raised_error:
+                    _ = client.fetch_word(EXISTENT_WORD, timeout=2 * DELAY)
+
+                assert time.monotonic() - started_at < 3 * DELAY
+
+
+class TestAsyncClientWithDeadline:
+    """
+    Contains tests for
+        * async client lookups with deadline.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    @pytest.mark.asyncio
+    async def test_request_is_cancelled_on_deadline(self):
+        client = SlowAsyncDictionaryApiClient()
+
+        started_at = time.monotonic()
+
+        with pytest.raises(DictionaryApiTimeoutError) as raised_error:
+            _ = await client.fetch_word(EXISTENT_WORD, timeout=DELAY / 4)
+
+        assert time.monotonic() - started_at < DELAY
+        assert 'waiting for response' in str(raised_error.value)
+
+    @pytest.mark.asyncio
+    async def test_queueing_is_limited_by_deadline(self):
+        scheduler = RequestScheduler(1)
+        client = SlowAsyncDictionaryApiClient(scheduler=scheduler)
+
+        lookup = asyncio.ensure_future(client.fetch_word(EXISTENT_WORD))
+        await asyncio.sleep(0)
+
+        with pytest.raises(DictionaryApiTimeoutError) as raised_error:
+            _ = await client.fetch_word(EXISTENT_WORD, timeout=DELAY / 4)
+
+        assert 'queueing' in str(raised_error.value)
+        assert scheduler.metrics['queued'] == 0
+        assert (await lookup).word == EXISTENT_WORD
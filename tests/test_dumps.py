@@ -0,0 +1,206 @@
+"""
+Contains tests for dumps of the API responses.
+
+.. class:: TestDumpReader
+.. class:: TestParallelDumpParser
+"""
+
+import gzip
+import json
+import typing
+
+import pytest
+
+from freedictionaryapi.dumps import (
+    DumpReader,
+    ParallelDumpParser
+)
+from freedictionaryapi.languages import LanguageCodes
+from freedictionaryapi.types import Word
+
+from .settings import DATA_DIR
+
+
+def get_headword(word: Word) -> str:
+    """ Function to apply in worker processes (must be picklable) """
+    return word.word
+
+
+class TestDumpReader:
+    """
+    Contains tests for
+        * streaming dump reader (``DumpReader``).
+
+    Checking that reader yields responses of the dump,
+    skips malformed lines and filters lines.
+    """
+
+    # fixtures ---------------------------------------------------------------------------------------------------------
+
+    @pytest.fixture(name='lines', scope='class')
+    def fixture_lines(self) -> typing.List[bytes]:
+        """ Lines of the dump: responses, envelope, malformed lines """
+        json_file_path = DATA_DIR / 'word_hello_API_response.json'
+        with open(json_file_path, 'r', encoding='utf-8') as file:
+            response = json.load(file)
+
+        hola_response = [{'word': 'hola', 'phonetics': [], 'meanings': []}]
+
+        lines = [
+            json.dumps(response).encode('utf-8'),
+            b'{"I am": "malformed"',
+            b'',
+            json.dumps({'language_code': 'es', 'response': hola_response}).encode('utf-8'),
+            b'"not a response"',
+            json.dumps(response, ensure_ascii=False).encode('utf-8'),
+        ]
+
+        return lines
+
+    @pytest.fixture(name='dump_path')
+    def fixture_dump_path(self, tmp_path, lines: typing.List[bytes]):
+        """ Path of the not compressed dump """
+        path = tmp_path / 'dump.jsonl'
+        path.write_bytes(b'\n'.join(lines) + b'\n')
+
+        return path
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_words_reading(self, dump_path):
+        reader = DumpReader(dump_path)
+
+        headwords = [word.word for word in reader.iter_words()]
+
+        assert headwords == ['hello', 'hola', 'hello']
+        assert reader.stats == {'lines': 5, 'records': 3, 'malformed': 2, 'filtered': 0}
+
+    def test_reading_with_small_chunks(self, dump_path):
+        reader = DumpReader(dump_path, chunk_size=7)
+
+        headwords = [parser.word.word for parser in reader]
+
+        assert headwords == ['hello', 'hola', 'hello']
+
+    def test_gzip_dump_reading(self, tmp_path, lines: typing.List[bytes]):
+        path = tmp_path / 'dump.jsonl.gz'
+        with gzip.open(path, 'wb') as file:
+            file.write(b'\n'.join(lines))
+
+        reader = DumpReader(path)
+
+        assert reader.compression == 'gzip'
+        assert [word.word for word in reader.iter_words()] == ['hello', 'hola', 'hello']
+
+    def test_too_long_lines_skipping(self, dump_path, lines: typing.List[bytes]):
+        reader = DumpReader(dump_path, chunk_size=64, max_line_size=len(lines[3]) + 1)
+
+        headwords = [word.word for word in reader.iter_words()]
+
+        assert headwords == ['hola']
+        assert reader.stats['malformed'] == 4
+
+    def test_language_filtering(self, dump_path):
+        reader = DumpReader(dump_path, languages=[LanguageCodes.SPANISH])
+
+        headwords = [word.word for word in reader.iter_words()]
+
+        assert headwords == ['hola']
+        assert reader.stats['filtered'] == 4
+
+    def test_headword_filtering(self, dump_path):
+        reader = DumpReader(dump_path, headwords=['hello'])
+
+        headwords = [word.word for word in reader.iter_words()]
+
+        assert headwords == ['hello', 'hello']
+
+    def test_range_reading(self, dump_path, lines: typing.List[bytes]):
+        reader = DumpReader(dump_path)
+        # range of the lines from the envelope (4th line) till the end
+        start = sum(len(line) + 1 for line in lines[:3])
+
+        headwords = [parser.word.word for parser in reader.iter_range_parsers(start, dump_path.stat().st_size)]
+
+        assert headwords == ['hola', 'hello']
+        assert reader.stats == {'lines': 3, 'records': 2, 'malformed': 1, 'filtered': 0}
+
+    def test_error_raising_on_compressed_range_reading(self, tmp_path):
+        path = tmp_path / 'dump.jsonl.gz'
+        path.write_bytes(b'')
+
+        with pytest.raises(ValueError) as raised_error:
+            _ = DumpReader(path).iter_range_parsers(0, 0)
+
+    def test_error_raising_on_wrong_compression(self, dump_path):
+        with pytest.raises(ValueError) as raised_error:
+            _ = DumpReader(dump_path, compression='rar')
+
+
+class TestParallelDumpParser:
+    """
+    Contains tests for
+        * parallel dump parser (``ParallelDumpParser``).
+
+    Checking that dump is split by line boundaries
+    and results are merged in the dump order.
+    """
+
+    # fixtures ---------------------------------------------------------------------------------------------------------
+
+    @pytest.fixture(name='dump_path', scope='class')
+    def fixture_dump_path(self, tmp_path_factory):
+        """ Path of the dump with numbered words and malformed lines """
+        path = tmp_path_factory.mktemp('dumps') / 'dump.jsonl'
+
+        lines = []
+        for index in range(200):
+            lines.append(json.dumps([{'word': f'word{index}', 'phonetics': [], 'meanings': []}]))
+            if index % 50 == 0:
+                lines.append('{"I am": "malformed"')
+
+        path.write_text('\n'.join(lines), encoding='utf-8')
+
+        return path
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_ranges_are_aligned_to_lines(self, dump_path):
+        parser = ParallelDumpParser(dump_path, workers=2, range_size=100)
+        content = dump_path.read_bytes()
+
+        ranges = parser.split()
+
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == len(content)
+        assert all(previous_end == start for (_, previous_end), (start, _) in zip(ranges, ranges[1:]))
+        assert all(content[start - 1:start] == b'\n' for start, _ in ranges[1:])
+
+    def test_words_are_merged_in_order(self, dump_path):
+        parser = ParallelDumpParser(dump_path, workers=2, range_size=1_000)
+
+        headwords = [word.word for word in parser.iter_words()]
+
+        assert headwords == [word.word for word in DumpReader(dump_path).iter_words()]
+        assert parser.stats == {'lines': 204, 'records': 200, 'malformed': 4, 'filtered': 0}
+
+    def test_payloads_are_serialized_words(self, dump_path):
+        parser = ParallelDumpParser(dump_path, workers=2, range_size=1_000)
+
+        words = [Word.from_bytes(payload) for payload in parser.iter_payloads()]
+
+        assert words == list(parser.iter_words())
+
+    def test_function_mapping(self, dump_path):
+        parser = ParallelDumpParser(dump_path, workers=2, range_size=1_000, headwords=['word7', 'word150'])
+
+        headwords = list(parser.map(get_headword))
+
+        assert headwords == ['word7', 'word150']
+
+    def test_error_raising_on_compressed_dump(self, tmp_path):
+        path = tmp_path / 'dump.jsonl.gz'
+        path.write_bytes(b'')
+
+        with pytest.raises(ValueError) as raised_error:
+            _ = ParallelDumpParser(path)
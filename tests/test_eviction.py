@@ -0,0 +1,151 @@
+"""
+Contains tests for eviction of the cached responses.
+
+.. class:: TestFrequencySketch
+.. class:: TestTinyLfuEviction
+.. class:: TestResponseCacheEvictionPolicy
+"""
+
+import pytest
+
+from freedictionaryapi.caching import (
+    EvictionPolicy,
+    ResponseCache
+)
+from freedictionaryapi.eviction import (
+    FrequencySketch,
+    LruEviction,
+    TinyLfuEviction
+)
+
+
+class TestFrequencySketch:
+    """
+    Contains tests for
+        * count-min sketch (``FrequencySketch``).
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_estimation_is_not_underestimated(self):
+        sketch = FrequencySketch(1_000)
+        counts = {f'word{index}': index % 10 for index in range(1_000)}
+
+        for key, count in counts.items():
+            for _ in range(count):
+                sketch.increment(key)
+
+        assert all(sketch.estimate(key) >= count for key, count in counts.items())
+
+    def test_counters_saturation(self):
+        sketch = FrequencySketch(16)
+
+        for _ in range(100):
+            sketch.increment('hello')
+
+        assert sketch.estimate('hello') == FrequencySketch.MAX_COUNT
+
+    def test_aging(self):
+        sketch = FrequencySketch(16, sample_size=10)
+
+        for _ in range(9):
+            sketch.increment('hello')
+
+        assert sketch.estimate('hello') == 9
+
+        sketch.increment('hello')
+
+        assert sketch.estimate('hello') == 5
+
+    def test_error_raising_on_wrong_width(self):
+        with pytest.raises(ValueError) as raised_error:
+            _ = FrequencySketch(0)
+
+
+class TestTinyLfuEviction:
+    """
+    Contains tests for
+        * W-TinyLFU eviction (``TinyLfuEviction``).
+
+    Checking that one-hit wonders are not admitted over frequently accessed keys.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_hot_keys_survive_scan(self):
+        eviction = TinyLfuEviction(100)
+        hot_keys = [f'hot{index}' for index in range(20)]
+
+        for _ in range(10):
+            for key in hot_keys:
+                eviction.record_access(key)
+
+        for key in hot_keys:
+            assert not eviction.add(key)
+
+        evicted_keys = set()
+
+        for index in range(300):
+            key = f'scanned{index}'
+            eviction.record_access(key)
+            evicted_keys.update(eviction.add(key))
+
+        assert not evicted_keys.intersection(hot_keys)
+
+    def test_lru_evicts_hot_keys_on_scan(self):
+        eviction = LruEviction(100)
+        hot_keys = [f'hot{index}' for index in range(50)]
+
+        for key in hot_keys:
+            eviction.add(key)
+
+        evicted_keys = set()
+
+        for index in range(1_000):
+            evicted_keys.update(eviction.add(f'scanned{index}'))
+
+        assert evicted_keys.issuperset(hot_keys)
+
+    def test_removed_key_is_not_evicted(self):
+        eviction = TinyLfuEviction(2, window_share=0.5)
+        eviction.add('a')
+        eviction.remove('a')
+
+        assert 'a' not in eviction.add('b') + eviction.add('c')
+
+    def test_error_raising_on_wrong_share(self):
+        with pytest.raises(ValueError) as raised_error:
+            _ = TinyLfuEviction(100, window_share=1.5)
+
+
+class TestResponseCacheEvictionPolicy:
+    """
+    Contains tests for
+        * eviction policies of the response cache.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_one_hit_wonders_are_not_admitted(self):
+        cache = ResponseCache(10, eviction_policy=EvictionPolicy.TINY_LFU)
+        hot_keys = [f'en_US/hot{index}' for index in range(9)]
+
+        for key in hot_keys:
+            for _ in range(3):
+                cache.get(key)
+
+            cache.set(key, 'url', 200, [])
+
+        for index in range(20):
+            key = f'en_US/crawled{index}'
+
+            if cache.get(key) is None:
+                cache.set(key, 'url', 200, [])
+
+        assert len(cache) == 10
+        # the only last one-off word is in the window of the new responses
+        assert all(key in cache for key in hot_keys)
+
+    def test_error_raising_on_wrong_policy(self):
+        with pytest.raises(TypeError) as raised_error:
+            _ = ResponseCache(eviction_policy='lru')
@@ -0,0 +1,118 @@
+"""
+Contains tests for multi-language lookup (``fetch_word_across_languages``).
+
+.. class:: TestFanout
+.. class:: TestAsyncFanout
+"""
+
+import asyncio
+import time
+import typing
+
+import pytest
+
+from freedictionaryapi.languages import LanguageCodes
+
+from .fakes import (
+    EXISTENT_WORD,
+    FakeAsyncDictionaryApiClient,
+    FakeDictionaryApiClient
+)
+
+
+LANGUAGES = [LanguageCodes.ENGLISH_US, LanguageCodes.SPANISH, LanguageCodes.FRENCH]
+DELAY = 0.1
+""" Delay of the responses of the slow clients (in seconds) """
+
+
+class SlowDictionaryApiClient(FakeDictionaryApiClient):
+    """ Sync client that responds with delay (French responses are 10 times slower) and applies timeout """
+
+    def fetch_api_response(self, url: str, *,
+                           timeout: typing.Optional[float] = None
+                           ) -> typing.Tuple[int, typing.Any]:
+        delay = 10 * DELAY if f'/{LanguageCodes.FRENCH.value}/' in url else DELAY
+
+        if timeout is not None and timeout < delay:
+            time.sleep(timeout)
+            raise TimeoutError(url)
+
+        time.sleep(delay)
+
+        return super().fetch_api_response(url)
+
+
+class SlowAsyncDictionaryApiClient(FakeAsyncDictionaryApiClient):
+    """ Async client that responds with delay (French responses are 10 times slower) """
+
+    async def fetch_api_response(self, url: str) -> typing.Tuple[int, typing.Any]:
+        await asyncio.sleep(10 * DELAY if f'/{LanguageCodes.FRENCH.value}/' in url else DELAY)
+
+        return await super().fetch_api_response(url)
+
+
+class TestFanout:
+    """
+    Contains tests for
+        * sync client multi-language lookup.
+
+    Checking mapping of the languages, concurrency of the lookups and deadline.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_error_raising_on_unsupported_language(self):
+        with pytest.raises(TypeError) as raised_error:
+            _ = FakeDictionaryApiClient().fetch_word_across_languages(EXISTENT_WORD, ['en_US'])
+
+    def test_error_raising_on_not_positive_timeout(self):
+        with pytest.raises(ValueError) as raised_error:
+            _ = FakeDictionaryApiClient().fetch_word_across_languages(EXISTENT_WORD, LANGUAGES, timeout=0)
+
+    def test_words_are_mapped_to_languages(self):
+        client = FakeDictionaryApiClient()
+
+        words = client.fetch_word_across_languages(EXISTENT_WORD, [*LANGUAGES, LanguageCodes.SPANISH])
+
+        assert list(words) == LANGUAGES
+        assert all(word.word == EXISTENT_WORD for word in words.values())
+        assert len(client.requested_urls) == 3
+
+    def test_missing_words_are_mapped_to_none(self):
+        words = FakeDictionaryApiClient().fetch_word_across_languages('blablablabla', LANGUAGES)
+
+        assert words == dict.fromkeys(LANGUAGES)
+
+    def test_lookups_are_concurrent_and_limited_by_deadline(self):
+        client = SlowDictionaryApiClient()
+
+        started_at = time.monotonic()
+        words = client.fetch_word_across_languages(EXISTENT_WORD, LANGUAGES, timeout=5 * DELAY)
+        elapsed = time.monotonic() - started_at
+
+        assert elapsed < 5 * DELAY + DELAY
+        assert words[LanguageCodes.ENGLISH_US] is not None
+        assert words[LanguageCodes.SPANISH] is not None
+        assert words[LanguageCodes.FRENCH] is None
+
+
+class TestAsyncFanout:
+    """
+    Contains tests for
+        * async client multi-language lookup.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    @pytest.mark.asyncio
+    async def test_lookups_are_concurrent_and_limited_by_deadline(self):
+        client = SlowAsyncDictionaryApiClient()
+
+        started_at = time.monotonic()
+        words = await client.fetch_word_across_languages(EXISTENT_WORD, LANGUAGES, timeout=5 * DELAY)
+        elapsed = time.monotonic() - started_at
+
+        assert elapsed < 5 * DELAY + DELAY
+        assert list(words) == LANGUAGES
+        assert words[LanguageCodes.SPANISH].word == EXISTENT_WORD
+        assert words[LanguageCodes.FRENCH] is None
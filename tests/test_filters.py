@@ -0,0 +1,177 @@
+"""
+Contains tests for missing words filter.
+
+.. class:: TestMissingWordsFilter
+.. class:: TestClientWithMissingWordsFilter
+"""
+
+import os
+
+import pytest
+
+from freedictionaryapi.errors import DictionaryApiNotFoundError
+from freedictionaryapi.filters import MissingWordsFilter
+from freedictionaryapi.languages import LanguageCodes
+
+from .fakes import (
+    EXISTENT_WORD,
+    FakeDictionaryApiClient
+)
+
+
+class TestMissingWordsFilter:
+    """
+    Contains tests for
+        * missing words filter (``MissingWordsFilter``).
+
+    Checking that filter has no false negatives,
+    keeps false positive rate and persists in file.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_error_raising_on_wrong_false_positive_rate(self):
+        with pytest.raises(ValueError) as raised_error:
+            _ = MissingWordsFilter(false_positive_rate=1.5)
+
+    def test_added_words_are_contained(self):
+        missing_words_filter = MissingWordsFilter(capacity=1_000)
+        words = [f'word{index}' for index in range(1_000)]
+
+        for word in words:
+            missing_words_filter.add(word, LanguageCodes.ENGLISH_US)
+
+        assert all((word, LanguageCodes.ENGLISH_US) in missing_words_filter for word in words)
+
+    def test_language_is_part_of_the_key(self):
+        missing_words_filter = MissingWordsFilter(capacity=1_000)
+        missing_words_filter.add('hola', LanguageCodes.ENGLISH_US)
+
+        assert ('hola', LanguageCodes.SPANISH) not in missing_words_filter
+
+    def test_false_positive_rate(self):
+        capacity = 5_000
+        false_positive_rate = 0.01
+        missing_words_filter = MissingWordsFilter(capacity=capacity, false_positive_rate=false_positive_rate)
+
+        for index in range(capacity):
+            missing_words_filter.add(f'missing{index}', LanguageCodes.ENGLISH_US)
+
+        checks_count = 20_000
+        false_positives_count = sum(
+            missing_words_filter.might_contain(f'existent{index}', LanguageCodes.ENGLISH_US)
+            for index in range(checks_count)
+        )
+
+        # generous bound to keep test stable
+        assert false_positives_count / checks_count < false_positive_rate * 2
+
+    def test_filter_persistence(self, tmp_path):
+        path = tmp_path / 'missing_words.bloom'
+
+        with MissingWordsFilter(capacity=100, path=path) as missing_words_filter:
+            missing_words_filter.add('blablablabla', LanguageCodes.ENGLISH_US)
+
+            # other instance with the same file sees the word at once (shared mapping)
+            with MissingWordsFilter(path=path) as other_missing_words_filter:
+                assert ('blablablabla', LanguageCodes.ENGLISH_US) in other_missing_words_filter
+
+        with MissingWordsFilter(capacity=999, path=path) as loaded_missing_words_filter:
+            assert loaded_missing_words_filter.capacity == 100
+            assert ('blablablabla', LanguageCodes.ENGLISH_US) in loaded_missing_words_filter
+
+    def test_error_raising_on_wrong_file(self, tmp_path):
+        path = tmp_path / 'not_a_filter.bin'
+        path.write_bytes(b'I am not a filter')
+
+        with pytest.raises(ValueError) as raised_error:
+            _ = MissingWordsFilter(path=path)
+
+    def test_error_raising_on_truncated_file(self, tmp_path):
+        path = tmp_path / 'missing_words.bloom'
+        MissingWordsFilter(capacity=100, path=path).close()
+
+        path.write_bytes(path.read_bytes()[:MissingWordsFilter.HEADER.size + 1])
+
+        with pytest.raises(ValueError) as raised_error:
+            _ = MissingWordsFilter(path=path)
+
+    def test_file_is_created_fully_written(self, tmp_path):
+        path = tmp_path / 'missing_words.bloom'
+
+        with MissingWordsFilter(capacity=100, path=path) as missing_words_filter:
+            expected_size = MissingWordsFilter.HEADER.size + missing_words_filter._get_bytes_count()
+
+        # temporary file is removed
+        assert os.listdir(tmp_path) == [path.name]
+        assert path.stat().st_size == expected_size
+
+    def test_concurrent_creation(self, tmp_path, monkeypatch: pytest.MonkeyPatch):
+        path = tmp_path / 'missing_words.bloom'
+        link = os.link
+
+        def link_after_other_process(source, destination):
+            # other process publishes its filter in the meantime
+            monkeypatch.setattr(os, 'link', link)
+
+            with MissingWordsFilter(capacity=100, path=path) as other_missing_words_filter:
+                other_missing_words_filter.add('blablablabla', LanguageCodes.ENGLISH_US)
+
+            link(source, destination)
+
+        monkeypatch.setattr(os, 'link', link_after_other_process)
+
+        with MissingWordsFilter(capacity=999, path=path) as missing_words_filter:
+            assert missing_words_filter.capacity == 100
+            assert ('blablablabla', LanguageCodes.ENGLISH_US) in missing_words_filter
+
+        assert os.listdir(tmp_path) == [path.name]
+
+
+class TestClientWithMissingWordsFilter:
+    """
+    Contains tests for
+        * base client usage of the missing words filter.
+
+    Checking that client feeds filter with missing words
+    and does not send requests for them.
+    """
+
+    # fixtures ---------------------------------------------------------------------------------------------------------
+
+    @pytest.fixture(name='client')
+    def fixture_client(self) -> FakeDictionaryApiClient:
+        """ Get instance of fake sync API client with missing words filter """
+        client = FakeDictionaryApiClient(missing_words_filter=MissingWordsFilter(capacity=100))
+
+        return client
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_error_raising_on_wrong_filter_argument(self):
+        with pytest.raises(TypeError) as raised_error:
+            _ = FakeDictionaryApiClient(missing_words_filter='I am not a filter')
+
+    def test_missing_word_short_circuit(self, client: FakeDictionaryApiClient):
+        nonexistent_word = 'blablablabla'
+
+        for _ in range(3):
+            with pytest.raises(DictionaryApiNotFoundError) as raised_error:
+                _ = client.fetch_word(nonexistent_word)
+
+        assert len(client.requested_urls) == 1
+
+    def test_filter_bypass(self, client: FakeDictionaryApiClient):
+        nonexistent_word = 'blablablabla'
+
+        for _ in range(2):
+            with pytest.raises(DictionaryApiNotFoundError) as raised_error:
+                _ = client.fetch_word(nonexistent_word, bypass_filter=True)
+
+        assert len(client.requested_urls) == 2
+
+    def test_existent_word_is_not_filtered(self, client: FakeDictionaryApiClient):
+        _ = client.fetch_word(EXISTENT_WORD)
+        _ = client.fetch_word(EXISTENT_WORD)
+
+        assert len(client.requested_urls) == 2
@@ -0,0 +1,136 @@
+"""
+Contains tests for string interning.
+
+.. class:: TestStringPool
+.. class:: TestClientWithStringPool
+"""
+
+import json
+import threading
+
+import pytest
+
+from freedictionaryapi.caching import ResponseCache
+from freedictionaryapi.canonical import get_canonical_key
+from freedictionaryapi.interning import StringPool
+from freedictionaryapi.languages import LanguageCodes
+from freedictionaryapi.parsers import DictionaryApiParser
+
+from .fakes import (
+    EXISTENT_WORD,
+    FakeDictionaryApiClient
+)
+from .settings import DATA_DIR
+
+
+class TestStringPool:
+    """
+    Contains tests for
+        * string pool (``StringPool``);
+        * response parser usage of the string pool (``DictionaryApiParser``).
+
+    Checking that equal strings are shared, pool is bounded
+    and parsed data is not changed.
+    """
+
+    # fixtures ---------------------------------------------------------------------------------------------------------
+
+    @pytest.fixture(name='response_text', scope='class')
+    def fixture_response_text(self) -> str:
+        """ API response (word=hello) as JSON text """
+        json_file_path = DATA_DIR / 'word_hello_API_response.json'
+        with open(json_file_path, 'r', encoding='utf-8') as file:
+            response_text = file.read()
+
+        return response_text
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_error_raising_on_wrong_max_size(self):
+        with pytest.raises(ValueError) as raised_error:
+            _ = StringPool(max_size=0)
+
+    def test_equal_strings_are_shared(self):
+        string_pool = StringPool()
+        # strings are built in runtime to be different objects
+        first_string = ''.join(['no', 'un'])
+        second_string = ''.join(['n', 'oun'])
+
+        assert string_pool.intern(first_string) is string_pool.intern(second_string)
+
+    def test_pool_is_bounded(self):
+        string_pool = StringPool(max_size=2)
+
+        for string in ('first', 'second', 'third'):
+            _ = string_pool.intern(string)
+
+        assert len(string_pool) == 2
+        assert 'third' not in string_pool
+        assert string_pool.stats == {'size': 2, 'hits': 0, 'misses': 2, 'rejections': 1}
+
+    def test_pool_is_bounded_in_threads(self):
+        string_pool = StringPool(max_size=100)
+
+        def intern_strings(thread_index: int) -> None:
+            for index in range(1_000):
+                _ = string_pool.intern(f'{thread_index}-{index}')
+
+        threads = [threading.Thread(target=intern_strings, args=(thread_index,)) for thread_index in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        stats = string_pool.stats
+
+        assert len(string_pool) == 100
+        assert stats['misses'] == 100
+        assert stats['rejections'] == 8 * 1_000 - 100
+
+    def test_parser_data_is_not_changed(self, response_text: str):
+        parser = DictionaryApiParser(json.loads(response_text), string_pool=StringPool())
+
+        assert parser.response == json.loads(response_text)
+
+    def test_parsers_share_strings(self, response_text: str):
+        string_pool = StringPool()
+
+        first_parser = DictionaryApiParser(json.loads(response_text), string_pool=string_pool)
+        second_parser = DictionaryApiParser(json.loads(response_text), string_pool=string_pool)
+
+        first_parts_of_speech = first_parser.get_all_parts_of_speech()
+        second_parts_of_speech = second_parser.get_all_parts_of_speech()
+
+        assert all(
+            first_part_of_speech is second_part_of_speech
+            for first_part_of_speech, second_part_of_speech in zip(first_parts_of_speech, second_parts_of_speech)
+        )
+        assert first_parser.get_all_definitions()[0] is not second_parser.get_all_definitions()[0]
+
+
+class TestClientWithStringPool:
+    """
+    Contains tests for
+        * client usage of the string pool.
+
+    Checking that the response is interned once and its only copy is shared by the cache, the result and the word.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_response_is_interned_once(self):
+        string_pool = StringPool()
+        response_cache = ResponseCache()
+        client = FakeDictionaryApiClient(string_pool=string_pool, response_cache=response_cache)
+
+        result = client.fetch_result(EXISTENT_WORD)
+        entry = response_cache.peek(get_canonical_key(EXISTENT_WORD, LanguageCodes.ENGLISH_US))
+        interned_strings_count = string_pool.stats['hits'] + string_pool.stats['misses']
+
+        assert entry.response is result.response
+        assert result.word.data is result.response[0]
+        assert client.fetch_result(EXISTENT_WORD).word.data is result.response[0]
+        # parsing and cache hits do not intern again
+        assert string_pool.stats['hits'] + string_pool.stats['misses'] == interned_strings_count
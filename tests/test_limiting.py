@@ -0,0 +1,212 @@
+"""
+Contains tests for adaptive concurrency limiting.
+
+.. class:: TestAdaptiveConcurrencyLimiter
+.. class:: TestBatchLookupsWithLimiter
+"""
+
+import asyncio
+import threading
+import time
+import typing
+
+import pytest
+
+from freedictionaryapi.clients import (
+    AdaptiveConcurrencyLimiter,
+    RequestScheduler
+)
+
+from .fakes import (
+    EXISTENT_WORD,
+    FakeAsyncDictionaryApiClient,
+    FakeDictionaryApiClient
+)
+
+
+OVERLOADING_WORD = 'overload'
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """
+    Contains tests for
+        * adaptive concurrency limiter (``AdaptiveConcurrencyLimiter``).
+
+    Checking that limit grows additively and is cut multiplicatively.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_error_raising_on_inconsistent_limits(self):
+        with pytest.raises(ValueError) as raised_error:
+            _ = AdaptiveConcurrencyLimiter(10, max_limit=5)
+
+        with pytest.raises(ValueError) as raised_error:
+            _ = AdaptiveConcurrencyLimiter(decrease_factor=1.5)
+
+    def test_additive_increase(self):
+        limiter = AdaptiveConcurrencyLimiter(10)
+
+        # a few round trips - ``limit`` successful requests with baseline latency per round trip
+        for _ in range(60):
+            limiter.record(0.0, is_overloaded=False, finished_at=0.1)
+
+        assert 13 <= limiter.limit <= 16
+
+    def test_no_increase_on_high_latency(self):
+        limiter = AdaptiveConcurrencyLimiter(10, latency_tolerance=2.0, baseline_drift=0.0)
+        limiter.record(0.0, is_overloaded=False, finished_at=0.1)
+        limit = limiter.limit
+
+        for _ in range(100):
+            limiter.record(0.0, is_overloaded=False, finished_at=1.0)
+
+        assert limiter.limit == limit
+
+    def test_multiplicative_decrease_once_per_burst(self):
+        limiter = AdaptiveConcurrencyLimiter(16)
+
+        # burst of the requests that have been started together
+        for _ in range(5):
+            limiter.record(1.0, is_overloaded=True, finished_at=2.0)
+
+        assert limiter.limit == 8
+
+        limiter.record(3.0, is_overloaded=True, finished_at=4.0)
+
+        assert limiter.limit == 4
+        assert limiter.metrics['decreases'] == 2
+        assert limiter.metrics['overloads'] == 6
+
+    def test_limit_bounds(self):
+        limiter = AdaptiveConcurrencyLimiter(2, min_limit=2, max_limit=3)
+
+        limiter.record(0.0, is_overloaded=True, finished_at=1.0)
+
+        assert limiter.limit == 2
+
+        for _ in range(100):
+            limiter.record(2.0, is_overloaded=False, finished_at=2.1)
+
+        assert limiter.limit == 3
+
+    def test_overload_statuses(self):
+        assert AdaptiveConcurrencyLimiter.is_overload_status(429)
+        assert AdaptiveConcurrencyLimiter.is_overload_status(503)
+        assert not AdaptiveConcurrencyLimiter.is_overload_status(404)
+
+
+def _respond_with_overload(url: str) -> typing.Optional[typing.Tuple[int, typing.Any]]:
+    if url.endswith(OVERLOADING_WORD):
+        return (503, {'title': 'Service Unavailable', 'message': '', 'resolution': ''})
+
+    return None
+
+
+class ThreadedFakeDictionaryApiClient(FakeDictionaryApiClient):
+    """ Sync fake client that responds with delay and tracks requests in flight (thread-safe) """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.lock = threading.Lock()
+        self.in_flight_count = 0
+        self.max_in_flight_count = 0
+
+    def fetch_api_response(self, url: str) -> typing.Tuple[int, typing.Any]:
+        with self.lock:
+            self.in_flight_count += 1
+            self.max_in_flight_count = max(self.max_in_flight_count, self.in_flight_count)
+
+        time.sleep(0.01)
+
+        with self.lock:
+            self.in_flight_count -= 1
+
+        return _respond_with_overload(url) or super().fetch_api_response(url)
+
+
+class SlowFakeAsyncDictionaryApiClient(FakeAsyncDictionaryApiClient):
+    """ Async fake client that responds with delay and tracks requests in flight """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.in_flight_count = 0
+        self.max_in_flight_count = 0
+
+    async def fetch_api_response(self, url: str) -> typing.Tuple[int, typing.Any]:
+        self.in_flight_count += 1
+        self.max_in_flight_count = max(self.max_in_flight_count, self.in_flight_count)
+
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight_count -= 1
+
+        return _respond_with_overload(url) or await super().fetch_api_response(url)
+
+
+async def _aiter(words: typing.Iterable[str]) -> typing.AsyncIterator[str]:
+    for word in words:
+        yield word
+
+
+class TestBatchLookupsWithLimiter:
+    """
+    Contains tests for
+        * batch lookups (``stream_lookups``) of the sync and async clients with adaptive limiter.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_error_raising_on_wrong_limiter_argument(self):
+        with pytest.raises(TypeError) as raised_error:
+            _ = FakeDictionaryApiClient(concurrency_limiter='I am not a limiter')
+
+    def test_sync_stream_lookups(self):
+        client = ThreadedFakeDictionaryApiClient()
+
+        results = list(client.stream_lookups([EXISTENT_WORD, 'blablablabla'] * 10, concurrency=4))
+
+        assert len(results) == 20
+        assert sum(result.is_found for result in results) == 10
+        assert client.max_in_flight_count <= 4
+
+    def test_sync_stream_lookups_are_limited(self):
+        limiter = AdaptiveConcurrencyLimiter(2, max_limit=2)
+        client = ThreadedFakeDictionaryApiClient(concurrency_limiter=limiter)
+
+        _ = list(client.stream_lookups([EXISTENT_WORD] * 20, concurrency=10))
+
+        assert client.max_in_flight_count <= 2
+        assert limiter.metrics['samples'] == 20
+
+    def test_limit_is_cut_on_overload(self):
+        limiter = AdaptiveConcurrencyLimiter(8)
+        client = ThreadedFakeDictionaryApiClient(concurrency_limiter=limiter)
+
+        results = list(client.stream_lookups([OVERLOADING_WORD] * 3, concurrency=1))
+
+        assert all(result.status_code == 503 for result in results)
+        assert limiter.limit == 1
+
+    @pytest.mark.asyncio
+    async def test_async_stream_lookups_are_limited(self):
+        limiter = AdaptiveConcurrencyLimiter(3, max_limit=3)
+        client = SlowFakeAsyncDictionaryApiClient(concurrency_limiter=limiter)
+
+        results = [result async for result in client.stream_lookups(_aiter([EXISTENT_WORD] * 20), concurrency=10)]
+
+        assert len(results) == 20
+        assert client.max_in_flight_count == 3
+
+    @pytest.mark.asyncio
+    async def test_limiter_sets_scheduler_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(8)
+        scheduler = RequestScheduler(8)
+        client = SlowFakeAsyncDictionaryApiClient(concurrency_limiter=limiter, scheduler=scheduler)
+
+        _ = await client.fetch_result(OVERLOADING_WORD)
+
+        assert scheduler.max_concurrency == 4
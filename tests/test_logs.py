@@ -0,0 +1,96 @@
+"""
+Contains tests for structured logging of the hot path events.
+
+.. class:: TestEventLogging
+"""
+
+import logging
+
+import pytest
+
+from freedictionaryapi.logs import (
+    get_sample_rate,
+    log_event,
+    set_sample_rate
+)
+
+from .fakes import (
+    EXISTENT_WORD,
+    FakeDictionaryApiClient
+)
+
+
+class CountingRepr:
+    """ Object that counts how many times it has been formatted """
+
+    def __init__(self) -> None:
+        self.formatting_count = 0
+
+    def __repr__(self) -> str:
+        self.formatting_count += 1
+        return 'counting'
+
+
+class TestEventLogging:
+    """
+    Contains tests for
+        * structured logging of the events (``log_event``);
+        * sampling of the events.
+
+    Checking that disabled events are not formatted at all.
+    """
+
+    # fixtures ---------------------------------------------------------------------------------------------------------
+
+    @pytest.fixture(name='logger')
+    def fixture_logger(self) -> logging.Logger:
+        return logging.getLogger('freedictionaryapi.tests')
+
+    @pytest.fixture(name='sampled_event', autouse=True)
+    def fixture_sampled_event(self) -> str:
+        event = 'test_event'
+        yield event
+        set_sample_rate(event, None)
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_disabled_event_is_not_formatted(self, caplog, logger: logging.Logger):
+        value = CountingRepr()
+
+        with caplog.at_level(logging.WARNING, logger=logger.name):
+            log_event(logger, logging.INFO, 'test_event', 'Value: %(value)r.', value=value)
+
+        assert value.formatting_count == 0
+        assert not caplog.records
+
+    def test_structured_event(self, caplog, logger: logging.Logger):
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            log_event(logger, logging.INFO, 'test_event', 'Value: %(value)r.', value=1)
+
+        record, = caplog.records
+
+        assert record.getMessage() == 'Value: 1.'
+        assert record.event == 'test_event'
+        assert record.event_fields == {'value': 1}
+
+    def test_sampling(self, caplog, logger: logging.Logger, sampled_event: str):
+        set_sample_rate(sampled_event, 0.1)
+
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            for _ in range(100):
+                log_event(logger, logging.INFO, sampled_event, 'Sampled.')
+
+        assert get_sample_rate(sampled_event) == pytest.approx(0.1)
+        assert len(caplog.records) == 10
+
+    def test_error_raising_on_wrong_sample_rate(self, sampled_event: str):
+        with pytest.raises(ValueError) as raised_error:
+            set_sample_rate(sampled_event, 0)
+
+    def test_client_events(self, caplog):
+        with caplog.at_level(logging.DEBUG, logger='freedictionaryapi'):
+            FakeDictionaryApiClient().fetch_result(EXISTENT_WORD)
+
+        events = [getattr(record, 'event', None) for record in caplog.records]
+
+        assert events == ['url_generated', 'request_sent', 'response_received']
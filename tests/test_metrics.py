@@ -0,0 +1,141 @@
+"""
+Contains tests for metrics of the client requests.
+
+.. class:: TestClientMetrics
+.. class:: TestClientWithMetrics
+"""
+
+import pytest
+
+from freedictionaryapi.clients.sync_client import DictionaryApiClient
+from freedictionaryapi.filters import MissingWordsFilter
+from freedictionaryapi.languages import LanguageCodes
+from freedictionaryapi.metrics import ClientMetrics
+
+from .fakes import (
+    EXISTENT_WORD,
+    FakeApiServer,
+    FakeAsyncDictionaryApiClient,
+    FakeDictionaryApiClient
+)
+
+
+MISSING_WORD = 'blablablabla'
+
+
+class TestClientMetrics:
+    """
+    Contains tests for
+        * metrics of the client requests (``ClientMetrics``).
+
+    Checking that metrics are counted and rendered in Prometheus text format.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_error_raising_on_wrong_buckets(self):
+        with pytest.raises(ValueError) as raised_error:
+            _ = ClientMetrics(latency_buckets=[])
+
+        with pytest.raises(ValueError) as raised_error:
+            _ = ClientMetrics(latency_buckets=[1.0, 0.5])
+
+    def test_histogram_buckets(self):
+        metrics = ClientMetrics(latency_buckets=[0.1, 1.0])
+
+        for latency in (0.05, 0.5, 0.7, 5.0):
+            metrics.request_started(LanguageCodes.ENGLISH_US)
+            metrics.request_finished(LanguageCodes.ENGLISH_US, latency)
+
+        name = 'freedictionaryapi_request_duration_seconds'
+        labels = {'language': LanguageCodes.ENGLISH_US.value}
+
+        assert metrics.get_sample_value(f'{name}_bucket', {**labels, 'le': '0.1'}) == 1
+        assert metrics.get_sample_value(f'{name}_bucket', {**labels, 'le': '1.0'}) == 3
+        assert metrics.get_sample_value(f'{name}_bucket', {**labels, 'le': '+Inf'}) == 4
+        assert metrics.get_sample_value(f'{name}_count', labels) == 4
+        assert metrics.get_sample_value(f'{name}_sum', labels) == pytest.approx(6.25)
+        assert metrics.get_sample_value('freedictionaryapi_requests_in_flight', labels) == 0
+
+    def test_rendering(self):
+        metrics = ClientMetrics(prefix='dictionary')
+        metrics.response_analyzed(404)
+        metrics.cache_looked_up('missing "words"\nfilter', is_hit=True)
+
+        exposition = metrics.render()
+
+        assert exposition.endswith('\n')
+        assert '# TYPE dictionary_responses_total counter' in exposition
+        assert '# TYPE dictionary_request_duration_seconds histogram' in exposition
+        assert 'dictionary_responses_total{status="404"} 1.0' in exposition
+        assert r'dictionary_cache_hits_total{cache="missing \"words\"\nfilter"} 1.0' in exposition
+
+
+class TestClientWithMetrics:
+    """
+    Contains tests for
+        * collecting of the metrics by the clients.
+
+    Checking that requests, responses, filter lookups and received bytes are collected.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_requests_collecting(self):
+        metrics = ClientMetrics()
+        client = FakeDictionaryApiClient(metrics=metrics, missing_words_filter=MissingWordsFilter())
+
+        client.fetch_result(EXISTENT_WORD)
+        client.fetch_result(MISSING_WORD)
+        # answered by the filter
+        client.fetch_result(MISSING_WORD)
+
+        language_labels = {'language': LanguageCodes.ENGLISH_US.value}
+
+        assert metrics.get_sample_value('freedictionaryapi_requests_total', language_labels) == 2
+        assert metrics.get_sample_value('freedictionaryapi_requests_in_flight', language_labels) == 0
+        assert metrics.get_sample_value('freedictionaryapi_request_duration_seconds_count', language_labels) == 2
+        assert metrics.get_sample_value('freedictionaryapi_responses_total', {'status': '200'}) == 1
+        assert metrics.get_sample_value('freedictionaryapi_responses_total', {'status': '404'}) == 1
+        assert metrics.get_sample_value('freedictionaryapi_cache_hits_total', {'cache': 'missing_words_filter'}) == 1
+        assert metrics.get_sample_value('freedictionaryapi_cache_misses_total', {'cache': 'missing_words_filter'}) == 2
+
+    def test_request_errors_collecting(self):
+        class FailingClient(FakeDictionaryApiClient):
+            def fetch_api_response(self, url):
+                raise ConnectionError(url)
+
+        metrics = ClientMetrics()
+        client = FailingClient(metrics=metrics)
+
+        with pytest.raises(ConnectionError):
+            client.fetch_result(EXISTENT_WORD)
+
+        labels = {'language': LanguageCodes.ENGLISH_US.value, 'error': 'ConnectionError'}
+
+        assert metrics.get_sample_value('freedictionaryapi_request_errors_total', labels) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_requests_collecting(self):
+        metrics = ClientMetrics()
+        client = FakeAsyncDictionaryApiClient(metrics=metrics)
+
+        await client.fetch_result(EXISTENT_WORD, LanguageCodes.SPANISH)
+
+        language_labels = {'language': LanguageCodes.SPANISH.value}
+
+        assert metrics.get_sample_value('freedictionaryapi_requests_total', language_labels) == 1
+        assert metrics.get_sample_value('freedictionaryapi_requests_in_flight', language_labels) == 0
+
+    def test_received_bytes_collecting(self):
+        metrics = ClientMetrics()
+
+        with FakeApiServer() as server:
+            with DictionaryApiClient(base_urls=[server.base_url], metrics=metrics) as client:
+                client.fetch_result(EXISTENT_WORD)
+
+        assert metrics.get_sample_value('freedictionaryapi_received_bytes_total') > 0
+
+    def test_error_raising_on_wrong_metrics(self):
+        with pytest.raises(TypeError) as raised_error:
+            _ = FakeDictionaryApiClient(metrics=object())
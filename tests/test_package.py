@@ -0,0 +1,70 @@
+"""
+Contains tests for lazy loading of the package.
+
+.. class:: TestLazyLoading
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import freedictionaryapi
+from freedictionaryapi import clients
+
+
+def run_python(code: str) -> str:
+    completed_process = subprocess.run(
+        [sys.executable, '-c', code],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True
+    )
+
+    return completed_process.stdout.strip()
+
+
+class TestLazyLoading:
+    """
+    Contains tests for
+        * lazy loading of the package (``freedictionaryapi``);
+        * lazy loading of the clients package (``freedictionaryapi.clients``).
+
+    Checking that attributes are imported only on first access.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_import_does_not_load_subpackages(self):
+        code = (
+            'import sys, freedictionaryapi; '
+            'print(sorted(name for name in sys.modules if name.startswith(("freedictionaryapi", "httpx", "aiohttp"))))'
+        )
+
+        assert run_python(code) == "['freedictionaryapi']"
+
+    def test_sync_client_does_not_load_asyncio(self):
+        code = (
+            'import sys, freedictionaryapi; '
+            'freedictionaryapi.DictionaryApiClient; '
+            'print("asyncio" in sys.modules, "aiohttp" in sys.modules)'
+        )
+
+        assert run_python(code) == 'False False'
+
+    def test_lazy_attributes(self):
+        from freedictionaryapi.clients.sync_client import DictionaryApiClient
+        from freedictionaryapi.languages import LanguageCodes
+
+        assert freedictionaryapi.DictionaryApiClient is DictionaryApiClient
+        assert clients.DictionaryApiClient is DictionaryApiClient
+        assert freedictionaryapi.LanguageCodes is LanguageCodes
+        assert set(freedictionaryapi.__all__) <= set(dir(freedictionaryapi))
+        assert set(clients.__all__) <= set(dir(clients))
+
+    def test_error_raising_on_unknown_attribute(self):
+        with pytest.raises(AttributeError) as raised_error:
+            _ = freedictionaryapi.UnknownClient
+
+        with pytest.raises(AttributeError) as raised_error:
+            _ = clients.UnknownClient
@@ -0,0 +1,263 @@
+"""
+Contains tests for speculative prefetch of the synonyms.
+
+.. class:: TestPrefetchPolicy
+.. class:: TestClientWithPrefetchPolicy
+.. class:: TestAsyncClientWithPrefetchPolicy
+"""
+
+import asyncio
+import threading
+import typing
+
+import pytest
+
+from freedictionaryapi.caching import ResponseCache
+from freedictionaryapi.parsers import DictionaryApiParser
+from freedictionaryapi.prefetching import PrefetchPolicy
+from freedictionaryapi.types import Word
+
+from .fakes import (
+    EXISTENT_WORD,
+    WORD_RESPONSE,
+    FakeAsyncDictionaryApiClient,
+    FakeDictionaryApiClient
+)
+
+
+class FakeClock:
+    """ Clock that is moved manually """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+SLOW_WORD = 'slowpoke'
+""" Word which lookup waits till it is released by the test """
+
+
+class BlockingDictionaryApiClient(FakeDictionaryApiClient):
+    """ Sync client which lookups of the slow word wait till they are released (requests are counted after that) """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.started = threading.Event()
+        self.released = threading.Event()
+
+    def fetch_api_response(self, url: str) -> typing.Tuple[int, typing.Any]:
+        if url.endswith(SLOW_WORD):
+            self.started.set()
+            self.released.wait(5)
+
+        return super().fetch_api_response(url)
+
+
+class BlockingAsyncDictionaryApiClient(FakeAsyncDictionaryApiClient):
+    """ Async client which lookups of the slow word wait till they are released (requests are counted after that) """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.released = asyncio.Event()
+
+    async def fetch_api_response(self, url: str) -> typing.Tuple[int, typing.Any]:
+        if url.endswith(SLOW_WORD):
+            await self.released.wait()
+
+        return await super().fetch_api_response(url)
+
+
+def _get_requested_words(client: FakeDictionaryApiClient) -> list:
+    return [url.rsplit('/', 1)[-1] for url in client.requested_urls]
+
+
+class TestPrefetchPolicy:
+    """
+    Contains tests for
+        * prefetch policy (``PrefetchPolicy``).
+    """
+
+    # fixtures ---------------------------------------------------------------------------------------------------------
+
+    @pytest.fixture(name='word')
+    def fixture_word(self) -> Word:
+        return DictionaryApiParser(WORD_RESPONSE).word
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_error_raising_on_not_positive_arguments(self):
+        with pytest.raises(ValueError) as raised_error:
+            _ = PrefetchPolicy(budget=0)
+
+    def test_synonyms_selection(self, word: Word):
+        policy = PrefetchPolicy(max_synonyms=3)
+
+        # the word itself is not selected
+        assert policy.select_synonyms(word) == ['greeting', 'welcome', 'salutation']
+
+    def test_budget(self):
+        clock = FakeClock()
+        policy = PrefetchPolicy(budget=2, clock=clock)
+
+        assert [policy.try_spend() for _ in range(3)] == [True, True, False]
+
+        clock.now = 0.5
+
+        assert policy.try_spend()
+        assert not policy.try_spend()
+
+    def test_cancellation(self):
+        policy = PrefetchPolicy()
+
+        policy.cancel()
+        assert policy.is_cancelled
+
+        policy.resume()
+        assert not policy.is_cancelled
+
+
+class TestClientWithPrefetchPolicy:
+    """
+    Contains tests for
+        * sync client prefetch of the synonyms.
+    """
+
+    # fixtures ---------------------------------------------------------------------------------------------------------
+
+    @pytest.fixture(name='client')
+    def fixture_client(self) -> FakeDictionaryApiClient:
+        return FakeDictionaryApiClient(
+            response_cache=ResponseCache(),
+            prefetch_policy=PrefetchPolicy(max_synonyms=3, budget=10)
+        )
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_error_raising_on_unsupported_policy(self):
+        with pytest.raises(TypeError) as raised_error:
+            _ = FakeDictionaryApiClient(response_cache=ResponseCache(), prefetch_policy=object())
+
+    def test_error_raising_on_policy_without_cache(self):
+        with pytest.raises(ValueError) as raised_error:
+            _ = FakeDictionaryApiClient(prefetch_policy=PrefetchPolicy())
+
+    def test_synonyms_are_prefetched(self, client: FakeDictionaryApiClient):
+        client.fetch_word(EXISTENT_WORD)
+        client.wait_for_prefetches()
+
+        assert _get_requested_words(client) == [EXISTENT_WORD, 'greeting', 'welcome', 'salutation']
+        assert client.fetch_result('greeting').is_cached
+
+    def test_cached_synonyms_are_not_prefetched(self, client: FakeDictionaryApiClient):
+        client.fetch_word(EXISTENT_WORD)
+        client.wait_for_prefetches()
+        client.fetch_word(EXISTENT_WORD)
+        client.wait_for_prefetches()
+
+        assert len(client.requested_urls) == 4
+
+    def test_prefetches_are_limited_by_budget(self):
+        client = FakeDictionaryApiClient(
+            response_cache=ResponseCache(),
+            prefetch_policy=PrefetchPolicy(budget=1, clock=FakeClock())
+        )
+
+        client.fetch_word(EXISTENT_WORD)
+        client.wait_for_prefetches()
+
+        assert _get_requested_words(client) == [EXISTENT_WORD, 'greeting']
+
+    def test_cancelled_policy_prefetches_nothing(self, client: FakeDictionaryApiClient):
+        client.prefetch_policy.cancel()
+
+        client.fetch_word(EXISTENT_WORD)
+        client.wait_for_prefetches()
+
+        assert _get_requested_words(client) == [EXISTENT_WORD]
+
+    def test_no_prefetches_while_foreground_lookup_is_in_flight(self):
+        client = BlockingDictionaryApiClient(
+            response_cache=ResponseCache(),
+            prefetch_policy=PrefetchPolicy(max_synonyms=3, budget=10)
+        )
+
+        slow_lookup = threading.Thread(target=client.fetch_result, args=(SLOW_WORD,))
+        slow_lookup.start()
+        client.started.wait(5)
+
+        client.fetch_word(EXISTENT_WORD)
+        client.wait_for_prefetches()
+
+        assert _get_requested_words(client) == [EXISTENT_WORD]
+
+        client.released.set()
+        slow_lookup.join()
+
+        # foreground is idle - synonyms of the cached word are prefetched
+        client.fetch_word(EXISTENT_WORD)
+        client.wait_for_prefetches()
+
+        assert _get_requested_words(client) == [EXISTENT_WORD, SLOW_WORD, 'greeting', 'welcome', 'salutation']
+
+
+class TestAsyncClientWithPrefetchPolicy:
+    """
+    Contains tests for
+        * async client prefetch of the synonyms.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    @pytest.mark.asyncio
+    async def test_synonyms_are_prefetched(self):
+        client = FakeAsyncDictionaryApiClient(
+            response_cache=ResponseCache(),
+            prefetch_policy=PrefetchPolicy(max_synonyms=3, budget=10)
+        )
+
+        await client.fetch_word(EXISTENT_WORD)
+        await client.wait_for_prefetches()
+
+        assert _get_requested_words(client) == [EXISTENT_WORD, 'greeting', 'welcome', 'salutation']
+        assert (await client.fetch_result('welcome')).is_cached
+
+    @pytest.mark.asyncio
+    async def test_prefetches_cancellation(self):
+        client = FakeAsyncDictionaryApiClient(
+            response_cache=ResponseCache(),
+            prefetch_policy=PrefetchPolicy(max_synonyms=3, budget=10)
+        )
+
+        await client.fetch_word(EXISTENT_WORD)
+        await client.cancel_prefetches()
+        await client.wait_for_prefetches()
+
+        assert _get_requested_words(client) == [EXISTENT_WORD]
+
+    @pytest.mark.asyncio
+    async def test_no_prefetches_while_foreground_lookup_is_in_flight(self):
+        # client without scheduler
+        client = BlockingAsyncDictionaryApiClient(
+            response_cache=ResponseCache(),
+            prefetch_policy=PrefetchPolicy(max_synonyms=3, budget=10)
+        )
+
+        slow_lookup = asyncio.ensure_future(client.fetch_result(SLOW_WORD))
+        await asyncio.sleep(0)
+
+        await client.fetch_word(EXISTENT_WORD)
+        await client.wait_for_prefetches()
+
+        assert _get_requested_words(client) == [EXISTENT_WORD]
+
+        client.released.set()
+        await slow_lookup
+
+        await client.fetch_word(EXISTENT_WORD)
+        await client.wait_for_prefetches()
+
+        assert _get_requested_words(client) == [EXISTENT_WORD, SLOW_WORD, 'greeting', 'welcome', 'salutation']
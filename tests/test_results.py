@@ -0,0 +1,246 @@
+"""
+Contains tests for lookup results.
+
+.. class:: TestLookupResult
+.. class:: TestAsyncLookupResult
+.. class:: TestLookupTimings
+"""
+
+import logging
+import time
+
+import pytest
+
+from freedictionaryapi.clients import RequestScheduler
+from freedictionaryapi.clients.sync_client import DictionaryApiClient
+
+from freedictionaryapi.errors import (
+    DictionaryApiError,
+    DictionaryApiNotFoundError
+)
+from freedictionaryapi import results
+from freedictionaryapi.filters import MissingWordsFilter
+from freedictionaryapi.parsers import DictionaryApiParser
+from freedictionaryapi.results import (
+    LookupResult,
+    LookupTimings
+)
+from freedictionaryapi.types import Word
+
+from .fakes import (
+    EXISTENT_WORD,
+    FakeApiServer,
+    FakeAsyncDictionaryApiClient,
+    FakeDictionaryApiClient
+)
+
+
+NONEXISTENT_WORD = 'blablablabla'
+
+PARSING_DELAY = 0.05
+""" Delay of the slow parser construction (in seconds) """
+
+
+class SlowDictionaryApiParser(DictionaryApiParser):
+    """ Parser which construction takes ``PARSING_DELAY`` """
+
+    def __init__(self, *args, **kwargs) -> None:
+        time.sleep(PARSING_DELAY)
+
+        super().__init__(*args, **kwargs)
+
+
+class TestLookupResult:
+    """
+    Contains tests for
+        * lookup result (``LookupResult``);
+        * ``fetch_result`` and ``fetch_word_or_none`` methods of the sync client.
+
+    Checking that missing word is returned as result (not raised)
+    and error is built only on demand.
+    """
+
+    # fixtures ---------------------------------------------------------------------------------------------------------
+
+    @pytest.fixture(name='client')
+    def fixture_client(self) -> FakeDictionaryApiClient:
+        """ Get instance of fake sync API client """
+        client = FakeDictionaryApiClient()
+
+        return client
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_found_result(self, client: FakeDictionaryApiClient):
+        result = client.fetch_result(EXISTENT_WORD)
+
+        assert isinstance(result, LookupResult)
+        assert result
+        assert result.is_found
+        assert not result.is_not_found
+        assert isinstance(result.word, Word)
+        assert result.error is None
+
+    def test_not_found_result(self, client: FakeDictionaryApiClient):
+        result = client.fetch_result(NONEXISTENT_WORD)
+
+        assert not result
+        assert result.is_not_found
+        assert result.word is None
+        assert isinstance(result.error, DictionaryApiNotFoundError)
+
+        with pytest.raises(DictionaryApiNotFoundError) as raised_error:
+            result.raise_for_status()
+
+    def test_error_is_built_on_demand(self, client: FakeDictionaryApiClient):
+        result = client.fetch_result(NONEXISTENT_WORD)
+
+        assert result._error_parser is None
+
+        _ = result.error
+
+        assert result._error_parser is not None
+
+    def test_fetch_word_or_none(self, client: FakeDictionaryApiClient):
+        assert isinstance(client.fetch_word_or_none(EXISTENT_WORD), Word)
+        assert client.fetch_word_or_none(NONEXISTENT_WORD) is None
+
+    def test_raising_methods_are_kept(self, client: FakeDictionaryApiClient):
+        with pytest.raises(DictionaryApiNotFoundError) as raised_error:
+            _ = client.fetch_word(NONEXISTENT_WORD)
+
+    def test_filtered_result(self):
+        client = FakeDictionaryApiClient(missing_words_filter=MissingWordsFilter(capacity=100))
+
+        _ = client.fetch_result(NONEXISTENT_WORD)
+        result = client.fetch_result(NONEXISTENT_WORD)
+
+        assert len(client.requested_urls) == 1
+        assert result.is_filtered
+        assert result.is_not_found
+        assert result.response is None
+        assert isinstance(result.error, DictionaryApiNotFoundError)
+        assert client.fetch_word_or_none(NONEXISTENT_WORD) is None
+
+    def test_not_found_error_is_common_error(self, client: FakeDictionaryApiClient):
+        result = client.fetch_result(NONEXISTENT_WORD)
+
+        assert isinstance(result.error, DictionaryApiError)
+
+
+class TestAsyncLookupResult:
+    """
+    Contains tests for
+        * ``fetch_result`` and ``fetch_word_or_none`` methods of the async client.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    @pytest.mark.asyncio
+    async def test_found_result(self):
+        client = FakeAsyncDictionaryApiClient()
+        result = await client.fetch_result(EXISTENT_WORD)
+
+        assert result.is_found
+        assert isinstance(result.word, Word)
+
+    @pytest.mark.asyncio
+    async def test_fetch_word_or_none(self):
+        client = FakeAsyncDictionaryApiClient()
+
+        assert isinstance(await client.fetch_word_or_none(EXISTENT_WORD), Word)
+        assert await client.fetch_word_or_none(NONEXISTENT_WORD) is None
+
+
+class TestLookupTimings:
+    """
+    Contains tests for
+        * per-stage timings of the lookup (``LookupTimings``);
+        * logging of the slow lookups.
+
+    Checking that stages are timed only if timings are collected.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_timings_are_not_collected_by_default(self):
+        result = FakeDictionaryApiClient().fetch_result(EXISTENT_WORD)
+
+        assert result.timings is None
+
+    def test_stages_timing(self):
+        client = FakeDictionaryApiClient(collect_timings=True)
+        result = client.fetch_result(EXISTENT_WORD)
+        timings = result.timings
+
+        assert isinstance(timings, LookupTimings)
+        assert timings.url_generation > 0
+        assert timings.network > 0
+        assert timings.analysis > 0
+        # parser is built only on demand
+        assert timings.parsing is None
+
+        _ = result.word
+
+        assert timings.parsing > 0
+        assert timings.total == pytest.approx(sum(timings.as_dict().values()))
+
+    def test_decoding_timing(self):
+        with FakeApiServer() as server:
+            with DictionaryApiClient(base_urls=[server.base_url], collect_timings=True) as client:
+                timings = client.fetch_result(EXISTENT_WORD).timings
+
+        assert timings.decoding > 0
+        assert timings.network > 0
+        assert timings.payload_size > 0
+
+    def test_filtered_result_timings(self):
+        client = FakeDictionaryApiClient(missing_words_filter=MissingWordsFilter(), collect_timings=True)
+        client.fetch_result(NONEXISTENT_WORD)
+        timings = client.fetch_result(NONEXISTENT_WORD).timings
+
+        assert timings.url_generation > 0
+        assert timings.network == 0
+
+    def test_slow_lookup_logging(self, caplog):
+        client = FakeDictionaryApiClient(slow_lookup_threshold=0)
+
+        with caplog.at_level(logging.WARNING):
+            client.fetch_result(EXISTENT_WORD)
+
+        assert 'Slow lookup' in caplog.text
+        assert 'network=' in caplog.text
+
+    def test_slow_parsing_is_logged(self, caplog, monkeypatch):
+        monkeypatch.setattr(results, 'DictionaryApiParser', SlowDictionaryApiParser)
+        client = FakeDictionaryApiClient(slow_lookup_threshold=PARSING_DELAY)
+
+        with caplog.at_level(logging.WARNING):
+            client.fetch_result(EXISTENT_WORD)
+
+            assert 'Slow lookup' not in caplog.text
+
+            client.fetch_word(EXISTENT_WORD)
+
+        assert 'Slow lookup' in caplog.text
+        assert 'parsing=' in caplog.text
+
+    def test_fast_lookup_is_not_logged(self, caplog):
+        client = FakeDictionaryApiClient(slow_lookup_threshold=60)
+
+        with caplog.at_level(logging.WARNING):
+            client.fetch_result(EXISTENT_WORD)
+
+        assert 'Slow lookup' not in caplog.text
+
+    def test_error_raising_on_negative_threshold(self):
+        with pytest.raises(ValueError) as raised_error:
+            _ = FakeDictionaryApiClient(slow_lookup_threshold=-1)
+
+    @pytest.mark.asyncio
+    async def test_async_stages_timing(self):
+        client = FakeAsyncDictionaryApiClient(scheduler=RequestScheduler(1), collect_timings=True)
+        timings = (await client.fetch_result(EXISTENT_WORD)).timings
+
+        assert timings.queueing > 0
+        assert timings.network > 0
@@ -0,0 +1,321 @@
+"""
+Contains tests for scheduling of the async requests.
+
+.. class:: TestRequestScheduler
+.. class:: TestLanguageFairQueuing
+.. class:: TestAsyncClientWithScheduler
+"""
+
+import asyncio
+import typing
+
+import pytest
+
+from freedictionaryapi.clients import (
+    Priority,
+    RequestScheduler
+)
+from freedictionaryapi.languages import LanguageCodes
+
+from .fakes import (
+    EXISTENT_WORD,
+    FakeAsyncDictionaryApiClient
+)
+
+
+async def _wait_for_queueing() -> None:
+    """ Let the started tasks reach the scheduler queue """
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestRequestScheduler:
+    """
+    Contains tests for
+        * request scheduler (``RequestScheduler``).
+
+    Checking that scheduler keeps limits and starts requests by priority.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_error_raising_on_wrong_limits(self):
+        with pytest.raises(ValueError) as raised_error:
+            _ = RequestScheduler(0)
+
+        with pytest.raises(ValueError) as raised_error:
+            _ = RequestScheduler(priority_limits={Priority.BACKGROUND: 0})
+
+    @pytest.mark.asyncio
+    async def test_interactive_requests_jump_ahead(self):
+        scheduler = RequestScheduler(1)
+        started_priorities: typing.List[Priority] = []
+
+        async def request(priority: Priority) -> None:
+            await scheduler.acquire(priority)
+            started_priorities.append(priority)
+            scheduler.release(priority)
+
+        await scheduler.acquire(Priority.BACKGROUND)
+
+        tasks = [asyncio.ensure_future(request(Priority.BACKGROUND)) for _ in range(3)]
+        tasks.append(asyncio.ensure_future(request(Priority.INTERACTIVE)))
+        await _wait_for_queueing()
+
+        assert scheduler.metrics['queued_background'] == 3
+        assert scheduler.metrics['queued_interactive'] == 1
+
+        scheduler.release(Priority.BACKGROUND)
+        await asyncio.gather(*tasks)
+
+        assert started_priorities[0] is Priority.INTERACTIVE
+        assert scheduler.metrics['in_flight'] == 0
+        assert scheduler.metrics['max_queued_background'] == 3
+
+    @pytest.mark.asyncio
+    async def test_priority_limit(self):
+        scheduler = RequestScheduler(10, priority_limits={Priority.BACKGROUND: 2})
+
+        for _ in range(2):
+            await scheduler.acquire(Priority.BACKGROUND)
+
+        waiting_task = asyncio.ensure_future(scheduler.acquire(Priority.BACKGROUND))
+        await _wait_for_queueing()
+
+        assert not waiting_task.done()
+
+        # limit of the background does not block interactive requests
+        await scheduler.acquire(Priority.INTERACTIVE)
+
+        scheduler.release(Priority.BACKGROUND)
+        await waiting_task
+
+        assert scheduler.metrics['in_flight_background'] == 2
+        assert scheduler.metrics['in_flight_interactive'] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_dropped(self):
+        scheduler = RequestScheduler(1)
+        await scheduler.acquire()
+
+        waiting_task = asyncio.ensure_future(scheduler.acquire())
+        await _wait_for_queueing()
+        waiting_task.cancel()
+        await asyncio.gather(waiting_task, return_exceptions=True)
+
+        assert scheduler.metrics['queued'] == 0
+
+        scheduler.release()
+
+        assert scheduler.metrics['in_flight'] == 0
+
+
+class TestLanguageFairQueuing:
+    """
+    Contains tests for
+        * per-language quotas and weighted fair queuing of the request scheduler (``RequestScheduler``).
+
+    Checking that hot language does not crowd out other languages.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_error_raising_on_wrong_weight(self):
+        with pytest.raises(ValueError) as raised_error:
+            _ = RequestScheduler(language_weights={LanguageCodes.SPANISH: 0})
+
+    @staticmethod
+    async def _get_start_order(scheduler: RequestScheduler, language_codes: typing.List[LanguageCodes]
+                               ) -> typing.List[LanguageCodes]:
+        """ Queue requests of the languages behind one holding request and get languages in the start order """
+
+        started_language_codes: typing.List[LanguageCodes] = []
+
+        async def request(language_code: LanguageCodes) -> None:
+            await scheduler.acquire(Priority.BACKGROUND, language_code)
+            started_language_codes.append(language_code)
+            scheduler.release(Priority.BACKGROUND, language_code)
+
+        await scheduler.acquire(Priority.BACKGROUND)
+
+        tasks = [asyncio.ensure_future(request(language_code)) for language_code in language_codes]
+        await _wait_for_queueing()
+
+        scheduler.release(Priority.BACKGROUND)
+        await asyncio.gather(*tasks)
+
+        return started_language_codes
+
+    @pytest.mark.asyncio
+    async def test_hot_language_does_not_crowd_out_others(self):
+        scheduler = RequestScheduler(1)
+        language_codes = [LanguageCodes.ENGLISH_US] * 20 + [LanguageCodes.SPANISH] * 2
+
+        start_order = await self._get_start_order(scheduler, language_codes)
+
+        # spanish requests queued after all english ones are started among the first ones
+        assert start_order[:4].count(LanguageCodes.SPANISH) == 2
+
+    @pytest.mark.asyncio
+    async def test_weighted_share(self):
+        scheduler = RequestScheduler(1, language_weights={LanguageCodes.ENGLISH_US: 3})
+        language_codes = [LanguageCodes.ENGLISH_US] * 30 + [LanguageCodes.SPANISH] * 30
+
+        start_order = await self._get_start_order(scheduler, language_codes)
+
+        assert start_order[:20].count(LanguageCodes.ENGLISH_US) == 15
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiters_do_not_push_language_back(self):
+        scheduler = RequestScheduler(1)
+        await scheduler.acquire(Priority.BACKGROUND)
+
+        # waiters of the language time out (cancelled) while queued
+        cancelled_tasks = [
+            asyncio.ensure_future(scheduler.acquire(Priority.BACKGROUND, LanguageCodes.SPANISH))
+            for _ in range(10)
+        ]
+        await _wait_for_queueing()
+
+        for task in cancelled_tasks:
+            task.cancel()
+
+        await asyncio.gather(*cancelled_tasks, return_exceptions=True)
+        scheduler.release(Priority.BACKGROUND)
+
+        start_order = await self._get_start_order(
+            scheduler,
+            [LanguageCodes.ENGLISH_US] * 4 + [LanguageCodes.SPANISH]
+        )
+
+        assert LanguageCodes.SPANISH in start_order[:2]
+
+    @pytest.mark.asyncio
+    async def test_background_requests_do_not_delay_interactive_ones_of_language(self):
+        scheduler = RequestScheduler(1)
+        started: typing.List[typing.Tuple[Priority, LanguageCodes]] = []
+
+        async def request(priority: Priority, language_code: LanguageCodes) -> None:
+            await scheduler.acquire(priority, language_code)
+            started.append((priority, language_code))
+            scheduler.release(priority, language_code)
+
+        await scheduler.acquire(Priority.BACKGROUND)
+
+        tasks = [
+            asyncio.ensure_future(request(Priority.BACKGROUND, LanguageCodes.ENGLISH_US))
+            for _ in range(10)
+        ]
+        await _wait_for_queueing()
+
+        tasks.append(asyncio.ensure_future(request(Priority.INTERACTIVE, LanguageCodes.ENGLISH_US)))
+        await _wait_for_queueing()
+        tasks.append(asyncio.ensure_future(request(Priority.INTERACTIVE, LanguageCodes.SPANISH)))
+        await _wait_for_queueing()
+
+        scheduler.release(Priority.BACKGROUND)
+        await asyncio.gather(*tasks)
+
+        assert started[:2] == [
+            (Priority.INTERACTIVE, LanguageCodes.ENGLISH_US),
+            (Priority.INTERACTIVE, LanguageCodes.SPANISH),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_language_quota(self):
+        scheduler = RequestScheduler(10, language_limits={LanguageCodes.ENGLISH_US: 2})
+
+        for _ in range(2):
+            await scheduler.acquire(Priority.BACKGROUND, LanguageCodes.ENGLISH_US)
+
+        waiting_task = asyncio.ensure_future(scheduler.acquire(Priority.BACKGROUND, LanguageCodes.ENGLISH_US))
+        await _wait_for_queueing()
+
+        assert not waiting_task.done()
+
+        # quota of the english does not block other languages
+        await scheduler.acquire(Priority.BACKGROUND, LanguageCodes.SPANISH)
+
+        metrics = scheduler.metrics
+
+        assert metrics['in_flight_en_US'] == 2
+        assert metrics['queued_en_US'] == 1
+        assert metrics['in_flight_es'] == 1
+
+        scheduler.release(Priority.BACKGROUND, LanguageCodes.ENGLISH_US)
+        await waiting_task
+
+    @pytest.mark.asyncio
+    async def test_default_language_limit(self):
+        scheduler = RequestScheduler(10, default_language_limit=1)
+        await scheduler.acquire(Priority.BACKGROUND, LanguageCodes.SPANISH)
+
+        waiting_task = asyncio.ensure_future(scheduler.acquire(Priority.BACKGROUND, LanguageCodes.SPANISH))
+        await _wait_for_queueing()
+
+        assert not waiting_task.done()
+
+        waiting_task.cancel()
+        await asyncio.gather(waiting_task, return_exceptions=True)
+
+
+class SlowFakeAsyncDictionaryApiClient(FakeAsyncDictionaryApiClient):
+    """ Async fake client that responds with delay and tracks requests in flight """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.in_flight_count = 0
+        self.max_in_flight_count = 0
+
+    async def fetch_api_response(self, url: str) -> typing.Tuple[int, typing.Any]:
+        self.in_flight_count += 1
+        self.max_in_flight_count = max(self.max_in_flight_count, self.in_flight_count)
+
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.in_flight_count -= 1
+
+        return await super().fetch_api_response(url)
+
+
+class TestAsyncClientWithScheduler:
+    """
+    Contains tests for
+        * async client with request scheduler.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_error_raising_on_wrong_scheduler_argument(self):
+        with pytest.raises(TypeError) as raised_error:
+            _ = FakeAsyncDictionaryApiClient(scheduler='I am not a scheduler')
+
+    @pytest.mark.asyncio
+    async def test_global_concurrency_cap(self):
+        client = SlowFakeAsyncDictionaryApiClient(scheduler=RequestScheduler(2))
+
+        words = await asyncio.gather(*(client.fetch_word(EXISTENT_WORD) for _ in range(10)))
+
+        assert len(words) == 10
+        assert client.max_in_flight_count == 2
+        assert client.scheduler.metrics['in_flight'] == 0
+
+    @pytest.mark.asyncio
+    async def test_interactive_lookup_is_not_starved(self):
+        client = SlowFakeAsyncDictionaryApiClient(scheduler=RequestScheduler(1))
+        finished_priorities: typing.List[Priority] = []
+
+        async def look_up(priority: Priority) -> None:
+            _ = await client.fetch_word(EXISTENT_WORD, priority=priority)
+            finished_priorities.append(priority)
+
+        background_tasks = [asyncio.ensure_future(look_up(Priority.BACKGROUND)) for _ in range(5)]
+        await _wait_for_queueing()
+        await look_up(Priority.INTERACTIVE)
+
+        # only the background request that had been already started is finished before interactive one
+        assert finished_priorities.index(Priority.INTERACTIVE) <= 1
+
+        await asyncio.gather(*background_tasks)
@@ -0,0 +1,125 @@
+"""
+Contains tests for binary serialization of the parsed objects.
+
+.. class:: TestParsedObjectSerialization
+"""
+
+import json
+import pickle
+import typing
+
+import pytest
+
+from freedictionaryapi.types import (
+    Meaning,
+    ParsedObject,
+    Word
+)
+from freedictionaryapi.types import serialization
+
+from .settings import DATA_DIR
+
+
+class TestParsedObjectSerialization:
+    """
+    Contains tests for
+        * binary serialization (``ParsedObject.to_bytes``, ``ParsedObject.from_bytes``) and pickling.
+
+    Checking that serialized objects are restored equal to the original.
+    """
+
+    # fixtures ---------------------------------------------------------------------------------------------------------
+
+    @pytest.fixture(name='word', scope='class')
+    def fixture_word(self) -> Word:
+        """ Word object init-ed with API response data (word=hello) """
+        json_file_path = DATA_DIR / 'word_hello_API_response.json'
+        with open(json_file_path, 'r', encoding='utf-8') as file:
+            response = json.load(file)
+
+        word = Word(response[0])
+
+        return word
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_word_round_trip(self, word: Word):
+        restored_word = Word.from_bytes(word.to_bytes())
+
+        assert restored_word == word
+
+    def test_serialized_word_is_smaller_than_json(self, word: Word):
+        json_size = len(json.dumps(word.data, ensure_ascii=False).encode('utf-8'))
+
+        assert len(word.to_bytes()) < json_size
+
+    def test_type_resolving_on_base_type(self, word: Word):
+        restored_object = ParsedObject.from_bytes(word.to_bytes())
+
+        assert isinstance(restored_object, Word)
+
+    def test_nested_type_round_trip(self, word: Word):
+        meaning = word.meanings[1]
+        restored_meaning = Meaning.from_bytes(meaning.to_bytes())
+
+        assert restored_meaning == meaning
+        assert restored_meaning.definitions == meaning.definitions
+
+    def test_word_pickling(self, word: Word):
+        restored_word = pickle.loads(pickle.dumps(word))
+
+        assert isinstance(restored_word, Word)
+        assert restored_word == word
+
+    def test_error_raising_on_other_type(self, word: Word):
+        with pytest.raises(ValueError) as raised_error:
+            _ = Meaning.from_bytes(word.to_bytes())
+
+    def test_error_raising_on_wrong_payload(self):
+        with pytest.raises(ValueError) as raised_error:
+            _ = Word.from_bytes(b'{"word": "hello"}')
+
+    @pytest.mark.parametrize(
+        argnames='get_size',
+        argvalues=[
+            lambda size: 16,
+            lambda size: 20,
+            lambda size: size // 2,
+            lambda size: size - 3,
+        ],
+        ids=['header', 'header and part of lengths', 'half', 'without last bytes']
+    )
+    def test_error_raising_on_truncated_payload(self, word: Word, get_size: typing.Callable[[int], int]):
+        payload = word.to_bytes()
+
+        with pytest.raises(ValueError) as raised_error:
+            _ = Word.from_bytes(payload[:get_size(len(payload))])
+
+    def test_error_raising_on_payload_with_extra_bytes(self, word: Word):
+        with pytest.raises(ValueError) as raised_error:
+            _ = Word.from_bytes(word.to_bytes() + b'\x00')
+
+    def test_error_raising_on_corrupted_body(self, word: Word):
+        payload = bytearray(word.to_bytes())
+        # header is 12 bytes, the first byte of the body is code of the tuple
+        payload[12] = ord('N')
+
+        with pytest.raises(ValueError) as raised_error:
+            _ = Word.from_bytes(bytes(payload))
+
+    def test_json_compatible_data_round_trip(self):
+        data = {
+            'strings': ['', 'hello', 'hello', 'Olá', '\ud83d', 'x' * 70_000],
+            'numbers': [0, 1, -1, 2 ** 40, -2 ** 40, 1.5, -0.25, 1e300],
+            'constants': [True, False, None],
+            'nested': {'empty_list': [], 'empty_dict': {}}
+        }
+
+        type_name, restored_data = serialization.decode(serialization.encode('Custom', data))
+
+        assert type_name == 'Custom'
+        assert restored_data == data
+
+    def test_error_raising_on_unsupported_data(self):
+        with pytest.raises(TypeError) as raised_error:
+            _ = serialization.encode('Custom', {'set': {1, 2}})
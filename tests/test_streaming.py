@@ -0,0 +1,137 @@
+"""
+Contains tests for streaming lookups.
+
+.. class:: TestAsyncStreamLookups
+"""
+
+import asyncio
+import typing
+
+import pytest
+
+from freedictionaryapi.results import LookupResult
+
+from .fakes import (
+    EXISTENT_WORD,
+    FakeAsyncDictionaryApiClient
+)
+
+
+SLOW_WORD = 'slow'
+
+
+class SlowFakeAsyncDictionaryApiClient(FakeAsyncDictionaryApiClient):
+    """ Async fake client that responds with delay and tracks requests in flight """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        self.in_flight_count = 0
+        self.max_in_flight_count = 0
+        self.cancelled_count = 0
+
+    async def fetch_api_response(self, url: str) -> typing.Tuple[int, typing.Any]:
+        self.in_flight_count += 1
+        self.max_in_flight_count = max(self.max_in_flight_count, self.in_flight_count)
+
+        try:
+            # "slow" words are answered much later
+            await asyncio.sleep(10 if url.endswith(SLOW_WORD) else 0.01)
+        except asyncio.CancelledError:
+            self.cancelled_count += 1
+            raise
+        finally:
+            self.in_flight_count -= 1
+
+        return await super().fetch_api_response(url)
+
+
+class CountingSource:
+    """ Async source of the words that counts pulled words """
+
+    def __init__(self, words: typing.Iterable[str]) -> None:
+        self.words = list(words)
+        self.pulled_count = 0
+
+    async def __aiter__(self) -> typing.AsyncIterator[str]:
+        for word in self.words:
+            self.pulled_count += 1
+            yield word
+
+
+class TestAsyncStreamLookups:
+    """
+    Contains tests for
+        * ``stream_lookups`` method of the async client.
+
+    Checking that pipeline is bounded, pulls source lazily
+    and cancels requests when consumer leaves.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    @pytest.mark.asyncio
+    async def test_all_words_are_looked_up(self):
+        client = SlowFakeAsyncDictionaryApiClient()
+        source = CountingSource([EXISTENT_WORD, 'blablablabla'] * 10)
+
+        results = [result async for result in client.stream_lookups(source, concurrency=4)]
+
+        assert len(results) == 20
+        assert all(isinstance(result, LookupResult) for result in results)
+        assert sum(result.is_found for result in results) == 10
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        client = SlowFakeAsyncDictionaryApiClient()
+        source = CountingSource([EXISTENT_WORD] * 30)
+
+        _ = [result async for result in client.stream_lookups(source, concurrency=3)]
+
+        assert client.max_in_flight_count == 3
+
+    @pytest.mark.asyncio
+    async def test_backpressure(self):
+        client = SlowFakeAsyncDictionaryApiClient()
+        source = CountingSource([EXISTENT_WORD] * 100)
+        concurrency, buffer = 2, 3
+
+        stream = client.stream_lookups(source, concurrency=concurrency, buffer=buffer)
+        _ = await stream.__anext__()
+        # consumer is slow - pipeline gets full and stops pulling
+        await asyncio.sleep(0.1)
+
+        assert source.pulled_count == 1 + concurrency + buffer
+
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_leaving_cancels_requests(self):
+        client = SlowFakeAsyncDictionaryApiClient()
+        source = CountingSource([EXISTENT_WORD] + [SLOW_WORD] * 100)
+
+        stream = client.stream_lookups(source, concurrency=5)
+        _ = await stream.__anext__()
+        await stream.aclose()
+
+        assert client.in_flight_count == 0
+        assert client.cancelled_count == 4
+        assert source.pulled_count < 100
+
+    @pytest.mark.asyncio
+    async def test_source_error_propagation(self):
+        client = SlowFakeAsyncDictionaryApiClient()
+
+        async def broken_source() -> typing.AsyncIterator[str]:
+            yield EXISTENT_WORD
+            raise RuntimeError('source is broken')
+
+        with pytest.raises(RuntimeError) as raised_error:
+            _ = [result async for result in client.stream_lookups(broken_source())]
+
+    @pytest.mark.asyncio
+    async def test_error_raising_on_wrong_concurrency(self):
+        client = SlowFakeAsyncDictionaryApiClient()
+
+        with pytest.raises(ValueError) as raised_error:
+            _ = [result async for result in client.stream_lookups(CountingSource([]), concurrency=0)]
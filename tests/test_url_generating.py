@@ -2,14 +2,19 @@
 Contains tests for API url generation.
 
 .. class:: TestApiUrlGeneration
+.. class:: TestUrlBuilder
 """
 
 import typing
+from urllib.parse import quote
 
 import pytest
 
 from freedictionaryapi.languages import LanguageCodes
-from freedictionaryapi.urls import ApiUrl
+from freedictionaryapi.urls import (
+    ApiUrl,
+    UrlBuilder
+)
 
 
 class TestApiUrlGeneration:
@@ -52,7 +57,70 @@ class TestApiUrlGeneration:
             word = data['word']
             language = data['language_code']
 
-            fact_url = f'https://api.dictionaryapi.dev/api/v2/entries/{language.value}/{word.strip()}'
+            fact_url = f'https://api.dictionaryapi.dev/api/v2/entries/{language.value}/{quote(word.strip())}'
             expected_url = ApiUrl(**data).get_url()
 
             assert expected_url == fact_url
+
+    def test_word_percent_encoding(self):
+        url = ApiUrl('Olá', language_code=LanguageCodes.BRAZILIAN_PORTUGUESE).get_url()
+        reserved_characters_url = ApiUrl("a/b?c#d%e don't").get_url()
+
+        assert url == 'https://api.dictionaryapi.dev/api/v2/entries/pt-BR/Ol%C3%A1'
+        assert reserved_characters_url.endswith("/en_US/a%2Fb%3Fc%23d%25e%20don't")
+
+
+class TestUrlBuilder:
+    """
+    Contains tests for
+        * API url builder (``UrlBuilder``).
+
+    Checking that builder generates the same URLs as ``ApiUrl`` and memoizes them.
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    def test_urls_are_equal_to_api_urls(self):
+        builder = UrlBuilder()
+        words = ['hello', ' Olá ', 'a/b?c', 'naïve']
+
+        for language_code in LanguageCodes:
+            for word in words:
+                assert builder.build(word, language_code) == ApiUrl(word, language_code=language_code).get_url()
+
+    def test_base_url(self):
+        builder = UrlBuilder('http://dictionary.local:9000/')
+
+        assert builder.build('hello') == 'http://dictionary.local:9000/api/v2/entries/en_US/hello'
+
+    def test_memoizing(self):
+        builder = UrlBuilder(cache_size=2)
+
+        for _ in range(3):
+            builder.build('hello')
+
+        assert builder.cache_info.hits == 2
+        assert builder.cache_info.misses == 1
+        assert UrlBuilder(cache_size=0).cache_info is None
+
+    def test_build_many(self):
+        builder = UrlBuilder()
+        words = ['hello', 'world', 'Olá']
+
+        urls = list(builder.build_many(words, LanguageCodes.FRENCH))
+
+        # batch words do not evict hot words
+        assert builder.cache_info.currsize == 0
+        assert urls == [builder.build(word, LanguageCodes.FRENCH) for word in words]
+
+    def test_error_raising(self):
+        builder = UrlBuilder()
+
+        with pytest.raises(ValueError) as raised_error:
+            _ = builder.build('   ')
+
+        with pytest.raises(TypeError) as raised_error:
+            _ = builder.build('hello', 'en_US')
+
+        with pytest.raises(TypeError) as raised_error:
+            _ = list(builder.build_many(['hello'], 'en_US'))
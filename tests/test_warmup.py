@@ -0,0 +1,145 @@
+"""
+Contains tests for cache warm-up.
+
+.. class:: TestWarmup
+.. class:: TestAsyncWarmup
+"""
+
+import time
+import typing
+
+import pytest
+
+from freedictionaryapi.caching import ResponseCache
+from freedictionaryapi.results import WarmupProgress
+
+from .fakes import (
+    EXISTENT_WORD,
+    FakeAsyncDictionaryApiClient,
+    FakeDictionaryApiClient
+)
+
+
+FREQUENCIES = {
+    'blablablabla': 10,
+    EXISTENT_WORD: 30,
+    'Hello': 25,
+    'qwertyuiop': 20,
+}
+""" Frequency list (``'Hello'`` is the variant of the ``'hello'``) """
+
+
+class BrokenDictionaryApiClient(FakeDictionaryApiClient):
+    """ Sync client that fails requests of the not existent words """
+
+    def fetch_api_response(self, url: str) -> typing.Tuple[int, typing.Any]:
+        if not url.endswith(EXISTENT_WORD):
+            raise ConnectionError(url)
+
+        return super().fetch_api_response(url)
+
+
+class TestWarmup:
+    """
+    Contains tests for
+        * sync client cache warm-up (``warmup``).
+
+    Checking order of the words, skipping of the cached words, rate budget and progress reporting.
+    """
+
+    # fixtures ---------------------------------------------------------------------------------------------------------
+
+    @pytest.fixture(name='client')
+    def fixture_client(self) -> FakeDictionaryApiClient:
+        return FakeDictionaryApiClient(response_cache=ResponseCache())
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    @pytest.mark.parametrize(
+        argnames='options',
+        argvalues=[
+            {'concurrency': 0},
+            {'budget': 0},
+            {'top': -1},
+        ]
+    )
+    def test_error_raising_on_not_positive_arguments(self, client: FakeDictionaryApiClient, options: dict):
+        with pytest.raises(ValueError) as raised_error:
+            _ = client.warmup(FREQUENCIES, **options)
+
+    def test_words_are_fetched_in_order_of_frequency(self, client: FakeDictionaryApiClient):
+        progress = client.warmup(FREQUENCIES, concurrency=1)
+
+        assert [url.rsplit('/', 1)[-1] for url in client.requested_urls] == [
+            EXISTENT_WORD,
+            'qwertyuiop',
+            'blablablabla',
+        ]
+        assert progress.is_finished
+        assert (progress.total, progress.fetched, progress.skipped, progress.failed) == (3, 3, 0, 0)
+
+    def test_top_words(self, client: FakeDictionaryApiClient):
+        progress = client.warmup(list(FREQUENCIES.items()), top=2)
+
+        assert progress.total == 2
+        assert len(client.requested_urls) == 2
+        assert client.fetch_result('blablablabla').is_cached is False
+
+    def test_cached_words_are_skipped(self, client: FakeDictionaryApiClient):
+        client.warmup(FREQUENCIES)
+        progress = client.warmup(FREQUENCIES)
+
+        assert (progress.fetched, progress.skipped) == (0, 3)
+        assert len(client.requested_urls) == 3
+        assert client.fetch_result(EXISTENT_WORD).is_cached
+
+    def test_requests_are_paced_by_budget(self, client: FakeDictionaryApiClient):
+        started_at = time.monotonic()
+        client.warmup(FREQUENCIES, budget=20)
+
+        # the 3rd request is sent not earlier than 2 / 20 seconds after start
+        assert time.monotonic() - started_at >= 0.1
+
+    def test_progress_reporting(self, client: FakeDictionaryApiClient):
+        reports: typing.List[int] = []
+
+        def report(progress: WarmupProgress) -> None:
+            reports.append(progress.done)
+
+        progress = client.warmup(FREQUENCIES, progress_callback=report)
+
+        assert reports == [1, 2, 3]
+        assert progress.ratio == 1.0
+
+    def test_failed_lookups_do_not_stop_warmup(self):
+        client = BrokenDictionaryApiClient(response_cache=ResponseCache())
+
+        progress = client.warmup(FREQUENCIES)
+
+        assert (progress.fetched, progress.failed) == (1, 2)
+        assert client.fetch_result(EXISTENT_WORD).is_cached
+
+
+class TestAsyncWarmup:
+    """
+    Contains tests for
+        * async client cache warm-up (``warmup``).
+    """
+
+    # tests ------------------------------------------------------------------------------------------------------------
+
+    @pytest.mark.asyncio
+    async def test_words_are_fetched_and_cached(self):
+        client = FakeAsyncDictionaryApiClient(response_cache=ResponseCache())
+
+        progress = await client.warmup(FREQUENCIES, concurrency=1)
+        second_progress = await client.warmup(FREQUENCIES)
+
+        assert [url.rsplit('/', 1)[-1] for url in client.requested_urls] == [
+            EXISTENT_WORD,
+            'qwertyuiop',
+            'blablablabla',
+        ]
+        assert (progress.fetched, progress.skipped) == (3, 0)
+        assert (second_progress.fetched, second_progress.skipped) == (0, 3)
+        assert (await client.fetch_result(EXISTENT_WORD)).is_cached